@@ -0,0 +1,418 @@
+"""
+benchmarks/cvd_pipeline.py
+==========================
+Reproducible, offline benchmark for the indicator and CVD pipeline.
+
+Times every public function in `core/cvd/indicators.py` (plus the Streaming*
+classes fed bar-by-bar), `CVDHistoricalBuilder.build_cvd_ohlc`,
+`build_price_cvd_from_ticks` and `CVDEngine.process_ticks` on deterministic
+synthetic series.  No Kite session or network access is needed.
+
+Usage (from the repository root):
+
+    python -m benchmarks.cvd_pipeline                         # all sizes
+    python -m benchmarks.cvd_pipeline --sizes 1k,10k --repeat 5
+    python -m benchmarks.cvd_pipeline --only indicators.calculate_ema
+    python -m benchmarks.cvd_pipeline --compare benchmarks/results/old.json
+
+Results are written as JSON (see `--output`) so two commits can be compared
+with `--compare`, which prints the new/old timing ratio per case and size.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import inspect
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from core.cvd import indicators
+from core.cvd.cvd_engine import CVDEngine
+from core.cvd.cvd_historical import CVDHistoricalBuilder
+from core.cvd.data_worker import build_price_cvd_from_ticks
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+SIZE_ALIASES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+DEFAULT_SIZES = ("1k", "10k", "100k", "1m")
+
+SEED = 20240101
+SESSION_MINUTES = 375            # 09:15 → 15:30
+SESSION_SECONDS = SESSION_MINUTES * 60
+ENGINE_TOKENS = 20               # instruments interleaved in the tick stream
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data
+# ---------------------------------------------------------------------------
+
+def _session_index(n: int, step_seconds: int) -> pd.DatetimeIndex:
+    """Timestamps inside 09:15–15:30 on consecutive weekdays."""
+    per_session = SESSION_SECONDS // step_seconds
+    i = np.arange(n)
+    day = i // per_session
+    offset = (i % per_session) * step_seconds
+    days = pd.bdate_range("2024-01-01", periods=int(day[-1]) + 1 if n else 1)
+    base = days.values[day] + np.timedelta64(9 * 3600 + 15 * 60, "s")
+    return pd.DatetimeIndex(base + offset.astype("timedelta64[s]"))
+
+
+def make_minute_bars(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(SEED)
+    close = 20_000.0 + np.cumsum(rng.normal(0.0, 4.0, n))
+    open_ = close + rng.normal(0.0, 2.0, n)
+    high = np.maximum(open_, close) + rng.uniform(0.0, 3.0, n)
+    low = np.minimum(open_, close) - rng.uniform(0.0, 3.0, n)
+    volume = rng.integers(100, 50_000, n).astype(float)
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": volume},
+        index=_session_index(n, 60),
+    )
+
+
+def make_ticks(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(SEED + 1)
+    ltp = np.round(20_000.0 + np.cumsum(rng.normal(0.0, 0.5, n)), 1)
+    volume = np.cumsum(rng.integers(0, 200, n)).astype(float)
+    return pd.DataFrame({
+        "timestamp": _session_index(n, 1),
+        "ltp": ltp,
+        "volume": volume,
+    })
+
+
+def make_engine_ticks(n: int) -> list[dict]:
+    rng = np.random.default_rng(SEED + 2)
+    tokens = np.arange(n) % ENGINE_TOKENS + 1
+    prices = np.round(1_000.0 + np.cumsum(rng.normal(0.0, 0.2, n)), 2)
+    qty = rng.integers(1, 500, n)
+    volume = np.cumsum(qty)
+    return [
+        {
+            "instrument_token": int(t),
+            "last_price": float(p),
+            "volume": int(v),
+            "last_quantity": int(q),
+        }
+        for t, p, v, q in zip(tokens, prices, volume, qty)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+#
+# Each case is `setup(n) -> run` where `run()` is the timed call; setup cost
+# (data generation, object construction) is excluded from the measurement.
+
+def _indicator_cases() -> dict[str, Callable[[int], Callable[[], object]]]:
+    def bars(n):
+        df = make_minute_bars(n)
+        return (
+            df["high"].to_numpy(), df["low"].to_numpy(),
+            df["close"].to_numpy(), df["volume"].to_numpy(),
+            list(df.index.date),
+        )
+
+    def ema(n):
+        _, _, c, _, _ = bars(n)
+        return lambda: indicators.calculate_ema(c, 21)
+
+    def vwap(n):
+        _, _, c, v, keys = bars(n)
+        return lambda: indicators.calculate_vwap(c, v, keys)
+
+    def atr(n):
+        h, l, c, _, _ = bars(n)
+        return lambda: indicators.calculate_atr(h, l, c, 14)
+
+    def adx(n):
+        h, l, c, _, _ = bars(n)
+        return lambda: indicators.compute_adx(h, l, c, 14)
+
+    def slope(n):
+        _, _, c, _, _ = bars(n)
+        return lambda: indicators.build_slope_direction_masks(c, 3)
+
+    def chop(n):
+        h, l, c, _, _ = bars(n)
+        atr_v = indicators.calculate_atr(h, l, c, 14)
+        adx_v = indicators.compute_adx(h, l, c, 14)
+        return lambda: indicators.is_chop_regime(atr_v, adx_v)
+
+    def regime(n):
+        _, _, c, _, _ = bars(n)
+        return lambda: indicators.calculate_regime_trend_filter(c, 20, 50)
+
+    def zscore(n):
+        _, _, c, v, _ = bars(n)
+        cvd = np.cumsum(np.where(np.diff(c, prepend=c[0]) >= 0, v, -v))
+        return lambda: indicators.calculate_cvd_zscore(cvd, 20)
+
+    def streaming_ema(n):
+        _, _, c, _, _ = bars(n)
+        c = c.tolist()
+
+        def run():
+            s = indicators.StreamingEMA(21)
+            for x in c:
+                s.update(x)
+        return run
+
+    def streaming_vwap(n):
+        _, _, c, v, keys = bars(n)
+        rows = list(zip(c.tolist(), v.tolist(), keys))
+
+        def run():
+            s = indicators.StreamingVWAP()
+            for p, vol, k in rows:
+                s.update(p, vol, k)
+        return run
+
+    def streaming_atr(n):
+        h, l, c, _, _ = bars(n)
+        rows = list(zip(h.tolist(), l.tolist(), c.tolist()))
+
+        def run():
+            s = indicators.StreamingATR(14)
+            for row in rows:
+                s.update(*row)
+        return run
+
+    def streaming_adx(n):
+        h, l, c, _, _ = bars(n)
+        rows = list(zip(h.tolist(), l.tolist(), c.tolist()))
+
+        def run():
+            s = indicators.StreamingADX(14)
+            for row in rows:
+                s.update(*row)
+        return run
+
+    def streaming_chop(n):
+        h, l, c, _, _ = bars(n)
+        rows = list(zip(
+            indicators.calculate_atr(h, l, c, 14).tolist(),
+            indicators.compute_adx(h, l, c, 14).tolist(),
+        ))
+
+        def run():
+            s = indicators.StreamingChopRegime()
+            for row in rows:
+                s.update(*row)
+        return run
+
+    def streaming_zscore(n):
+        _, _, c, v, _ = bars(n)
+        cvd = np.cumsum(np.where(np.diff(c, prepend=c[0]) >= 0, v, -v)).tolist()
+
+        def run():
+            s = indicators.StreamingCVDZScore(20)
+            for x in cvd:
+                s.update(x)
+        return run
+
+    cases = {
+        "indicators.calculate_ema": ema,
+        "indicators.calculate_vwap": vwap,
+        "indicators.calculate_atr": atr,
+        "indicators.compute_adx": adx,
+        "indicators.build_slope_direction_masks": slope,
+        "indicators.is_chop_regime": chop,
+        "indicators.calculate_regime_trend_filter": regime,
+        "indicators.calculate_cvd_zscore": zscore,
+        "indicators.StreamingEMA": streaming_ema,
+        "indicators.StreamingVWAP": streaming_vwap,
+        "indicators.StreamingATR": streaming_atr,
+        "indicators.StreamingADX": streaming_adx,
+        "indicators.StreamingChopRegime": streaming_chop,
+        "indicators.StreamingCVDZScore": streaming_zscore,
+    }
+
+    # Guard: a new public indicator must get a benchmark case.
+    public = {
+        f"indicators.{name}"
+        for name, obj in vars(indicators).items()
+        if not name.startswith("_")
+        and (inspect.isfunction(obj) or inspect.isclass(obj))
+        and getattr(obj, "__module__", None) == indicators.__name__
+    }
+    missing = public - cases.keys()
+    if missing:
+        raise RuntimeError(f"No benchmark case for: {', '.join(sorted(missing))}")
+    return cases
+
+
+def _pipeline_cases() -> dict[str, Callable[[int], Callable[[], object]]]:
+    def build_cvd_ohlc(n):
+        df = make_minute_bars(n)
+        return lambda: CVDHistoricalBuilder.build_cvd_ohlc(df)
+
+    def price_cvd_from_ticks(n):
+        ticks = make_ticks(n)
+        return lambda: build_price_cvd_from_ticks(ticks, 1)
+
+    def price_cvd_from_ticks_5m(n):
+        ticks = make_ticks(n)
+        return lambda: build_price_cvd_from_ticks(ticks, 5)
+
+    def engine_process_ticks(n):
+        ticks = make_engine_ticks(n)
+
+        def run():
+            engine = CVDEngine()
+            for token in range(1, ENGINE_TOKENS + 1):
+                engine.register_token(token)
+            engine.process_ticks(ticks)
+        return run
+
+    return {
+        "CVDHistoricalBuilder.build_cvd_ohlc": build_cvd_ohlc,
+        "build_price_cvd_from_ticks[1m]": price_cvd_from_ticks,
+        "build_price_cvd_from_ticks[5m]": price_cvd_from_ticks_5m,
+        "CVDEngine.process_ticks": engine_process_ticks,
+    }
+
+
+def all_cases() -> dict[str, Callable[[int], Callable[[], object]]]:
+    return {**_indicator_cases(), **_pipeline_cases()}
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _time_case(setup: Callable[[int], Callable[[], object]], n: int, repeat: int) -> dict:
+    run = setup(n)
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    best = min(timings)
+    return {
+        "best_s": best,
+        "mean_s": sum(timings) / len(timings),
+        "repeat": repeat,
+        "per_item_us": best / n * 1e6,
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, timeout=10,
+        )
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run_benchmarks(sizes: list[int], repeat: int, only: list[str] | None = None) -> dict:
+    cases = all_cases()
+    if only:
+        unknown = set(only) - cases.keys()
+        if unknown:
+            raise SystemExit(f"Unknown case(s): {', '.join(sorted(unknown))}")
+        cases = {name: cases[name] for name in only}
+
+    results: dict[str, dict[str, dict]] = {}
+    for name, setup in cases.items():
+        results[name] = {}
+        for n in sizes:
+            # The 1M-size pure-Python loops take seconds each; one pass is
+            # enough to compare at that scale.
+            reps = 1 if n >= 1_000_000 else repeat
+            stats = _time_case(setup, n, reps)
+            results[name][str(n)] = stats
+            print(f"{name:<45} n={n:>9,}  best={stats['best_s'] * 1e3:>10.2f} ms", flush=True)
+
+    return {
+        "meta": {
+            "benchmark": "cvd_pipeline",
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "seed": SEED,
+            "sizes": sizes,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """Return a table of current/baseline best-time ratios (<1.0 is faster)."""
+    lines = [f"{'case':<45} {'n':>9}  {'base ms':>10}  {'new ms':>10}  {'ratio':>6}"]
+    for name, by_size in current["results"].items():
+        base_sizes = baseline.get("results", {}).get(name, {})
+        for size, stats in by_size.items():
+            base = base_sizes.get(size)
+            if not base:
+                continue
+            ratio = stats["best_s"] / base["best_s"] if base["best_s"] > 0 else float("nan")
+            lines.append(
+                f"{name:<45} {int(size):>9,}  {base['best_s'] * 1e3:>10.2f}  "
+                f"{stats['best_s'] * 1e3:>10.2f}  {ratio:>6.2f}"
+            )
+    return lines
+
+
+def _parse_sizes(raw: str) -> list[int]:
+    sizes = []
+    for part in raw.split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        sizes.append(SIZE_ALIASES.get(part) or int(part))
+    return sizes
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the indicator / CVD pipeline offline.")
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES),
+                        help="comma-separated sizes, e.g. 1k,10k,100k,1m or raw integers")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (best is reported)")
+    parser.add_argument("--only", action="append", help="run only this case (repeatable)")
+    parser.add_argument("--output", type=Path, help="JSON output path (default: benchmarks/results/<rev>.json)")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare against")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(_parse_sizes(args.sizes), max(1, args.repeat), args.only)
+
+    output = args.output
+    if output is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        output = RESULTS_DIR / f"cvd_pipeline_{report['meta']['git_revision'] or 'local'}.json"
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nSaved results to {output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        print()
+        print("\n".join(compare(report, baseline)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
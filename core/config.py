@@ -23,6 +23,8 @@ DEFAULT_LOT_SIZES = {
 
 # UI constants
 REFRESH_INTERVAL_MS = 1000  # 2 seconds
+# Live fills arrive on the ticker's order-update stream; this poll is only the safety net.
+LIVE_ORDER_RECONCILE_INTERVAL_MS = 30000
 MAX_STRIKE_RANGE = 10
 DEFAULT_STRIKE_RANGE = 3
 
@@ -0,0 +1,238 @@
+# core/cvd/bar_pyramid.py
+"""
+Multi-timeframe bar pyramid built incrementally from 1-minute bars.
+
+One `BarPyramid` holds a 1-minute OHLC(V) series — price or CVD — together
+with every higher timeframe derived from it (3/5/15/30-minute and daily by
+default).  Each incoming minute touches only the last bucket of each
+timeframe, so a live update reaches every timeframe at once in O(1) and
+switching timeframe is a read of an already-built series, not a resample.
+
+Intraday buckets are aligned to the 09:15 session open (matching Kite's own
+higher-timeframe candles); daily buckets are calendar sessions.  For a CVD
+pyramid fed with gapless 1-minute candles (open = previous close) every
+higher timeframe stays gapless too, because a bucket opens with its first
+minute's open.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+DAILY = 1440
+DEFAULT_TIMEFRAMES = (3, 5, 15, 30, DAILY)
+SESSION_OPEN_MINUTE = 9 * 60 + 15
+
+_NS_PER_MINUTE = 60_000_000_000
+
+
+class _Series:
+    """Append-only OHLCV columns; the last row may still be rewritten."""
+
+    __slots__ = ("keys", "open", "high", "low", "close", "volume")
+
+    def __init__(self):
+        self.keys: list[int] = []
+        self.open: list[float] = []
+        self.high: list[float] = []
+        self.low: list[float] = []
+        self.close: list[float] = []
+        self.volume: list[float] = []
+
+    def __len__(self):
+        return len(self.keys)
+
+    def append(self, key, o, h, l, c, v):
+        self.keys.append(key)
+        self.open.append(o)
+        self.high.append(h)
+        self.low.append(l)
+        self.close.append(c)
+        self.volume.append(v)
+
+    def set_last(self, o, h, l, c, v):
+        self.open[-1], self.high[-1], self.low[-1], self.close[-1], self.volume[-1] = o, h, l, c, v
+
+    def last(self) -> tuple:
+        return self.open[-1], self.high[-1], self.low[-1], self.close[-1], self.volume[-1]
+
+
+class _Level:
+    """One higher timeframe: finished buckets + the aggregate of the last bucket's closed minutes."""
+
+    __slots__ = ("minutes", "bars", "closed")
+
+    def __init__(self, minutes: int):
+        self.minutes = minutes
+        self.bars = _Series()
+        self.closed: tuple | None = None    # (open, high, low, volume) excluding the forming minute
+
+    def bucket(self, wall_minute: int) -> int:
+        day_start = wall_minute - wall_minute % DAILY
+        if self.minutes >= DAILY:
+            return day_start
+        offset = wall_minute - day_start - SESSION_OPEN_MINUTE
+        return day_start + SESSION_OPEN_MINUTE + (offset // self.minutes) * self.minutes
+
+    def _show(self, o, h, l, c, v):
+        if self.closed is None:
+            self.bars.set_last(o, h, l, c, v)
+        else:
+            co, ch, cl, cv = self.closed
+            self.bars.set_last(co, max(ch, h), min(cl, l), c, cv + v)
+
+    def new_minute(self, wall_minute: int, prev: tuple | None, bar: tuple):
+        """``bar`` starts a new minute; ``prev`` is the minute it supersedes."""
+        key = self.bucket(wall_minute)
+        if self.bars.keys and self.bars.keys[-1] == key:
+            po, ph, pl, _, pv = prev
+            if self.closed is None:
+                self.closed = (po, ph, pl, pv)
+            else:
+                co, ch, cl, cv = self.closed
+                self.closed = (co, max(ch, ph), min(cl, pl), cv + pv)
+            self._show(*bar)
+        else:
+            self.closed = None
+            self.bars.append(key, *bar)
+
+    def replace_minute(self, bar: tuple):
+        self._show(*bar)
+
+
+class BarPyramid:
+    """1-minute bars plus incrementally maintained higher timeframes."""
+
+    def __init__(self, timeframes: Iterable[int] = DEFAULT_TIMEFRAMES):
+        self.timeframes = tuple(sorted(set(timeframes)))
+        self.clear()
+
+    def clear(self):
+        self._tz = None
+        self._unit = "ns"                      # index resolution handed back by `frame`
+        self._minutes = _Series()              # keys: wall-clock epoch minutes
+        self._levels = {tf: _Level(tf) for tf in self.timeframes}
+
+    def __len__(self) -> int:
+        return len(self._minutes)
+
+    def __contains__(self, minutes: int) -> bool:
+        return minutes == 1 or minutes in self._levels
+
+    @property
+    def last_timestamp(self) -> pd.Timestamp | None:
+        if not self._minutes.keys:
+            return None
+        return self._to_index([self._minutes.keys[-1]])[0]
+
+    @property
+    def first_timestamp(self) -> pd.Timestamp | None:
+        if not self._minutes.keys:
+            return None
+        return self._to_index([self._minutes.keys[0]])[0]
+
+    # ------------------------------------------------------------------
+    # Feeding
+    # ------------------------------------------------------------------
+
+    def update(self, timestamp, open_: float, high: float, low: float, close: float, volume: float = 0.0) -> bool:
+        """Apply one 1-minute bar (new or a revision of the forming minute).
+
+        Returns False — and changes nothing — for a minute older than the
+        last one; callers rebuild with `load` when history is revised.
+        """
+        ts = pd.Timestamp(timestamp)
+        if self._tz is None and not self._minutes.keys:
+            self._tz = ts.tz
+            self._unit = ts.unit
+        wall = self._wall_minute(ts)
+        bar = (float(open_), float(high), float(low), float(close), float(volume))
+        return self._feed(wall, bar)
+
+    def load(self, df: pd.DataFrame):
+        """Rebuild from a 1-minute OHLC(V) frame (index: minute timestamps)."""
+        self.clear()
+        self.extend(df)
+
+    def extend(self, df: pd.DataFrame):
+        """Feed 1-minute rows in order; rows older than the last minute are skipped."""
+        if df is None or df.empty:
+            return
+        index = pd.DatetimeIndex(df.index)
+        if self._tz is None and not self._minutes.keys:
+            self._tz = index.tz
+            self._unit = index.unit
+        walls = self._wall_minutes(index)
+        volume = df["volume"].to_numpy(dtype=float) if "volume" in df.columns else np.zeros(len(df))
+        columns = zip(
+            walls.tolist(),
+            df["open"].to_numpy(dtype=float).tolist(),
+            df["high"].to_numpy(dtype=float).tolist(),
+            df["low"].to_numpy(dtype=float).tolist(),
+            df["close"].to_numpy(dtype=float).tolist(),
+            volume.tolist(),
+        )
+        for wall, o, h, l, c, v in columns:
+            self._feed(wall, (o, h, l, c, v))
+
+    def _feed(self, wall: int, bar: tuple) -> bool:
+        minutes = self._minutes
+        if minutes.keys and wall < minutes.keys[-1]:
+            return False
+        if minutes.keys and wall == minutes.keys[-1]:
+            minutes.set_last(*bar)
+            for level in self._levels.values():
+                level.replace_minute(bar)
+            return True
+        prev = minutes.last() if minutes.keys else None
+        minutes.append(wall, *bar)
+        for level in self._levels.values():
+            level.new_minute(wall, prev, bar)
+        return True
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def frame(self, minutes: int = 1) -> pd.DataFrame:
+        """OHLCV frame for ``minutes`` (1, one of `timeframes`, or DAILY)."""
+        series = self._minutes if minutes == 1 else self._levels[minutes].bars
+        if not series.keys:
+            return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
+        return pd.DataFrame(
+            {
+                "open": series.open,
+                "high": series.high,
+                "low": series.low,
+                "close": series.close,
+                "volume": series.volume,
+            },
+            index=self._to_index(series.keys),
+        )
+
+    # ------------------------------------------------------------------
+    # Time helpers (buckets are computed on wall-clock minutes)
+    # ------------------------------------------------------------------
+
+    def _wall_minute(self, ts: pd.Timestamp) -> int:
+        if self._tz is not None:
+            ts = ts.tz_localize(self._tz) if ts.tzinfo is None else ts.tz_convert(self._tz)
+            ts = ts.tz_localize(None)
+        elif ts.tzinfo is not None:
+            ts = ts.tz_localize(None)
+        return int(ts.as_unit("ns").value // _NS_PER_MINUTE)
+
+    def _wall_minutes(self, index: pd.DatetimeIndex) -> np.ndarray:
+        if self._tz is not None:
+            index = index.tz_localize(self._tz) if index.tz is None else index.tz_convert(self._tz)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        return index.as_unit("ns").asi8 // _NS_PER_MINUTE
+
+    def _to_index(self, keys) -> pd.DatetimeIndex:
+        ns = np.asarray(keys, dtype=np.int64) * _NS_PER_MINUTE
+        index = pd.DatetimeIndex(ns.astype("datetime64[ns]")).as_unit(self._unit)
+        return index.tz_localize(self._tz) if self._tz is not None else index
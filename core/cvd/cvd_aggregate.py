@@ -0,0 +1,253 @@
+# core/cvd/cvd_aggregate.py
+"""
+Incremental aggregate CVD for symbol sets.
+
+The aggregate at minute m is the sum of every member's latest session CVD as
+of m (a member that did not trade in m contributes its last close of the same
+session; before its first bar of a session it contributes 0, matching the
+daily CVD anchor reset).
+
+State lives on a dense, minute-indexed grid (position 0 = `origin` minute), so
+a live tick is a single delta added into the forming minute: O(1) per tick
+regardless of set size.  Members can join or leave at any time; that costs
+one vectorised pass over the grid for that member only.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+_NS_PER_MINUTE = 60_000_000_000
+
+
+@dataclass
+class _Member:
+    values: np.ndarray                    # per-position CVD close, NaN where no bar
+    last_pos: int = -1
+    last_value: float = 0.0
+    positions: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+
+
+class AggregateCVDSeries:
+    """Summed CVD across a set of instruments, maintained tick by tick."""
+
+    _MIN_CAPACITY = 2048
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._members: dict[int, _Member] = {}
+        self._tz = None
+        self._origin: int | None = None          # epoch minute of position 0
+        self._agg = np.zeros(0, dtype=float)     # aggregate CVD per position
+        self._bars = np.zeros(0, dtype=np.int32)  # members with a bar at position
+        self._day = np.zeros(0, dtype=np.int64)  # session day ordinal per position
+        self._end = -1                            # last populated position
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    @property
+    def tokens(self) -> set[int]:
+        return set(self._members)
+
+    def __contains__(self, token: int) -> bool:
+        return token in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    @property
+    def last_timestamp(self) -> pd.Timestamp | None:
+        if self._end < 0:
+            return None
+        return self._to_timestamps(np.array([self._end]))[0]
+
+    @property
+    def last_value(self) -> float | None:
+        return float(self._agg[self._end]) if self._end >= 0 else None
+
+    # ------------------------------------------------------------------
+    # Membership
+    # ------------------------------------------------------------------
+
+    def set_member(self, token: int, cvd_df: pd.DataFrame | None):
+        """Add ``token`` (or replace its history) from a CVD OHLC frame."""
+        self.remove_member(token)
+        if cvd_df is None or cvd_df.empty:
+            return
+
+        index = pd.DatetimeIndex(cvd_df.index)
+        if self._tz is None and not self._members:
+            self._tz = index.tz
+        index = self._align_tz(index)
+        minutes = index.as_unit("ns").asi8 // _NS_PER_MINUTE
+        closes = cvd_df["close"].to_numpy(dtype=float)
+
+        self._reserve(int(minutes.min()), int(minutes.max()))
+        positions = (minutes - self._origin).astype(np.int64)
+        member = _Member(values=np.full(len(self._agg), np.nan))
+        member.values[positions] = closes
+        member.positions = np.unique(positions)
+
+        last = int(member.positions[-1])
+        if last > self._end:
+            self._extend_to(last)
+
+        self._agg[:self._end + 1] += self._contribution(member, self._end)
+        self._bars[member.positions] += 1
+        member.last_pos = last
+        member.last_value = float(member.values[last])
+        self._members[token] = member
+
+    def remove_member(self, token: int):
+        member = self._members.pop(token, None)
+        if member is None:
+            return
+        self._agg[:self._end + 1] -= self._contribution(member, self._end)
+        self._bars[member.positions] -= 1
+        if not self._members:
+            self.clear()
+
+    # ------------------------------------------------------------------
+    # Live updates
+    # ------------------------------------------------------------------
+
+    def update(self, token: int, timestamp: datetime, cvd: float) -> bool | None:
+        """Apply a member's live CVD value for the minute containing ``timestamp``.
+
+        Returns None when the tick was ignored (unknown member, stale minute),
+        True when only the last aggregate minute changed, False when earlier
+        minutes were touched too (a lagging member caught up) and consumers
+        should redraw from `to_frame()`.
+        """
+        member = self._members.get(token)
+        if member is None:
+            return None
+
+        minute = self._align_tz(pd.DatetimeIndex([timestamp])).as_unit("ns").asi8[0] // _NS_PER_MINUTE
+        self._reserve(int(minute), int(minute))
+        p = int(minute - self._origin)
+        if p < member.last_pos:
+            return None
+        if p > self._end:
+            self._extend_to(p)
+
+        day = self._day[p]
+        same_session = member.last_pos >= 0 and self._day[member.last_pos] == day
+        delta = float(cvd) - (member.last_value if same_session else 0.0)
+
+        # The member's value carries forward to the end of its session.
+        stop = min(self._end + 1, int(np.searchsorted(self._day, day, side="right")))
+        if stop - p == 1:
+            self._agg[p] += delta
+        else:
+            self._agg[p:stop] += delta
+
+        if np.isnan(member.values[p]):
+            self._bars[p] += 1
+            member.positions = np.append(member.positions, p)
+        member.values[p] = float(cvd)
+        member.last_pos = p
+        member.last_value = float(cvd)
+        return p == self._end
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def to_frame(self) -> pd.DataFrame:
+        """CVD OHLC frame (open=high=low=close) for minutes where any member traded."""
+        if self._end < 0:
+            return pd.DataFrame()
+        positions = np.flatnonzero(self._bars[:self._end + 1] > 0)
+        if positions.size == 0:
+            return pd.DataFrame()
+        index = self._to_timestamps(positions)
+        close = self._agg[positions]
+        agg_df = pd.DataFrame(
+            {"open": close, "high": close, "low": close, "close": close},
+            index=index,
+        )
+        agg_df["session"] = agg_df.index.date
+        return agg_df
+
+    # ------------------------------------------------------------------
+    # Grid management
+    # ------------------------------------------------------------------
+
+    def _align_tz(self, index: pd.DatetimeIndex) -> pd.DatetimeIndex:
+        if self._tz is None:
+            return index.tz_localize(None) if index.tz is not None else index
+        if index.tz is None:
+            return index.tz_localize(self._tz)
+        return index.tz_convert(self._tz)
+
+    def _to_timestamps(self, positions: np.ndarray) -> pd.DatetimeIndex:
+        ns = (positions.astype(np.int64) + self._origin) * _NS_PER_MINUTE
+        if self._tz is None:
+            return pd.DatetimeIndex(ns.astype("datetime64[ns]"))
+        return pd.DatetimeIndex(ns.astype("datetime64[ns]")).tz_localize("UTC").tz_convert(self._tz)
+
+    def _reserve(self, first_minute: int, last_minute: int):
+        """Grow / shift the grid so both minutes map to valid positions."""
+        if self._origin is None:
+            self._origin = first_minute
+        shift = max(0, self._origin - first_minute)
+        needed = last_minute - (self._origin - shift) + 1
+        if shift == 0 and needed <= len(self._agg):
+            return
+
+        capacity = max(self._MIN_CAPACITY, len(self._agg) * 2, needed + shift)
+        used = self._end + 1
+
+        agg = np.zeros(capacity, dtype=float)
+        bars = np.zeros(capacity, dtype=np.int32)
+        agg[shift:shift + used] = self._agg[:used]
+        bars[shift:shift + used] = self._bars[:used]
+        for member in self._members.values():
+            values = np.full(capacity, np.nan)
+            values[shift:shift + used] = member.values[:used]
+            member.values = values
+            member.positions = member.positions + shift
+            if member.last_pos >= 0:
+                member.last_pos += shift
+
+        self._origin -= shift
+        self._agg, self._bars = agg, bars
+        self._day = self._day_ordinals(np.arange(capacity))
+        if self._end >= 0:
+            self._end += shift
+
+    def _day_ordinals(self, positions: np.ndarray) -> np.ndarray:
+        ts = self._to_timestamps(positions)
+        return (ts.normalize().tz_localize(None).as_unit("ns").asi8 // (_NS_PER_MINUTE * 1440)).astype(np.int64)
+
+    def _extend_to(self, p: int):
+        """Populate positions (end, p]: carry the aggregate within a session, 0 after."""
+        start = self._end + 1
+        if self._end >= 0:
+            carry = self._agg[self._end]
+            same_day = self._day[start:p + 1] == self._day[self._end]
+            self._agg[start:p + 1] = np.where(same_day, carry, 0.0)
+        else:
+            self._agg[start:p + 1] = 0.0
+        self._end = p
+
+    def _contribution(self, member: _Member, end: int) -> np.ndarray:
+        """Member's forward-filled (within session) CVD for positions [0, end]."""
+        if end < 0:
+            return np.zeros(0)
+        values = member.values[:end + 1]
+        has_bar = ~np.isnan(values)
+        last_bar = np.maximum.accumulate(np.where(has_bar, np.arange(end + 1), -1))
+        valid = last_bar >= 0
+        safe = np.where(valid, last_bar, 0)
+        valid &= self._day[safe] == self._day[:end + 1]
+        return np.where(valid, values[safe], 0.0)
@@ -1,3 +1,6 @@
+import logging
+
+import numpy as np
 import pyqtgraph as pg
 import pandas as pd
 from datetime import datetime, timedelta
@@ -8,8 +11,17 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QColor
 
-from core.cvd.cvd_historical import CVDHistoricalBuilder
+from core.cvd.history_cache import history_cache
+from core.cvd.history_loader import (
+    HistoryLoadSignals,
+    HistoryLoadTask,
+    history_thread_pool,
+    load_cvd_history,
+)
 from core.cvd.live_refresh_controller import MinuteAlignedPoller
+from core.widgets.decimated_curve import DecimatedCurveItem
+
+logger = logging.getLogger(__name__)
 
 
 class CVDChartWidget(QWidget):
@@ -26,8 +38,14 @@ class CVDChartWidget(QWidget):
 
     # Signal for crosshair synchronization (x_position, timestamp)
     crosshair_moved = Signal(float, datetime)
+    # Emitted after cvd_df has been (re)built from historical data
+    history_loaded = Signal()
+    # Emitted when a date load ends without data (error, empty result, loading disabled)
+    history_failed = Signal()
 
     REFRESH_INTERVAL_MS = 3000  # 3 seconds (live mode)
+    CROSSHAIR_BROADCAST_MS = 16  # coalesce sibling-chart sync to ~1 per frame
+    MAX_PAGED_SESSIONS = 20      # older sessions a pan past the left edge may add
 
     COLOR_UP = "#26A69A"  # green
     COLOR_DOWN = "#EF5350"  # red
@@ -58,7 +76,17 @@ class CVDChartWidget(QWidget):
         self._historical_loaded = False
         self._historical_failed = False
         self._last_hist_range = None          # guard: poller can fire before set_instrument()
+        self._history_request_id = 0          # latest background load; older results are dropped
+        self._history_in_flight = False
         self._last_live_refresh_minute: datetime | None = None
+        self._held_token: int | None = None   # token this chart holds in the shared history cache
+
+        # Backward paging: panning past the left edge loads one more session.
+        self._extra_sessions = 0
+        self._history_exhausted = False
+        self._page_anchor_ts = None           # first plotted timestamp when a page was requested
+        self._follow_latest = True            # keep the view on the live edge while not panned away
+        self._live_view_start = 0             # plot index of the default window's first point
 
         # --- Live dot pulse state ---
         self._pulse_size = 6
@@ -69,9 +97,20 @@ class CVDChartWidget(QWidget):
         # Crosshair state
         self.all_timestamps = []
         self.x_offset_map = {}  # session -> x_offset
+
+        # Persistent plot state: items are created once and fed with views of
+        # preallocated buffers; x is simply the global point index.
+        self._x_buf = np.empty(0, dtype=float)
+        self._y_buf = np.empty(0, dtype=float)
+        self._ts_buf = np.empty(0, dtype=np.int64)  # epoch ns, parallel to all_timestamps
+        self._n_points = 0
+        self._current_session_idx = 0
+        self._current_session_start = 0   # plot index of the current session's zero point
+        self._last_plot_ts = None         # timestamp of the last plotted point
         self.crosshair_line = None
         self.crosshair_label = None
         self.external_update = False  # Flag to prevent feedback loop
+        self._pending_crosshair: tuple[int, datetime] | None = None
 
         self.axis = pg.AxisItem(orientation="bottom")
         self._auto_refresh = auto_refresh
@@ -86,8 +125,14 @@ class CVDChartWidget(QWidget):
             self.COLOR_FLAT: pg.mkBrush(self.COLOR_FLAT),
         }
 
+        self._history_signals = HistoryLoadSignals(self)
+        self._history_signals.loaded.connect(self._on_history_loaded)
+        self._history_signals.failed.connect(self._on_history_failed)
+
         self._setup_ui()
         self._setup_crosshair()
+        if self.instrument_token and isinstance(self.instrument_token, int):
+            self._hold_history(self.instrument_token)
         if self._auto_refresh and self.instrument_token and isinstance(self.instrument_token, int):
             self._start_refresh_timer()
 
@@ -163,8 +208,9 @@ class CVDChartWidget(QWidget):
         self.plot = pg.PlotWidget(axisItems={"bottom": self.axis})
         self.plot.setBackground("#161A25")
         self.plot.showGrid(x=True, y=True, alpha=0.15)
-        self.plot.setMouseEnabled(x=False, y=True)
+        self.plot.setMouseEnabled(x=True, y=True)
         self.plot.setMenuEnabled(False)
+        self.plot.getViewBox().sigRangeChangedManually.connect(self._on_view_changed_manually)
 
         zero_pen = pg.mkPen("#8A9BA8", style=Qt.DashLine, width=1)
         self.zero_line = pg.InfiniteLine(0, angle=0, pen=zero_pen)
@@ -182,20 +228,36 @@ class CVDChartWidget(QWidget):
         )
         self.plot.addItem(self.end_dot)
 
+        # Session curves are pooled and reused across redraws and render a
+        # min/max decimation of the visible range; the live curve is the thin
+        # segment from the previous close to the forming minute.
+        self._session_curves: list[DecimatedCurveItem] = []
+        self._live_curve = pg.PlotCurveItem(pen=self._pen_live_segment)
+        self.plot.addItem(self._live_curve)
+
+        self.axis.tickStrings = self._format_time_ticks
+        self.axis.setTickSpacing(major=60, minor=15)
+
         root.addWidget(self.plot)
 
-    def set_instrument(self, token: int, symbol: str):
+    def set_instrument(self, token: int, symbol: str, load: bool = True):
         if not token or not isinstance(token, int):
             return
 
         self.instrument_token = token
         self.symbol = symbol
         self.title_label.setText(f"{symbol} (Rebased)")
+        self._hold_history(token)
 
         # Reset historical state
         self._historical_loaded = False
         self._historical_failed = False
         self._last_hist_range = None
+        self._history_request_id += 1   # drop any load still in flight for the old token
+        self._history_in_flight = False
+        self._reset_paging()
+        self.cvd_df = None
+        self._clear_plot()
 
         # ✅ Start ALL timers (refresh, pulse, blink)
         if self._auto_refresh and (not hasattr(self, "timer") or not self.timer.isActive()):
@@ -205,8 +267,8 @@ class CVDChartWidget(QWidget):
         if hasattr(self, "pulse_timer") and not self.pulse_timer.isActive():
             self.pulse_timer.start(40)
 
-        # Load now (safe)
-        self._load_historical()
+        if load:
+            self._load_historical()
 
     def _setup_crosshair(self):
         """Setup synchronized crosshair."""
@@ -232,6 +294,12 @@ class CVDChartWidget(QWidget):
         # Connect mouse move event
         self.plot.scene().sigMouseMoved.connect(self._on_mouse_moved)
 
+        # Sibling charts are synced at most once per frame, with the latest position.
+        self._crosshair_broadcast_timer = QTimer(self)
+        self._crosshair_broadcast_timer.setSingleShot(True)
+        self._crosshair_broadcast_timer.setInterval(self.CROSSHAIR_BROADCAST_MS)
+        self._crosshair_broadcast_timer.timeout.connect(self._flush_crosshair_broadcast)
+
     # ------------------------------------------------------------------
     # Crosshair Sync
     # ------------------------------------------------------------------
@@ -256,47 +324,53 @@ class CVDChartWidget(QWidget):
                     self.crosshair_line.show()
 
                     self.crosshair_time_label.setText(ts.strftime("%H:%M:%S"))
-                    self.crosshair_moved.emit(idx, ts)
+                    self._pending_crosshair = (idx, ts)
+                    if not self._crosshair_broadcast_timer.isActive():
+                        self._crosshair_broadcast_timer.start()
 
         else:
             self.crosshair_line.hide()
             self.crosshair_time_label.setText("--:--:--")
 
+    def _flush_crosshair_broadcast(self):
+        pending, self._pending_crosshair = self._pending_crosshair, None
+        if pending is not None:
+            self.crosshair_moved.emit(*pending)
+
+    def nearest_index(self, timestamp: datetime) -> int | None:
+        """Binary-search the plotted point closest in time to ``timestamp``."""
+        n = self._n_points
+        if n == 0:
+            return None
+        target = pd.Timestamp(timestamp).value
+        ts = self._ts_buf[:n]
+        i = int(np.searchsorted(ts, target))
+        if i >= n:
+            return n - 1
+        if i > 0 and target - ts[i - 1] <= ts[i] - target:
+            return i - 1
+        return i
+
     def update_crosshair(self, x_pos: float, timestamp: datetime):
         """Update crosshair from external signal."""
-        self.external_update = True
-
-        # Map timestamp to local x coordinate
-        if self.all_timestamps:
-            try:
-                # Find matching timestamp or closest
-                local_idx = None
-                for i, ts in enumerate(self.all_timestamps):
-                    if ts == timestamp:
-                        local_idx = i
-                        break
-
-                if local_idx is None:
-                    # Find closest timestamp
-                    time_diffs = [abs((ts - timestamp).total_seconds())
-                                  for ts in self.all_timestamps]
-                    local_idx = time_diffs.index(min(time_diffs))
-
-                if local_idx is not None:
-                    self.crosshair_line.setPos(local_idx)
-                    self.crosshair_line.show()
-                    self.crosshair_line.setPos(local_idx)
-                    self.crosshair_line.show()
-                    self.crosshair_time_label.setText(timestamp.strftime("%H:%M:%S"))
-
-            except Exception:
-                pass
+        if not self.isVisible():
+            return
 
-        self.external_update = False
+        self.external_update = True
+        try:
+            local_idx = self.nearest_index(timestamp)
+            if local_idx is not None:
+                self.crosshair_line.setPos(local_idx)
+                self.crosshair_line.show()
+                self.crosshair_time_label.setText(timestamp.strftime("%H:%M:%S"))
+        except Exception:
+            pass
+        finally:
+            self.external_update = False
 
     def _update_pulse(self):
         # Do nothing if dot is not visible / no data
-        if not self.end_dot.data:
+        if len(self.end_dot.data) == 0:
             return
 
         if self._pulse_size == self._pulse_target:
@@ -321,12 +395,14 @@ class CVDChartWidget(QWidget):
     def load_historical_dates(self, current_date: datetime, previous_date: datetime):
         """Load data for specific dates (used by navigator)."""
         if not self.instrument_token or not isinstance(self.instrument_token, int):
+            self.history_failed.emit()
             return
 
         today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
 
         self.current_date = current_date
         self.previous_date = previous_date
+        self._reset_paging()
 
         # ✅ Decide mode based on date
         if current_date >= today:
@@ -347,7 +423,14 @@ class CVDChartWidget(QWidget):
             if hasattr(self, "_poller"):
                 self._poller.stop()
 
+        request_id = self._history_request_id
         self._load_historical()
+        if self._history_request_id == request_id:
+            # Nothing was requested: the range is already drawn, or loading is off.
+            if self._historical_loaded and not self._historical_failed:
+                self.history_loaded.emit()
+            else:
+                self.history_failed.emit()
 
     # ------------------------------------------------------------------
     # Historical load
@@ -355,12 +438,13 @@ class CVDChartWidget(QWidget):
 
     def _load_historical(self):
         """
-        Load historical data ONCE per date-range.
+        Load historical data ONCE per date-range, on the history thread pool.
 
         Design rules:
         - Never spam REST API
         - Fail once, then stop retrying
         - Reload ONLY if date range actually changes
+        - Never block the GUI thread; the latest request wins
         - Safe for multi-chart dialogs
         """
 
@@ -375,209 +459,329 @@ class CVDChartWidget(QWidget):
             self._historical_failed = True
             return
 
-        try:
-            # --- Determine date range ---
-            if self.live_mode:
-                to_dt = datetime.now()
-                from_dt = to_dt - timedelta(days=5)
-            else:
-                if not self.current_date or not self.previous_date:
-                    return
-                to_dt = self.current_date + timedelta(days=1)
-                from_dt = self.previous_date
-
-            date_key = (from_dt, to_dt)
-
-            # --- Prevent duplicate reloads ---
-            if self._historical_loaded and self._last_hist_range == date_key:
+        # --- Determine date range ---
+        # Each paged-in session widens the window by two calendar days
+        # (weekends); the minute cache fetches only the added head span.
+        extra = self._extra_sessions
+        if self.live_mode:
+            to_dt = datetime.now()
+            from_dt = to_dt - timedelta(days=5 + 2 * extra)
+            session_dates = None
+        else:
+            if not self.current_date or not self.previous_date:
                 return
+            to_dt = self.current_date + timedelta(days=1)
+            from_dt = self.previous_date - timedelta(days=2 * extra)
+            session_dates = (self.previous_date.date(), self.current_date.date()) if not extra else None
 
-            self._last_hist_range = date_key
+        date_key = (from_dt, to_dt)
 
-            # --- Fetch historical ---
-            hist = self.kite.historical_data(
-                self.instrument_token,
-                from_dt,
-                to_dt,
-                interval="minute"
-            )
+        # --- Prevent duplicate reloads ---
+        if self._historical_loaded and self._last_hist_range == date_key:
+            return
 
-            if not hist:
-                self._historical_failed = True
+        self._last_hist_range = date_key
+
+        self._history_request_id += 1
+        self._history_in_flight = True
+        history_thread_pool().start(HistoryLoadTask(
+            self._history_request_id,
+            self._history_signals,
+            load_cvd_history,
+            self.kite,
+            self.instrument_token,
+            from_dt,
+            to_dt,
+            session_dates,
+            2 + extra,
+        ))
+
+    def _hold_history(self, token: int):
+        """Keep ``token``'s minute history in the shared cache while this chart shows it."""
+        if token == self._held_token:
+            return
+        self.release_history()
+        history_cache().acquire(token)
+        self._held_token = token
+
+    def release_history(self):
+        """Drop this chart's hold on the shared history cache (owners call on close)."""
+        if self._held_token is not None:
+            history_cache().release(self._held_token)
+            self._held_token = None
+
+    def _on_history_loaded(self, request_id: int, result):
+        if request_id != self._history_request_id:
+            return  # superseded by a newer request / instrument change
+        self._history_in_flight = False
+
+        if not result:
+            if self._page_anchor_ts is not None:
+                self._end_paging()
                 return
+            self._historical_failed = True
+            self.history_failed.emit()
+            return
 
-            # --- Build dataframe ---
-            df = pd.DataFrame(hist)
-            df["date"] = pd.to_datetime(df["date"])
-            df.set_index("date", inplace=True)
-
-            cvd_df = CVDHistoricalBuilder.build_cvd_ohlc(df)
-            cvd_df["session"] = cvd_df.index.date
+        if self._page_anchor_ts is not None and result["cvd_df"].index[0] >= self._page_anchor_ts:
+            self._end_paging()   # nothing older exists (or is served) for this token
+            return
 
-            # --- Filter sessions ---
-            if self.live_mode:
-                sessions = sorted(cvd_df["session"].unique())[-2:]
-            else:
-                target_dates = {
-                    self.previous_date.date(),
-                    self.current_date.date()
-                }
-                sessions = [
-                    d for d in sorted(cvd_df["session"].unique())
-                    if d in target_dates
-                ]
-
-            cvd_df = cvd_df[cvd_df["session"].isin(sessions)]
-
-            # --- Previous day close ---
-            if len(sessions) >= 2:
-                prev_data = cvd_df[cvd_df["session"] == sessions[0]]
-                self.prev_day_close_cvd = (
-                    prev_data["close"].iloc[-1]
-                    if not prev_data.empty else 0.0
-                )
-            else:
-                self.prev_day_close_cvd = 0.0
+        try:
+            self.prev_day_close_cvd = result["prev_day_close_cvd"]
 
             # --- Commit ---
-            self.cvd_df = cvd_df
+            self.cvd_df = result["cvd_df"]
             self._historical_loaded = True
             self._plot()
-
-        except Exception as e:
+            self.history_loaded.emit()
+        except Exception:
             self._historical_failed = True
-            import logging
-            logging.getLogger(__name__).exception(
+            logger.exception(
                 f"CVD historical failed once for {self.symbol}. Disabling retries."
             )
+            self.history_failed.emit()
+
+    def _on_history_failed(self, request_id: int, message: str):
+        if request_id != self._history_request_id:
+            return
+        self._history_in_flight = False
+        if self._page_anchor_ts is not None:
+            self._end_paging()
+            logger.warning(f"CVD older history unavailable for {self.symbol}: {message}")
+            return
+        self._historical_failed = True
+        logger.error(
+            f"CVD historical failed once for {self.symbol}: {message}. Disabling retries."
+        )
+        self.history_failed.emit()
 
     # ------------------------------------------------------------------
-    # Plotting + Momentum Dot
+    # Backward paging
     # ------------------------------------------------------------------
 
-    def _plot(self):
-        if self.cvd_df is None or self.cvd_df.empty:
+    def _reset_paging(self):
+        self._extra_sessions = 0
+        self._history_exhausted = False
+        self._page_anchor_ts = None
+        self._follow_latest = True
+
+    def _end_paging(self):
+        """Undo the pending page request and stop paging further back."""
+        self._extra_sessions -= 1
+        self._page_anchor_ts = None
+        self._history_exhausted = True
+
+    def _on_view_changed_manually(self, *_):
+        (x0, x1), _ = self.plot.getViewBox().viewRange()
+        self._follow_latest = x1 >= self._n_points - 1
+        if x0 <= 0:
+            self._request_older_session()
+
+    def _request_older_session(self):
+        if (
+            self._history_in_flight
+            or self._history_exhausted
+            or self._extra_sessions >= self.MAX_PAGED_SESSIONS
+            or not self.all_timestamps
+            or not isinstance(self.instrument_token, int)
+        ):
             return
+        self._extra_sessions += 1
+        self._page_anchor_ts = self.all_timestamps[0]
+        self._load_historical()
 
-        self.plot.clear()
-        self.plot.addItem(self.zero_line)
-        self.plot.addItem(self.end_dot)
-        self.plot.addItem(self.crosshair_line)
-
-        sessions = sorted(self.cvd_df["session"].unique())
-        self.all_timestamps = []
-        self.x_offset_map = {}
-
-        x_offset = 0
-        last_two_y = []
-        last_x = None
-        last_y = None
+    def _apply_x_view(self, n: int):
+        anchor, self._page_anchor_ts = self._page_anchor_ts, None
+        if anchor is not None:
+            # Keep the panned view on the same bars now that older ones sit in front.
+            shift = self.nearest_index(anchor) or 0
+            (x0, x1), _ = self.plot.getViewBox().viewRange()
+            self.plot.setXRange(x0 + shift, x1 + shift, padding=0)
+        elif self._follow_latest:
+            self.plot.setXRange(self._live_view_start, n, padding=0.02)
 
-        for i, sess in enumerate(sessions):
-            df_sess = self.cvd_df[self.cvd_df["session"] == sess]
-            y_raw = df_sess["close"].values
+    # ------------------------------------------------------------------
+    # Plotting + Momentum Dot
+    # ------------------------------------------------------------------
 
-            # Rebasing logic
-            if self.rebased_mode and i == 0 and len(sessions) == 2:
-                y = y_raw - self.prev_day_close_cvd
+    def _format_time_ticks(self, values, *_):
+        out = []
+        for v in values:
+            idx = int(v)
+            if 0 <= idx < len(self.all_timestamps):
+                out.append(self.all_timestamps[idx].strftime("%H:%M"))
             else:
-                y = y_raw
-
-            # Prepend zero point for current session (fills gap from zero line)
-            is_current_session = (i == len(sessions) - 1)
-            if is_current_session:
-                import numpy as np
-                y = np.insert(y, 0, 0.0)
-                first_ts = df_sess.index[0]
-                self.all_timestamps.append(first_ts)
-
-            # Store timestamps
-            if not is_current_session:
-                self.all_timestamps.extend(df_sess.index.tolist())
-            else:
-                self.all_timestamps.extend(df_sess.index.tolist())
+                out.append("")
+        return out
 
-            self.x_offset_map[sess] = x_offset
+    def _ensure_capacity(self, n: int):
+        if n <= len(self._y_buf):
+            return
+        capacity = max(512, 2 * n)
+        y_buf = np.empty(capacity, dtype=float)
+        y_buf[:self._n_points] = self._y_buf[:self._n_points]
+        ts_buf = np.empty(capacity, dtype=np.int64)
+        ts_buf[:self._n_points] = self._ts_buf[:self._n_points]
+        self._y_buf = y_buf
+        self._ts_buf = ts_buf
+        self._x_buf = np.arange(capacity, dtype=float)
+
+    def _session_curve(self, i: int) -> DecimatedCurveItem:
+        while len(self._session_curves) <= i:
+            curve = DecimatedCurveItem()
+            self.plot.addItem(curve)
+            self._session_curves.append(curve)
+        return self._session_curves[i]
+
+    def _clear_plot(self):
+        for curve in self._session_curves:
+            curve.setData([], [])
+        self._live_curve.setData([], [])
+        self.end_dot.clear()
+        self.all_timestamps = []
+        self.x_offset_map = {}
+        self._n_points = 0
+        self._last_plot_ts = None
+        self._last_slope = None
 
-            x = list(range(x_offset, x_offset + len(y)))
+    def _plot(self):
+        """Rebuild plot buffers from ``cvd_df`` and push them into the persistent items."""
+        if self.cvd_df is None or self.cvd_df.empty:
+            return
 
-            # Styling: previous day dimmed, current day bright
-            pen = (
-                self._pen_prev_session
-                if i == 0 and len(sessions) == 2
-                else self._pen_current_session
-            )
+        close = self.cvd_df["close"].to_numpy(dtype=float)
+        session_values = self.cvd_df["session"].to_numpy()
+        index = self.cvd_df.index
+
+        starts = [0, *(np.flatnonzero(session_values[1:] != session_values[:-1]) + 1).tolist()]
+        ends = starts[1:] + [len(close)]
+        n_sessions = len(starts)
+
+        # Current session gets a leading zero point (fills gap from zero line).
+        n = len(close) + 1
+        self._ensure_capacity(n)
+        y = self._y_buf
+        cur_start = starts[-1]
+
+        y[:cur_start] = close[:cur_start]
+        if self.rebased_mode and n_sessions >= 2:
+            # The previous session ends at zero; paged-in older sessions are
+            # rebased on their own close the same way.
+            y[starts[-2]:cur_start] -= self.prev_day_close_cvd
+            for a, b in zip(starts[:-2], ends[:-2]):
+                y[a:b] -= close[b - 1]
+        y[cur_start] = 0.0
+        y[cur_start + 1:n] = close[cur_start:]
+
+        timestamps = index.tolist()
+        timestamps.insert(cur_start, timestamps[cur_start])
+        self.all_timestamps = timestamps
+        ts_ns = index.as_unit("ns").asi8
+        self._ts_buf[:cur_start + 1] = ts_ns[:cur_start + 1]
+        self._ts_buf[cur_start + 1:n] = ts_ns[cur_start:]
 
-            # Keep live minute simple: one thin segment from previous close
-            # to the latest tick of current minute (no intra-minute trail).
-            is_live_current_session = (
-                is_current_session and self.live_mode and len(y) >= 2
-            )
+        self.x_offset_map = {}
+        for i, (a, b) in enumerate(zip(starts, ends)):
+            sess = session_values[a]
+            is_current = i == n_sessions - 1
+            p0 = a
+            p1 = b + 1 if is_current else b
+            self.x_offset_map[sess] = p0
+
+            curve = self._session_curve(i)
+            curve.setPen(self._pen_current_session if is_current else self._pen_prev_session)
+            if not is_current:
+                curve.setData(self._x_buf[p0:p1], y[p0:p1])
+
+        for curve in self._session_curves[n_sessions:]:
+            curve.setData([], [])
+
+        self._n_points = n
+        self._current_session_idx = n_sessions - 1
+        self._current_session_start = cur_start
+        self._live_view_start = starts[-2] if n_sessions >= 2 else 0
+        self._last_plot_ts = index[-1]
+        self._render_current_session()
+        self._update_end_dot()
 
-            if is_live_current_session:
-                self.plot.addItem(pg.PlotCurveItem(x[:-1], y[:-1], pen=pen))
-                self.plot.addItem(
-                    pg.PlotCurveItem([x[-2], x[-1]], [y[-2], y[-1]], pen=self._pen_live_segment)
-                )
-            else:
-                self.plot.addItem(pg.PlotCurveItem(x, y, pen=pen))
+        self.plot.enableAutoRange(axis=pg.ViewBox.YAxis)
+        self._apply_x_view(n)
+
+    def _render_current_session(self):
+        """Push the current session (and live segment) buffers into their curves."""
+        a, n = self._current_session_start, self._n_points
+        curve = self._session_curves[self._current_session_idx]
+
+        # Keep live minute simple: one thin segment from previous close
+        # to the latest tick of current minute (no intra-minute trail).
+        if self.live_mode and n - a >= 2:
+            curve.setData(self._x_buf[a:n - 1], self._y_buf[a:n - 1])
+            self._live_curve.setData(self._x_buf[n - 2:n], self._y_buf[n - 2:n])
+        else:
+            curve.setData(self._x_buf[a:n], self._y_buf[a:n])
+            self._live_curve.setData([], [])
 
-            if i == len(sessions) - 1 and len(y) >= 2:
-                last_two_y = y[-2:].tolist()
-                last_x = x[-1]
-                last_y = y[-1]
+    def _update_end_dot(self):
+        n = self._n_points
+        if n - self._current_session_start < 2:
+            self.end_dot.clear()
+            return
 
-            x_offset += len(y)
+        prev_y, curr_y = float(self._y_buf[n - 2]), float(self._y_buf[n - 1])
+        slope = curr_y - prev_y
 
-        # --- Momentum-based dot color ---
-        if len(last_two_y) == 2 and last_x is not None:
-            prev_y, curr_y = last_two_y
-            slope = curr_y - prev_y
+        # Momentum color
+        if slope > 0:
+            color = self.COLOR_UP
+        elif slope < 0:
+            color = self.COLOR_DOWN
+        else:
+            color = self.COLOR_FLAT
 
-            # Momentum color
-            if slope > 0:
-                color = self.COLOR_UP
-            elif slope < 0:
-                color = self.COLOR_DOWN
-            else:
-                color = self.COLOR_FLAT
+        self.end_dot.setBrush(self._dot_brushes.get(color, self._dot_brushes[self.COLOR_FLAT]))
+        self.end_dot.setData([n - 1], [curr_y])
 
-            self.end_dot.setBrush(self._dot_brushes.get(color, self._dot_brushes[self.COLOR_FLAT]))
-            self.end_dot.setData([last_x], [last_y])
+        # --- Institutional pulse trigger ---
+        if self._last_slope is not None:
 
-            # --- Pulse trigger ---
-            # --- Institutional pulse trigger ---
-            if self._last_slope is not None:
+            slope_flip = (slope > 0 > self._last_slope) or (slope < 0 < self._last_slope)
 
-                slope_flip = (slope > 0 > self._last_slope) or (slope < 0 < self._last_slope)
+            acceleration = abs(slope) > abs(self._last_slope) * 2.0
 
-                acceleration = abs(slope) > abs(self._last_slope) * 2.0
+            if slope_flip or acceleration:
+                self._pulse_size = 14  # instant expansion
+                self._pulse_target = 6  # decay back
+                self._pulse_velocity = 0
 
-                if slope_flip or acceleration:
-                    self._pulse_size = 14  # instant expansion
-                    self._pulse_target = 6  # decay back
-                    self._pulse_velocity = 0
+        self._last_slope = slope
 
-            self._last_slope = slope
-        else:
-            self.end_dot.clear()
+    def _apply_live_point(self, ts: datetime, cvd: float) -> bool:
+        """Fast path for live ticks: touch only the forming (or one new) point.
 
-        # --- Time axis formatter ---
-        def time_formatter(values, *_):
-            out = []
-            for v in values:
-                idx = int(v)
-                if 0 <= idx < len(self.all_timestamps):
-                    out.append(self.all_timestamps[idx].strftime("%H:%M"))
-                else:
-                    out.append("")
-            return out
+        Returns False when the tick does not continue the plotted current
+        session and a full rebuild is required.
+        """
+        if self._n_points == 0 or self._last_plot_ts is None:
+            return False
 
-        self.axis.tickStrings = time_formatter
-        self.axis.setTickSpacing(major=60, minor=15)
+        if ts == self._last_plot_ts:
+            self._y_buf[self._n_points - 1] = cvd
+        elif ts > self._last_plot_ts and ts.date() == self._last_plot_ts.date():
+            self._ensure_capacity(self._n_points + 1)
+            self._y_buf[self._n_points] = cvd
+            self._ts_buf[self._n_points] = ts.value
+            self._n_points += 1
+            self._last_plot_ts = ts
+            self.all_timestamps.append(ts)
+            if self._follow_latest:
+                self.plot.setXRange(self._live_view_start, self._n_points, padding=0.02)
+        else:
+            return False
 
-        self.plot.enableAutoRange(axis=pg.ViewBox.YAxis)
-        self.plot.setXRange(0, x_offset, padding=0.02)
+        self._render_current_session()
+        self._update_end_dot()
+        return True
 
     # ------------------------------------------------------------------
     # Timer
@@ -610,6 +814,8 @@ class CVDChartWidget(QWidget):
             and current_minute <= self._last_live_refresh_minute
         ):
             return
+        if self._history_in_flight:
+            return
 
         self._last_live_refresh_minute = current_minute
         self._load_historical()
@@ -624,7 +830,7 @@ class CVDChartWidget(QWidget):
 
     def refresh_if_live(self, force: bool = False):
         """External refresh hook (used by shared timers / date nav)."""
-        if not self.live_mode:
+        if not self.live_mode or self._history_in_flight:
             return
         if force or self._is_refresh_allowed():
             self._load_historical()
@@ -636,8 +842,12 @@ class CVDChartWidget(QWidget):
         if self.cvd_df is None or self.cvd_df.empty:
             return
 
-        ts = (timestamp or datetime.now()).replace(second=0, microsecond=0)
+        ts = pd.Timestamp((timestamp or datetime.now()).replace(second=0, microsecond=0))
         cvd = float(cvd_value)
+        last_ts = self.cvd_df.index[-1]
+        # Kite history is tz-aware; keep live minutes comparable with it.
+        if last_ts.tzinfo is not None and ts.tzinfo is None:
+            ts = ts.tz_localize(last_ts.tzinfo)
 
         if ts in self.cvd_df.index:
             row = self.cvd_df.loc[ts]
@@ -653,13 +863,17 @@ class CVDChartWidget(QWidget):
                 cvd,
                 ts.date(),
             ]
-            self.cvd_df.sort_index(inplace=True)
+            if ts < last_ts:
+                self.cvd_df.sort_index(inplace=True)
 
-            sessions = sorted(self.cvd_df["session"].unique())
-            if len(sessions) > 2:
-                self.cvd_df = self.cvd_df[self.cvd_df["session"].isin(sessions[-2:])]
+            if ts.date() != last_ts.date():
+                sessions = sorted(self.cvd_df["session"].unique())
+                keep = 2 + self._extra_sessions
+                if len(sessions) > keep:
+                    self.cvd_df = self.cvd_df[self.cvd_df["session"].isin(sessions[-keep:])]
 
-        self._plot()
+        if not self._apply_live_point(ts, cvd):
+            self._plot()
 
     def stop_updates(self):
         if hasattr(self, "_poller"):
@@ -696,4 +910,5 @@ class CVDChartWidget(QWidget):
 
     def closeEvent(self, event):
         self.stop_updates()
+        self.release_history()
         super().closeEvent(event)
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 from PySide6.QtCore import QObject, Signal
 from core.cvd.cvd_state import CVDState
@@ -95,7 +95,8 @@ class CVDEngine(QObject):
             return  # Only process registered tokens
 
         # Session management
-        today = datetime.now().date()
+        now = datetime.now()
+        today = now.date()
 
         # NORMAL → reset only on date change
         if self.mode == CVDMode.NORMAL:
@@ -128,6 +129,7 @@ class CVDEngine(QObject):
             volume_delta = int(last_qty)
 
         # Update CVD if volume increased
+        cvd_before = state.cvd
         if volume_delta > 0:
             if price >= state.last_price:
                 state.cvd += volume_delta
@@ -149,6 +151,7 @@ class CVDEngine(QObject):
         state.last_price = price
         if volume is not None:
             state.last_volume = volume
+        state.record_bar(int(now.timestamp()) // 60, cvd_before)
 
         # Emit latest point even when CVD is unchanged so price can update live.
         self.cvd_updated.emit(token, state.cvd, float(price))
@@ -165,6 +168,82 @@ class CVDEngine(QObject):
             for token, state in self._states.items()
         }
 
+    # ------------------------------------------------------------------
+    # Warm-start checkpoint
+    # ------------------------------------------------------------------
+
+    def export_state(self) -> list[dict]:
+        """JSON-ready copy of every tracked token's state (see CVDCheckpointer)."""
+        return [state.to_dict() for state in self._states.values()]
+
+    def restore_state(
+        self,
+        states: Iterable[dict],
+        session_day: date,
+        resume_minute: int,
+    ) -> Dict[int, Optional[int]]:
+        """Restore checkpointed states recorded for ``session_day``.
+
+        Tokens already tracked since start-up keep their live state.  A state
+        whose last bar is older than ``resume_minute`` (epoch minute) lost
+        ticks while the app was down, so its cumulative-volume baseline is
+        dropped and re-established by the next tick, as after seeding.
+
+        Returns token -> epoch minute of its last recorded bar (None if none).
+        """
+        restored: Dict[int, Optional[int]] = {}
+        for data in states:
+            try:
+                state = CVDState.from_dict(data)
+            except (KeyError, TypeError, ValueError):
+                logger.warning("[CVD] Skipping malformed checkpoint entry: %r", data)
+                continue
+            token = state.instrument_token
+            if state.session_date != session_day or token in self._states:
+                continue
+            last_minute = state.minute_bars[-1][0] if state.minute_bars else None
+            if last_minute is None or last_minute < resume_minute:
+                state.last_volume = None
+            self._states[token] = state
+            restored[token] = last_minute
+        if restored:
+            logger.info(f"[CVD] Restored {len(restored)} token(s) from checkpoint")
+        return restored
+
+    def apply_gap_bars(self, token: int, gap: Iterable[Tuple[int, float]]):
+        """Splice CVD deltas for minutes missed while the app was down.
+
+        ``gap`` is (epoch_minute, delta) for completed minutes, in order; live
+        bars recorded after them are shifted by the gap total.
+        """
+        state = self._states.get(token)
+        gap = list(gap)
+        if state is None or not gap:
+            return
+
+        bars = state.minute_bars
+        first = gap[0][0]
+        split = next((i for i, bar in enumerate(bars) if bar[0] >= first), len(bars))
+        before, after = bars[:split], bars[split:]
+        running = before[-1][4] if before else 0.0
+
+        spliced = []
+        for minute, delta in gap:
+            close = running + delta
+            spliced.append([minute, running, max(running, close), min(running, close), close])
+            running = close
+        total = sum(delta for _, delta in gap)
+        for bar in after:
+            bar[1] += total
+            bar[2] += total
+            bar[3] += total
+            bar[4] += total
+
+        state.minute_bars = before + spliced + after
+        state.cvd += total
+        if state.last_price is not None:
+            self.cvd_updated.emit(token, state.cvd, float(state.last_price))
+
     def subscribe_instruments(self, tokens: Iterable[int]) -> bool:
         """Compatibility helper used by some UI flows.
 
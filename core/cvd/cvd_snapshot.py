@@ -0,0 +1,157 @@
+# core/cvd/cvd_snapshot.py
+"""
+Warm-start checkpoints for `CVDEngine`.
+
+The engine's per-token state (session CVD, last price, last cumulative
+volume, intraday CVD minute bars) is written to disk every minute and on
+shutdown.  A restart on the same trading day restores it and fetches only
+the minutes that were missed while the app was down, instead of re-seeding
+every symbol from a full REST history.
+
+Gap minutes are converted to CVD with the same candle-direction rule as
+`CVDHistoricalBuilder` (close > open → +volume, close < open → −volume).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QTimer
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "cvd_engine_snapshot.json"
+SNAPSHOT_VERSION = 1
+CHECKPOINT_INTERVAL_MS = 60_000
+
+
+def write_snapshot(path: Path, states: list[dict], saved_at: datetime):
+    """Atomically replace ``path`` with a checkpoint of ``states``."""
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "saved_at": saved_at.isoformat(),
+        "states": states,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(payload, f)
+    os.replace(tmp, path)
+
+
+def read_snapshot(path: Path) -> dict | None:
+    """Checkpoint payload, or None when missing, unreadable or another version."""
+    try:
+        with open(path, "r") as f:
+            payload = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"[CVD] Ignoring unreadable checkpoint {path}: {e}")
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != SNAPSHOT_VERSION:
+        return None
+    return payload
+
+
+def gap_deltas(rows: list[dict], after_minute: int | None, before_minute: int) -> list[tuple[int, float]]:
+    """(epoch_minute, CVD delta) for minute candles strictly between the two minutes."""
+    gap = []
+    for row in rows:
+        minute = int(row["date"].timestamp()) // 60
+        if (after_minute is not None and minute <= after_minute) or minute >= before_minute:
+            continue
+        if row["close"] > row["open"]:
+            delta = float(row["volume"])
+        elif row["close"] < row["open"]:
+            delta = -float(row["volume"])
+        else:
+            delta = 0.0
+        gap.append((minute, delta))
+    gap.sort()
+    return gap
+
+
+class CVDCheckpointer(QObject):
+    """Periodically checkpoints a `CVDEngine` and restores it on start-up."""
+
+    def __init__(self, engine, path: Path, kite=None, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.path = Path(path)
+        self.kite = kite
+        self._resume_minute: int | None = None
+        self._gap_from: dict[int, int | None] = {}   # request id (token) -> last restored minute
+        self._gap_signals = None
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.save)
+
+    def start(self, interval_ms: int = CHECKPOINT_INTERVAL_MS):
+        self._timer.start(interval_ms)
+
+    def stop(self):
+        self._timer.stop()
+
+    def save(self) -> bool:
+        try:
+            write_snapshot(self.path, self.engine.export_state(), datetime.now())
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"[CVD] Checkpoint failed: {e}")
+            return False
+
+    def restore(self, now: datetime | None = None) -> list[int]:
+        """Restore today's checkpoint and start background gap fills; returns tokens."""
+        payload = read_snapshot(self.path)
+        if not payload:
+            return []
+
+        now = now or datetime.now()
+        resume_minute = int(now.timestamp()) // 60
+        restored = self.engine.restore_state(payload.get("states", []), now.date(), resume_minute)
+
+        gaps = {t: m for t, m in restored.items() if m is None or m < resume_minute - 1}
+        if gaps and self.kite is not None:
+            self._fill_gaps(gaps, resume_minute, now)
+        return list(restored)
+
+    def _fill_gaps(self, gaps: dict[int, int | None], resume_minute: int, now: datetime):
+        from core.cvd.history_loader import (
+            HistoryLoadSignals,
+            HistoryLoadTask,
+            fetch_minute_history,
+            history_thread_pool,
+        )
+
+        if self._gap_signals is None:
+            self._gap_signals = HistoryLoadSignals(self)
+            self._gap_signals.loaded.connect(self._on_gap_loaded)
+            self._gap_signals.failed.connect(self._on_gap_failed)
+
+        self._resume_minute = resume_minute
+        session_open = now.replace(hour=9, minute=15, second=0, microsecond=0)
+        for token, last_minute in gaps.items():
+            from_dt = session_open
+            if last_minute is not None:
+                from_dt = max(from_dt, datetime.fromtimestamp(last_minute * 60))
+            if from_dt >= now:
+                continue
+            self._gap_from[token] = last_minute
+            history_thread_pool().start(HistoryLoadTask(
+                token, self._gap_signals, fetch_minute_history, self.kite, token, from_dt, now,
+            ))
+
+    def _on_gap_loaded(self, token: int, rows):
+        after_minute = self._gap_from.pop(token, None)
+        gap = gap_deltas(rows or [], after_minute, self._resume_minute)
+        self.engine.apply_gap_bars(token, gap)
+        logger.info(f"[CVD] Warm start: token {token} filled {len(gap)} missed minute(s)")
+
+    def _on_gap_failed(self, token: int, message: str):
+        self._gap_from.pop(token, None)
+        logger.warning(f"[CVD] Warm start gap fetch failed for token {token}: {message}")
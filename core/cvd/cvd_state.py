@@ -1,6 +1,6 @@
 # core/cvd/cvd_state.py
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Optional
 
@@ -17,10 +17,54 @@ class CVDState:
     last_price: float | None = None
     last_volume: int | None = None
     session_date: date | None = None
+    # Intraday CVD minute bars: [epoch_minute, open, high, low, close]
+    minute_bars: list = field(default_factory=list)
 
     def reset_session(self, new_date: date):
         """Reset CVD at the start of a new session."""
         self.cvd = 0.0
         self.session_date = new_date
         self.last_price = None
-        self.last_volume = None
\ No newline at end of file
+        self.last_volume = None
+        self.minute_bars = []
+
+    def record_bar(self, epoch_minute: int, cvd_before: float):
+        """Fold the current CVD into the minute bar for ``epoch_minute``."""
+        bars = self.minute_bars
+        if bars and bars[-1][0] == epoch_minute:
+            bar = bars[-1]
+            bar[2] = max(bar[2], self.cvd)
+            bar[3] = min(bar[3], self.cvd)
+            bar[4] = self.cvd
+            return
+        if bars and bars[-1][0] > epoch_minute:
+            return   # clock stepped back; keep bars monotonic
+        open_ = bars[-1][4] if bars else cvd_before
+        bars.append([epoch_minute, open_, max(open_, self.cvd), min(open_, self.cvd), self.cvd])
+
+    def to_dict(self) -> dict:
+        return {
+            "instrument_token": self.instrument_token,
+            "cvd": self.cvd,
+            "last_price": self.last_price,
+            "last_volume": self.last_volume,
+            "session_date": self.session_date.isoformat() if self.session_date else None,
+            "minute_bars": [list(bar) for bar in self.minute_bars],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CVDState":
+        session_date: Optional[date] = None
+        if data.get("session_date"):
+            session_date = date.fromisoformat(data["session_date"])
+        return cls(
+            instrument_token=int(data["instrument_token"]),
+            cvd=float(data.get("cvd", 0.0)),
+            last_price=data.get("last_price"),
+            last_volume=data.get("last_volume"),
+            session_date=session_date,
+            minute_bars=[
+                [int(bar[0]), *(float(v) for v in bar[1:5])]
+                for bar in data.get("minute_bars", [])
+            ],
+        )
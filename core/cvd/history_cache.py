@@ -0,0 +1,257 @@
+# core/cvd/history_cache.py
+"""
+Shared, reference-counted minute history per instrument token.
+
+Every chart that shows a token (CVD charts, multi-chart grids, symbol sets,
+Price/CVD dialogs, the market monitor) reads its minute OHLCV — and the CVD
+candles derived from it — through one cache entry, so NIFTY futures open in
+three places are fetched, transformed and held once.
+
+Views `acquire` a token while they display it and `release` it when they stop;
+the entry is dropped when the last holder releases.  Reads for a range the
+entry already covers are served from memory; otherwise only the missing span
+is fetched (for live charts: just the tail since the last cached bar, which
+also refreshes the still-forming minute).  Tokens nobody holds are fetched
+and returned without being cached.
+
+Higher timeframes come from a per-entry `BarPyramid` for price and for CVD,
+fed with only the minutes that changed, so switching timeframe is a read.
+
+Frames handed out are fresh slices; treat them as read-only snapshots.
+
+Thread-safe — loads run on the history pool.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable
+
+import pandas as pd
+
+from core.cvd.bar_pyramid import DAILY, BarPyramid
+
+logger = logging.getLogger(__name__)
+
+# fetch(token, from_dt, to_dt) -> list of Kite historical rows
+FetchFn = Callable[[int, datetime, datetime], list]
+
+SESSION_OPEN_MINUTE = 9 * 60 + 15    # NSE session open, 09:15
+PYRAMID_TIMEFRAMES = (3, 5, 10, 15, 30, 60, DAILY)
+
+
+@dataclass
+class _Entry:
+    refs: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    bars: pd.DataFrame = field(default_factory=pd.DataFrame)
+    covered_from: datetime | None = None
+    covered_to: datetime | None = None
+    cvd: pd.DataFrame | None = None      # derived from `bars`, rebuilt on change
+    # Higher timeframes, keyed by "price" / "cvd"; dropped when history is revised
+    # anywhere but the tail.
+    pyramids: dict = field(default_factory=dict)
+
+
+def _rows_to_frame(rows: list) -> pd.DataFrame:
+    if not rows:
+        return pd.DataFrame()
+    df = pd.DataFrame(rows)
+    df["date"] = pd.to_datetime(df["date"])
+    df.set_index("date", inplace=True)
+    return df
+
+
+def _naive(ts: pd.Timestamp) -> datetime:
+    return (ts.tz_localize(None) if ts.tzinfo is not None else ts).to_pydatetime()
+
+
+def _slice(df: pd.DataFrame, from_dt: datetime, to_dt: datetime) -> pd.DataFrame:
+    """Rows with from_dt <= index <= to_dt (naive bounds, matched to the index tz)."""
+    if df.empty:
+        return df.copy()
+    start, end = pd.Timestamp(from_dt), pd.Timestamp(to_dt)
+    tz = df.index.tz
+    if tz is not None:
+        start = start.tz_localize(tz) if start.tzinfo is None else start.tz_convert(tz)
+        end = end.tz_localize(tz) if end.tzinfo is None else end.tz_convert(tz)
+    return df[(df.index >= start) & (df.index <= end)]
+
+
+def _build_cvd(bars: pd.DataFrame) -> pd.DataFrame:
+    from core.cvd.cvd_historical import CVDHistoricalBuilder
+
+    return CVDHistoricalBuilder.build_cvd_ohlc(bars)
+
+
+class MinuteHistoryCache:
+    """Per-token minute OHLCV + derived CVD candles, shared by every open view."""
+
+    def __init__(self):
+        self._entries: dict[int, _Entry] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Reference counting
+    # ------------------------------------------------------------------
+
+    def acquire(self, token: int):
+        """Register interest in ``token``; its history stays cached until released."""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                entry = self._entries[token] = _Entry()
+            entry.refs += 1
+
+    def release(self, token: int):
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return
+            entry.refs -= 1
+            if entry.refs <= 0:
+                del self._entries[token]
+
+    def refcount(self, token: int) -> int:
+        with self._lock:
+            entry = self._entries.get(token)
+            return entry.refs if entry else 0
+
+    def __contains__(self, token: int) -> bool:
+        with self._lock:
+            return token in self._entries
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def minute_bars(self, token: int, from_dt: datetime, to_dt: datetime, fetch: FetchFn) -> pd.DataFrame:
+        """Minute OHLCV for [from_dt, to_dt], fetching only what the cache lacks."""
+        entry = self._entry(token)
+        if entry is None:
+            return _rows_to_frame(fetch(token, from_dt, to_dt))
+        with entry.lock:
+            self._fill(entry, token, from_dt, to_dt, fetch)
+            return _slice(entry.bars, from_dt, to_dt)
+
+    def cvd_bars(self, token: int, from_dt: datetime, to_dt: datetime, fetch: FetchFn) -> pd.DataFrame:
+        """Session-anchored CVD candles for [from_dt, to_dt] (see CVDHistoricalBuilder)."""
+        entry = self._entry(token)
+        if entry is None:
+            return _build_cvd(_rows_to_frame(fetch(token, from_dt, to_dt)))
+        with entry.lock:
+            self._fill(entry, token, from_dt, to_dt, fetch)
+            if entry.cvd is None:
+                entry.cvd = _build_cvd(entry.bars)
+            return _slice(entry.cvd, from_dt, to_dt)
+
+    def timeframe_bars(
+        self,
+        token: int,
+        from_dt: datetime,
+        to_dt: datetime,
+        fetch: FetchFn,
+        minutes: int,
+        cvd: bool = False,
+    ) -> pd.DataFrame:
+        """Price (or CVD) bars at ``minutes`` for [from_dt, to_dt] from the entry's pyramid."""
+        if minutes <= 1:
+            return (self.cvd_bars if cvd else self.minute_bars)(token, from_dt, to_dt, fetch)
+        entry = self._entry(token)
+        if entry is None or minutes not in PYRAMID_TIMEFRAMES:
+            source = (self.cvd_bars if cvd else self.minute_bars)(token, from_dt, to_dt, fetch)
+            return resample_minute_bars(source, minutes)
+        with entry.lock:
+            self._fill(entry, token, from_dt, to_dt, fetch)
+            if cvd and entry.cvd is None:
+                entry.cvd = _build_cvd(entry.bars)
+            pyramid = self._sync_pyramid(entry, "cvd" if cvd else "price", entry.cvd if cvd else entry.bars)
+            out = pyramid.frame(minutes)
+            if cvd:
+                out = out.drop(columns="volume")
+            return _slice(out, from_dt, to_dt)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _entry(self, token: int) -> _Entry | None:
+        with self._lock:
+            return self._entries.get(token)
+
+    @staticmethod
+    def _gaps(entry: _Entry, from_dt: datetime, to_dt: datetime) -> list[tuple[datetime, datetime]]:
+        if entry.covered_from is None:
+            return [(from_dt, to_dt)]
+        gaps = []
+        if from_dt < entry.covered_from:
+            gaps.append((from_dt, entry.covered_from))
+        if to_dt > entry.covered_to:
+            start = entry.covered_to
+            if not entry.bars.empty:
+                # Re-read from the last cached bar: it may have been the forming minute.
+                last_bar = _naive(entry.bars.index[-1])
+                if entry.covered_from <= last_bar < start:
+                    start = last_bar
+            gaps.append((start, to_dt))
+        return gaps
+
+    @staticmethod
+    def _sync_pyramid(entry: _Entry, kind: str, source: pd.DataFrame) -> BarPyramid:
+        """Bring the entry's pyramid up to date by feeding only the changed tail."""
+        pyramid = entry.pyramids.get(kind)
+        if pyramid is None:
+            pyramid = entry.pyramids[kind] = BarPyramid(PYRAMID_TIMEFRAMES)
+            pyramid.load(source)
+        elif len(pyramid) and not source.empty:
+            pyramid.extend(source[source.index >= pyramid.last_timestamp])
+        else:
+            pyramid.load(source)
+        return pyramid
+
+    def _fill(self, entry: _Entry, token: int, from_dt: datetime, to_dt: datetime, fetch: FetchFn):
+        gaps = self._gaps(entry, from_dt, to_dt)
+        if not gaps:
+            return
+        chunks = [_rows_to_frame(fetch(token, start, end)) for start, end in gaps]
+        chunks = [c for c in chunks if not c.empty]
+        if chunks:
+            if not entry.bars.empty and min(c.index[0] for c in chunks) < entry.bars.index[-1]:
+                entry.pyramids.clear()   # history revised before the tail: rebuild on next read
+            bars = pd.concat([entry.bars, *chunks]) if not entry.bars.empty else pd.concat(chunks)
+            bars = bars[~bars.index.duplicated(keep="last")].sort_index()
+            entry.bars = bars
+            entry.cvd = None
+        entry.covered_from = from_dt if entry.covered_from is None else min(entry.covered_from, from_dt)
+        entry.covered_to = to_dt if entry.covered_to is None else max(entry.covered_to, to_dt)
+        logger.debug(
+            "[HistoryCache] token=%s fetched %d span(s), %d bars cached",
+            token, len(gaps), len(entry.bars),
+        )
+
+
+def resample_minute_bars(df: pd.DataFrame, minutes: int) -> pd.DataFrame:
+    """Roll minute OHLCV up to ``minutes``-bars aligned to the 09:15 session open."""
+    if df.empty or minutes <= 1:
+        return df
+    offset = pd.Timedelta(minutes=SESSION_OPEN_MINUTE % minutes)
+    agg = {"open": "first", "high": "max", "low": "min", "close": "last"}
+    if "volume" in df.columns:
+        agg["volume"] = "sum"
+    out = df.resample(f"{minutes}min", origin="start_day", offset=offset).agg(agg)
+    return out.dropna(subset=["open", "high", "low", "close"])
+
+
+_cache = MinuteHistoryCache()
+
+
+def history_cache() -> MinuteHistoryCache:
+    """Process-wide cache shared by all chart views."""
+    return _cache
@@ -0,0 +1,148 @@
+"""
+core/cvd/history_loader.py
+==========================
+Background loading of CVD minute history for chart widgets.
+
+Charts submit a load to a shared QThreadPool and get the result back on the
+GUI thread through Qt signals, so multi-chart dialogs fetch every member
+concurrently and draw each chart as soon as its own data lands — instead of
+blocking the event loop for one REST round trip per chart.
+
+Request starts are paced to Kite's historical-data rate limit, so a large
+symbol set queues briefly instead of tripping "Too many requests".  Minute
+bars and CVD candles come from the shared `history_cache`, so charts showing
+the same token share one fetch and one copy of the data.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import date, datetime
+from typing import Callable, Iterable
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from core.cvd.history_cache import history_cache
+
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENT_LOADS = 6
+HISTORICAL_REQUESTS_PER_SECOND = 3   # Kite Connect historical API limit
+
+
+class _RequestPacer:
+    """Thread-safe minimum spacing between request starts."""
+
+    def __init__(self, per_second: float):
+        self._interval = 1.0 / per_second
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+_pacer = _RequestPacer(HISTORICAL_REQUESTS_PER_SECOND)
+_pool: QThreadPool | None = None
+
+
+def history_thread_pool() -> QThreadPool:
+    """Pool shared by all chart history loads (created on first use)."""
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(MAX_CONCURRENT_LOADS)
+    return _pool
+
+
+def fetch_minute_history(kite, instrument_token: int, from_dt: datetime, to_dt: datetime) -> list[dict]:
+    """Rate-paced ``kite.historical_data`` call at minute granularity."""
+    _pacer.wait()
+    return kite.historical_data(instrument_token, from_dt, to_dt, interval="minute")
+
+
+def minute_fetcher(kite) -> Callable[[int, datetime, datetime], list[dict]]:
+    """Bind ``kite`` into the fetch callback `history_cache` expects."""
+    return lambda token, from_dt, to_dt: fetch_minute_history(kite, token, from_dt, to_dt)
+
+
+def load_cvd_history(
+    kite,
+    instrument_token: int,
+    from_dt: datetime,
+    to_dt: datetime,
+    session_dates: Iterable[date] | None = None,
+    max_sessions: int = 2,
+) -> dict | None:
+    """
+    Fetch minute candles and build the multi-session CVD frame a chart plots.
+
+    ``session_dates`` selects explicit sessions (historical navigation); when
+    omitted the last ``max_sessions`` sessions are kept (live mode, or a chart
+    that has paged in older sessions).  Returns None when the API has no data
+    for the range.  Safe to call from a worker thread.
+    """
+    cvd_df = history_cache().cvd_bars(instrument_token, from_dt, to_dt, minute_fetcher(kite))
+    if cvd_df.empty:
+        return None
+
+    cvd_df = cvd_df.assign(session=cvd_df.index.date)
+
+    all_sessions = sorted(cvd_df["session"].unique())
+    if session_dates is None:
+        sessions = all_sessions[-max_sessions:]
+    else:
+        wanted = set(session_dates)
+        sessions = [d for d in all_sessions if d in wanted]
+
+    cvd_df = cvd_df[cvd_df["session"].isin(sessions)]
+
+    prev_day_close_cvd = 0.0
+    if len(sessions) >= 2:
+        prev_data = cvd_df[cvd_df["session"] == sessions[-2]]
+        if not prev_data.empty:
+            prev_day_close_cvd = float(prev_data["close"].iloc[-1])
+
+    return {"cvd_df": cvd_df, "prev_day_close_cvd": prev_day_close_cvd}
+
+
+class HistoryLoadSignals(QObject):
+    """Result channel for `HistoryLoadTask`; lives on the GUI thread."""
+
+    loaded = Signal(int, object)   # request_id, result (None = no data)
+    failed = Signal(int, str)      # request_id, error message
+
+
+class HistoryLoadTask(QRunnable):
+    """Runs ``fn(*args)`` on the pool and reports through ``signals``."""
+
+    def __init__(self, request_id: int, signals: HistoryLoadSignals, fn: Callable, *args):
+        super().__init__()
+        self.request_id = request_id
+        self.signals = signals
+        self._fn = fn
+        self._args = args
+
+    def run(self):
+        try:
+            result = self._fn(*self._args)
+        except Exception as exc:
+            logger.debug("[CVD] History load %s failed", self.request_id, exc_info=True)
+            self._emit(self.signals.failed, str(exc))
+            return
+        self._emit(self.signals.loaded, result)
+
+    def _emit(self, signal, payload):
+        try:
+            signal.emit(self.request_id, payload)
+        except RuntimeError:
+            # Owner widget was destroyed while the request was in flight.
+            pass
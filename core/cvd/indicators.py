@@ -8,13 +8,16 @@ Design principles (institutional grade):
   - No look-ahead bias: every value at index i only uses data up to index i.
   - Wilder smoothing (RMA) for ATR / ADX — same as TradingView / Bloomberg.
   - VWAP resets per session key — matches exchange VWAP exactly.
+  - Streaming* classes update one bar at a time and track the batch results.
 """
 
 from __future__ import annotations
 
-import numpy as np
+from collections import deque
 from typing import Sequence
 
+import numpy as np
+
 
 # ---------------------------------------------------------------------------
 # EMA  (Exponential Moving Average)
@@ -337,4 +340,255 @@ def calculate_cvd_zscore(
         sigma = float(np.std(window))
         result[i] = (cvd[i] - mu) / sigma if sigma > 1e-9 else 0.0
 
-    return result
\ No newline at end of file
+    return result
+
+# ---------------------------------------------------------------------------
+# Streaming (incremental) indicators
+# ---------------------------------------------------------------------------
+#
+# Stateful counterparts of the batch functions above for live charts: feed one
+# closed bar at a time, read `.value`.  After any number of bars the streaming
+# value equals the LAST element of the batch function run over the same
+# prefix, so once the warm-up window has passed it matches the batch series
+# bar-for-bar.  Warm-up bars replay the batch seeding rules exactly (SMA / sum
+# seeds over the first `period` values); after that every update is O(1).
+
+
+class StreamingEMA:
+    """Incremental `calculate_ema`."""
+
+    def __init__(self, period: int):
+        self.period = int(period)
+        self._k = 2.0 / (self.period + 1)
+        self.reset()
+
+    def reset(self) -> None:
+        self._warmup: list[float] = []
+        self._value = float("nan")
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @property
+    def ready(self) -> bool:
+        """True once the SMA seed window is complete."""
+        return self._warmup is None
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        if self._warmup is None:
+            self._value = x * self._k + self._value * (1.0 - self._k)
+            return self._value
+
+        # Warm-up: the batch seed is the mean of the first `period` values,
+        # so replay the (short) buffer from the current seed.
+        self._warmup.append(x)
+        value = float(np.mean(self._warmup))
+        for v in self._warmup[1:]:
+            value = v * self._k + value * (1.0 - self._k)
+        self._value = value
+        if len(self._warmup) >= self.period:
+            self._warmup = None
+        return self._value
+
+
+class StreamingVWAP:
+    """Incremental `calculate_vwap`; pass `session_key` to reset per session."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._cum_pv = 0.0
+        self._cum_v = 0.0
+        self._session_key = None
+        self._started = False
+        self._value = float("nan")
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def update(self, price: float, volume: float, session_key=None) -> float:
+        price = float(price)
+        volume = float(volume)
+        if self._started and session_key != self._session_key:
+            self._cum_pv = 0.0
+            self._cum_v = 0.0
+        self._session_key = session_key
+        self._started = True
+
+        self._cum_pv += price * volume
+        self._cum_v += volume
+        self._value = self._cum_pv / self._cum_v if self._cum_v > 0 else price
+        return self._value
+
+
+class StreamingATR:
+    """Incremental Wilder `calculate_atr`."""
+
+    def __init__(self, period: int = 14):
+        self.period = int(period)
+        self.reset()
+
+    def reset(self) -> None:
+        self._prev_close: float | None = None
+        self._warmup: list[float] | None = []
+        self._value = float("nan")
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @property
+    def ready(self) -> bool:
+        return self._warmup is None
+
+    def update(self, high: float, low: float, close: float) -> float:
+        high, low, close = float(high), float(low), float(close)
+        if self._prev_close is None:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._prev_close = close
+
+        if self._warmup is None:
+            self._value = (self._value * (self.period - 1) + tr) / self.period
+            return self._value
+
+        self._warmup.append(tr)
+        self._value = float(np.mean(self._warmup))
+        if len(self._warmup) >= self.period:
+            self._warmup = None
+        return self._value
+
+
+class StreamingADX:
+    """Incremental Wilder `compute_adx` (ADX only, 0–100)."""
+
+    def __init__(self, period: int = 14):
+        self.period = int(period)
+        self.reset()
+
+    def reset(self) -> None:
+        self._prev: tuple[float, float, float] | None = None
+        self._warmup: tuple[list[float], list[float], list[float]] | None = ([], [], [])
+        self._s_tr = 0.0
+        self._s_plus = 0.0
+        self._s_minus = 0.0
+        self._value = 0.0
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @property
+    def ready(self) -> bool:
+        return self._warmup is None
+
+    def _dx(self) -> float:
+        if self._s_tr > 0:
+            di_plus = 100.0 * self._s_plus / self._s_tr
+            di_minus = 100.0 * self._s_minus / self._s_tr
+        else:
+            di_plus = di_minus = 0.0
+        di_sum = di_plus + di_minus
+        return 100.0 * abs(di_plus - di_minus) / di_sum if di_sum > 0 else 0.0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        high, low, close = float(high), float(low), float(close)
+        if self._prev is None:
+            self._prev = (high, low, close)
+            self._value = 0.0
+            return self._value
+
+        prev_high, prev_low, prev_close = self._prev
+        self._prev = (high, low, close)
+
+        up_move = high - prev_high
+        down_move = prev_low - low
+        plus_dm = up_move if (up_move > down_move and up_move > 0) else 0.0
+        minus_dm = down_move if (down_move > up_move and down_move > 0) else 0.0
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+        if self._warmup is not None:
+            # Batch seeds each Wilder sum with the plain sum of the first
+            # `period` moves and back-fills the warm-up, so every warm-up DX is
+            # the DX of the running sums and ADX equals it.
+            w_tr, w_plus, w_minus = self._warmup
+            w_tr.append(tr)
+            w_plus.append(plus_dm)
+            w_minus.append(minus_dm)
+            self._s_tr = float(np.sum(w_tr))
+            self._s_plus = float(np.sum(w_plus))
+            self._s_minus = float(np.sum(w_minus))
+            self._value = self._dx()
+            if len(w_tr) >= self.period:
+                self._warmup = None
+            return self._value
+
+        self._s_tr = self._s_tr - self._s_tr / self.period + tr
+        self._s_plus = self._s_plus - self._s_plus / self.period + plus_dm
+        self._s_minus = self._s_minus - self._s_minus / self.period + minus_dm
+        self._value = (self._value * (self.period - 1) + self._dx()) / self.period
+        return self._value
+
+
+class StreamingChopRegime:
+    """Incremental `is_chop_regime`; feed the current ATR and ADX values."""
+
+    def __init__(
+        self,
+        adx_threshold: float = 20.0,
+        atr_ratio_threshold: float = 0.8,
+        lookback: int = 10,
+    ):
+        self.adx_threshold = adx_threshold
+        self.atr_ratio_threshold = atr_ratio_threshold
+        self.lookback = int(lookback)
+        self.reset()
+
+    def reset(self) -> None:
+        self._atr_window: deque[float] = deque(maxlen=max(1, self.lookback))
+        self._value = False
+
+    @property
+    def value(self) -> bool:
+        return self._value
+
+    def update(self, atr: float, adx: float) -> bool:
+        atr = float(atr)
+        self._atr_window.append(atr)
+        window = np.fromiter(self._atr_window, dtype=float, count=len(self._atr_window))
+        mean_atr = float(np.mean(window))
+        atr_ratio = (atr / mean_atr) if mean_atr > 0 else 1.0
+        self._value = bool((float(adx) < self.adx_threshold) and (atr_ratio < self.atr_ratio_threshold))
+        return self._value
+
+
+class StreamingCVDZScore:
+    """Incremental `calculate_cvd_zscore` over a fixed rolling window."""
+
+    def __init__(self, period: int = 20):
+        self.period = int(period)
+        self.reset()
+
+    def reset(self) -> None:
+        self._window: deque[float] = deque(maxlen=max(1, self.period))
+        self._value = 0.0
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def update(self, cvd: float) -> float:
+        cvd = float(cvd)
+        self._window.append(cvd)
+        # Window is bounded by `period`, so this stays constant-time per bar
+        # regardless of history length and matches the batch mean/std exactly.
+        window = np.fromiter(self._window, dtype=float, count=len(self._window))
+        mu = float(np.mean(window))
+        sigma = float(np.std(window))
+        self._value = (cvd - mu) / sigma if sigma > 1e-9 else 0.0
+        return self._value
@@ -129,6 +129,9 @@ class CVDMultiChartDialog(QDialog):
         self.kite = kite
         self.symbol_to_token = symbol_to_token or {}
         self.chart_widgets = []
+        self._pending_loads: set[int] = set()
+        self._failed_loads: set[int] = set()
+        self._loading_range = ""
 
         self.setWindowTitle("CVD Multi Chart Monitor")
         self.setMinimumSize(1300, 700)
@@ -190,6 +193,13 @@ class CVDMultiChartDialog(QDialog):
                     auto_refresh=False,
                 )
 
+                widget.history_loaded.connect(
+                    lambda w=widget: self._on_chart_loaded(w)
+                )
+                widget.history_failed.connect(
+                    lambda w=widget: self._on_chart_failed(w)
+                )
+
                 row = idx // 2
                 col = idx % 2
                 grid_layout.addWidget(widget, row, col)
@@ -253,17 +263,45 @@ class CVDMultiChartDialog(QDialog):
         QTimer.singleShot(10, lambda: self._load_all_charts(current_date, previous_date))
 
     def _load_all_charts(self, current_date: datetime, previous_date: datetime):
-        """Load historical data for all charts."""
+        """Request historical data for all charts; loads run concurrently in the background."""
+        self._loading_range = (
+            f"{previous_date.strftime('%Y-%m-%d')} → {current_date.strftime('%Y-%m-%d')}"
+        )
+        self._pending_loads = set()
+        self._failed_loads = set()
         for widget in self.chart_widgets:
             try:
                 if hasattr(widget, 'load_historical_dates'):
+                    self._pending_loads.add(id(widget))
                     widget.load_historical_dates(current_date, previous_date)
             except Exception:
+                self._pending_loads.discard(id(widget))
                 logger.exception(f"Failed to load data for widget")
 
-        self.lbl_status.setText(
-            f"Loaded: {previous_date.strftime('%Y-%m-%d')} → {current_date.strftime('%Y-%m-%d')}"
-        )
+        self._update_load_status()
+
+    def _on_chart_loaded(self, widget: CVDChartWidget):
+        self._pending_loads.discard(id(widget))
+        self._update_load_status()
+
+    def _on_chart_failed(self, widget: CVDChartWidget):
+        if id(widget) in self._pending_loads:
+            self._pending_loads.discard(id(widget))
+            self._failed_loads.add(id(widget))
+        self._update_load_status()
+
+    def _update_load_status(self):
+        if self._pending_loads:
+            done = len(self.chart_widgets) - len(self._pending_loads)
+            self.lbl_status.setText(
+                f"Loading {self._loading_range} ({done}/{len(self.chart_widgets)})..."
+            )
+        elif self._failed_loads:
+            self.lbl_status.setText(
+                f"Loaded: {self._loading_range} ({len(self._failed_loads)} without data)"
+            )
+        else:
+            self.lbl_status.setText(f"Loaded: {self._loading_range}")
 
     def closeEvent(self, event):
         """Cleanup on close."""
@@ -273,6 +311,8 @@ class CVDMultiChartDialog(QDialog):
         for widget in self.chart_widgets:
             if hasattr(widget, 'stop_updates'):
                 widget.stop_updates()
+            if hasattr(widget, 'release_history'):
+                widget.release_history()
         if hasattr(self, "refresh_timer"):
             self.refresh_timer.stop()
 
@@ -4,13 +4,13 @@ import logging
 from datetime import datetime
 from typing import List
 
-import pandas as pd
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QGridLayout, QHBoxLayout,
     QLabel, QPushButton, QComboBox
 )
 from PySide6.QtCore import Qt, QTimer
 
+from core.cvd.cvd_aggregate import AggregateCVDSeries
 from core.cvd.cvd_symbol_sets import CVDSymbolSetManager
 from core.cvd.cvd_chart_widget import CVDChartWidget
 from core.dialogs.cvd_multi_chart_dialog import DateNavigator
@@ -56,6 +56,8 @@ class CVDSetMultiChartDialog(QDialog):
 
         self.chart_widgets: List[CVDChartWidget] = []
         self.active_tokens: set[int] = set()
+        # Summed CVD of the visible members, updated per tick
+        self._aggregate = AggregateCVDSeries()
 
         self.setWindowTitle("CVD Symbol Set Monitor")
         self.setMinimumSize(1300, 720)
@@ -66,9 +68,10 @@ class CVDSetMultiChartDialog(QDialog):
             | Qt.WindowCloseButtonHint
         )
 
+        self._pending_chart_loads: set[int] = set()
+
         self._setup_ui()
         self._load_sets()
-        self._pending_chart_reload = 0
 
         if self.cvd_engine is not None:
             self.cvd_engine.cvd_updated.connect(self._on_cvd_tick)
@@ -206,6 +209,12 @@ class CVDSetMultiChartDialog(QDialog):
                 parent=self
             )
             widget.crosshair_moved.connect(self._on_crosshair_sync)
+            widget.history_loaded.connect(
+                lambda w=widget: self._on_chart_history_loaded(w)
+            )
+            widget.history_failed.connect(
+                lambda w=widget: self._on_chart_history_failed(w)
+            )
             widget.stop_updates()  # ensure no timers
             widget.hide()
 
@@ -238,9 +247,13 @@ class CVDSetMultiChartDialog(QDialog):
     def _on_crosshair_sync(self, x_index: int, timestamp: datetime):
         """
         Synchronize crosshair across all visible charts.
+
+        Sources already coalesce broadcasts to one per frame; each target
+        resolves its own bar by binary search on its timestamp array.
         """
+        source = self.sender()
         for w in self.chart_widgets:
-            if w.isVisible():
+            if w is not source and w.isVisible():
                 w.update_crosshair(x_index, timestamp)
 
         # Aggregate chart should follow, never lead
@@ -271,10 +284,9 @@ class CVDSetMultiChartDialog(QDialog):
 
         self.set_combo.blockSignals(False)
 
-        # Auto-select first set AND trigger load
+        # Auto-select first set; currentIndexChanged triggers the load
         if self.symbol_sets:
             self.set_combo.setCurrentIndex(1)
-            self._on_set_changed(1)
 
     def _on_symbol_sets_updated(self):
         """
@@ -304,75 +316,30 @@ class CVDSetMultiChartDialog(QDialog):
                 if w.instrument_token:
                     w.show()
 
-    def _show_aggregate_chart(self):
-        # Hide individual charts
-        for w in self.chart_widgets:
-            w.hide()
-
-        # Build aggregate CVD
-        agg_df = self._build_aggregate_cvd()
-        if agg_df is None or agg_df.empty:
+    def _on_chart_history_loaded(self, widget: CVDChartWidget):
+        """(Re)seed the aggregate with a member's freshly loaded history."""
+        token = widget.instrument_token
+        if token not in self.active_tokens:
             return
+        self._aggregate.set_member(token, widget.cvd_df)
 
-        # Inject data into aggregate widget
-        self.aggregate_chart.stop_updates()
-        self.aggregate_chart.cvd_df = agg_df
-        self.aggregate_chart.prev_day_close_cvd = 0.0
-        self.aggregate_chart.rebased_mode = True
-        self.aggregate_chart.symbol = "AGGREGATE CVD"
-        self.aggregate_chart.title_label.setText("AGGREGATE CVD (Rebased)")
-        self.aggregate_chart._plot()
-
-        self.aggregate_chart.show()
-
-    def _show_separate_charts(self):
-        self.aggregate_chart.hide()
-
-        for w in self.chart_widgets:
-            if w.instrument_token:
-                w.show()
-
-    def _build_aggregate_cvd(self):
-        """
-        Build aggregate CVD using the SAME sessions and dates
-        as the individual charts.
-        """
-        dfs = []
-
-        for w in self.chart_widgets:
-            if w.cvd_df is not None and not w.cvd_df.empty:
-                dfs.append(w.cvd_df)
-
-        if not dfs:
-            return None
+        self._settle_chart_load(token)
 
-        # --- Find common timestamps across all charts ---
-        common_index = dfs[0].index
-        for df in dfs[1:]:
-            common_index = common_index.intersection(df.index)
-
-        if common_index.empty:
-            return None
-
-        # --- Sum CLOSE values ---
-        agg_close = None
-        for df in dfs:
-            series = df.loc[common_index, "close"]
-            agg_close = series if agg_close is None else agg_close + series
+        if self.aggregate_toggle.isChecked():
+            self._refresh_aggregate_chart()
 
-        # --- Build aggregate dataframe ---
-        agg_df = pd.DataFrame(index=common_index)
-        agg_df["close"] = agg_close
-        agg_df["open"] = agg_close
-        agg_df["high"] = agg_close
-        agg_df["low"] = agg_close
-        agg_df["session"] = agg_df.index.date
+    def _on_chart_history_failed(self, widget: CVDChartWidget):
+        self._settle_chart_load(widget.instrument_token)
 
-        return agg_df
+    def _settle_chart_load(self, token):
+        if token in self._pending_chart_loads:
+            self._pending_chart_loads.discard(token)
+            loaded = len(self.active_tokens) - len(self._pending_chart_loads)
+            self.status.setText(f"Loaded {loaded}/{len(self.active_tokens)} symbols")
 
     def _refresh_aggregate_chart(self):
-        agg_df = self._build_aggregate_cvd()
-        if agg_df is None or agg_df.empty:
+        agg_df = self._aggregate.to_frame()
+        if agg_df.empty:
             return
 
         self.aggregate_chart.stop_updates()
@@ -384,7 +351,9 @@ class CVDSetMultiChartDialog(QDialog):
         self.aggregate_chart.title_label.setText("AGGREGATE CVD (Rebased)")
 
         #  Force aggregate to follow same mode as children
-        self.aggregate_chart.live_mode = False
+        self.aggregate_chart.live_mode = any(
+            w.live_mode for w in self.chart_widgets if w.instrument_token in self.active_tokens
+        )
         self.aggregate_chart.current_date = self.current_date
         self.aggregate_chart.previous_date = self.previous_date
 
@@ -408,23 +377,30 @@ class CVDSetMultiChartDialog(QDialog):
         if not self.isVisible():
             return
 
-        updated = False
+        live_member = False
         for widget in self.chart_widgets:
-            if (
-                widget.isVisible()
-                and widget.live_mode
-                and widget.instrument_token == instrument_token
-            ):
-                widget.apply_live_cvd_tick(cvd_value)
-                updated = True
-
-        if updated and self.aggregate_toggle.isChecked() and self.aggregate_chart.isVisible():
+            if widget.live_mode and widget.instrument_token == instrument_token:
+                if widget.isVisible():
+                    widget.apply_live_cvd_tick(cvd_value)
+                live_member = True
+
+        if not live_member or instrument_token not in self._aggregate:
+            return
+
+        now = datetime.now()
+        tail_only = self._aggregate.update(instrument_token, now, cvd_value)
+        if tail_only is None or not self.aggregate_chart.isVisible():
+            return
+        if tail_only and self.aggregate_chart.cvd_df is not None:
+            self.aggregate_chart.apply_live_cvd_tick(self._aggregate.last_value, now)
+        else:
             self._refresh_aggregate_chart()
 
     # ------------------------------------------------------------------
 
     def _activate_symbols(self, symbols: List[str]):
-        self._clear_charts()
+        # Keep cache holds across the switch so tokens shared by both sets are not refetched.
+        self._clear_charts(release_history=False)
 
         for i, symbol in enumerate(symbols):
             token = self._resolve_fut_token(symbol)
@@ -439,52 +415,28 @@ class CVDSetMultiChartDialog(QDialog):
             )
 
             widget = self.chart_widgets[i]
-            widget.set_instrument(token, f"{symbol}")
+            # History is requested once, by _load_charts_for_dates.
+            widget.set_instrument(token, f"{symbol}", load=False)
             widget.show()
 
+        for widget in self.chart_widgets:
+            if widget.instrument_token not in self.active_tokens:
+                widget.release_history()
+
         self.status.setText(f"Loaded {len(self.active_tokens)} symbols")
 
     # ------------------------------------------------------------------
 
     def _load_charts_for_dates(self, current_date, previous_date):
-        # Count how many charts will reload
+        """Request every visible chart at once; each draws when its data lands."""
         visible_charts = [
             w for w in self.chart_widgets
-            if w.isVisible() and hasattr(w, "load_historical_dates")
+            if w.instrument_token in self.active_tokens
         ]
-
-        self._pending_chart_reload = len(visible_charts)
-
-        if self._pending_chart_reload == 0:
-            return
+        self._pending_chart_loads = {w.instrument_token for w in visible_charts}
 
         for widget in visible_charts:
-            # Wrap reload completion
-            self._reload_chart_with_callback(
-                widget, current_date, previous_date
-            )
-
-    def _reload_chart_with_callback(self, widget, current_date, previous_date):
-        """
-        Reload a chart and notify dialog when done.
-        """
-
-        # Call chart reload
-        widget.load_historical_dates(current_date, previous_date)
-
-        # Poll until data is ready (lightweight & safe)
-        def check_ready():
-            if widget.cvd_df is not None and not widget.cvd_df.empty:
-                self._pending_chart_reload -= 1
-
-                # When ALL charts finished → rebuild aggregate
-                if self._pending_chart_reload == 0:
-                    if self.aggregate_toggle.isChecked():
-                        self._refresh_aggregate_chart()
-            else:
-                QTimer.singleShot(30, check_ready)
-
-        QTimer.singleShot(30, check_ready)
+            widget.load_historical_dates(current_date, previous_date)
 
     # ------------------------------------------------------------------
 
@@ -513,13 +465,16 @@ class CVDSetMultiChartDialog(QDialog):
 
     # ------------------------------------------------------------------
 
-    def _clear_charts(self):
+    def _clear_charts(self, release_history: bool = True):
         if self.active_tokens:
             self._unregister_tokens(self.active_tokens)
             self.active_tokens.clear()
+        self._aggregate.clear()
 
         for widget in self.chart_widgets:
             widget.stop_updates()
+            if release_history:
+                widget.release_history()
             widget.hide()
 
     # ------------------------------------------------------------------
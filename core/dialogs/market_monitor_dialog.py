@@ -12,12 +12,127 @@ from PySide6.QtCore import Qt, QByteArray, QTimer, Signal, QEvent
 from PySide6.QtGui import QFont
 from kiteconnect import KiteConnect
 
+from core.cvd.history_cache import SESSION_OPEN_MINUTE, history_cache
+from core.cvd.history_loader import (
+    HistoryLoadSignals,
+    HistoryLoadTask,
+    history_thread_pool,
+    minute_fetcher,
+)
 from core.utils.config_manager import ConfigManager
 from core.utils.cpr_calculator import CPRCalculator
+from core.utils.ohlcv_ring_buffer import OHLCVRingBuffer
 from core.market_data.market_data_worker import MarketDataWorker
 
 logger = logging.getLogger(__name__)
 
+OLDER_SESSION_LOOKBACK_DAYS = 7   # calendar days searched for the session before a chart's first bar
+
+# Symbol -> token map built from the day's instruments dump, shared by every monitor.
+_token_map_cache: Dict[str, object] = {}
+
+
+def _token_map_from_frame(instruments_df: pd.DataFrame) -> Dict[str, int]:
+    """Equity and index symbols to instrument tokens, plus the usual index aliases."""
+    token_map = {}
+
+    if instruments_df.empty:
+        logger.warning("MarketMonitor: instruments_df is empty, token map will be empty")
+        return token_map
+
+    # Filter for equity and indices only
+    try:
+        filtered = instruments_df[instruments_df['instrument_type'].isin(['EQ', 'INDICES'])]
+        token_map.update(zip(filtered['tradingsymbol'], filtered['instrument_token']))
+    except KeyError:
+        # Fallback: just use NSE exchange if instrument_type column doesn't exist
+        logger.warning("MarketMonitor: instrument_type column not found, using NSE filter")
+        try:
+            nse_df = instruments_df[instruments_df['exchange'] == 'NSE']
+            token_map.update(zip(nse_df['tradingsymbol'], nse_df['instrument_token']))
+        except Exception as e:
+            logger.error(f"Failed to build token map: {e}")
+
+    # Add common aliases
+    if 'NIFTY 50' in token_map:
+        token_map['NIFTY'] = token_map['NIFTY 50']
+    if 'NIFTY BANK' in token_map:
+        token_map['BANKNIFTY'] = token_map['NIFTY BANK']
+    if 'NIFTY FIN SERVICE' in token_map:
+        token_map['FINNIFTY'] = token_map['NIFTY FIN SERVICE']
+
+    logger.info(f"MarketMonitor: Built token map with {len(token_map)} symbols")
+    return token_map
+
+
+def _load_token_map(kite) -> Dict[str, int]:
+    """Fetch the instruments dump (pool thread) and build the day's token map."""
+    today = datetime.now().date()
+    if _token_map_cache.get("day") != today:
+        token_map = _token_map_from_frame(pd.DataFrame(kite.instruments()))
+        _token_map_cache.update(day=today, map=token_map)
+    return _token_map_cache["map"]
+
+
+
+def _load_chart_history(kite, token: int, from_date: datetime, to_date: datetime,
+                        bar_minutes: int) -> dict | None:
+    """
+    Fetch one monitor chart's bars and split them into the two sessions it plots.
+
+    Runs on the history thread pool.  Returns None when the API has no data;
+    otherwise ``{"df", "day_separator_pos", "cpr_levels", "sessions"}``, where
+    the separator and CPR are None unless two sessions are present.
+    """
+    # Minute bars are shared with every other chart on this token and
+    # higher timeframes are kept pre-built, so a timeframe switch is a read.
+    df = history_cache().timeframe_bars(token, from_date, to_date, minute_fetcher(kite), bar_minutes)
+    if df.empty:
+        return None
+
+    df = df.dropna()
+    if df.index.tz is not None:
+        df.index = df.index.tz_localize(None)
+
+    dates = df.index.normalize()
+    unique_dates = dates.unique().sort_values()
+    if len(unique_dates) < 2:
+        return {"df": df, "day_separator_pos": None, "cpr_levels": None,
+                "sessions": [d.date() for d in unique_dates]}
+
+    prev_day_df = df[dates == unique_dates[-2]]
+    today_df = df[dates == unique_dates[-1]]
+    return {
+        "df": pd.concat([prev_day_df, today_df]),
+        "day_separator_pos": len(prev_day_df),
+        "cpr_levels": CPRCalculator.get_previous_day_cpr(prev_day_df),
+        "sessions": [unique_dates[-2].date(), unique_dates[-1].date()],
+    }
+
+
+def _load_older_session(kite, token: int, before: datetime, bar_minutes: int) -> pd.DataFrame | None:
+    """
+    Bars of the last session that ends before ``before`` (naive IST).
+
+    Runs on the history thread pool.  Searches back day by day, skipping
+    weekends, so a holiday does not end paging; None when nothing is found.
+    """
+    fetch = minute_fetcher(kite)
+    to_date = before - timedelta(microseconds=1)
+    day = before.replace(hour=0, minute=0, second=0, microsecond=0)
+    for _ in range(OLDER_SESSION_LOOKBACK_DAYS):
+        day -= timedelta(days=1)
+        if day.weekday() >= 5:
+            continue
+        df = history_cache().timeframe_bars(token, day, to_date, fetch, bar_minutes).dropna()
+        if df.empty:
+            continue
+        if df.index.tz is not None:
+            df.index = df.index.tz_localize(None)
+        dates = df.index.normalize()
+        return df[dates == dates[-1]]
+    return None
+
 
 class DateNavigator(QWidget):
     """Date navigation control for historical data viewing"""
@@ -114,18 +229,33 @@ class MarketChartWidget(QWidget):
     """Optimized chart with line mode only"""
 
     MAX_CHART_POINTS = 1500
+    MAX_PAGED_SESSIONS = 20
+
+    # Emitted when the user pans or zooms past the first loaded bar.
+    older_history_requested = Signal()
 
     def __init__(self, parent=None, timeframe_combo=None):
         super().__init__(parent)
         self.timeframe_combo = timeframe_combo
         self.symbol = ""
-        self.chart_data = pd.DataFrame()
+        # Live OHLCV series; ticks extend the forming bar or open the next one.
+        self.bars = OHLCVRingBuffer(self.MAX_CHART_POINTS)
+        self._x = np.arange(self.MAX_CHART_POINTS, dtype=np.float64)
+        self.bar_minutes = 1
+        self.live = True
+        self._last_cum_volume = None
         self.day_separator_pos = None
         self.cpr_levels = None
         self._line_plot_today = None
         self._line_plot_prev = None
+        self._sep_line = None
         self._live_dot = None  # Small dot at the end
 
+        # Backward paging state (owner fetches; the chart only asks and prepends)
+        self.paged_sessions = 0
+        self.loading_older = False
+        self.history_exhausted = False
+
         # Optimized update system
         self._data_is_dirty = False
         self._pending_ticks = []  # Batch tick updates
@@ -174,6 +304,45 @@ class MarketChartWidget(QWidget):
             axis.setPen(axis_pen)
             axis.setTickFont(font)
         self.plot_widget.getAxis('bottom').setStyle(showValues=False)
+        self.plot_widget.getViewBox().sigRangeChangedManually.connect(self._on_view_changed_manually)
+
+    def _on_view_changed_manually(self, *_):
+        (x0, _x1), _ = self.plot_widget.getViewBox().viewRange()
+        if (
+            x0 <= 0
+            and len(self.bars)
+            and not self.loading_older
+            and not self.history_exhausted
+            and self.paged_sessions < self.MAX_PAGED_SESSIONS
+        ):
+            self.loading_older = True
+            self.older_history_requested.emit()
+
+    def prepend_bars(self, data: pd.DataFrame):
+        """Put an older session in front of the loaded bars, keeping the view on the same bars."""
+        self.loading_older = False
+        if data is None or data.empty:
+            self.history_exhausted = True
+            return
+        (x0, x1), _ = self.plot_widget.getViewBox().viewRange()
+        self.bars.prepend_frame(data)
+        if len(self._x) < self.bars.capacity:
+            self._x = np.arange(self.bars.capacity, dtype=np.float64)   # paging grew the buffer
+        added = len(data)
+        self.paged_sessions += 1
+        if self.day_separator_pos is None:
+            # Only today was loaded: the paged session is the previous day.
+            self.day_separator_pos = added
+            if self.cpr_levels is None:
+                self.cpr_levels = CPRCalculator.get_previous_day_cpr(data)
+        else:
+            self.day_separator_pos += added
+        self._plot_chart_data(full_redraw=True)
+        self.plot_widget.setXRange(x0 + added, x1 + added, padding=0)
+
+    def older_history_failed(self):
+        self.loading_older = False
+        self.history_exhausted = True
 
     def _throttled_update(self):
         """Batched update - process all pending ticks at once"""
@@ -184,16 +353,8 @@ class MarketChartWidget(QWidget):
             return
         if self._data_is_dirty:
             for tick in self._pending_ticks:
-                ltp = tick.get("last_price")
-                if ltp is None or self.chart_data.empty:
-                    continue
-                self.chart_data.iat[-1, self.chart_data.columns.get_loc("close")] = ltp
-                current_high = self.chart_data.iat[-1, self.chart_data.columns.get_loc("high")]
-                current_low = self.chart_data.iat[-1, self.chart_data.columns.get_loc("low")]
-                self.chart_data.iat[-1, self.chart_data.columns.get_loc("high")] = max(current_high, ltp)
-                self.chart_data.iat[-1, self.chart_data.columns.get_loc("low")] = min(current_low, ltp)
-
-            self._prune_chart_data()
+                self._apply_tick(tick)
+
             self._plot_chart_data(full_redraw=False)
             self._data_is_dirty = False
             self._pending_ticks.clear()
@@ -206,27 +367,73 @@ class MarketChartWidget(QWidget):
             self.update_timer.stop()
 
     def set_data(self, symbol: str, data: pd.DataFrame, day_separator_pos: int | None = None,
-                 cpr_levels: Dict | None = None):
+                 cpr_levels: Dict | None = None, bar_minutes: int = 1, live: bool = True):
         if data.empty:
             self.show_message(f"[{symbol}]", "No historical data available.")
             return
         self.symbol = symbol
-        # Avoid copy - just reference it (assuming no external mutation)
-        self.chart_data = data
-        self._prune_chart_data()
+        if self.bars.capacity != self.MAX_CHART_POINTS:
+            self.bars = OHLCVRingBuffer(self.MAX_CHART_POINTS)   # drop capacity grown by paging
+        self.bars.load_frame(data)
+        self.paged_sessions = 0
+        self.loading_older = False
+        self.history_exhausted = False
+        self.bar_minutes = bar_minutes
+        self.live = live
+        self._last_cum_volume = None
+        self._pending_ticks.clear()
+        # Only the newest MAX_CHART_POINTS bars are kept; shift the separator with them.
+        if day_separator_pos is not None:
+            day_separator_pos -= len(data) - len(self.bars)
+            if day_separator_pos <= 0:
+                day_separator_pos = None
         self.day_separator_pos = day_separator_pos
         self.cpr_levels = cpr_levels
         self.symbol_label.setText(self.symbol)
         self._plot_chart_data(full_redraw=True)
         self.set_visible_range("Auto")
 
-    def _prune_chart_data(self):
-        """Keep only recent bars for long-running monitor sessions."""
-        if self.chart_data.empty:
+    def _apply_tick(self, tick: dict):
+        """Fold one tick into the forming bar, or open the next bar when its period starts."""
+        ltp = tick.get("last_price")
+        if ltp is None or not self.live or not len(self.bars):
             return
-        if len(self.chart_data) <= self.MAX_CHART_POINTS:
+
+        volume = tick.get("volume")
+        traded = 0.0
+        if volume is not None:
+            if self._last_cum_volume is not None and volume >= self._last_cum_volume:
+                traded = float(volume - self._last_cum_volume)
+            self._last_cum_volume = volume
+
+        ts = tick.get("exchange_timestamp") or tick.get("last_trade_time")
+        if not hasattr(ts, "replace"):
+            ts = datetime.now()
+        bar_open = self._bar_open_ns(ts)
+        last_open = self.bars.last_time()
+        if bar_open == last_open:
+            self.bars.update_last(ltp, traded)
+        elif bar_open > last_open:
+            if self.bars.append(bar_open, ltp, ltp, ltp, ltp, traded):
+                self._on_oldest_bar_dropped()
+
+    def _bar_open_ns(self, ts: datetime) -> int:
+        """Open time (epoch ns, wall clock) of the ``bar_minutes`` bar holding ``ts``."""
+        minute = ts.hour * 60 + ts.minute
+        start = SESSION_OPEN_MINUTE + ((minute - SESSION_OPEN_MINUTE) // self.bar_minutes) * self.bar_minutes
+        bar_open = ts.replace(hour=start // 60, minute=start % 60, second=0, microsecond=0, tzinfo=None)
+        return int(np.datetime64(bar_open, "ns").astype(np.int64))
+
+    def _on_oldest_bar_dropped(self):
+        if self.day_separator_pos is None:
             return
-        self.chart_data = self.chart_data.tail(self.MAX_CHART_POINTS).copy()
+        self.day_separator_pos -= 1
+        if self.day_separator_pos <= 0:
+            # Yesterday has scrolled out entirely; redraw without the split.
+            self.day_separator_pos = None
+            self._plot_chart_data(full_redraw=True)
+        elif self._sep_line is not None:
+            self._sep_line.setPos(self.day_separator_pos - 0.5)
 
     def add_tick(self, tick: dict):
         """Queue tick for batched processing"""
@@ -278,7 +485,7 @@ class MarketChartWidget(QWidget):
 
     def _plot_chart_data(self, full_redraw=True):
         """Optimized line chart plotting only"""
-        if self.chart_data.empty:
+        if not len(self.bars):
             return
 
         plot_item = self.plot_widget.getPlotItem()
@@ -287,11 +494,11 @@ class MarketChartWidget(QWidget):
             plot_item.clear()
             self._line_plot_today = None
             self._line_plot_prev = None
+            self._sep_line = None
             self._live_dot = None
 
-        df = self.chart_data
-        x = np.arange(len(df))
-        closes = df['close'].values
+        closes = self.bars.column("close")
+        x = self._x[:len(closes)]
 
         # Line chart mode
         if self.day_separator_pos is not None:
@@ -324,15 +531,15 @@ class MarketChartWidget(QWidget):
         if full_redraw:
             self._draw_cpr()
             if self.day_separator_pos:
-                sep_line = pg.InfiniteLine(
+                self._sep_line = pg.InfiniteLine(
                     pos=self.day_separator_pos - 0.5,
                     angle=90,
                     pen=self._sep_pen
                 )
-                plot_item.addItem(sep_line)
+                plot_item.addItem(self._sep_line)
 
         # Add small dot at the end to show live movement
-        if len(df) > 0:
+        if len(closes) > 0:
             last_x = x[-1]
             last_price = closes[-1]
 
@@ -350,10 +557,10 @@ class MarketChartWidget(QWidget):
 
     def set_visible_range(self, count_text: str):
         """Optimized range setting"""
-        if self.chart_data.empty:
+        if not len(self.bars):
             return
 
-        total = len(self.chart_data)
+        total = len(self.bars)
 
         if count_text == "Auto":
             self.plot_widget.enableAutoRange()
@@ -368,6 +575,7 @@ class MarketChartWidget(QWidget):
 
     def show_message(self, title: str, msg: str):
         """Lightweight message display"""
+        self.bars.clear()   # ticks must not extend a series that is no longer shown
         self.plot_widget.clear()
         text_item = pg.TextItem(f"{title}\n{msg}", color='#888888', anchor=(0.5, 0.5))
         text_item.setPos(0.5, 0.5)
@@ -389,14 +597,41 @@ class MarketMonitorDialog(QDialog):
         self.config_manager = config_manager
         self.market_data_worker = market_data_worker
 
-        # Get instruments from parent's instrument_data (dict format)
-        # Convert to DataFrame for token mapping
-        self.instruments_df = self._get_instruments_from_parent(parent, instruments_df)
-
-        # Pre-build token map once (don't rebuild every lookup)
-        self.symbol_to_token_map = self._build_token_map()
+        # Symbol -> token map.  The instruments dump behind it is fetched once
+        # a day on the history pool; a chart load requested before it lands
+        # runs when it does.
+        self.symbol_to_token_map: Dict[str, int] = {}
+        self._token_map_loading = False
+        self._load_after_token_map = False
+        self._token_map_signals = HistoryLoadSignals(self)
+        self._token_map_signals.loaded.connect(self._on_token_map_loaded)
+        self._token_map_signals.failed.connect(self._on_token_map_failed)
+        if instruments_df is not None:
+            self.symbol_to_token_map = _token_map_from_frame(instruments_df)
+        elif _token_map_cache.get("day") == datetime.now().date():
+            self.symbol_to_token_map = _token_map_cache["map"]
+        elif self.kite:
+            self._token_map_loading = True
+            history_thread_pool().start(HistoryLoadTask(0, self._token_map_signals, _load_token_map, self.kite))
+        else:
+            self.symbol_to_token_map = _token_map_from_frame(self._instruments_from_parent(parent))
 
         self.token_to_chart_map: Dict[int, MarketChartWidget] = {}
+        self._history_tokens: Set[int] = set()   # tokens held in the shared history cache
+
+        # Initial history loads run on the shared pool; results for a request id
+        # no longer in `_pending_loads` (superseded or dialog closed) are dropped.
+        self._history_signals = HistoryLoadSignals(self)
+        self._history_signals.loaded.connect(self._on_history_loaded)
+        self._history_signals.failed.connect(self._on_history_failed)
+        self._pending_loads: Dict[int, tuple[MarketChartWidget, str, int]] = {}
+        self._next_request_id = 0
+
+        # Older sessions paged in when a chart is panned past its first bar.
+        self._page_signals = HistoryLoadSignals(self)
+        self._page_signals.loaded.connect(self._on_older_history_loaded)
+        self._page_signals.failed.connect(self._on_older_history_failed)
+        self._pending_pages: Dict[int, MarketChartWidget] = {}
         self.symbol_sets = []
 
         # Track current dates for historical browsing
@@ -419,77 +654,28 @@ class MarketMonitorDialog(QDialog):
         # Initialize with today's date
         self.current_date, self.previous_date = self.navigator.get_dates()
 
-    def _get_instruments_from_parent(self, parent, instruments_df):
-        """Extract instruments from kite.instruments() or parent"""
-        if instruments_df is not None:
-            return instruments_df
-
-        # The original approach: fetch directly from kite
-        if self.kite:
-            try:
-                instrument_list = self.kite.instruments()
-                # Convert list of dicts to DataFrame
-                return pd.DataFrame(instrument_list)
-            except Exception as e:
-                logger.error(f"Failed to fetch instruments from kite: {e}")
-
-        # Fallback: Try parent's instrument_data (but it's in different format)
+    def _instruments_from_parent(self, parent) -> pd.DataFrame:
+        """Flatten the parent's ``instrument_data`` (used when there is no Kite client)."""
+        rows = []
         if parent and hasattr(parent, 'instrument_data'):
             # parent.instrument_data is dict[symbol -> list of instruments]
-            # We need to flatten it
-            rows = []
-            instrument_data = parent.instrument_data
-            for symbol, instruments in instrument_data.items():
+            for instruments in parent.instrument_data.values():
                 if isinstance(instruments, list):
-                    for instr in instruments:
-                        if isinstance(instr, dict):
-                            rows.append(instr)
-                        elif isinstance(instr, str):
-                            # Skip string entries
-                            continue
-
-            if rows:
-                return pd.DataFrame(rows)
-
-        # Last resort: empty DataFrame
+                    rows.extend(instr for instr in instruments if isinstance(instr, dict))
+        if rows:
+            return pd.DataFrame(rows)
         return pd.DataFrame(columns=['tradingsymbol', 'instrument_token', 'exchange'])
 
-    def _build_token_map(self) -> Dict[str, int]:
-        """Build symbol-to-token map once at init"""
-        token_map = {}
+    def _on_token_map_loaded(self, request_id: int, token_map):
+        self._token_map_loading = False
+        self.symbol_to_token_map = token_map or {}
+        if self._load_after_token_map:
+            self._load_after_token_map = False
+            self._load_charts_data()
 
-        if self.instruments_df.empty:
-            logger.warning("MarketMonitor: instruments_df is empty, token map will be empty")
-            return token_map
-
-        # Filter for equity and indices only
-        try:
-            filtered = self.instruments_df[
-                self.instruments_df['instrument_type'].isin(['EQ', 'INDICES'])
-            ]
-
-            for _, row in filtered.iterrows():
-                token_map[row['tradingsymbol']] = row['instrument_token']
-        except KeyError:
-            # Fallback: just use NSE exchange if instrument_type column doesn't exist
-            logger.warning("MarketMonitor: instrument_type column not found, using NSE filter")
-            try:
-                nse_df = self.instruments_df[self.instruments_df['exchange'] == 'NSE']
-                for _, row in nse_df.iterrows():
-                    token_map[row['tradingsymbol']] = row['instrument_token']
-            except Exception as e:
-                logger.error(f"Failed to build token map: {e}")
-
-        # Add common aliases
-        if 'NIFTY 50' in token_map:
-            token_map['NIFTY'] = token_map['NIFTY 50']
-        if 'NIFTY BANK' in token_map:
-            token_map['BANKNIFTY'] = token_map['NIFTY BANK']
-        if 'NIFTY FIN SERVICE' in token_map:
-            token_map['FINNIFTY'] = token_map['NIFTY FIN SERVICE']
-
-        logger.info(f"MarketMonitor: Built token map with {len(token_map)} symbols")
-        return token_map
+    def _on_token_map_failed(self, request_id: int, message: str):
+        logger.error(f"Failed to fetch instruments from kite: {message}")
+        self._on_token_map_loaded(request_id, _token_map_from_frame(self._instruments_from_parent(self.parent())))
 
     def _setup_ui(self):
         """UI setup with maximize and resize enabled"""
@@ -562,74 +748,115 @@ class MarketMonitorDialog(QDialog):
         for row in range(2):
             for col in range(3):
                 chart = MarketChartWidget(self, self.timeframe_combo)
+                chart.older_history_requested.connect(
+                    lambda chart=chart: self._load_older_history(chart)
+                )
                 chart_grid.addWidget(chart, row, col)
                 self.charts.append(chart)
 
         main_layout.addLayout(chart_grid, 1)
 
     def _fetch_and_plot_initial(self, chart: MarketChartWidget, symbol: str, token: int):
-        """Optimized initial data fetch with historical date support"""
+        """Queue ``chart``'s initial history on the pool; it is drawn when it lands."""
         if not self.kite:
             chart.show_message(f"[{symbol}] ERROR", "Kite client not available")
             logger.error("MarketMonitor: Kite client is None")
             return
 
-        try:
-            tf = self.timeframe_combo.currentText()
-
-            # Always include previous trading day + current day in one request,
-            # so CPR can be calculated from previous day even in live mode.
-            if self.live_mode:
-                current_trading_day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-                previous_trading_day = self._get_previous_trading_day(current_trading_day)
-
-                # Give small forward buffer to include the latest intraday bars.
-                from_date = previous_trading_day
-                to_date = datetime.now() + timedelta(minutes=1)
-            else:
-                # Historical mode - use navigator dates
-                to_date = self.current_date + timedelta(days=1)
-                from_date = self.previous_date
-
-            records = self.kite.historical_data(
-                token, from_date, to_date, tf, continuous=False, oi=False
-            )
+        # Always include previous trading day + current day in one request,
+        # so CPR can be calculated from previous day even in live mode.
+        if self.live_mode:
+            current_trading_day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            previous_trading_day = self._get_previous_trading_day(current_trading_day)
 
-            if not records:
+            # Give small forward buffer to include the latest intraday bars.
+            from_date = previous_trading_day
+            to_date = datetime.now() + timedelta(minutes=1)
+        else:
+            # Historical mode - use navigator dates
+            to_date = self.current_date + timedelta(days=1)
+            from_date = self.previous_date
+
+        bar_minutes = self._timeframe_minutes(self.timeframe_combo.currentText())
+        self._next_request_id += 1
+        request_id = self._next_request_id
+        self._pending_loads[request_id] = (chart, symbol, bar_minutes)
+        chart.show_message(f"[{symbol}]", "Loading...")
+        history_thread_pool().start(HistoryLoadTask(
+            request_id, self._history_signals, _load_chart_history,
+            self.kite, token, from_date, to_date, bar_minutes,
+        ))
+
+    def _on_history_loaded(self, request_id: int, result):
+        pending = self._pending_loads.pop(request_id, None)
+        if pending is None:
+            return  # superseded by a newer load
+        chart, symbol, bar_minutes = pending
+        try:
+            if result is None:
                 chart.show_message(f"[{symbol}] NO DATA", "No historical data available")
                 return
-
-            df = pd.DataFrame(records)
-            df.dropna(inplace=True)
-            df['date'] = pd.to_datetime(df['date'])
-            df.set_index('date', inplace=True)
-            if df.index.tz is not None:
-                df.index = df.index.tz_localize(None)
-
-            unique_dates = sorted(pd.Series(df.index.date).unique())
-            cpr_levels, day_separator_pos = None, None
-
-            if len(unique_dates) < 2:
+            if result["day_separator_pos"] is None:
                 logger.warning(
                     "MarketMonitor: CPR unavailable for %s - expected 2 sessions, got %s (%s)",
                     symbol,
-                    len(unique_dates),
-                    unique_dates,
+                    len(result["sessions"]),
+                    result["sessions"],
                 )
-                chart.set_data(symbol, df)
-                return
-
-            today_date, prev_day_date = unique_dates[-1], unique_dates[-2]
-            today_df = df[df.index.date == today_date]
-            prev_day_df = df[df.index.date == prev_day_date]
-            cpr_levels = CPRCalculator.get_previous_day_cpr(prev_day_df)
-            day_separator_pos = len(prev_day_df)
-            two_day_df = pd.concat([prev_day_df, today_df])
-            chart.set_data(symbol, two_day_df, day_separator_pos, cpr_levels)
-
+            chart.set_data(symbol, result["df"], result["day_separator_pos"], result["cpr_levels"],
+                           bar_minutes=bar_minutes, live=self.live_mode)
+            chart.set_visible_range(self.candle_count_combo.currentText())
         except Exception as e:
-            logger.error(f"Failed to fetch/plot data for {symbol}: {e}", exc_info=True)
+            logger.error(f"Failed to plot data for {symbol}: {e}", exc_info=True)
             chart.show_message(f"[{symbol}] DATA ERROR", "Could not load data.")
+        finally:
+            self._finish_load_if_idle()
+
+    def _on_history_failed(self, request_id: int, message: str):
+        pending = self._pending_loads.pop(request_id, None)
+        if pending is None:
+            return
+        chart, symbol, _ = pending
+        logger.error(f"Failed to fetch data for {symbol}: {message}")
+        chart.show_message(f"[{symbol}] DATA ERROR", "Could not load data.")
+        self._finish_load_if_idle()
+
+    def _load_older_history(self, chart: MarketChartWidget):
+        """Fetch the session before ``chart``'s first bar in the background."""
+        token = next((t for t, c in self.token_to_chart_map.items() if c is chart), None)
+        first_bar = chart.bars.times()[:1]
+        if token is None or not self.kite or not len(first_bar):
+            chart.older_history_failed()
+            return
+        before = pd.Timestamp(first_bar[0]).to_pydatetime()
+        self._next_request_id += 1
+        self._pending_pages[self._next_request_id] = chart
+        history_thread_pool().start(HistoryLoadTask(
+            self._next_request_id, self._page_signals, _load_older_session,
+            self.kite, token, before, chart.bar_minutes,
+        ))
+
+    def _on_older_history_loaded(self, request_id: int, result):
+        chart = self._pending_pages.pop(request_id, None)
+        if chart is not None:
+            chart.prepend_bars(result)
+
+    def _on_older_history_failed(self, request_id: int, message: str):
+        chart = self._pending_pages.pop(request_id, None)
+        if chart is not None:
+            logger.warning(f"MarketMonitor: older history unavailable for {chart.symbol}: {message}")
+            chart.older_history_failed()
+
+    def _finish_load_if_idle(self):
+        if not self._pending_loads:
+            self.load_button.setEnabled(True)
+            self.load_button.setText("Load Charts")
+
+    @staticmethod
+    def _timeframe_minutes(tf: str) -> int:
+        """Kite interval name ("minute", "5minute", ...) to minutes."""
+        prefix = tf[:-len("minute")]
+        return int(prefix) if prefix else 1
 
     @staticmethod
     def _get_previous_trading_day(date: datetime) -> datetime:
@@ -711,8 +938,15 @@ class MarketMonitorDialog(QDialog):
 
     def _load_charts_data(self):
         """Load charts (unchanged logic)"""
+        if self._token_map_loading:
+            self._load_after_token_map = True
+            for chart in self.charts:
+                chart.show_message("LOADING", "Fetching instruments...")
+            return
         self.unsubscribe_all()
         self.token_to_chart_map.clear()
+        self._pending_loads.clear()   # results still in flight belong to the previous load
+        self._pending_pages.clear()
         symbols = [s.strip() for s in self.symbols_entry.text().strip().split(',') if s.strip()]
         if not symbols:
             return
@@ -720,6 +954,9 @@ class MarketMonitorDialog(QDialog):
         self.load_button.setEnabled(False)
         self.load_button.setText("Loading...")
         tokens_to_subscribe = set()
+        self._hold_history({
+            token for token in map(self._get_instrument_token, symbols[:len(self.charts)]) if token
+        })
 
         for i, chart in enumerate(self.charts):
             if i < len(symbols):
@@ -733,12 +970,19 @@ class MarketMonitorDialog(QDialog):
             else:
                 chart.show_message("EMPTY", "Awaiting symbol")
 
-        self._on_candle_count_changed(self.candle_count_combo.currentText())
         if tokens_to_subscribe:
             self._subscribe_to(tokens_to_subscribe)
 
-        self.load_button.setEnabled(True)
-        self.load_button.setText("Load Charts")
+        self._finish_load_if_idle()
+
+    def _hold_history(self, tokens: Set[int]):
+        """Swap the cache holds to ``tokens``; acquire first so shared entries survive."""
+        cache = history_cache()
+        for token in tokens - self._history_tokens:
+            cache.acquire(token)
+        for token in self._history_tokens - tokens:
+            cache.release(token)
+        self._history_tokens = set(tokens)
 
     def _on_ticks_received(self, ticks: list[dict]):
         """Optimized tick routing - direct dispatch without logging"""
@@ -830,6 +1074,9 @@ class MarketMonitorDialog(QDialog):
             logger.error(f"Failed to save dialog state: {e}")
 
         self.market_data_worker.data_received.disconnect(self._on_ticks_received)
+        self._pending_loads.clear()
+        self._pending_pages.clear()
+        self._hold_history(set())
         super().closeEvent(event)
 
     def changeEvent(self, event):
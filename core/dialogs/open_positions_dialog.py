@@ -340,6 +340,10 @@ class OpenPositionsDialog(QDialog):
         self.positions_table.update_positions(positions)
         self._update_display()
 
+    def update_changed_positions(self, positions: List[Position]):
+        # Header stats catch up on the 1s display timer.
+        self.positions_table.update_changed_positions(positions)
+
     def _update_display(self):
         """Update all display elements"""
         positions = self.positions_table.get_all_positions()
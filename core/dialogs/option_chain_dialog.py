@@ -11,6 +11,7 @@ from PySide6.QtWidgets import (QAbstractItemView, QCheckBox, QComboBox, QDialog,
 from scipy.stats import norm
 
 from kiteconnect import KiteConnect
+from core.market_data.strike_grid import StrikeGrid
 from core.market_data.strike_ladder import StrikeLadder
 
 logger = logging.getLogger(__name__)
@@ -453,7 +454,8 @@ class OptionChainDialog(QDialog):
                 self.underlying_ltp,
                 expiry_date,
                 self.lot_size,
-                show_per_lot
+                show_per_lot,
+                self.strike_ladder.grid(symbol, expiry_date),
             )
             self.chain_widget.center_on_atm()
 
@@ -717,7 +719,7 @@ class OptionChainWidget(QWidget):
         self.table.setItemDelegate(delegate)
 
     def update_chain(self, contracts_data: Dict, market_data: Dict, underlying_ltp: float, expiry_date,
-                     lot_size: int, show_per_lot: bool):
+                     lot_size: int, show_per_lot: bool, strike_grid: Optional[StrikeGrid] = None):
         self.table.setUpdatesEnabled(False)
         if not underlying_ltp:
             self.table.setUpdatesEnabled(True)
@@ -729,25 +731,14 @@ class OptionChainWidget(QWidget):
         self.show_per_lot = show_per_lot
         self.table.setRowCount(0)
 
-        all_strikes = sorted(list(contracts_data.keys()))
-        if not all_strikes:
+        grid = strike_grid if strike_grid is not None else StrikeGrid(sorted(contracts_data.keys()))
+        if not len(grid):
             self.table.setUpdatesEnabled(True)
             return
 
-        if len(all_strikes) > 1:
-            strike_step = all_strikes[1] - all_strikes[0]
-            self.atm_strike = round(underlying_ltp / strike_step) * strike_step
-        else:
-            self.atm_strike = all_strikes[0]
-
-        try:
-            atm_index = all_strikes.index(self.atm_strike)
-        except ValueError:
-            atm_index = min(range(len(all_strikes)), key=lambda i: abs(all_strikes[i] - self.atm_strike))
-
-        start_index = max(0, atm_index - 7)
-        end_index = min(len(all_strikes), atm_index + 8)
-        display_strikes = all_strikes[start_index:end_index]
+        atm_index = grid.atm_index(underlying_ltp)
+        self.atm_strike = float(grid.strikes[atm_index])
+        display_strikes = grid.strikes[grid.window(atm_index, 7, 7)].tolist()
 
         max_call_oi, max_put_oi = 0, 0
         for strike in display_strikes:
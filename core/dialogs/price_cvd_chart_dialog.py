@@ -62,6 +62,16 @@ class PriceCVDChartDialog(QDialog):
         self._settings_key = f"PriceCVDChart/{symbol}"
         self._restore_geometry()
 
+        # Hold both tokens in the shared minute-history cache while open, so
+        # other charts on the same instruments reuse this dialog's fetches.
+        from core.cvd.history_cache import history_cache
+
+        self._history_tokens = {
+            int(t) for t in (self.instrument_token, self.price_instrument_token) if t
+        }
+        for token in self._history_tokens:
+            history_cache().acquire(token)
+
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
         root.setSpacing(0)
@@ -199,9 +209,17 @@ class PriceCVDChartDialog(QDialog):
         self._disconnect_live_feeds()
         self._teardown_web_view()
         self._unsubscribe_price_token_on_parent()
+        self._release_history()
         self._save_geometry()
         super().closeEvent(event)
 
+    def _release_history(self) -> None:
+        from core.cvd.history_cache import history_cache
+
+        for token in self._history_tokens:
+            history_cache().release(token)
+        self._history_tokens = set()
+
     def _teardown_web_view(self) -> None:
         web_view = getattr(self, "_web_view", None)
         if web_view is None:
@@ -244,72 +262,62 @@ class PriceCVDChartDialog(QDialog):
 
     # ── Historical data ──────────────────────────────────────────────────
 
-    def _fetch_historical(self, token: int, from_dt: datetime, to_dt: datetime) -> list[dict]:
+    def _fetch_historical(self, token: int, from_dt: datetime, to_dt: datetime):
+        """Minute OHLCV frame for ``token`` from the shared history cache."""
+        import pandas as pd
+
         if not self.kite or not token:
-            return []
+            return pd.DataFrame()
         try:
-            data = self.kite.historical_data(token, from_dt, to_dt, interval="minute")
-            if isinstance(data, list):
-                return data
+            from core.cvd.history_cache import history_cache
+            from core.cvd.history_loader import minute_fetcher
+
+            return history_cache().minute_bars(token, from_dt, to_dt, minute_fetcher(self.kite))
         except Exception:
             logger.exception(
                 "[PriceCVDChart] Historical fetch failed for token=%s", token
             )
-        return []
+        return pd.DataFrame()
 
     @staticmethod
-    def _normalize_rows(rows: list[dict]) -> list[dict]:
-        normalized = []
-        for r in rows:
-            dt = r.get("date")
-            if not dt:
-                continue
-            try:
-                ts = dt.isoformat() if hasattr(dt, "isoformat") else str(dt)
-            except Exception:
-                continue
-            normalized.append({
-                "date": ts,
-                "o": float(r.get("open", 0.0)),
-                "h": float(r.get("high", 0.0)),
-                "l": float(r.get("low", 0.0)),
-                "c": float(r.get("close", 0.0)),
-                "v": float(r.get("volume", 0.0)),
-            })
-        return normalized
-
-    def _build_cvd_candles(self, raw_rows: list[dict]) -> list[dict]:
-        """Pre-compute CVD OHLC from raw OHLCV using CVDHistoricalBuilder.
+    def _normalize_rows(df) -> list[dict]:
+        if df is None or df.empty:
+            return []
+        volume = df["volume"].tolist() if "volume" in df.columns else [0.0] * len(df)
+        return [
+            {
+                "date": ts.isoformat(),
+                "o": float(o),
+                "h": float(h),
+                "l": float(l),
+                "c": float(c),
+                "v": float(v),
+            }
+            for ts, o, h, l, c, v in zip(
+                df.index, df["open"].tolist(), df["high"].tolist(),
+                df["low"].tolist(), df["close"].tolist(), volume,
+            )
+        ]
+
+    def _build_cvd_candles(self, from_dt: datetime, to_dt: datetime) -> list[dict]:
+        """CVD OHLC rows for the CVD token, built once per bar by the shared cache.
 
         Returns rows where o/h/l/c are CVD values (not price), so the HTML
         can read them directly instead of recomputing from direction × volume.
         Returns empty list on any failure so caller can fall back.
         """
-        if not raw_rows:
+        if not self.kite or not self.instrument_token:
             return []
         try:
-            import pandas as pd
-            from core.cvd.cvd_historical import CVDHistoricalBuilder
-
-            df = pd.DataFrame(raw_rows)
-            df["date"] = pd.to_datetime(df["date"])
-            df.set_index("date", inplace=True)
-            for col in ("open", "high", "low", "close", "volume"):
-                if col not in df.columns:
-                    return []
-
-            cvd_df = CVDHistoricalBuilder.build_cvd_ohlc(df)
-            result = []
-            for ts, row in cvd_df.iterrows():
-                result.append({
-                    "date": ts.isoformat(),
-                    "o": float(row["open"]),
-                    "h": float(row["high"]),
-                    "l": float(row["low"]),
-                    "c": float(row["close"]),
-                    "v": 0.0,   # not needed for pre-computed CVD
-                })
-            return result
+            from core.cvd.history_cache import history_cache
+            from core.cvd.history_loader import minute_fetcher
+
+            cvd_df = history_cache().cvd_bars(
+                self.instrument_token, from_dt, to_dt, minute_fetcher(self.kite)
+            )
+            if cvd_df.empty:
+                return []
+            return self._normalize_rows(cvd_df)   # no volume column: "v" is 0.0
         except Exception:
             logger.exception("[PriceCVDChart] CVD candle pre-build failed for %s", self.symbol)
             return []
@@ -400,15 +408,18 @@ class PriceCVDChartDialog(QDialog):
             to_dt = datetime.now()
             from_dt = to_dt - timedelta(days=8)
 
-            price_rows = self._fetch_historical(self.price_instrument_token, from_dt, to_dt)
-            cvd_raw_rows = self._fetch_historical(self.instrument_token, from_dt, to_dt)
+            # Both series come from the shared cache: after the first load each
+            # minute refresh only fetches the bars since the last cached one.
+            price_df = self._fetch_historical(self.price_instrument_token, from_dt, to_dt)
 
             # Pre-compute CVD OHLC so the HTML reads CVD values directly.
             # If the builder fails, fall back to raw rows (HTML recomputes).
-            cvd_candle_rows = self._build_cvd_candles(cvd_raw_rows) or self._normalize_rows(cvd_raw_rows)
+            cvd_candle_rows = self._build_cvd_candles(from_dt, to_dt) or self._normalize_rows(
+                self._fetch_historical(self.instrument_token, from_dt, to_dt)
+            )
 
             payload = {
-                "price": self._normalize_rows(price_rows),
+                "price": self._normalize_rows(price_df),
                 "cvd": cvd_candle_rows,
             }
             self._inject_payload(payload)
@@ -21,6 +21,9 @@ class ExecutionService:
     def confirm_and_finalize_order(self, *args, **kwargs):
         self.order_methods.confirm_and_finalize_order(*args, **kwargs)
 
+    def shutdown(self):
+        self.order_methods.shutdown()
+
     def has_pending_order_for_symbol(self, tradingsymbol: str | None) -> bool:
         return self.order_methods.has_pending_order_for_symbol(tradingsymbol)
 
@@ -1,7 +1,9 @@
 import json
 import logging
 import random
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -19,6 +21,9 @@ from core.observability import (
 
 logger = logging.getLogger(__name__)
 
+# Child orders in flight at once across all parents (Kite allows ~10 orders/s).
+DISPATCH_WORKERS = 4
+
 
 @dataclass
 class ExecutionRequest:
@@ -95,7 +100,8 @@ class RetryPolicy:
     def max_attempts(self, bucket: str) -> int:
         return {"transient": 3, "throttle": 4, "risk": 1, "fatal": 1}.get(bucket, 1)
 
-    def sleep_seconds(self, bucket: str, attempt: int) -> float:
+    def backoff_seconds(self, bucket: str, attempt: int) -> float:
+        """Delay before re-queuing attempt ``attempt + 1`` (never slept on a caller's thread)."""
         if bucket == "throttle":
             return min(1.5, 0.4 * (attempt + 1))
         if bucket == "transient":
@@ -117,6 +123,52 @@ class FillQualityTracker:
             logger.error("Failed to write execution quality record: %s", exc)
 
 
+@dataclass
+class DispatchResult:
+    """Outcome of one submitted request.
+
+    ``order_ids`` are the children placed, in slice order.  ``error`` is the
+    failure that stopped the parent; the ``unsent`` slices after it never
+    went out.
+    """
+    order_ids: List[str] = field(default_factory=list)
+    error: Optional[BaseException] = None
+    unsent: int = 0
+
+
+class _ParentOrder:
+    """Child-order bookkeeping for one submitted request.
+
+    Slices go out one after another, as the blocking loop did: the next child
+    is dispatched when the previous one is placed, and the first error that
+    runs out of retries stops the rest.  ``future`` then resolves to a
+    DispatchResult.
+    """
+
+    def __init__(self, request: ExecutionRequest, place_order_fn: Callable[..., str], trace: TraceContext,
+                 route: Dict[str, Any], children: List[Dict[str, Any]]):
+        self.request = request
+        self.place_order_fn = place_order_fn
+        self.trace = trace
+        self.route = route
+        self.children = children
+        self.result = DispatchResult()
+        self.future: Future = Future()
+
+    def child_placed(self, order_id: str) -> bool:
+        """Record a placed child; True when more slices remain."""
+        self.result.order_ids.append(order_id)
+        if len(self.result.order_ids) < len(self.children):
+            return True
+        self.future.set_result(self.result)
+        return False
+
+    def child_failed(self, error: BaseException):
+        self.result.error = error
+        self.result.unsent = len(self.children) - len(self.result.order_ids) - 1
+        self.future.set_result(self.result)
+
+
 class ExecutionStack:
     """
     Core execution engine.
@@ -159,6 +211,11 @@ class ExecutionStack:
         self._heartbeat_interval_seconds = 30
         self._heartbeat_thread: Optional[threading.Timer] = None
 
+        # Live child orders go out on this pool; paper orders hit the local
+        # ledger inline.  Journal/telemetry writes are serialised by the lock.
+        self._dispatch_pool = ThreadPoolExecutor(max_workers=DISPATCH_WORKERS, thread_name_prefix="order-dispatch")
+        self._record_lock = threading.RLock()   # re-entrant: remediation hooks may record from inside a heartbeat
+
     # ------------------------------------------------------------------
     # FIX #5: External heartbeat timer management
     # ------------------------------------------------------------------
@@ -187,7 +244,8 @@ class ExecutionStack:
 
     def _run_heartbeat(self):
         try:
-            self.anomaly_detector.heartbeat()
+            with self._record_lock:
+                self.anomaly_detector.heartbeat()
             self.tca_reporter.generate(self.journal.path)
         except Exception as exc:
             logger.error("ExecutionStack heartbeat error: %s", exc)
@@ -199,12 +257,21 @@ class ExecutionStack:
     # Core execute path
     # ------------------------------------------------------------------
 
-    def execute(
+    def submit(
         self,
         request: ExecutionRequest,
         place_order_fn: Callable[..., str],
         base_order_args: Dict[str, Any],
-    ) -> List[str]:
+    ) -> Future:
+        """
+        Dispatch ``request``'s child orders without blocking the caller.
+
+        Returns a Future resolving to a DispatchResult.  It carries the children
+        placed so far even when a later slice fails, so callers can still
+        confirm them.  Retries are re-queued after their backoff instead of
+        sleeping.  Done-callbacks run on a worker thread; UI code must hop back
+        to the GUI thread before touching widgets.
+        """
         trace = TraceContext.new(
             tags={
                 "tradingsymbol": request.tradingsymbol,
@@ -220,31 +287,9 @@ class ExecutionStack:
             or request.metadata.get("auto_token")
             or ""
         )
-        self.anomaly_detector.on_signal(
-            raw_signal_id,
-            tradingsymbol=request.tradingsymbol,
-            quantity=request.quantity,
-            source=request.metadata.get("source", ""),
-        )
-
         route = self.router.choose_route(request)
-        slices = self.planner.plan(request)
-        order_ids: List[str] = []
-
-        signal_event = trace.next_span(
-            "signal_received",
-            {
-                "signal_id": raw_signal_id or None,
-                "tradingsymbol": request.tradingsymbol,
-                "quantity": request.quantity,
-                "metadata": request.metadata,
-            },
-        )
-        self.journal.append("signal", signal_event)
-        self.dashboard.observe("signal", signal_event)
-
-        for idx, child_qty in enumerate(slices, start=1):
-            metrics = self.slippage.estimate(request, child_qty)
+        children = []
+        for child_qty in self.planner.plan(request):
             order_args = dict(base_order_args)
             order_args["quantity"] = child_qty
             order_args["order_type"] = route.get("order_type") or request.order_type
@@ -253,76 +298,155 @@ class ExecutionStack:
                 order_args["price"] = limit_price
             else:
                 order_args.pop("price", None)
+            children.append(order_args)
+        parent = _ParentOrder(request, place_order_fn, trace, route, children)
+
+        with self._record_lock:
+            self.anomaly_detector.on_signal(
+                raw_signal_id,
+                tradingsymbol=request.tradingsymbol,
+                quantity=request.quantity,
+                source=request.metadata.get("source", ""),
+            )
+            signal_event = trace.next_span(
+                "signal_received",
+                {
+                    "signal_id": raw_signal_id or None,
+                    "tradingsymbol": request.tradingsymbol,
+                    "quantity": request.quantity,
+                    "metadata": request.metadata,
+                },
+            )
+            self.journal.append("signal", signal_event)
+            self.dashboard.observe("signal", signal_event)
 
-            attempts = 0
-            while True:
-                started_at = time.time()
-                try:
-                    order_id = place_order_fn(**order_args)
-                    self.anomaly_detector.on_order_submitted(order_id)
-                    order_ids.append(order_id)
-                    placed_record = {
-                        # FIX #2: use UTC, not datetime.now()
-                        "timestamp": _utc_now_iso(),
-                        "trace_id": trace.trace_id,
-                        "tradingsymbol": request.tradingsymbol,
-                        "child_index": idx,
-                        "children": len(slices),
-                        "quantity": child_qty,
-                        "order_id": order_id,
-                        "arrival_price": request.ltp,
-                        "limit_price": order_args.get("price"),
-                        "expected_slippage": metrics["expected_slippage"],
-                        "impact_estimate": metrics["impact_estimate"],
-                        "latency_ms": round((time.time() - started_at) * 1000, 2),
-                        "execution_algo": request.execution_algo,
-                        "route": route.get("route"),
-                        "queue_priority": route.get("queue_priority"),
-                        "status": "placed",
-                        "risk_used": request.metadata.get("risk_used"),
-                        "risk_total": request.metadata.get("risk_total"),
-                    }
-                    self.fill_quality.append(placed_record)
-                    journal_event = trace.next_span("order_placed", placed_record)
-                    self.journal.append("order_placed", journal_event)
-                    self.dashboard.observe("order_placed", placed_record)
-                    break
-                except Exception as exc:
-                    bucket = self.retry.classify(exc)
-                    max_attempts = self.retry.max_attempts(bucket)
-                    attempts += 1
-                    error_record = {
-                        "timestamp": _utc_now_iso(),  # FIX #2
-                        "trace_id": trace.trace_id,
-                        "tradingsymbol": request.tradingsymbol,
-                        "child_index": idx,
-                        "children": len(slices),
-                        "quantity": child_qty,
-                        "arrival_price": request.ltp,
-                        "expected_slippage": metrics["expected_slippage"],
-                        "impact_estimate": metrics["impact_estimate"],
-                        "execution_algo": request.execution_algo,
-                        "route": route.get("route"),
-                        "queue_priority": route.get("queue_priority"),
-                        "status": "error",
-                        "error_bucket": bucket,
-                        "error": str(exc),
-                        "attempt": attempts,
-                        "risk_used": request.metadata.get("risk_used"),
-                        "risk_total": request.metadata.get("risk_total"),
-                    }
-                    self.fill_quality.append(error_record)
-                    self.journal.append("order_error", trace.next_span("order_error", error_record))
-                    self.dashboard.observe("order_error", error_record)
-                    if attempts >= max_attempts:
-                        raise
-                    time.sleep(self.retry.sleep_seconds(bucket, attempts))
+        if children:
+            self._dispatch(parent, 1, 0)
+        else:
+            parent.future.set_result(parent.result)
 
         # FIX #5: do NOT call anomaly_detector.heartbeat() here anymore.
         # Heartbeat now runs on its own independent timer started via
         # start_heartbeat_timer().  Calling it here caused it to only run
         # when new orders arrived, missing stuck orders during quiet periods.
-        return order_ids
+        return parent.future
+
+    def execute(
+        self,
+        request: ExecutionRequest,
+        place_order_fn: Callable[..., str],
+        base_order_args: Dict[str, Any],
+    ) -> List[str]:
+        """Blocking form of submit() for worker threads and scripts; never call it from the UI.
+
+        Returns the placed order ids, or raises the error that stopped the parent.
+        """
+        result = self.submit(request, place_order_fn, base_order_args).result()
+        if result.error is not None:
+            raise result.error
+        return result.order_ids
+
+    def shutdown(self):
+        """Stop accepting new children; orders already in flight finish on their own."""
+        self.stop_heartbeat_timer()
+        self._dispatch_pool.shutdown(wait=False)
+
+    def _dispatch(self, parent: _ParentOrder, idx: int, attempts: int):
+        if self.trading_mode == "paper":
+            self._run_child(parent, idx, attempts)
+        else:
+            self._dispatch_pool.submit(self._run_child, parent, idx, attempts)
+
+    def _run_child(self, parent: _ParentOrder, idx: int, attempts: int):
+        try:
+            self._place_child(parent, idx, attempts)
+        except Exception as exc:
+            # A journal/telemetry failure must not leave the caller's future pending.
+            logger.exception("ExecutionStack child %s of %s failed outside placement", idx, parent.request.tradingsymbol)
+            if not parent.future.done():
+                parent.child_failed(exc)
+
+    def _retry_later(self, delay: float, parent: _ParentOrder, idx: int, attempts: int):
+        # Paper orders are local: nothing to back off from, and the ledger
+        # must stay on the caller's thread.
+        if delay <= 0 or self.trading_mode == "paper":
+            self._dispatch(parent, idx, attempts)
+            return
+        timer = threading.Timer(delay, self._dispatch, args=(parent, idx, attempts))
+        timer.daemon = True
+        timer.start()
+
+    def _place_child(self, parent: _ParentOrder, idx: int, attempts: int):
+        request, route, trace = parent.request, parent.route, parent.trace
+        order_args = parent.children[idx - 1]
+        child_qty = order_args["quantity"]
+        metrics = self.slippage.estimate(request, child_qty)
+        started_at = time.time()
+        try:
+            order_id = parent.place_order_fn(**order_args)
+        except Exception as exc:
+            bucket = self.retry.classify(exc)
+            max_attempts = self.retry.max_attempts(bucket)
+            attempts += 1
+            error_record = {
+                "timestamp": _utc_now_iso(),  # FIX #2
+                "trace_id": trace.trace_id,
+                "tradingsymbol": request.tradingsymbol,
+                "child_index": idx,
+                "children": len(parent.children),
+                "quantity": child_qty,
+                "arrival_price": request.ltp,
+                "expected_slippage": metrics["expected_slippage"],
+                "impact_estimate": metrics["impact_estimate"],
+                "execution_algo": request.execution_algo,
+                "route": route.get("route"),
+                "queue_priority": route.get("queue_priority"),
+                "status": "error",
+                "error_bucket": bucket,
+                "error": str(exc),
+                "attempt": attempts,
+                "risk_used": request.metadata.get("risk_used"),
+                "risk_total": request.metadata.get("risk_total"),
+            }
+            with self._record_lock:
+                self.fill_quality.append(error_record)
+                self.journal.append("order_error", trace.next_span("order_error", error_record))
+                self.dashboard.observe("order_error", error_record)
+            if attempts >= max_attempts:
+                parent.child_failed(exc)
+            else:
+                self._retry_later(self.retry.backoff_seconds(bucket, attempts), parent, idx, attempts)
+            return
+
+        placed_record = {
+            # FIX #2: use UTC, not datetime.now()
+            "timestamp": _utc_now_iso(),
+            "trace_id": trace.trace_id,
+            "tradingsymbol": request.tradingsymbol,
+            "child_index": idx,
+            "children": len(parent.children),
+            "quantity": child_qty,
+            "order_id": order_id,
+            "arrival_price": request.ltp,
+            "limit_price": order_args.get("price"),
+            "expected_slippage": metrics["expected_slippage"],
+            "impact_estimate": metrics["impact_estimate"],
+            "latency_ms": round((time.time() - started_at) * 1000, 2),
+            "execution_algo": request.execution_algo,
+            "route": route.get("route"),
+            "queue_priority": route.get("queue_priority"),
+            "status": "placed",
+            "risk_used": request.metadata.get("risk_used"),
+            "risk_total": request.metadata.get("risk_total"),
+        }
+        with self._record_lock:
+            self.anomaly_detector.on_order_submitted(order_id)
+            self.fill_quality.append(placed_record)
+            journal_event = trace.next_span("order_placed", placed_record)
+            self.journal.append("order_placed", journal_event)
+            self.dashboard.observe("order_placed", placed_record)
+        if parent.child_placed(order_id):
+            self._dispatch(parent, idx + 1, 0)
 
     # ------------------------------------------------------------------
     # Fill / exit recording
@@ -334,15 +458,16 @@ class ExecutionStack:
         FIX #3: this is the correct place to close out active_orders so the
         AnomalyDetector stops watching the order.
         """
-        self.anomaly_detector.on_order_closed(order_id)
         payload = {
             "order_id": order_id,
             "filled_price": filled_price,
             "filled_qty": filled_qty,
             "status": "filled",
         }
-        self.journal.append("order_fill", payload)
-        self.dashboard.observe("order_fill", payload)
+        with self._record_lock:
+            self.anomaly_detector.on_order_closed(order_id)
+            self.journal.append("order_fill", payload)
+            self.dashboard.observe("order_fill", payload)
 
     def record_paper_fill(self, order_data: Dict[str, Any]):
         """
@@ -368,8 +493,9 @@ class ExecutionStack:
         Call when an order is cancelled/rejected so it's removed from the
         stuck-order watchlist immediately.
         """
-        self.anomaly_detector.on_order_closed(order_id)
-        self.journal.append("order_cancelled", {"order_id": order_id, "status": "cancelled"})
+        with self._record_lock:
+            self.anomaly_detector.on_order_closed(order_id)
+            self.journal.append("order_cancelled", {"order_id": order_id, "status": "cancelled"})
 
     def record_exit(self, tradingsymbol: str, outcome: str, pnl: float):
         payload = {
@@ -378,20 +504,19 @@ class ExecutionStack:
             "pnl": pnl,
             "status": "closed",
         }
-        self.journal.append("position_exit", payload)
-        self.dashboard.observe("position_exit", payload)
+        with self._record_lock:
+            self.journal.append("position_exit", payload)
+            self.dashboard.observe("position_exit", payload)
 
     def ingest_tick(self, symbol: str, tick_ts: Optional[float] = None):
-        self.anomaly_detector.on_tick(symbol, tick_ts=tick_ts)
+        with self._record_lock:
+            self.anomaly_detector.on_tick(symbol, tick_ts=tick_ts)
 
     def heartbeat(self):
         """
         Public heartbeat entrypoint — safe to call from Qt QTimer as well.
         Delegates to the anomaly detector and refreshes the TCA report.
         """
-        self.anomaly_detector.heartbeat()
+        with self._record_lock:
+            self.anomaly_detector.heartbeat()
         self.tca_reporter.generate(self.journal.path)
-
-
-# Avoid circular import — import threading at module level is fine
-import threading
\ No newline at end of file
@@ -1,9 +1,11 @@
 import logging
-import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import partial
+from typing import Callable, Dict, List, Optional
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
 from PySide6.QtWidgets import QMessageBox
 
 from core.utils.data_models import Contract, Position
@@ -13,16 +15,66 @@ from core.utils.pricing_utils import calculate_smart_limit_price
 
 logger = logging.getLogger(__name__)
 
+# Order-status polls in flight at once; each may wait several seconds on the broker.
+CONFIRM_WORKERS = 2
+
+
+class _DispatchResults(QObject):
+    """Brings ExecutionStack futures back to the GUI thread."""
+
+    _ready = Signal(object, object)   # callback, future
+
+    def __init__(self):
+        super().__init__()
+        self._ready.connect(self._deliver, Qt.QueuedConnection)
+
+    def when_done(self, future: Future, callback: Callable[[Future], None]):
+        future.add_done_callback(lambda done: self._ready.emit(callback, done))
+
+    @staticmethod
+    def _deliver(callback, future):
+        callback(future)
+
+
+@dataclass
+class _PanelOrderBatch:
+    """One buy-panel submission while its orders are being placed and confirmed."""
+    details: dict
+    product: str
+    quantity: int
+    trade_status: str
+    strategy_name: str
+    successful: List[Dict] = field(default_factory=list)
+    failed: List[Dict] = field(default_factory=list)
+    open: int = 0
+
 
 class OrderExecutionMethods:
     """Extracted order execution operations used by the main window."""
 
     def __init__(self, window):
         self.window = window
+        self._dispatch = _DispatchResults()
+        self._confirm_pool = ThreadPoolExecutor(max_workers=CONFIRM_WORKERS, thread_name_prefix="order-confirm")
+
+    def shutdown(self):
+        """Drop queued order-status polls; polls already running finish on their own."""
+        self._confirm_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _confirm_async(self, order_id: str, callback: Callable[[Optional[dict]], None]):
+        """Poll ``order_id`` off the GUI thread; ``callback`` gets the order (or None) on the GUI thread."""
+        future = self._confirm_pool.submit(self.window._confirm_order_success, order_id)
+        self._dispatch.when_done(future, lambda done: callback(self._confirmed_order(order_id, done)))
+
+    @staticmethod
+    def _confirmed_order(order_id: str, done: Future) -> Optional[dict]:
+        error = done.exception()
+        if error is not None:
+            logger.error(f"Order status check failed for {order_id}: {error}", exc_info=error)
+            return None
+        return done.result()
 
     def execute_orders(self, confirmed_order_details: dict):
-        successful_orders_info = []
-        failed_orders_info = []
         order_product = confirmed_order_details.get('product', self.window.trader.PRODUCT_MIS)
         total_quantity_per_strike = confirmed_order_details.get('total_quantity_per_strike', 0)
         trade_status = str(confirmed_order_details.get("trade_status") or "MANUAL").upper()
@@ -49,11 +101,18 @@ class OrderExecutionMethods:
                 return
 
         self.window._publish_status("Placing orders...", 2000, level="action")
+        batch = _PanelOrderBatch(
+            details=confirmed_order_details,
+            product=order_product,
+            quantity=total_quantity_per_strike,
+            trade_status=trade_status,
+            strategy_name=strategy_name,
+        )
         for strike_detail in confirmed_order_details.get('strikes', []):
             contract_to_trade: Optional[Contract] = strike_detail.get('contract')
             if not contract_to_trade or not contract_to_trade.tradingsymbol:
                 logger.warning(f"Missing contract or tradingsymbol for strike {strike_detail.get('strike')}. Skipping.")
-                failed_orders_info.append(
+                batch.failed.append(
                     {'symbol': f"Strike {strike_detail.get('strike')}", 'error': "Missing contract data"})
                 continue
             try:
@@ -87,79 +146,123 @@ class OrderExecutionMethods:
                     randomize_slices=bool(confirmed_order_details.get('randomize_slices', True)),
                     metadata={'source': 'buy_exit_panel'},
                 )
-                placed_order_ids = self.window.execution_stack.execute(
+                future = self.window.execution_stack.submit(
                     request=execution_request,
                     place_order_fn=self.window.trader.place_order,
                     base_order_args=order_args,
                 )
-
-                logger.info(
-                    "Execution stack placed %s child order(s) for panel order %s, Qty: %s",
-                    len(placed_order_ids),
-                    contract_to_trade.tradingsymbol,
-                    total_quantity_per_strike,
+                batch.open += 1
+                self._dispatch.when_done(
+                    future,
+                    lambda done, c=contract_to_trade, lp=limit_price: self._on_panel_order_placed(done, c, lp, batch),
                 )
-                if isinstance(self.window.trader, PaperTradingManager):
-                    successful_orders_info.append(
-                        {'order_id': placed_order_ids[-1], 'symbol': contract_to_trade.tradingsymbol,
-                         'quantity': total_quantity_per_strike,
-                         'price': limit_price if limit_price is not None else contract_to_trade.ltp})
-                    continue
-
-                for order_id in placed_order_ids:
-                    time.sleep(0.5)
-                    confirmed_order_api_data = self.window._confirm_order_success(order_id)
-                    if confirmed_order_api_data:
-                        order_status = confirmed_order_api_data.get('status')
-                        if order_status in ['OPEN', 'TRIGGER PENDING', 'AMO REQ RECEIVED']:
-                            logger.info(f"Order {order_id} is pending with status: {order_status}. Triggering refresh.")
-                            self.window._refresh_positions()
-                            continue
-
-                        if order_status == 'COMPLETE':
-                            avg_price_from_order = confirmed_order_api_data.get('average_price', contract_to_trade.ltp)
-                            tsl = confirmed_order_details.get("trailing_stop_loss") or 0
-
-                            new_position = Position(
-                                symbol=f"{contract_to_trade.symbol}{contract_to_trade.strike}{contract_to_trade.option_type}",
-                                tradingsymbol=contract_to_trade.tradingsymbol,
-                                quantity=confirmed_order_api_data.get('filled_quantity', total_quantity_per_strike),
-                                average_price=avg_price_from_order,
-                                ltp=avg_price_from_order,
-                                pnl=0,
-                                contract=contract_to_trade,
-                                order_id=order_id,
-                                exchange=self.window.trader.EXCHANGE_NFO,
-                                product=order_product,
-                                stop_loss_price=confirmed_order_details.get("stop_loss_price"),
-                                target_price=confirmed_order_details.get("target_price"),
-                                trailing_stop_loss=tsl if tsl > 0 else None,
-                                entry_time=datetime.now(),
-                                trade_status=trade_status,
-                                strategy_name=strategy_name,
-                            )
-
-                            self.window.position_manager.add_position(new_position)
-                            self.window.trade_logger.log_trade(confirmed_order_api_data)
-                            successful_orders_info.append(
-                                {'order_id': order_id, 'symbol': contract_to_trade.tradingsymbol,
-                                 'quantity': confirmed_order_api_data.get('filled_quantity', total_quantity_per_strike),
-                                 'price': avg_price_from_order})
-                            logger.info(
-                                f"Order {order_id} for {contract_to_trade.tradingsymbol} successful and position added.")
-                    else:
-                        logger.warning(
-                            f"Order {order_id} for {contract_to_trade.tradingsymbol} failed or not confirmed.")
-                        failed_orders_info.append(
-                            {'symbol': contract_to_trade.tradingsymbol,
-                             'error': "Order rejected or status not confirmed"})
             except Exception as e:
                 logger.error(f"Order placement failed for {contract_to_trade.tradingsymbol}: {e}", exc_info=True)
-                failed_orders_info.append({'symbol': contract_to_trade.tradingsymbol, 'error': str(e)})
+                batch.failed.append({'symbol': contract_to_trade.tradingsymbol, 'error': str(e)})
+
+        self._finish_panel_batch(batch)
+
+    def _on_panel_order_placed(self, done: Future, contract_to_trade: Contract, limit_price: Optional[float],
+                               batch: _PanelOrderBatch):
+        result = done.result()
+        placed_order_ids = result.order_ids
+        if result.error is not None:
+            logger.error(
+                f"Order placement failed for {contract_to_trade.tradingsymbol} after {len(placed_order_ids)} "
+                f"placed child order(s), {result.unsent} not sent: {result.error}",
+                exc_info=result.error,
+            )
+            batch.failed.append({'symbol': contract_to_trade.tradingsymbol, 'error': str(result.error)})
+        if not placed_order_ids:
+            batch.open -= 1
+            self._finish_panel_batch(batch)
+            return
+
+        logger.info(
+            "Execution stack placed %s child order(s) for panel order %s, Qty: %s",
+            len(placed_order_ids),
+            contract_to_trade.tradingsymbol,
+            batch.quantity,
+        )
+        if isinstance(self.window.trader, PaperTradingManager):
+            batch.successful.append(
+                {'order_id': placed_order_ids[-1], 'symbol': contract_to_trade.tradingsymbol,
+                 'quantity': batch.quantity,
+                 'price': limit_price if limit_price is not None else contract_to_trade.ltp})
+            batch.open -= 1
+            self._finish_panel_batch(batch)
+            return
 
+        # Each child is confirmed on its own staggered timer (the same spacing
+        # as single-strike orders); the status poll itself runs off the GUI thread.
+        batch.open += len(placed_order_ids) - 1
+        for index, order_id in enumerate(placed_order_ids):
+            QTimer.singleShot(
+                500 + index * 250,
+                lambda oid=order_id: self._confirm_async(
+                    oid, partial(self._on_panel_order_confirmed, oid, contract_to_trade, batch)),
+            )
+
+    def _on_panel_order_confirmed(self, order_id: str, contract_to_trade: Contract, batch: _PanelOrderBatch,
+                                  confirmed_order_api_data: Optional[dict]):
+        try:
+            if confirmed_order_api_data:
+                order_status = confirmed_order_api_data.get('status')
+                if order_status in ['OPEN', 'TRIGGER PENDING', 'AMO REQ RECEIVED']:
+                    logger.info(f"Order {order_id} is pending with status: {order_status}. Triggering refresh.")
+                    self.window._refresh_positions()
+
+                elif order_status == 'COMPLETE':
+                    avg_price_from_order = confirmed_order_api_data.get('average_price', contract_to_trade.ltp)
+                    tsl = batch.details.get("trailing_stop_loss") or 0
+
+                    new_position = Position(
+                        symbol=f"{contract_to_trade.symbol}{contract_to_trade.strike}{contract_to_trade.option_type}",
+                        tradingsymbol=contract_to_trade.tradingsymbol,
+                        quantity=confirmed_order_api_data.get('filled_quantity', batch.quantity),
+                        average_price=avg_price_from_order,
+                        ltp=avg_price_from_order,
+                        pnl=0,
+                        contract=contract_to_trade,
+                        order_id=order_id,
+                        exchange=self.window.trader.EXCHANGE_NFO,
+                        product=batch.product,
+                        stop_loss_price=batch.details.get("stop_loss_price"),
+                        target_price=batch.details.get("target_price"),
+                        trailing_stop_loss=tsl if tsl > 0 else None,
+                        entry_time=datetime.now(),
+                        trade_status=batch.trade_status,
+                        strategy_name=batch.strategy_name,
+                    )
+
+                    self.window.position_manager.add_position(new_position)
+                    self.window.trade_logger.log_trade(confirmed_order_api_data)
+                    batch.successful.append(
+                        {'order_id': order_id, 'symbol': contract_to_trade.tradingsymbol,
+                         'quantity': confirmed_order_api_data.get('filled_quantity', batch.quantity),
+                         'price': avg_price_from_order})
+                    logger.info(
+                        f"Order {order_id} for {contract_to_trade.tradingsymbol} successful and position added.")
+            else:
+                logger.warning(
+                    f"Order {order_id} for {contract_to_trade.tradingsymbol} failed or not confirmed.")
+                batch.failed.append(
+                    {'symbol': contract_to_trade.tradingsymbol,
+                     'error': "Order rejected or status not confirmed"})
+        except Exception as e:
+            logger.error(f"Order confirmation failed for {contract_to_trade.tradingsymbol}: {e}", exc_info=True)
+            batch.failed.append({'symbol': contract_to_trade.tradingsymbol, 'error': str(e)})
+        finally:
+            batch.open -= 1
+            self._finish_panel_batch(batch)
+
+    def _finish_panel_batch(self, batch: _PanelOrderBatch):
+        if batch.open > 0:
+            return
+        batch.open = -1   # finish exactly once
         self.window._refresh_positions()
-        self.window._play_sound(success=not failed_orders_info)
-        self.show_order_results(successful_orders_info, failed_orders_info)
+        self.window._play_sound(success=not batch.failed)
+        self.show_order_results(batch.successful, batch.failed)
         self.window._publish_status("Order placement flow completed.", 3000, level="info")
 
     def show_order_results(self, successful_list: List[Dict], failed_list: List[Dict]):
@@ -252,71 +355,81 @@ class OrderExecutionMethods:
                     'group_name': group_name,
                 },
             )
-            placed_order_ids = self.window.execution_stack.execute(
+            future = self.window.execution_stack.submit(
                 request=execution_request,
                 place_order_fn=self.window.trader.place_order,
                 base_order_args=order_args,
             )
-            order_id = placed_order_ids[-1]
-            logger.info(
-                "Execution stack placed %s child order(s) for %s. Last order id: %s",
-                len(placed_order_ids),
-                contract_to_trade.tradingsymbol,
-                order_id,
-            )
-
-            def _build_fill_anchored_risk_values(position):
-                qty = abs(position.quantity)
-                if qty <= 0:
-                    return None, None, None
+        except Exception as e:
+            self._on_single_strike_failed(e, contract_to_trade, order_params)
+            return
 
-                is_buy_position = position.quantity > 0
-                avg_fill_price = float(position.average_price or 0)
-                if avg_fill_price <= 0:
-                    return None, None, None
+        def _build_fill_anchored_risk_values(position):
+            qty = abs(position.quantity)
+            if qty <= 0:
+                return None, None, None
 
-                anchored_sl = None
-                anchored_tp = None
-                anchored_tsl = None
+            is_buy_position = position.quantity > 0
+            avg_fill_price = float(position.average_price or 0)
+            if avg_fill_price <= 0:
+                return None, None, None
 
-                if stop_loss_amount > 0:
-                    sl_per_unit = stop_loss_amount / qty
-                    anchored_sl = avg_fill_price - sl_per_unit if is_buy_position else avg_fill_price + sl_per_unit
+            anchored_sl = None
+            anchored_tp = None
+            anchored_tsl = None
 
-                if target_amount > 0:
-                    tp_per_unit = target_amount / qty
-                    anchored_tp = avg_fill_price + tp_per_unit if is_buy_position else avg_fill_price - tp_per_unit
+            if stop_loss_amount > 0:
+                sl_per_unit = stop_loss_amount / qty
+                anchored_sl = avg_fill_price - sl_per_unit if is_buy_position else avg_fill_price + sl_per_unit
 
-                if trailing_stop_loss_amount > 0:
-                    anchored_tsl = trailing_stop_loss_amount / qty
+            if target_amount > 0:
+                tp_per_unit = target_amount / qty
+                anchored_tp = avg_fill_price + tp_per_unit if is_buy_position else avg_fill_price - tp_per_unit
 
-                return anchored_sl, anchored_tp, anchored_tsl
+            if trailing_stop_loss_amount > 0:
+                anchored_tsl = trailing_stop_loss_amount / qty
 
-            def _apply_risk_after_fill():
-                position = self.window.position_manager.get_position(contract_to_trade.tradingsymbol)
-                if not position:
-                    logger.warning(
-                        "Position not yet available for risk application: %s",
-                        contract_to_trade.tradingsymbol,
-                    )
-                    return
+            return anchored_sl, anchored_tp, anchored_tsl
 
-                anchored_sl, anchored_tp, anchored_tsl = _build_fill_anchored_risk_values(position)
-                self.window.position_manager.update_sl_tp_for_position(
-                    contract_to_trade.tradingsymbol,
-                    anchored_sl,
-                    anchored_tp,
-                    anchored_tsl,
-                )
-                if getattr(self.window, "inline_positions_table", None):
-                    self.window.inline_positions_table._save_table_state()
-                logger.info(
-                    "✅ Applied fill-anchored SL/TP for %s | SL=%s TP=%s TSL=%s",
+        def _apply_risk_after_fill():
+            position = self.window.position_manager.get_position(contract_to_trade.tradingsymbol)
+            if not position:
+                logger.warning(
+                    "Position not yet available for risk application: %s",
                     contract_to_trade.tradingsymbol,
-                    anchored_sl,
-                    anchored_tp,
-                    anchored_tsl,
                 )
+                return
+
+            anchored_sl, anchored_tp, anchored_tsl = _build_fill_anchored_risk_values(position)
+            self.window.position_manager.update_sl_tp_for_position(
+                contract_to_trade.tradingsymbol,
+                anchored_sl,
+                anchored_tp,
+                anchored_tsl,
+            )
+            if getattr(self.window, "inline_positions_table", None):
+                self.window.inline_positions_table._save_table_state()
+            logger.info(
+                "✅ Applied fill-anchored SL/TP for %s | SL=%s TP=%s TSL=%s",
+                contract_to_trade.tradingsymbol,
+                anchored_sl,
+                anchored_tp,
+                anchored_tsl,
+            )
+
+        def _on_placed(done: Future):
+            result = done.result()
+            placed_order_ids = result.order_ids
+            if result.error is not None:
+                self._on_single_strike_failed(result.error, contract_to_trade, order_params)
+            if not placed_order_ids:
+                return
+            logger.info(
+                "Execution stack placed %s child order(s) for %s. Last order id: %s",
+                len(placed_order_ids),
+                contract_to_trade.tradingsymbol,
+                placed_order_ids[-1],
+            )
 
             if isinstance(self.window.trader, PaperTradingManager):
                 QTimer.singleShot(500, self.window._refresh_positions)
@@ -342,12 +455,14 @@ class OrderExecutionMethods:
                                                     trade_status=ts, strategy_name=sn)
                 )
 
-        except Exception as e:
-            self.window._play_sound(success=False)
-            logger.error(f"Single strike order execution failed for {contract_to_trade.tradingsymbol}: {e}",
-                         exc_info=True)
-            self.window._handle_order_error(e, order_params)
-            self.show_order_results([], [{'symbol': contract_to_trade.tradingsymbol, 'error': str(e)}])
+        self._dispatch.when_done(future, _on_placed)
+
+    def _on_single_strike_failed(self, e: Exception, contract_to_trade: Contract, order_params: dict):
+        self.window._play_sound(success=False)
+        logger.error(f"Single strike order execution failed for {contract_to_trade.tradingsymbol}: {e}",
+                     exc_info=e)
+        self.window._handle_order_error(e, order_params)
+        self.show_order_results([], [{'symbol': contract_to_trade.tradingsymbol, 'error': str(e)}])
 
     def confirm_and_finalize_order(
         self, order_id, contract_to_trade, quantity, price,
@@ -357,7 +472,19 @@ class OrderExecutionMethods:
         trade_status=None, strategy_name=None,
     ):
         self.window._refresh_positions()
-        confirmed_order_api_data = self.window._confirm_order_success(order_id)
+        self._confirm_async(order_id, partial(
+            self._finalize_order, order_id, contract_to_trade, quantity, price, transaction_type, product,
+            stop_loss_price, target_price, trailing_stop_loss, stop_loss_amount, target_amount,
+            trailing_stop_loss_amount, group_name, auto_token, trade_status, strategy_name,
+        ))
+
+    def _finalize_order(
+        self, order_id, contract_to_trade, quantity, price,
+        transaction_type, product, stop_loss_price, target_price,
+        trailing_stop_loss, stop_loss_amount, target_amount,
+        trailing_stop_loss_amount, group_name, auto_token,
+        trade_status, strategy_name, confirmed_order_api_data,
+    ):
         if confirmed_order_api_data:
             order_status = confirmed_order_api_data.get('status')
             if order_status in ['OPEN', 'TRIGGER PENDING', 'AMO REQ RECEIVED']:
@@ -0,0 +1,57 @@
+# core/execution/order_versions.py
+"""
+Per-order high-water marks for live order reconciliation.
+
+An order's version is ``(exchange_update_timestamp, filled_quantity,
+terminal)``.  The ticker's order postbacks and the periodic ``orders()``
+reconciliation both pass orders through ``advance``; an order is handed on
+only when its version moves past the last one seen, so unchanged orders cost
+one dict probe and a stale snapshot (a poll that lands after a newer
+postback) never rolls an order back.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+TERMINAL_STATUSES = frozenset({"COMPLETE", "CANCELLED", "REJECTED"})
+
+
+def order_version(order: dict) -> Tuple[str, int, bool]:
+    # REST rows carry datetimes and postbacks carry strings; both render as
+    # "YYYY-mm-dd HH:MM:SS", which orders correctly as text.
+    stamp = order.get("exchange_update_timestamp") or order.get("exchange_timestamp") or order.get("order_timestamp")
+    return (
+        str(stamp) if stamp else "",
+        int(order.get("filled_quantity") or 0),
+        order.get("status") in TERMINAL_STATUSES,
+    )
+
+
+class OrderVersionTracker:
+    """Last seen version of each of the day's orders."""
+
+    def __init__(self):
+        self._versions: Dict[str, Tuple[str, int, bool]] = {}
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def advance(self, order: dict) -> bool:
+        """Record ``order`` and return True when it moved past its high-water mark."""
+        order_id = order.get("order_id")
+        if not order_id:
+            return False
+        version = order_version(order)
+        seen = self._versions.get(order_id)
+        if seen is not None and version <= seen:
+            return False
+        self._versions[order_id] = version
+        return True
+
+    def changed(self, orders: Iterable[dict]) -> List[dict]:
+        """The orders in a full order-book pass that moved since the last pass."""
+        return [order for order in orders if self.advance(order)]
+
+    def clear(self):
+        self._versions.clear()
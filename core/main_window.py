@@ -22,16 +22,18 @@ from core.dialogs import SettingsDialog
 from core.dialogs import OpenPositionsDialog
 from core.dialogs import QuickOrderDialog, QuickOrderMode
 from core.positions.position_manager import PositionManager
-from core.config import REFRESH_INTERVAL_MS
+from core.config import LIVE_ORDER_RECONCILE_INTERVAL_MS, REFRESH_INTERVAL_MS
 from core.utils.trade_logger import TradeLogger
 from core.execution.paper_trading_manager import PaperTradingManager
 from core.dialogs.option_chain_dialog import OptionChainDialog
 from core.dialogs import StrategyBuilderDialog
 from core.dialogs.order_confirmation_dialog import OrderConfirmationDialog
 from core.cvd.cvd_engine import CVDEngine
+from core.cvd.cvd_snapshot import SNAPSHOT_FILE, CVDCheckpointer
 from core.cvd.cvd_symbol_sets import CVDSymbolSetManager
 from core.dialogs import CVDSetMultiChartDialog
 from core.execution.trade_ledger import TradeLedger
+from core.execution.order_versions import OrderVersionTracker
 from core.widgets.title_bar import TitleBar
 from core.ui.main_window_shell import MainWindowShell
 from core.market_data import APICircuitBreaker
@@ -243,6 +245,7 @@ class ImperiumMainWindow(QMainWindow):
         self._connect_signals()
         self._setup_keyboard_shortcuts()
         self._init_background_workers()
+        self._init_cvd_checkpointing()
         self._schedule_trading_day_reset()
 
         self._publish_status("App startup successful. Initializing live data flows...", 6000, level="success")
@@ -261,15 +264,18 @@ class ImperiumMainWindow(QMainWindow):
         self.pending_order_refresh_timer.timeout.connect(self._refresh_positions)
 
         self._processed_live_exit_orders: set[str] = set()
+        self._live_order_versions = OrderVersionTracker()
 
         # 🔥 FIX: Cache position snapshots before exit to preserve entry data
         # When a SELL order completes, the position may already be gone from API
         # This cache maps tradingsymbol → Position snapshot at exit time
         self._position_snapshots_for_exit: Dict[str, object] = {}
 
+        # Fills come from the ticker's order-update stream; this slow poll only
+        # reconciles postbacks missed while the socket was down.
         self.live_order_monitor_timer = QTimer(self)
-        self.live_order_monitor_timer.timeout.connect(self._check_live_completed_orders)
-        self.live_order_monitor_timer.start(1000)  # 1s polling (safe)
+        self.live_order_monitor_timer.timeout.connect(self._poll_live_orders)
+        self.live_order_monitor_timer.start(LIVE_ORDER_RECONCILE_INTERVAL_MS)
 
         self.restore_window_state()
         self._publish_status("Loading instruments...", 5000, level="action")
@@ -334,12 +340,15 @@ class ImperiumMainWindow(QMainWindow):
     def _setup_position_manager(self):
         self.inline_positions_table.set_position_manager(self.position_manager)
         self.position_manager.positions_updated.connect(self._on_positions_updated)
+        self.position_manager.positions_changed.connect(self._on_positions_changed)
+        self.position_manager.orders_refreshed.connect(self._reconcile_live_orders)
         self.position_manager.position_added.connect(self._on_position_added)
         self.position_manager.position_removed.connect(self._on_position_removed)
         self.position_manager.refresh_completed.connect(self._on_refresh_completed)
         self.position_manager.api_error_occurred.connect(self._on_api_error)
         self.position_manager.position_exiting.connect(self._on_position_exiting)
         self.position_manager.portfolio_exit_triggered.connect(self._on_portfolio_exit_triggered)
+        self.position_manager.group_exit_triggered.connect(self._on_group_exit_triggered)
 
     # =========================================================================
     # SECTION 3: BACKGROUND WORKERS & MARKET DATA
@@ -351,6 +360,7 @@ class ImperiumMainWindow(QMainWindow):
         self.market_data_worker = MarketDataWorker(self.api_key, self.access_token)
         self.market_data_worker.data_received.connect(self._on_market_data, Qt.QueuedConnection)
         self.market_data_worker.connection_status_changed.connect(self._on_network_status_changed)
+        self.market_data_worker.order_update_received.connect(self._on_live_order_update)
         # self.market_data_worker.state_changed.connect(self._on_websocket_state_changed)
 
         self.market_data_worker.start()
@@ -359,6 +369,21 @@ class ImperiumMainWindow(QMainWindow):
         self.update_timer.timeout.connect(self._update_ui)
         self.update_timer.start(REFRESH_INTERVAL_MS)
 
+    def _init_cvd_checkpointing(self):
+        """Warm-start the CVD engine from today's checkpoint, then checkpoint every minute."""
+        self.cvd_checkpointer = CVDCheckpointer(
+            self.cvd_engine,
+            self.config_manager.config_dir / SNAPSHOT_FILE,
+            kite=self.real_kite_client,
+            parent=self,
+        )
+        restored = self.cvd_checkpointer.restore()
+        if restored:
+            # Keep restored tokens streaming so no flow is missed before their charts reopen.
+            self.active_cvd_tokens.update(restored)
+            logger.info(f"CVD warm start restored {len(restored)} token(s) from checkpoint")
+        self.cvd_checkpointer.start()
+
     def _init_instrument_loader(self):
         """Build InstrumentLoader from saved Symbol Universe Config."""
         inst_config = InstrumentConfig.from_settings(self.settings)
@@ -407,14 +432,18 @@ class ImperiumMainWindow(QMainWindow):
 
     def _on_instruments_loaded(self, data: dict):
         self.instrument_data = data
+        strike_grids = None
         if hasattr(self, "instrument_loader") and hasattr(self.instrument_loader, "strike_ladder"):
+            # Empty while the cached index stub is shown, before the loader has run.
+            if self.instrument_loader.strike_ladder.ladders:
+                strike_grids = self.instrument_loader.strike_ladder
             if self.option_chain_dialog is not None:
                 self.option_chain_dialog.strike_ladder = self.instrument_loader.strike_ladder
         if isinstance(self.trader, PaperTradingManager):
             self.trader.set_instrument_data(data)
 
         self.position_manager.set_instrument_data(data)
-        self.strike_ladder.set_instrument_data(data)
+        self.strike_ladder.set_instrument_data(data, strike_grids)
         symbols = sorted(data.keys())
         self.header.set_symbols(symbols)
         if self.watchlist_dialog:
@@ -464,6 +493,9 @@ class ImperiumMainWindow(QMainWindow):
 
             self._process_subscription_queue()
 
+            # Order postbacks sent while the socket was down are not replayed.
+            self._poll_live_orders()
+
             self._publish_status("✓ Market data connected", 3000, level="success")
 
         elif new_state == "connecting":
@@ -872,6 +904,10 @@ class ImperiumMainWindow(QMainWindow):
         self._update_market_subscriptions()
         self.position_sync_adapter.on_positions_updated(positions)
 
+    def _on_positions_changed(self, positions: List[Position]):
+        # Tick deltas leave the position set (and so subscriptions) untouched.
+        self.position_sync_adapter.on_positions_changed(positions)
+
     def _on_position_added(self, position: Position):
         self.position_sync_adapter.on_position_added(position)
 
@@ -884,9 +920,9 @@ class ImperiumMainWindow(QMainWindow):
         popped from the internal dict.
 
         For live mode this caches the Position snapshot so that
-        _check_live_completed_orders() can match the completed SELL order to
+        _process_live_exit_order() can match the completed SELL order to
         the original entry data even if the broker has already removed the
-        position from its API response by the time the 1-second poll fires.
+        position from its API response by the time the fill is reported.
 
         Safe to call unconditionally — the snapshot dict is keyed by symbol so
         duplicate writes are idempotent, and existing manual-exit paths that
@@ -927,6 +963,13 @@ class ImperiumMainWindow(QMainWindow):
         else:
             self._play_sound(success=False, flow="exit")
 
+    def _on_group_exit_triggered(self, group_name: str, reason: str, pnl: float):
+        # PositionManager has already sent the exits for the group's legs.
+        label = "target" if reason == "TARGET" else "stop-loss"
+        self._publish_status(f"Group '{group_name}' {label} hit at ₹{pnl:,.2f}. Exiting group.", 5000,
+                             level="success" if reason == "TARGET" else "warning")
+        self._play_sound(success=reason == "TARGET", flow="exit")
+
     def _sync_positions_to_dialog(self):
         self.position_sync_adapter.sync_positions_to_dialog()
 
@@ -1058,66 +1101,86 @@ class ImperiumMainWindow(QMainWindow):
     def _exit_option_positions(self, option_type: OptionType):
         self.execution_service.exit_option_positions(option_type)
 
-    def _check_live_completed_orders(self):
+    def _poll_live_orders(self):
+        """Safety-net reconciliation; the refresh's order book lands in _reconcile_live_orders."""
         if self.trading_mode != "live":
             return
+        self.position_manager.refresh_from_api()
 
-        try:
-            orders = self.real_kite_client.orders()
-        except Exception as e:
-            logger.debug(f"Live order fetch failed: {e}")
+    def _on_live_order_update(self, order: dict):
+        """Order postback from the ticker stream (live mode)."""
+        if self.trading_mode != "live" or not self._live_order_versions.advance(order):
             return
+        self._process_live_exit_order(order)
+        # Async and coalesced, so a burst of postbacks costs one round trip.
+        self.position_manager.refresh_from_api()
 
+    def _reconcile_live_orders(self, orders: list):
+        # Orders whose (update time, filled qty, status) moved since the last
+        # pass or postback are looked at again, and so is every completed SELL
+        # not yet recorded: its postback may have landed before the position
+        # snapshot or position it needs.
+        if self.trading_mode != "live":
+            return
         for order in orders:
-            if order.get("status") != "COMPLETE":
-                continue
-
-            if order.get("transaction_type") != "SELL":
-                continue
+            moved = self._live_order_versions.advance(order)
+            if moved or (
+                order.get("status") == "COMPLETE"
+                and order.get("transaction_type") == "SELL"
+                and order.get("order_id") not in self._processed_live_exit_orders
+            ):
+                self._process_live_exit_order(order)
+
+    def _process_live_exit_order(self, order: dict):
+        if order.get("status") != "COMPLETE":
+            return
 
-            order_id = order.get("order_id")
-            if not order_id:
-                continue
+        if order.get("transaction_type") != "SELL":
+            return
 
-            # 🔒 Prevent duplicate ledger writes
-            if order_id in self._processed_live_exit_orders:
-                continue
+        order_id = order.get("order_id")
+        if not order_id:
+            return
 
-            tradingsymbol = order.get("tradingsymbol")
+        # 🔒 Prevent duplicate ledger writes (stream and reconciliation both land here)
+        if order_id in self._processed_live_exit_orders:
+            return
 
-            # NOTE:
-            # We intentionally snapshot the CURRENT Position object at exit time.
-            # For LIVE trading, each completed SELL order is treated as an independent exit trade.
-            # This design correctly supports partial exits and scaling out.
-            # Do NOT replace this with cached entry data or dict snapshots.
+        tradingsymbol = order.get("tradingsymbol")
 
-            # 🔥 FIX: Try cached snapshot first, then current position
-            # The position may already be removed from API after order completion
-            original_position = self._position_snapshots_for_exit.get(tradingsymbol)
+        # NOTE:
+        # We intentionally snapshot the CURRENT Position object at exit time.
+        # For LIVE trading, each completed SELL order is treated as an independent exit trade.
+        # This design correctly supports partial exits and scaling out.
+        # Do NOT replace this with cached entry data or dict snapshots.
 
-            if not original_position:
-                # Fallback: Try getting current position (may still exist for partial exits)
-                original_position = self.position_manager.get_position(tradingsymbol)
+        # 🔥 FIX: Try cached snapshot first, then current position
+        # The position may already be removed from API after order completion
+        original_position = self._position_snapshots_for_exit.get(tradingsymbol)
 
-            if not original_position:
-                logger.warning(
-                    f"[LIVE] Cannot record exit trade for {tradingsymbol} - "
-                    f"no position snapshot or current position found (order_id: {order_id})"
-                )
-                continue
+        if not original_position:
+            # Fallback: Try getting current position (may still exist for partial exits)
+            original_position = self.position_manager.get_position(tradingsymbol)
 
-            self._record_completed_exit_trade(
-                confirmed_order=order,
-                original_position=original_position,
-                trading_mode="LIVE"
+        if not original_position:
+            logger.warning(
+                f"[LIVE] Cannot record exit trade for {tradingsymbol} - "
+                f"no position snapshot or current position found (order_id: {order_id})"
             )
+            return
 
-            self._processed_live_exit_orders.add(order_id)
+        self._record_completed_exit_trade(
+            confirmed_order=order,
+            original_position=original_position,
+            trading_mode="LIVE"
+        )
 
-            # 🔥 FIX: Clean up snapshot after successful recording
-            if tradingsymbol in self._position_snapshots_for_exit:
-                del self._position_snapshots_for_exit[tradingsymbol]
-                logger.debug(f"Removed position snapshot for {tradingsymbol}")
+        self._processed_live_exit_orders.add(order_id)
+
+        # 🔥 FIX: Clean up snapshot after successful recording
+        if tradingsymbol in self._position_snapshots_for_exit:
+            del self._position_snapshots_for_exit[tradingsymbol]
+            logger.debug(f"Removed position snapshot for {tradingsymbol}")
 
     def _record_completed_exit_trade(
             self,
@@ -1304,6 +1367,11 @@ class ImperiumMainWindow(QMainWindow):
             expiry=expiry_date,
             strike_interval=calculated_interval
         )
+        tracking_token, tracking_is_future = self._get_atm_tracking_token(symbol)
+        self.strike_ladder.set_tracking_token(tracking_token, tracking_is_future)
+        # The futures basis must come from a tick received from here on, not a
+        # cached one from before the switch.
+        self._latest_market_data.pop(tracking_token, None)
 
         self._update_market_subscriptions()
         return True
@@ -1408,6 +1476,22 @@ class ImperiumMainWindow(QMainWindow):
 
         return fut.get("instrument_token")
 
+    def _get_atm_tracking_token(self, symbol: str):
+        """
+        Token whose ticks drive the strike ladder's ATM tracking.
+
+        Spot index/equity when the instrument data carries one, otherwise the
+        nearest future (the ladder removes its basis over spot).
+
+        Returns tuple: (token, is_future)
+        """
+        symbol_info = self.instrument_data.get(symbol.upper()) or {}
+        spot_token = symbol_info.get("instrument_token")
+        if spot_token:
+            return spot_token, False
+        fut_token = self._get_nearest_future_token(symbol)
+        return fut_token, bool(fut_token)
+
     def _get_cvd_token(self, symbol: str):
         """
         Get the appropriate token for CVD calculation.
@@ -2338,6 +2422,8 @@ class ImperiumMainWindow(QMainWindow):
     def _on_trading_day_reset(self):
         logger.info("Trading day reset at 07:30 AM")
         self.risk_controller.reset_for_new_trading_day()
+        self._live_order_versions.clear()
+        self._processed_live_exit_orders.clear()
         self._update_account_summary_widget()
         self._schedule_trading_day_reset()  # schedule next day
 
@@ -2435,6 +2521,9 @@ class ImperiumMainWindow(QMainWindow):
         for timer in list(getattr(self, '_cvd_pending_retry_timers', {}).values()):
             timer.stop()
         self._cvd_pending_retry_timers.clear()
+        if hasattr(self, 'cvd_checkpointer'):
+            self.cvd_checkpointer.stop()
+            self.cvd_checkpointer.save()
 
         # Background workers
         if hasattr(self, 'market_data_worker') and self.market_data_worker.is_running:
@@ -2450,6 +2539,11 @@ class ImperiumMainWindow(QMainWindow):
             else:
                 logger.info("Instrument loader stopped.")
 
+        if hasattr(self, 'execution_stack'):
+            self.execution_stack.shutdown()
+        if hasattr(self, 'execution_service'):
+            self.execution_service.shutdown()
+
         logger.info("Proceeding with application shutdown.")
         self.save_window_state()
         event.accept()
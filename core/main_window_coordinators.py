@@ -222,7 +222,11 @@ class MarketDataOrchestrator:
         if not w._ui_update_needed:
             return
 
+        # Latest tick per token since the last flush; drained so each flush
+        # carries only what moved, not every token ever seen.
         ticks_to_process = list(w._latest_market_data.values())
+        w._latest_market_data.clear()
+        # Also feeds the underlying tick that drives ATM recentring.
         w.strike_ladder.update_prices(ticks_to_process)
         w.position_manager.update_pnl_from_market_data(ticks_to_process)
         w._update_account_summary_widget()
@@ -230,16 +234,6 @@ class MarketDataOrchestrator:
         if w.positions_dialog and w.positions_dialog.isVisible() and hasattr(w.positions_dialog, 'update_market_data'):
             w.positions_dialog.update_market_data(ticks_to_process)
 
-        for tick in ticks_to_process:
-            token = tick.get("instrument_token")
-            if not token:
-                continue
-            current_symbol = w.header.get_current_settings().get("symbol")
-            if current_symbol in w.instrument_data:
-                index_token = w.instrument_data[current_symbol].get("instrument_token")
-                if token == index_token:
-                    w.strike_ladder.update_index_price(tick.get("last_price"))
-
         ladder_data = w.strike_ladder.get_ladder_data()
         if ladder_data:
             w.buy_exit_panel.update_strike_ladder(
@@ -1,6 +1,8 @@
 import os
 import pickle
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+from core.market_data.strike_grid import StrikeGrid
 
 
 class InstrumentIndex:
@@ -34,7 +36,9 @@ class InstrumentIndex:
                 "strikes": data.get("strikes", []),
                 "options": {},
                 "futures": {},
+                "grids": {},
             }
+            by_expiry: Dict[Any, list] = {}
 
             for inst in data.get("instruments", []):
                 key = (
@@ -43,6 +47,12 @@ class InstrumentIndex:
                     inst.get("instrument_type"),
                 )
                 symbol_index["options"][key] = inst.get("instrument_token")
+                by_expiry.setdefault(inst.get("expiry"), []).append(inst)
+
+            symbol_index["grids"] = {
+                expiry: StrikeGrid.from_instruments(insts)
+                for expiry, insts in by_expiry.items()
+            }
 
             for fut in data.get("futures", []):
                 symbol_index["futures"][fut.get("expiry")] = fut.get("instrument_token")
@@ -55,6 +65,23 @@ class InstrumentIndex:
     def get_option_token(self, symbol, expiry, strike, option_type):
         return self.data[symbol]["options"].get((expiry, strike, option_type))
 
+    def get_strike_grid(self, symbol, expiry) -> Optional[StrikeGrid]:
+        symbol_index = self.data.get(symbol)
+        if not symbol_index:
+            return None
+        grids = symbol_index.setdefault("grids", {})
+        if expiry not in grids:
+            # Index pickled before grids were stored: derive from the option tokens.
+            rows = [
+                (strike, option_type, token)
+                for (exp, strike, option_type), token in symbol_index["options"].items()
+                if exp == expiry
+            ]
+            if not rows:
+                return None
+            grids[expiry] = StrikeGrid.from_rows(rows)
+        return grids[expiry]
+
     def get_future_token(self, symbol, expiry):
         return self.data[symbol]["futures"].get(expiry)
 
@@ -22,6 +22,7 @@ class MarketDataWorker(QObject):
     connection_closed = Signal()
     connection_error = Signal(str)
     connection_status_changed = Signal(str)
+    order_update_received = Signal(dict)   # KiteTicker order postback (orders() row shape)
 
     # Internal signals: KiteTicker callbacks arrive from a non-Qt thread.
     # We fan-in through queued Qt signals so QTimer operations happen on this
@@ -30,6 +31,7 @@ class MarketDataWorker(QObject):
     _ws_connected = Signal(object)
     _ws_closed = Signal(int, str)
     _ws_error = Signal(int, str)
+    _ws_order_update = Signal(object)
 
     def __init__(self, api_key: str, access_token: str):
         super().__init__()
@@ -62,6 +64,7 @@ class MarketDataWorker(QObject):
         self._ws_connected.connect(self._handle_connect, Qt.QueuedConnection)
         self._ws_closed.connect(self._handle_close, Qt.QueuedConnection)
         self._ws_error.connect(self._handle_error, Qt.QueuedConnection)
+        self._ws_order_update.connect(self._handle_order_update, Qt.QueuedConnection)
 
     def _check_network_connectivity(self, force_http_probe: bool = False) -> tuple[bool, str]:
         """
@@ -198,6 +201,7 @@ class MarketDataWorker(QObject):
             self.kws.on_connect = self._on_connect
             self.kws.on_close = self._on_close
             self.kws.on_error = self._on_error
+            self.kws.on_order_update = self._on_order_update
 
         # The connect call is non-blocking and runs in its own thread
         try:
@@ -276,6 +280,9 @@ class MarketDataWorker(QObject):
     def _on_error(self, _, code, reason):
         self._safe_emit(self._ws_error, int(code), str(reason), signal_name="_ws_error")
 
+    def _on_order_update(self, _, data):
+        self._safe_emit(self._ws_order_update, data, signal_name="_ws_order_update")
+
     def _safe_emit(self, signal, *args, signal_name: str):
         """Best-effort emit from non-Qt callbacks during shutdown.
 
@@ -297,6 +304,11 @@ class MarketDataWorker(QObject):
         self._heartbeat_stale_reported = False
         self.data_received.emit(ticks)
 
+    def _handle_order_update(self, data):
+        """Qt-thread handler for order postbacks."""
+        if isinstance(data, dict):
+            self.order_update_received.emit(data)
+
     def _handle_connect(self, response):
         """Callback on successful connection."""
         logger.info("WebSocket connected. Subscribing to existing tokens.")
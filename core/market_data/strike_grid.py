@@ -0,0 +1,91 @@
+"""
+Sorted, array-backed strike grid for one (symbol, expiry).
+
+Strikes are kept in an ascending float64 array with the CE and PE instrument
+tokens in parallel int64 arrays (0 where a side is not listed).  ATM lookup
+is a binary search, a window of N strikes above/below is a slice, and the
+tokens for that window are array views - nothing is rescanned per tick.
+"""
+
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+
+class StrikeGrid:
+    """Ascending strikes with CE/PE token columns."""
+
+    def __init__(self, strikes: Iterable[float], ce_tokens=None, pe_tokens=None):
+        if not isinstance(strikes, np.ndarray):
+            strikes = list(strikes)
+        self.strikes = np.asarray(strikes, dtype=np.float64)
+        n = len(self.strikes)
+        self.ce_tokens = np.zeros(n, dtype=np.int64) if ce_tokens is None else np.asarray(ce_tokens, dtype=np.int64)
+        self.pe_tokens = np.zeros(n, dtype=np.int64) if pe_tokens is None else np.asarray(pe_tokens, dtype=np.int64)
+
+        steps = np.diff(self.strikes)
+        steps = steps[steps > 0]
+        self.interval = float(steps.min()) if len(steps) else 0.0
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[float, str, int]]) -> "StrikeGrid":
+        """Build from ``(strike, option_type, token)`` rows in any order."""
+        tokens = {}
+        for strike, option_type, token in rows:
+            if strike is None or option_type not in ("CE", "PE"):
+                continue
+            side = tokens.setdefault(float(strike), [0, 0])
+            side[0 if option_type == "CE" else 1] = token or 0
+        strikes = sorted(tokens)
+        ce = [tokens[s][0] for s in strikes]
+        pe = [tokens[s][1] for s in strikes]
+        return cls(strikes, ce, pe)
+
+    @classmethod
+    def from_instruments(cls, instruments: Iterable[dict]) -> "StrikeGrid":
+        return cls.from_rows(
+            (inst.get("strike"), inst.get("instrument_type"), inst.get("instrument_token"))
+            for inst in instruments
+        )
+
+    def __len__(self) -> int:
+        return len(self.strikes)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def atm_index(self, price: float) -> int:
+        """Index of the strike nearest ``price`` (the lower one on a tie); -1 when empty."""
+        strikes = self.strikes
+        n = len(strikes)
+        if not n:
+            return -1
+        i = int(np.searchsorted(strikes, price))
+        if i == 0:
+            return 0
+        if i == n:
+            return n - 1
+        return i - 1 if price - strikes[i - 1] <= strikes[i] - price else i
+
+    def atm_strike(self, price: float) -> Optional[float]:
+        i = self.atm_index(price)
+        return float(self.strikes[i]) if i >= 0 else None
+
+    def index_of(self, strike: float) -> int:
+        """Position of an exact ``strike``; -1 when it is not on the grid."""
+        i = int(np.searchsorted(self.strikes, strike))
+        if i < len(self.strikes) and self.strikes[i] == strike:
+            return i
+        return -1
+
+    def window(self, center: int, below: int, above: int) -> slice:
+        """Slice of ``below`` strikes under ``center``, ``center`` and ``above`` over it."""
+        return slice(max(0, center - below), min(len(self.strikes), center + above + 1))
+
+    def strikes_around(self, price: float, below: int, above: int) -> np.ndarray:
+        return self.strikes[self.window(self.atm_index(price), below, above)]
+
+    def tokens(self, window: slice) -> Tuple[np.ndarray, np.ndarray]:
+        """CE and PE token views for ``window`` (0 where a side is missing)."""
+        return self.ce_tokens[window], self.pe_tokens[window]
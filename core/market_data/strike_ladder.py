@@ -1,4 +1,6 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from core.market_data.strike_grid import StrikeGrid
 
 
 class StrikeLadder:
@@ -19,6 +21,7 @@ class StrikeLadder:
             pe_map = {}
             ce_inst_map = {}
             pe_inst_map = {}
+            by_expiry: Dict[Any, list] = {}
 
             for inst in data.get("instruments", []):
                 strike = inst.get("strike")
@@ -28,6 +31,7 @@ class StrikeLadder:
 
                 if strike is None or not opt_type or token is None or expiry is None:
                     continue
+                by_expiry.setdefault(expiry, []).append(inst)
 
                 if opt_type == "CE":
                     ce_map[(expiry, strike)] = token
@@ -43,18 +47,33 @@ class StrikeLadder:
                 "ce_inst_map": ce_inst_map,
                 "pe_inst_map": pe_inst_map,
                 "expiries": data.get("expiries", []),
+                "grid": StrikeGrid(strikes),
+                "grids": {
+                    expiry: StrikeGrid.from_instruments(insts)
+                    for expiry, insts in by_expiry.items()
+                },
             }
 
         self.ladders = ladders
 
-    def get_atm_index(self, symbol: str, spot_price: float) -> int:
-        strikes = self.ladders[symbol]["strikes"]
-
-        if not strikes:
-            return 0
+    def grid(self, symbol: str, expiry=None) -> Optional[StrikeGrid]:
+        """Strike grid for ``expiry``, or across all loaded expiries when None."""
+        ladder = self.ladders.get(symbol)
+        if not ladder:
+            return None
+        if expiry is None:
+            return ladder["grid"]
+        return ladder["grids"].get(expiry)
+
+    def get_instrument(self, symbol: str, expiry, strike: float, option_type: str) -> Optional[dict]:
+        ladder = self.ladders.get(symbol)
+        if not ladder:
+            return None
+        inst_map = ladder.get(f"{option_type.lower()}_inst_map", {})
+        return inst_map.get((expiry, strike))
 
-        closest = min(range(len(strikes)), key=lambda i: abs(strikes[i] - spot_price))
-        return closest
+    def get_atm_index(self, symbol: str, spot_price: float) -> int:
+        return max(self.ladders[symbol]["grid"].atm_index(spot_price), 0)
 
     def build_chain(
         self,
@@ -36,6 +36,11 @@ class MarketSubscriptionPolicy:
 
         required_tokens.update(w.active_cvd_tokens)
 
+        # Underlying whose ticks re-centre the ladder's ATM window.
+        tracking_token = getattr(w.strike_ladder, "tracking_token", None)
+        if tracking_token:
+            required_tokens.add(int(tracking_token))
+
         # Keep live updates flowing for all open positions, even when their
         # strikes are outside the currently visible strike ladder symbol.
         if hasattr(w, "position_manager") and w.position_manager is not None:
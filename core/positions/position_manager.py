@@ -1,17 +1,50 @@
 # core/position_manager.py
 
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Sequence, Union
 from datetime import datetime
 import logging
-from PySide6.QtCore import QObject, Signal
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 from kiteconnect import KiteConnect
 
 from core.utils.trade_logger import TradeLogger
 from core.utils.data_models import Position, Contract
 from core.execution.paper_trading_manager import PaperTradingManager
+from core.positions.protective_engine import GROUP, LEG, PORTFOLIO, STOP_LOSS, ProtectiveOrderEngine, Trigger
 
 logger = logging.getLogger(__name__)
 
+# Broker-side fields; a refresh only reports a position as changed when one moves.
+_API_FIELDS = ("quantity", "average_price", "product", "exchange")
+
+
+class _RefreshTask(QRunnable):
+    """Runs the ``positions()`` / ``orders()`` round trips off the GUI thread."""
+
+    def __init__(self, trader, fetched: Signal, failed: Signal):
+        super().__init__()
+        self._trader = trader
+        self._fetched = fetched
+        self._failed = failed
+
+    def run(self):
+        try:
+            api_positions = self._trader.positions().get('net', [])
+            api_orders = self._trader.orders()
+        except Exception as e:
+            logger.error(f"API refresh failed: {e}", exc_info=True)
+            self._emit(self._failed, str(e))
+            return
+        self._emit(self._fetched, api_positions, api_orders)
+
+    @staticmethod
+    def _emit(signal, *payload):
+        try:
+            signal.emit(*payload)
+        except RuntimeError:
+            # PositionManager was destroyed while the request was in flight.
+            pass
+
 
 class PositionManager(QObject):
     """
@@ -19,24 +52,43 @@ class PositionManager(QObject):
     and differentiating them from the Kite API or a simulated trader.
     """
     positions_updated = Signal(list)
+    # Tick-driven: only the positions whose LTP / P&L moved in a batch.
+    positions_changed = Signal(list)
     pending_orders_updated = Signal(list)
+    orders_refreshed = Signal(list)   # the day's full order book from each refresh
     refresh_completed = Signal(bool)
     api_error_occurred = Signal(str)
     position_added = Signal(object)
     position_removed = Signal(str)
     position_exiting = Signal(object)
     portfolio_exit_triggered = Signal(str, float)
-
     # args: reason ("STOP_LOSS" / "TARGET"), pnl
+    group_exit_triggered = Signal(str, str, float)
+    # args: group name, reason, group pnl
+
+    # Worker -> GUI thread hand-off for refresh_from_api (queued across threads).
+    _refresh_fetched = Signal(object, object)
+    _refresh_failed = Signal(str)
 
     def __init__(self, trader: Union[KiteConnect, PaperTradingManager], trade_logger: TradeLogger):
         super().__init__()
         self.trader = trader
         self.trade_logger = trade_logger
         self._positions: Dict[str, Position] = {}
+        # Kept in step with _positions by _reindex(); ticks are priced and
+        # every SL/TP/TSL level is checked there.
+        self._protection = ProtectiveOrderEngine()
         self._pending_orders: List[Dict] = []
         self.last_refresh_time: Optional[datetime] = None
         self._refresh_in_progress = False
+        self._refresh_queued = False
+        # Bumped by local adds/exits; a snapshot fetched under an older value is stale.
+        self._local_generation = 0
+        self._fetch_generation = 0
+        self._refresh_pool = QThreadPool(self)
+        self._refresh_pool.setMaxThreadCount(1)
+        self._refresh_fetched.connect(self._on_refresh_fetched)
+        self._refresh_failed.connect(self._on_refresh_failed)
         self._exit_in_progress: set[str] = set()
         self._group_name_hints: Dict[str, str] = {}
 
@@ -68,6 +120,7 @@ class PositionManager(QObject):
         self.portfolio_stop_loss = sl if sl < 0 else None
         self.portfolio_target = tp if tp > 0 else None
         self._portfolio_exit_triggered = False
+        self._protection.set_portfolio(self.portfolio_stop_loss, self.portfolio_target)
 
         logger.warning(
             f"PORTFOLIO SL/TP ARMED | SL={self.portfolio_stop_loss}, TP={self.portfolio_target}"
@@ -77,29 +130,76 @@ class PositionManager(QObject):
         self.portfolio_stop_loss = None
         self.portfolio_target = None
         self._portfolio_exit_triggered = False
+        self._protection.set_portfolio(None, None)
 
         logger.info("Portfolio SL/TP cleared")
 
     def refresh_from_api(self):
-        if not self.trader or self._refresh_in_progress:
+        """
+        Fetch positions and orders and merge them in.
+
+        Live clients are queried on a worker thread and the result is merged
+        on the GUI thread when it lands; the paper ledger is local and is read
+        in place.  A request made while one is in flight is folded into a
+        single follow-up refresh so a post-order refresh is never dropped.
+        """
+        if not self.trader:
+            return
+        if self._refresh_in_progress:
+            self._refresh_queued = True
+            return
+
+        self._refresh_in_progress = True
+        self._fetch_generation = self._local_generation
+        if not isinstance(self.trader, PaperTradingManager):
+            self._refresh_pool.start(_RefreshTask(self.trader, self._refresh_fetched, self._refresh_failed))
             return
 
         try:
-            self._refresh_in_progress = True
             api_positions_data = self.trader.positions().get('net', [])
             api_orders_data = self.trader.orders()
-            self._process_orders_and_positions(api_positions_data, api_orders_data)
-            self.last_refresh_time = datetime.now()
-            self.refresh_completed.emit(True)
         except Exception as e:
             logger.error(f"API refresh failed: {e}", exc_info=True)
-            self.api_error_occurred.emit(str(e))
-            self.refresh_completed.emit(False)
-        finally:
+            self._on_refresh_failed(str(e))
+            return
+        self._on_refresh_fetched(api_positions_data, api_orders_data)
+
+    def _on_refresh_fetched(self, api_positions_data: List[Dict], api_orders_data: List[Dict]):
+        if self._fetch_generation != self._local_generation:
+            # A position was added or exited locally while this snapshot was in
+            # flight; merging it would drop the new leg (and its SL/TP).
+            logger.info("Discarding a position snapshot older than a local add/exit; refetching.")
             self._refresh_in_progress = False
+            self.refresh_from_api()
+            return
+        try:
+            self._process_orders_and_positions(api_positions_data, api_orders_data)
+            self.last_refresh_time = datetime.now()
+        except Exception as e:
+            logger.error(f"Merging refreshed positions failed: {e}", exc_info=True)
+            self._on_refresh_failed(str(e))
+            return
+        self._finish_refresh(True)
+
+    def _on_refresh_failed(self, message: str):
+        self.api_error_occurred.emit(message)
+        self._finish_refresh(False)
+
+    def _finish_refresh(self, success: bool):
+        self._refresh_in_progress = False
+        self.refresh_completed.emit(success)
+        if self._refresh_queued:
+            self._refresh_queued = False
+            self.refresh_from_api()
 
     def _process_orders_and_positions(self, api_positions: List[Dict], api_orders: List[Dict]):
+        """
+        Merge a refresh as a diff: added/removed positions are a structural
+        ``positions_updated``, broker-side value changes go out as
+        ``positions_changed``, and an unchanged book emits nothing.
+        """
         current_positions: Dict[str, Position] = {}
+        changed: List[Position] = []
 
         pending_orders = [
             o for o in api_orders
@@ -154,6 +254,13 @@ class PositionManager(QObject):
 
                 pos.is_exiting = pos.tradingsymbol in self._exit_in_progress
 
+                # Nothing moved broker-side: keep the live object (tick LTP/P&L).
+                if all(getattr(pos, f) == getattr(existing_pos, f) for f in _API_FIELDS):
+                    existing_pos.is_exiting = pos.is_exiting
+                    pos = existing_pos
+                else:
+                    changed.append(pos)
+
             # --------------------------------------------------
             # Register position for this refresh
             # --------------------------------------------------
@@ -162,6 +269,7 @@ class PositionManager(QObject):
         # ------------------------------------------------------
         # Synchronize (add / remove positions atomically)
         # ------------------------------------------------------
+        structural = current_positions.keys() != self._positions.keys()
         self._synchronize_positions(current_positions)
 
         # ------------------------------------------------------
@@ -171,10 +279,16 @@ class PositionManager(QObject):
             if getattr(p, "is_new", False):
                 p.is_new = False
 
+        orders_changed = pending_orders != self._pending_orders
         self._pending_orders = pending_orders
 
-        self.positions_updated.emit(self.get_all_positions())
-        self.pending_orders_updated.emit(self.get_pending_orders())
+        if structural:
+            self.positions_updated.emit(self.get_all_positions())
+        elif changed:
+            self.positions_changed.emit(changed)
+        if orders_changed:
+            self.pending_orders_updated.emit(self.get_pending_orders())
+        self.orders_refreshed.emit(api_orders)
 
     def _recalculate_sl_tp_on_averaging(self, new_pos: Position, old_pos: Position):
         """
@@ -294,75 +408,84 @@ class PositionManager(QObject):
 
         self._positions = new_positions
         expired_count = self.remove_expired_positions()
+        self._reindex()
         if expired_count > 0:
             self._emit_all()
 
+    def _reindex(self):
+        """Reload the protective-order arrays after the position set changes."""
+        self._protection.load(self._positions.values())
+
+    def set_group_sl_tp(self, group_members: Dict[str, Sequence[str]],
+                        group_sl_tp: Dict[str, Dict[str, Optional[float]]]):
+        """Group SL/TP as drawn in the positions table (``sl`` negative, ``tp`` positive)."""
+        self._protection.set_groups(group_members, group_sl_tp)
+
     def update_pnl_from_market_data(self, data: Union[dict, list]):
-        updated = False
+        """
+        Reprice the positions the ticks touch, run every SL/TP/TSL check in one
+        pass, and emit the moved positions as ``positions_changed``.
+        """
         ticks = data if isinstance(data, list) else [data]
-        ticks_by_token = {tick['instrument_token']: tick for tick in ticks}
+        if not ticks or not len(self._protection):
+            return
 
-        for pos in list(self._positions.values()):
+        tokens = np.array([t.get('instrument_token') or 0 for t in ticks], dtype=np.int64)
+        prices = np.array([t.get('last_price') for t in ticks], dtype=np.float64)   # None -> NaN, skipped
+        result = self._protection.evaluate(tokens, prices)
 
-            if pos.is_exiting:
+        changed: List[Position] = []
+        for symbol in result.moved:
+            pos = self._positions.get(symbol)
+            if pos is None:
                 continue
+            pos.ltp, pos.pnl, stop_loss = self._protection.leg_values(symbol)
+            if pos.trailing_stop_loss:
+                pos.stop_loss_price = stop_loss
+            changed.append(pos)
+
+        exiting = {t.key for t in result.triggers if t.scope == LEG}
+        for trigger in result.triggers:
+            if trigger.scope == GROUP:
+                exiting.update(self._protection.group_members(trigger.key))
+
+        changed = [p for p in changed if p.tradingsymbol not in exiting]
+        if changed:
+            self.positions_changed.emit(changed)
+
+        for trigger in result.triggers:
+            self._handle_trigger(trigger)
+
+    def _handle_trigger(self, trigger: Trigger):
+        if trigger.scope == PORTFOLIO:
+            label = "PORTFOLIO STOP-LOSS HIT" if trigger.reason == STOP_LOSS else "PORTFOLIO TARGET HIT"
+            logger.critical(f"🚨 {label}: Total P&L={trigger.value:.2f}")
+            self._portfolio_exit_triggered = True
+            self.portfolio_exit_triggered.emit(trigger.reason, trigger.value)
+            return
 
-            if pos.contract and pos.contract.instrument_token in ticks_by_token:
-                tick = ticks_by_token[pos.contract.instrument_token]
-                ltp = tick.get('last_price', pos.ltp)
-
-                if ltp != pos.ltp:
-                    pos.ltp = ltp
-                    qty = pos.quantity
-                    avg = pos.average_price
-                    pos.pnl = (ltp - avg) * qty
-                    updated = True
-
-                    if pos.trailing_stop_loss and pos.trailing_stop_loss > 0:
-                        pos.stop_loss_price = self._update_trailing_stop_loss(pos, ltp)
-
-                    if pos.stop_loss_price:
-                        if (qty > 0 and ltp <= pos.stop_loss_price) or \
-                                (qty < 0 and ltp >= pos.stop_loss_price):
-                            logger.warning(f"🛑 SL HIT: {pos.tradingsymbol} @ {ltp} (SL: {pos.stop_loss_price})")
-                            self.exit_position(pos)
-                            continue
-
-                    if pos.target_price:
-                        if (qty > 0 and ltp >= pos.target_price) or \
-                                (qty < 0 and ltp <= pos.target_price):
-                            logger.warning(f"🎯 TARGET HIT: {pos.tradingsymbol} @ {ltp} (Target: {pos.target_price})")
-                            self.exit_position(pos)
-                            continue
-
-        if updated:
-            self.positions_updated.emit(self.get_all_positions())
-
-        self._check_portfolio_sl_tp()
+        if trigger.scope == GROUP:
+            logger.warning(f"🛑 GROUP {trigger.reason}: {trigger.key} P&L={trigger.value:.2f} (level {trigger.level:.2f})")
+            for symbol in self._protection.group_members(trigger.key):
+                pos = self._positions.get(symbol)
+                if pos is not None and not pos.is_exiting:
+                    self.exit_position(pos)
+            self.group_exit_triggered.emit(trigger.key, trigger.reason, trigger.value)
+            return
 
-    def _update_trailing_stop_loss(self, pos: Position, ltp: float) -> float:
-        if not pos.stop_loss_price:
-            if pos.quantity > 0:
-                pos.stop_loss_price = ltp - pos.trailing_stop_loss
-            else:
-                pos.stop_loss_price = ltp + pos.trailing_stop_loss
-            return pos.stop_loss_price
-
-        if pos.quantity > 0:
-            new_sl = ltp - pos.trailing_stop_loss
-            if new_sl > pos.stop_loss_price:
-                pos.stop_loss_price = new_sl
-                logger.info(f"📈 TSL updated: {pos.tradingsymbol} SL={new_sl:.2f}")
+        pos = self._positions.get(trigger.key)
+        if pos is None:
+            return
+        if trigger.reason == STOP_LOSS:
+            logger.warning(f"🛑 SL HIT: {pos.tradingsymbol} @ {trigger.value} (SL: {trigger.level})")
         else:
-            new_sl = ltp + pos.trailing_stop_loss
-            if new_sl < pos.stop_loss_price:
-                pos.stop_loss_price = new_sl
-                logger.info(f"📉 TSL updated: {pos.tradingsymbol} SL={new_sl:.2f}")
-
-        return pos.stop_loss_price
+            logger.warning(f"🎯 TARGET HIT: {pos.tradingsymbol} @ {trigger.value} (Target: {trigger.level})")
+        self.exit_position(pos)
 
     def add_position(self, position: Position):
+        self._local_generation += 1
         self._positions[position.tradingsymbol] = position
+        self._reindex()
         if position.group_name:
             self._group_name_hints[position.tradingsymbol] = position.group_name
         # if position.stop_loss_price or position.target_price:
@@ -384,11 +507,14 @@ class PositionManager(QObject):
 
         self._exit_in_progress.add(symbol)
         position.is_exiting = True
+        self._protection.deactivate(symbol)
         # 🔒 FIX: paper trading must NOT place orders here
         if isinstance(self.trader, PaperTradingManager):
             # UI already placed the exit order
             exited_pos = self._positions.pop(symbol, None)
             if exited_pos:
+                self._local_generation += 1
+                self._reindex()
                 self._group_name_hints.pop(symbol, None)
                 self.position_removed.emit(symbol)
                 self.positions_updated.emit(self.get_all_positions())
@@ -413,6 +539,8 @@ class PositionManager(QObject):
             logger.info(f"Exit order placed for {position.tradingsymbol}")
             exited_pos = self._positions.pop(symbol, None)
             if exited_pos:
+                self._local_generation += 1
+                self._reindex()
                 self._group_name_hints.pop(symbol, None)
                 self.position_removed.emit(symbol)
                 self.positions_updated.emit(self.get_all_positions())
@@ -427,6 +555,8 @@ class PositionManager(QObject):
     def remove_position(self, tradingsymbol: str):
         removed_pos = self._positions.pop(tradingsymbol, None)
         if removed_pos:
+            self._local_generation += 1
+            self._reindex()
             self._group_name_hints.pop(tradingsymbol, None)
             self.position_removed.emit(tradingsymbol)
             self._emit_all()
@@ -442,26 +572,7 @@ class PositionManager(QObject):
         return self._pending_orders
 
     def get_total_pnl(self) -> float:
-        return sum(p.pnl for p in self._positions.values() if p.pnl is not None)
-
-    def _check_portfolio_sl_tp(self):
-        if self._portfolio_exit_triggered:
-            return
-
-        if self.portfolio_stop_loss is None and self.portfolio_target is None:
-            return
-
-        total_pnl = self.get_total_pnl()
-
-        if self.portfolio_stop_loss is not None and total_pnl <= self.portfolio_stop_loss:
-            logger.critical(f"🚨 PORTFOLIO STOP-LOSS HIT: Total P&L={total_pnl:.2f}")
-            self._portfolio_exit_triggered = True
-            self.portfolio_exit_triggered.emit("STOP_LOSS", total_pnl)
-
-        elif self.portfolio_target is not None and total_pnl >= self.portfolio_target:
-            logger.critical(f"🎯 PORTFOLIO TARGET HIT: Total P&L={total_pnl:.2f}")
-            self._portfolio_exit_triggered = True
-            self.portfolio_exit_triggered.emit("TARGET", total_pnl)
+        return self._protection.total_pnl
 
     def get_position(self, tradingsymbol: str) -> Optional[Position]:
         return self._positions.get(tradingsymbol)
@@ -509,6 +620,9 @@ class PositionManager(QObject):
         position.stop_loss_price = sl_price if sl_price and sl_price > 0 else None
         position.target_price = tp_price if tp_price and tp_price > 0 else None
         position.trailing_stop_loss = tsl_value if tsl_value and tsl_value > 0 else None
+        self._protection.set_leg_levels(
+            tradingsymbol, position.stop_loss_price, position.target_price, position.trailing_stop_loss
+        )
 
         logger.info(
             f"Local SL/TP updated for {tradingsymbol}: "
@@ -45,6 +45,18 @@ class PositionSyncAdapter:
         self._update_performance()
         self._update_market_subscriptions()
 
+    def on_positions_changed(self, positions: List[Position]):
+        """Tick delta from PositionManager: only the positions whose P&L moved."""
+        positions_dialog = self._get_positions_dialog()
+        if positions_dialog and positions_dialog.isVisible():
+            positions_dialog.update_changed_positions(positions)
+
+        inline_positions_table = self._get_inline_positions_table()
+        if inline_positions_table:
+            inline_positions_table.update_changed_positions(
+                [self._position_to_dict(position) for position in positions]
+            )
+
     def on_position_added(self, position: Position):
         logger.debug(f"Position added: {position.tradingsymbol}, forwarding to UI.")
 
@@ -0,0 +1,266 @@
+# core/positions/protective_engine.py
+"""
+Array-backed stop-loss / target / trailing-stop evaluation.
+
+Every open leg is a row in parallel NumPy arrays (token, quantity, average
+price, LTP, SL, TP, trail, group).  ``evaluate`` folds a tick batch into the
+LTP column and checks every leg, group and portfolio level in one vectorized
+pass, so a batch costs about the same with five legs or five hundred.
+
+Trigger order is deterministic: portfolio, then groups (by name), then legs
+(by tradingsymbol).  A portfolio trigger supersedes everything else in the
+batch and a group trigger supersedes its own legs.  A fired level stays
+disarmed until it is set again.
+
+Missing levels are NaN, so every comparison against them is simply False.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.utils.data_models import Position
+
+logger = logging.getLogger(__name__)
+
+PORTFOLIO, GROUP, LEG = "PORTFOLIO", "GROUP", "LEG"
+STOP_LOSS, TARGET = "STOP_LOSS", "TARGET"
+
+# Batches slower than this are logged; the per-batch cost is tracked either way.
+LATENCY_BUDGET_US = 2000.0
+
+
+@dataclass(frozen=True)
+class Trigger:
+    scope: str      # PORTFOLIO / GROUP / LEG
+    reason: str     # STOP_LOSS / TARGET
+    key: str        # "" for the portfolio, else the group name or tradingsymbol
+    level: float
+    value: float    # P&L for portfolio/group, LTP for a leg
+
+
+@dataclass
+class Evaluation:
+    moved: List[str] = field(default_factory=list)      # legs whose LTP changed, row order
+    triggers: List[Trigger] = field(default_factory=list)
+    total_pnl: float = 0.0
+    elapsed_us: float = 0.0
+
+
+def _level(value: Optional[float]) -> float:
+    return float(value) if value else np.nan
+
+
+class ProtectiveOrderEngine:
+    """SL/TP/TSL levels for legs, groups and the portfolio, held as arrays."""
+
+    def __init__(self):
+        self.symbols: List[str] = []
+        self._row_of: Dict[str, int] = {}
+        self._sorted_tokens = np.zeros(0, dtype=np.int64)
+        self._token_rows = np.zeros(0, dtype=np.int64)
+
+        self.qty = np.zeros(0, dtype=np.float64)
+        self.avg = np.zeros(0, dtype=np.float64)
+        self.ltp = np.zeros(0, dtype=np.float64)
+        self.pnl = np.zeros(0, dtype=np.float64)
+        self.sl = np.zeros(0, dtype=np.float64)
+        self.tp = np.zeros(0, dtype=np.float64)
+        self.trail = np.zeros(0, dtype=np.float64)
+        self.active = np.zeros(0, dtype=bool)
+        self.group = np.zeros(0, dtype=np.int64)
+
+        self._members: Dict[str, Sequence[str]] = {}
+        self._group_levels: Dict[str, tuple] = {}
+        self.group_names: List[str] = []
+        self._group_sl = np.zeros(0, dtype=np.float64)
+        self._group_tp = np.zeros(0, dtype=np.float64)
+        self._group_armed = np.zeros(0, dtype=bool)
+
+        self.portfolio_sl = np.nan
+        self.portfolio_tp = np.nan
+        self._portfolio_armed = False
+
+        self.total_pnl = 0.0
+        self.last_latency_us = 0.0
+        self.max_latency_us = 0.0
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    # ------------------------------------------------------------------
+    # Levels
+    # ------------------------------------------------------------------
+
+    def load(self, positions: Iterable[Position]):
+        """Rebuild the leg rows from the current position set."""
+        legs = sorted(positions, key=lambda p: p.tradingsymbol)
+        self.symbols = [p.tradingsymbol for p in legs]
+        self._row_of = {s: i for i, s in enumerate(self.symbols)}
+
+        tokens = np.array([(p.contract.instrument_token if p.contract else 0) or 0 for p in legs], dtype=np.int64)
+        order = np.argsort(tokens, kind="stable")
+        self._sorted_tokens = tokens[order]
+        self._token_rows = order
+
+        self.qty = np.array([p.quantity for p in legs], dtype=np.float64)
+        self.avg = np.array([p.average_price for p in legs], dtype=np.float64)
+        self.ltp = np.array([p.ltp or 0.0 for p in legs], dtype=np.float64)
+        self.pnl = np.array([p.pnl or 0.0 for p in legs], dtype=np.float64)
+        self.sl = np.array([_level(p.stop_loss_price) for p in legs], dtype=np.float64)
+        self.tp = np.array([_level(p.target_price) for p in legs], dtype=np.float64)
+        self.trail = np.array([_level(p.trailing_stop_loss) for p in legs], dtype=np.float64)
+        self.active = np.array([not p.is_exiting for p in legs], dtype=bool)
+        self.total_pnl = float(self.pnl.sum())
+        self._assign_groups()
+
+    def set_leg_levels(self, symbol: str, sl: Optional[float], tp: Optional[float], trail: Optional[float]):
+        row = self._row_of.get(symbol)
+        if row is None:
+            return
+        self.sl[row] = _level(sl)
+        self.tp[row] = _level(tp)
+        self.trail[row] = _level(trail)
+
+    def deactivate(self, symbol: str):
+        """Stop evaluating a leg (an exit is already on its way)."""
+        row = self._row_of.get(symbol)
+        if row is not None:
+            self.active[row] = False
+
+    def set_groups(self, members: Dict[str, Sequence[str]], levels: Dict[str, Dict[str, Optional[float]]]):
+        """Group membership plus ``{"sl": <negative>, "tp": <positive>}`` per group.
+
+        Groups whose levels are unchanged keep their armed/fired state.
+        """
+        previous = dict(zip(self.group_names, self._group_armed.tolist()))
+        old_levels = self._group_levels
+
+        self._members = {name: list(syms) for name, syms in members.items() if name in levels}
+        self._group_levels = {
+            name: (_level(levels[name].get("sl")), _level(levels[name].get("tp")))
+            for name in self._members
+        }
+        self.group_names = sorted(self._members)
+        self._group_sl = np.array([self._group_levels[g][0] for g in self.group_names], dtype=np.float64)
+        self._group_tp = np.array([self._group_levels[g][1] for g in self.group_names], dtype=np.float64)
+        self._group_armed = np.array([
+            previous.get(g, True) if np.array_equal(old_levels.get(g, ()), self._group_levels[g], equal_nan=True)
+            else True
+            for g in self.group_names
+        ], dtype=bool)
+        self._assign_groups()
+
+    def _assign_groups(self):
+        self.group = np.full(len(self.symbols), -1, dtype=np.int64)
+        for gid, name in enumerate(self.group_names):
+            for symbol in self._members.get(name, ()):
+                row = self._row_of.get(symbol)
+                if row is not None:
+                    self.group[row] = gid
+
+    def leg_values(self, symbol: str) -> Tuple[float, float, Optional[float]]:
+        """``(ltp, pnl, stop_loss)`` for a leg; the stop-loss moves with a trail."""
+        row = self._row_of[symbol]
+        sl = self.sl[row]
+        return float(self.ltp[row]), float(self.pnl[row]), None if np.isnan(sl) else float(sl)
+
+    def group_members(self, name: str) -> List[str]:
+        return [s for s in self._members.get(name, ()) if s in self._row_of]
+
+    def set_portfolio(self, sl: Optional[float], tp: Optional[float]):
+        self.portfolio_sl = _level(sl)
+        self.portfolio_tp = _level(tp)
+        self._portfolio_armed = not (np.isnan(self.portfolio_sl) and np.isnan(self.portfolio_tp))
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def evaluate(self, tokens: np.ndarray, prices: np.ndarray) -> Evaluation:
+        """Apply a tick batch (parallel token / last-price arrays) and collect triggers."""
+        start = time.perf_counter()
+        result = Evaluation()
+        n = len(self.symbols)
+        if n and len(tokens):
+            rows, px = self._match(tokens, prices)
+            self._apply(rows, px)
+            self.total_pnl = float(self.pnl.sum())
+            result.moved = [self.symbols[r] for r in rows]
+            result.triggers = self._triggers(rows, self.total_pnl)
+        result.total_pnl = self.total_pnl
+
+        elapsed = (time.perf_counter() - start) * 1e6
+        result.elapsed_us = self.last_latency_us = elapsed
+        if elapsed > self.max_latency_us:
+            self.max_latency_us = elapsed
+        if elapsed > LATENCY_BUDGET_US:
+            logger.warning(f"Protective order check took {elapsed:.0f}µs for {n} legs / {len(tokens)} ticks")
+        return result
+
+    def _match(self, tokens: np.ndarray, prices: np.ndarray):
+        """Leg rows hit by the batch (ascending, last tick per leg wins) and their new LTPs."""
+        sorted_tokens = self._sorted_tokens
+        pos = np.minimum(np.searchsorted(sorted_tokens, tokens), len(sorted_tokens) - 1)
+        hit = (sorted_tokens[pos] == tokens) & ~np.isnan(prices)
+        rows = self._token_rows[pos[hit]]
+        px = prices[hit]
+        if len(rows) > 1:
+            rows, last = np.unique(rows[::-1], return_index=True)
+            px = px[::-1][last]
+
+        keep = (self.ltp[rows] != px) & self.active[rows]
+        return rows[keep], px[keep]
+
+    def _apply(self, rows: np.ndarray, px: np.ndarray):
+        self.ltp[rows] = px
+        self.pnl[rows] = (px - self.avg[rows]) * self.qty[rows]
+
+        trailing = rows[self.trail[rows] > 0]
+        if len(trailing):
+            ltp, trail, current = self.ltp[trailing], self.trail[trailing], self.sl[trailing]
+            long = self.qty[trailing] > 0
+            candidate = np.where(long, ltp - trail, ltp + trail)
+            tighter = np.where(long, candidate > current, candidate < current)
+            self.sl[trailing] = np.where(np.isnan(current) | tighter, candidate, current)
+
+    def _triggers(self, rows: np.ndarray, total: float) -> List[Trigger]:
+        if self._portfolio_armed:
+            if total <= self.portfolio_sl:
+                self._portfolio_armed = False
+                return [Trigger(PORTFOLIO, STOP_LOSS, "", float(self.portfolio_sl), total)]
+            if total >= self.portfolio_tp:
+                self._portfolio_armed = False
+                return [Trigger(PORTFOLIO, TARGET, "", float(self.portfolio_tp), total)]
+
+        triggers: List[Trigger] = []
+        if len(self.group_names):
+            grouped = self.group >= 0
+            group_pnl = np.bincount(self.group[grouped], weights=self.pnl[grouped], minlength=len(self.group_names))
+            sl_hit = self._group_armed & (group_pnl <= self._group_sl)
+            tp_hit = self._group_armed & ~sl_hit & (group_pnl >= self._group_tp)
+            fired_groups = sl_hit | tp_hit
+            for gid in np.flatnonzero(fired_groups):
+                reason, level = (STOP_LOSS, self._group_sl[gid]) if sl_hit[gid] else (TARGET, self._group_tp[gid])
+                triggers.append(Trigger(GROUP, reason, self.group_names[gid], float(level), float(group_pnl[gid])))
+            self._group_armed &= ~fired_groups
+            self.active[np.isin(self.group, np.flatnonzero(fired_groups))] = False
+            in_fired = self.group[rows] >= 0
+            in_fired[in_fired] = fired_groups[self.group[rows][in_fired]]
+            rows = rows[~in_fired]
+
+        ltp, long = self.ltp[rows], self.qty[rows] > 0
+        sl, tp = self.sl[rows], self.tp[rows]
+        sl_hit = np.where(long, ltp <= sl, ltp >= sl)
+        tp_hit = ~sl_hit & np.where(long, ltp >= tp, ltp <= tp)
+        for i in np.flatnonzero(sl_hit | tp_hit):
+            row = rows[i]
+            reason, level = (STOP_LOSS, sl[i]) if sl_hit[i] else (TARGET, tp[i])
+            triggers.append(Trigger(LEG, reason, self.symbols[row], float(level), float(ltp[i])))
+            self.active[row] = False
+        return triggers
@@ -0,0 +1,141 @@
+# core/utils/ohlcv_ring_buffer.py
+"""
+Fixed-capacity OHLCV series backed by preallocated NumPy arrays.
+
+Appending a bar is O(1) and never allocates; once the buffer is full the
+oldest bar rolls off.  Every value is written twice — at ``i`` and
+``i + capacity`` — so the live window is always one contiguous slice and
+the column accessors return views that can go straight to pyqtgraph
+without a copy or an ``np.roll``.
+
+Timestamps are stored as epoch nanoseconds of the bar open (wall clock,
+tz-naive).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ("open", "high", "low", "close", "volume")
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(len(COLUMNS))
+
+
+class OHLCVRingBuffer:
+    """The most recent ``capacity`` OHLCV bars, oldest first."""
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._values = np.zeros((len(COLUMNS), 2 * capacity), dtype=np.float64)
+        self._times = np.zeros(2 * capacity, dtype=np.int64)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
+
+    # ------------------------------------------------------------------
+    # Feeding
+    # ------------------------------------------------------------------
+
+    def load_frame(self, df: pd.DataFrame):
+        """Replace the contents with the last ``capacity`` rows of an OHLC(V) frame."""
+        self.clear()
+        if df is None or df.empty:
+            return
+        times, values = self._frame_arrays(df.tail(self.capacity))
+        self._store(times, values)
+
+    def prepend_frame(self, df: pd.DataFrame):
+        """Insert older bars before the current ones.
+
+        Capacity grows by ``len(df)`` so paged-in history is kept and live
+        bars still have the same room before the oldest starts rolling off.
+        """
+        if df is None or df.empty:
+            return
+        older_times, older_values = self._frame_arrays(df)
+        n = self._size
+        times = np.concatenate((older_times, self.times()))
+        values = np.concatenate((older_values, self._values[:, self._start:self._start + n]), axis=1)
+        self.capacity += len(df)
+        self._values = np.zeros((len(COLUMNS), 2 * self.capacity), dtype=np.float64)
+        self._times = np.zeros(2 * self.capacity, dtype=np.int64)
+        self._store(times, values)
+
+    @staticmethod
+    def _frame_arrays(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        values = np.zeros((len(COLUMNS), len(df)), dtype=np.float64)
+        for col, name in enumerate(COLUMNS):
+            if name in df.columns:
+                values[col] = df[name].to_numpy(dtype=np.float64)
+        return index.as_unit("ns").asi8, values
+
+    def _store(self, times: np.ndarray, values: np.ndarray):
+        n = len(times)
+        cap = self.capacity
+        self._times[:n] = times
+        self._times[cap:cap + n] = times
+        self._values[:, :n] = values
+        self._values[:, cap:cap + n] = values
+        self._start = 0
+        self._size = n
+
+    def append(self, time_ns: int, open_: float, high: float, low: float, close: float,
+               volume: float = 0.0) -> bool:
+        """Add a bar; returns True when the oldest bar rolled off to make room."""
+        cap = self.capacity
+        rolled = self._size == cap
+        if rolled:
+            slot = self._start
+            self._start = (self._start + 1) % cap
+        else:
+            slot = (self._start + self._size) % cap
+            self._size += 1
+        self._times[slot] = self._times[slot + cap] = time_ns
+        values = self._values
+        for col, value in enumerate((open_, high, low, close, volume)):
+            values[col, slot] = values[col, slot + cap] = value
+        return rolled
+
+    def update_last(self, price: float, volume: float = 0.0):
+        """Fold a trade into the forming (last) bar."""
+        if not self._size:
+            return
+        slot = (self._start + self._size - 1) % self.capacity
+        values = self._values
+        high = max(values[HIGH, slot], price)
+        low = min(values[LOW, slot], price)
+        total = values[VOLUME, slot] + volume
+        for col, value in ((HIGH, high), (LOW, low), (CLOSE, price), (VOLUME, total)):
+            values[col, slot] = values[col, slot + self.capacity] = value
+
+    # ------------------------------------------------------------------
+    # Views (valid until the next append / load)
+    # ------------------------------------------------------------------
+
+    def column(self, name: str) -> np.ndarray:
+        col = COLUMNS.index(name)
+        return self._values[col, self._start:self._start + self._size]
+
+    def times(self) -> np.ndarray:
+        return self._times[self._start:self._start + self._size]
+
+    def last_time(self) -> int | None:
+        if not self._size:
+            return None
+        return int(self._times[self._start + self._size - 1])
+
+    def last(self, name: str) -> float | None:
+        if not self._size:
+            return None
+        return float(self._values[COLUMNS.index(name), self._start + self._size - 1])
@@ -0,0 +1,128 @@
+# core/widgets/decimated_curve.py
+"""
+Level-of-detail line curve for long chart histories.
+
+`DecimatedCurveItem` keeps the full-resolution series it is given and hands
+pyqtgraph only the visible slice, reduced to one min and one max point per
+horizontal pixel.  Peaks and troughs survive decimation, so the line looks
+the same as the full series, but the points pushed to the scene are bounded
+by the view's pixel width instead of the history length.
+
+The decimated copy is rebuilt when the data changes or the view is panned,
+zoomed or resized.  Data bounds (auto-range, bounding rect) are reported for
+the full series so the view does not chase its own decimation.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pyqtgraph as pg
+
+
+def minmax_decimate(x: np.ndarray, y: np.ndarray, x0: float, x1: float, pixels: int):
+    """
+    Points of (x, y) that draw the same line over [x0, x1] at ``pixels`` width.
+
+    ``x`` must be ascending.  One point outside each edge is kept so the line
+    runs off-screen instead of stopping short; the first and last visible
+    points are always included.
+    """
+    n = len(x)
+    lo = max(int(np.searchsorted(x, x0, side="left")) - 1, 0)
+    hi = min(int(np.searchsorted(x, x1, side="right")) + 1, n)
+    xs, ys = x[lo:hi], y[lo:hi]
+    m = len(xs)
+    pixels = max(int(pixels), 1)
+    if m <= 2 * pixels:
+        return xs, ys
+
+    per_bucket = -(-m // pixels)
+    buckets = m // per_bucket
+    blocks = ys[:buckets * per_bucket].reshape(buckets, per_bucket)
+    arg_min = blocks.argmin(axis=1)
+    arg_max = blocks.argmax(axis=1)
+    base = np.arange(buckets) * per_bucket
+
+    idx = np.empty(2 * buckets + 2, dtype=np.intp)
+    idx[0] = 0
+    idx[1:-1:2] = base + np.minimum(arg_min, arg_max)   # keep min/max in time order
+    idx[2:-1:2] = base + np.maximum(arg_min, arg_max)
+    idx[-1] = buckets * per_bucket - 1
+    tail = np.arange(buckets * per_bucket, m)
+    if len(tail):
+        idx = np.concatenate((idx, tail))
+    return xs[idx], ys[idx]
+
+
+class DecimatedCurveItem(pg.PlotCurveItem):
+    """`PlotCurveItem` that renders a min/max decimation of the visible range."""
+
+    # Below this many points decimation costs more than it saves.
+    MIN_POINTS = 512
+
+    def setData(self, *args, **kargs):
+        if len(args) == 2:
+            x, y = args
+        elif len(args) == 1:
+            y = args[0]
+            x = None if y is None else np.arange(len(y), dtype=float)
+        else:
+            x, y = kargs.pop("x", None), kargs.pop("y", None)
+        self._full_x = np.empty(0) if x is None else np.asarray(x, dtype=float)
+        self._full_y = np.empty(0) if y is None else np.asarray(y, dtype=float)
+        self._full_bounds = {}
+        self._rendered_key = None
+        self._render(force=True, **kargs)
+
+    def full_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """The undecimated series (for crosshair lookups and export)."""
+        return self._full_x, self._full_y
+
+    def viewRangeChanged(self):
+        super().viewRangeChanged()
+        self._render()
+
+    def viewTransformChanged(self):
+        super().viewTransformChanged()
+        self._render()
+
+    def _render(self, force: bool = False, **kargs):
+        x = getattr(self, "_full_x", None)
+        if x is None:
+            return
+        y = self._full_y
+        vb = self.getViewBox() if len(x) > self.MIN_POINTS else None
+        if vb is None:
+            if force:
+                super().setData(x, y, **kargs)
+            return
+
+        (x0, x1), pixels = vb.viewRange()[0], int(vb.width())
+        key = (x0, x1, pixels)
+        if not force and key == self._rendered_key:
+            return
+        self._rendered_key = key
+        super().setData(*minmax_decimate(x, y, x0, x1, pixels), **kargs)
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        full_x = getattr(self, "_full_x", None)
+        if full_x is None or not len(full_x):
+            return None, None
+        key = (ax, frac, None if orthoRange is None else tuple(orthoRange))
+        cached = self._full_bounds.get(key)
+        if cached is not None:
+            return cached
+
+        d, other = (full_x, self._full_y) if ax == 0 else (self._full_y, full_x)
+        if orthoRange is not None:
+            d = d[(other >= orthoRange[0]) & (other <= orthoRange[1])]
+        d = d[np.isfinite(d)]
+        if not len(d):
+            return None, None
+        if frac >= 1.0:
+            bounds = (float(d.min()), float(d.max()))
+        else:
+            lo, hi = np.percentile(d, (50 * (1 - frac), 50 * (1 + frac)))
+            bounds = (float(lo), float(hi))
+        self._full_bounds[key] = bounds
+        return bounds
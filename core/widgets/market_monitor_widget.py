@@ -6,67 +6,123 @@ import pandas as pd
 import numpy as np
 import pyqtgraph as pg
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-from PySide6.QtCore import Qt, QRectF, QTimer
+from PySide6.QtCore import Qt, QLineF, QRectF, QTimer
 from PySide6.QtGui import QFont, QPicture, QPainter
 
 logger = logging.getLogger(__name__)
 
 
 class CandlestickItem(pg.GraphicsObject):
+    """Candles drawn from two cached pictures: closed bars and the forming bar.
+
+    ``data`` is a sequence of ``(x, open, high, low, close)`` rows.  Closed
+    bars are recorded once into a static QPicture; a live update that only
+    revises the last bar re-records just that bar, and a newly closed bar is
+    appended to the static picture instead of redrawing the whole series.
+    """
+
+    BULL_COLOR = '#26A69A'
+    BEAR_COLOR = '#EF5350'
+    BODY_HALF_WIDTH = 0.3
+    PEN_WIDTH_OFFSET = 1
+
+    _styles = None   # {bullish: (pen, brush)}, shared by every item
+
     def __init__(self, data=None):
         super().__init__()
-        self.data = data or []
+        self.data = self._as_bars(data)
+        self._static_picture = QPicture()
+        self._live_picture = QPicture()
+        self._static_count = 0   # bars recorded in the static picture
+        self._bounds = QRectF()
         self.generatePicture()
 
+    @classmethod
+    def _pen_and_brush(cls, bullish: bool):
+        if cls._styles is None:
+            cls._styles = {
+                True: (pg.mkPen(color=cls.BULL_COLOR, width=1.5), pg.mkBrush(cls.BULL_COLOR)),
+                False: (pg.mkPen(color=cls.BEAR_COLOR, width=1.5), pg.mkBrush(cls.BEAR_COLOR)),
+            }
+        return cls._styles[bullish]
+
+    @staticmethod
+    def _as_bars(data) -> np.ndarray:
+        if data is None or len(data) == 0:
+            return np.empty((0, 5), dtype=float)
+        return np.asarray(data, dtype=float).reshape(-1, 5)
+
     def updateData(self, data):
-        self.data = data
-        self.generatePicture()
+        bars = self._as_bars(data)
+        closed = bars[:-1]
+        recorded = self.data[:self._static_count]
+        if len(closed) >= len(recorded) and np.array_equal(closed[:len(recorded)], recorded):
+            self.data = bars
+            if len(closed) > len(recorded):
+                self._extend_static(closed[len(recorded):])
+            self._record_live()
+        else:
+            self.data = bars
+            self.generatePicture()
+        self._update_bounds()
         self.update()
 
     def generatePicture(self):
+        """Re-record every bar (initial load, or history changed before the forming bar)."""
+        self._static_picture = QPicture()
+        self._static_count = 0
+        self._extend_static(self.data[:-1])
+        self._record_live()
+        self._update_bounds()
+
+    def _extend_static(self, bars: np.ndarray):
         pic = QPicture()
         painter = QPainter(pic)
         painter.setRenderHint(QPainter.Antialiasing)
+        if self._static_count:
+            painter.drawPicture(0, 0, self._static_picture)
+        self._draw_bars(painter, bars)
+        painter.end()
+        self._static_picture = pic
+        self._static_count += len(bars)
 
-        BULL_COLOR = '#26A69A'
-        BEAR_COLOR = '#EF5350'
-        w = 0.3
+    def _record_live(self):
+        pic = QPicture()
+        painter = QPainter(pic)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._draw_bars(painter, self.data[-1:])
+        painter.end()
+        self._live_picture = pic
 
-        for x, open_, high, low, close in self.data:
-            bullish = close >= open_
-            pen_color = BULL_COLOR if bullish else BEAR_COLOR
-            pen = pg.mkPen(color=pen_color, width=1.5)
+    def _draw_bars(self, painter: QPainter, bars: np.ndarray):
+        w = self.BODY_HALF_WIDTH
+        bullish = bars[:, 4] >= bars[:, 1]
+        for (x, open_, high, low, close), up in zip(bars.tolist(), bullish.tolist()):
+            pen, brush = self._pen_and_brush(up)
             painter.setPen(pen)
-            painter.drawLine(x, low, x, high)
-
-            brush_color = BULL_COLOR if bullish else BEAR_COLOR
-            painter.setBrush(pg.mkBrush(brush_color))
-
-            top = max(open_, close)
+            painter.setBrush(brush)
+            painter.drawLine(QLineF(x, low, x, high))
             bottom = min(open_, close)
-            height = top - bottom
-            # if height == 0:
-            #     height = 0.5
-
-            painter.drawRect(QRectF(x - w, bottom, w * 2, height))
+            painter.drawRect(QRectF(x - w, bottom, w * 2, max(open_, close) - bottom))
 
-        painter.end()
-        self.picture = pic
+    def _update_bounds(self):
+        if not len(self.data):
+            bounds = QRectF()
+        else:
+            xs, lows, highs = self.data[:, 0], self.data[:, 3], self.data[:, 2]
+            x_min, x_max, low, high = xs.min(), xs.max(), lows.min(), highs.max()
+            offset = self.PEN_WIDTH_OFFSET
+            bounds = QRectF(x_min - offset, low, (x_max - x_min) + 2 * offset, high - low)
+        if bounds != self._bounds:
+            self.prepareGeometryChange()
+            self._bounds = bounds
 
     def paint(self, p, *args):
-        p.drawPicture(0, 0, self.picture)
+        p.drawPicture(0, 0, self._static_picture)
+        p.drawPicture(0, 0, self._live_picture)
 
     def boundingRect(self):
-        if not self.data:
-            return QRectF()
-        xs, opens, highs, lows, closes = zip(*self.data)
-        pen_width_offset = 1
-        return QRectF(
-            min(xs) - pen_width_offset,
-            min(lows),
-            (max(xs) - min(xs)) + (2 * pen_width_offset),
-            max(highs) - min(lows)
-        )
+        return QRectF(self._bounds)
 
 
 class MarketChartWidget(QWidget):
@@ -199,8 +255,8 @@ class MarketChartWidget(QWidget):
                 self._line_plot = self.plot_widget.plot([], [], pen=pg.mkPen(width=1.5))
             self._line_plot.setData(x, self.chart_data['close'].values)
         else:
-            cs_data = [(i, *self.chart_data.iloc[i][['open', 'high', 'low', 'close']].values)
-                       for i in range(len(self.chart_data))]
+            ohlc = self.chart_data[['open', 'high', 'low', 'close']].to_numpy(dtype=float)
+            cs_data = np.column_stack((x, ohlc))
             if self._candlestick_item is None or full_redraw:
                 self._candlestick_item = CandlestickItem(cs_data)
                 self.plot_widget.addItem(self._candlestick_item)
@@ -165,6 +165,15 @@ class OpenPositionsTable(QWidget):
             self._positions = new_positions_map
             self._update_rows_data()
 
+    def update_changed_positions(self, positions: List[Position]):
+        """Refresh just the rows of ``positions``; symbols not on screen wait for the next full update."""
+        for position in positions:
+            row = self._row_map.get(position.symbol)
+            if row is None:
+                continue
+            self._positions[position.symbol] = position
+            self._update_row_data(row, position)
+
     def _group_key(self, position: Position) -> str:
         """Return a stable group label for each position."""
         return (position.group_name or "").strip() or "General Positions"
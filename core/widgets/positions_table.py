@@ -1,20 +1,411 @@
 import logging
 import json
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QTableWidget, QTableWidgetItem, QHeaderView, QApplication,
+    QTableView, QStyledItemDelegate, QStyleOptionViewItem, QStyle, QHeaderView, QApplication,
     QMenu, QAbstractItemView, QDialog, QFormLayout, QDoubleSpinBox, QPushButton,
     QLineEdit, QComboBox, QDialogButtonBox, QFrame
 )
-from PySide6.QtCore import Qt, Signal, QPoint, QTimer, QEvent
-from PySide6.QtGui import QColor, QFont, QFontMetrics, QIcon, QPixmap, QPainter, QPen
+from PySide6.QtCore import Qt, Signal, QPoint, QTimer, QEvent, QAbstractTableModel, QModelIndex, QRectF
+from PySide6.QtGui import (
+    QColor, QFont, QFontMetrics, QIcon, QPixmap, QPainter, QPen, QTextDocument, QTextOption
+)
 
 from core.utils.config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Row kinds of the flattened table.
+POSITION, SLTP, GROUP, GROUP_SLTP, DIVIDER = "POSITION", "SLTP", "GROUP", "GROUP_SLTP", "DIVIDER"
+RICH_TEXT_ROLE = Qt.UserRole + 1
+
+HEADERS = ["Symbol", "Qty", "Avg", "LTP", "P&L"]
+SYMBOL_COL, QUANTITY_COL, AVG_PRICE_COL, LTP_COL, PNL_COL = range(len(HEADERS))
+
+ROW_HEIGHTS = {POSITION: 30, SLTP: 24, GROUP: 30, GROUP_SLTP: 30, DIVIDER: 3}
+
+PROFIT_COLOR = "#1DB87E"
+LOSS_COLOR = "#E0424A"
+GROUP_BG = "#0E2533"
+DIVIDER_BG = "#2A3350"
+
+
+def _has_sl_tp(pos_data: dict) -> bool:
+    return any((pos_data.get(key) or 0) > 0
+               for key in ('stop_loss_price', 'target_price', 'trailing_stop_loss'))
+
+
+def _sltp_html(pos_data: dict) -> str:
+    sl = pos_data.get('stop_loss_price')
+    tp = pos_data.get('target_price')
+    tsl = pos_data.get('trailing_stop_loss')
+    avg = pos_data.get('average_price', 0.0)
+    qty = abs(pos_data.get('quantity', 0))
+
+    parts = []
+    if sl and sl > 0:
+        sl_pnl = abs(avg - sl) * qty
+        parts.append(
+            f"<span style='color:#F87171;'>Stop Loss</span> "
+            f"<span style='color:#E5E7EB;'>₹{sl_pnl:,.0f}</span> "
+            f"<span style='color:#9CA3AF;'>@ {sl:.2f}</span>"
+        )
+    if tp and tp > 0:
+        tp_pnl = abs(tp - avg) * qty
+        parts.append(
+            f"<span style='color:#1DB87E;'>Take Profit</span> "
+            f"<span style='color:#E5E7EB;'>₹{tp_pnl:,.0f}</span> "
+            f"<span style='color:#9CA3AF;'>@ {tp:.2f}</span>"
+        )
+    if tsl and tsl > 0:
+        parts.append(
+            f"<span style='color:#60A5FA;'>TSL</span> "
+            f"<span style='color:#E5E7EB;'>{tsl:.0f}</span>"
+        )
+    return "  •  ".join(parts)
+
+
+def _group_sltp_html(sltp_data: Dict[str, float]) -> str:
+    sl = sltp_data.get("sl")
+    tp = sltp_data.get("tp")
+    parts = []
+    if sl is not None:
+        parts.append(
+            f"<span style='color:#F87171;'>Group SL</span> "
+            f"<span style='color:#E5E7EB;'>₹{abs(sl):,.0f}</span>"
+        )
+    if tp is not None:
+        parts.append(
+            f"<span style='color:#1DB87E;'>Group TP</span> "
+            f"<span style='color:#E5E7EB;'>₹{tp:,.0f}</span>"
+        )
+    return "  •  ".join(parts) if parts else "Group SL/TP: —"
+
+
+def _group_icon_pixmap(icon_kind: str, color_hex: str) -> QPixmap:
+    pixmap = QPixmap(16, 16)
+    pixmap.fill(Qt.transparent)
+
+    color = QColor(color_hex)
+    if not color.isValid():
+        color = QColor("#E5E7EB")
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+
+    if icon_kind == "folder":
+        body = color.lighter(110)
+        tab = color.lighter(125)
+        painter.setPen(QPen(color.darker(130), 1.0))
+        painter.setBrush(tab)
+        painter.drawRoundedRect(2, 3, 6, 3, 1.4, 1.4)
+        painter.setBrush(body)
+        painter.drawRoundedRect(1.5, 5, 13, 8.5, 1.8, 1.8)
+    else:
+        painter.setPen(QPen(color.darker(130), 1.1))
+        painter.setBrush(color)
+        painter.drawRoundedRect(3, 3, 10, 10, 1.6, 1.6)
+        painter.setPen(QPen(color.lighter(165), 1.0))
+        painter.drawLine(3.5, 7.5, 13, 7.5)
+        painter.drawLine(7.5, 3.5, 7.5, 13)
+
+    painter.end()
+    return pixmap
+
+
+class PositionsTableModel(QAbstractTableModel):
+    """
+    Flattened rows (group headers and their SL/TP lines, positions and their
+    SL/TP lines, dividers) over a ``positions`` dict keyed by tradingsymbol.
+
+    Group and portfolio P&L are running sums moved by each position's P&L
+    delta, and the formatted text of every cell is cached, so a position
+    update emits ``dataChanged`` only for the cells whose text changed.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Tuple[str, Optional[str]]] = []
+        self._position_rows: Dict[str, int] = {}
+        self._sltp_rows: Dict[str, int] = {}
+        self._group_rows: Dict[str, int] = {}
+        self._group_of: Dict[str, str] = {}
+        self._positions: Dict[str, dict] = {}
+        self._group_sl_tp: Dict[str, Dict[str, float]] = {}
+        self._group_styles: Dict[str, Dict[str, str]] = {}
+
+        self._pnl: Dict[str, float] = {}
+        self._group_pnl: Dict[str, float] = {}
+        self.total_pnl = 0.0
+        self._cells: Dict[str, Tuple[str, str, str, str]] = {}
+        self._sltp_text: Dict[str, str] = {}
+        self._group_text: Dict[str, str] = {}
+        self._group_icons: Dict[tuple, QIcon] = {}
+
+        self._fg = {'profit': QColor(PROFIT_COLOR), 'loss': QColor(LOSS_COLOR)}
+        self._group_bg = QColor(GROUP_BG)
+        self._divider_bg = QColor(DIVIDER_BG)
+        self._bold = QFont()
+        self._bold.setBold(True)
+        self._align_left = int(Qt.AlignLeft | Qt.AlignVCenter)
+        self._align_right = int(Qt.AlignRight | Qt.AlignVCenter)
+
+    # ── structure ─────────────────────────────────────────────────────────────
+    def set_rows(self, rows: List[Tuple[str, Optional[str]]], positions: Dict[str, dict],
+                 group_members: Dict[str, List[str]], group_sl_tp: Dict[str, Dict[str, float]],
+                 group_styles: Dict[str, Dict[str, str]]):
+        """Replace the layout and re-seed every aggregate from scratch."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._positions = positions
+        self._group_sl_tp = group_sl_tp
+        self._group_styles = group_styles
+        self._group_of = {s: g for g, members in group_members.items() for s in members}
+
+        self._position_rows.clear()
+        self._sltp_rows.clear()
+        self._group_rows.clear()
+        for row, (kind, key) in enumerate(self._rows):
+            if kind == POSITION:
+                self._position_rows[key] = row
+            elif kind == SLTP:
+                self._sltp_rows[key] = row
+            elif kind == GROUP:
+                self._group_rows[key] = row
+
+        self._pnl = {s: p.get('pnl', 0.0) for s, p in positions.items()}
+        self._cells = {s: self._format_cells(p) for s, p in positions.items()}
+        self._sltp_text = {s: _sltp_html(positions[s]) for s in self._sltp_rows}
+        self._group_pnl = {g: sum(self._pnl.get(s, 0.0) for s in members)
+                           for g, members in group_members.items()}
+        self._group_text = {g: f"{v:,.0f}" for g, v in self._group_pnl.items()}
+        self.total_pnl = sum(self._pnl.values())
+        self.endResetModel()
+
+    def row_kind(self, row: int) -> Optional[str]:
+        return self._rows[row][0] if 0 <= row < len(self._rows) else None
+
+    def row_symbol(self, row: int) -> Optional[str]:
+        kind = self.row_kind(row)
+        return self._rows[row][1] if kind in (POSITION, SLTP) else None
+
+    def row_group(self, row: int) -> Optional[str]:
+        kind = self.row_kind(row)
+        if kind in (GROUP, GROUP_SLTP):
+            return self._rows[row][1]
+        if kind in (POSITION, SLTP):
+            return self._group_of.get(self._rows[row][1])
+        return None
+
+    def group_pnl(self, group_name: str) -> float:
+        return self._group_pnl.get(group_name, 0.0)
+
+    # ── incremental updates ───────────────────────────────────────────────────
+    @staticmethod
+    def _format_cells(pos_data: dict) -> Tuple[str, str, str, str]:
+        return (
+            f"{int(pos_data.get('quantity', 0)):,}",
+            f"{pos_data.get('average_price', 0.0):,.2f}",
+            f"{pos_data.get('last_price', 0.0):,.2f}",
+            f"{pos_data.get('pnl', 0.0):,.0f}",
+        )
+
+    def update_position(self, pos_data: dict) -> bool:
+        """
+        Fold one position's new values into its row, its group and the total.
+
+        Returns True when the portfolio total moved.  The position must already
+        be laid out; new symbols or SL/TP lines appearing go through ``set_rows``.
+        """
+        symbol = pos_data['tradingsymbol']
+        self._positions[symbol] = pos_data
+        row = self._position_rows.get(symbol)
+        if row is None:
+            return False
+
+        pnl = pos_data.get('pnl', 0.0)
+        delta = pnl - self._pnl.get(symbol, 0.0)
+        self._pnl[symbol] = pnl
+
+        cells = self._format_cells(pos_data)
+        old_cells = self._cells.get(symbol)
+        self._cells[symbol] = cells
+        changed = [QUANTITY_COL + i for i, text in enumerate(cells)
+                   if old_cells is None or text != old_cells[i]]
+        if changed:
+            self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]))
+
+        sltp_row = self._sltp_rows.get(symbol)
+        if sltp_row is not None:
+            html = _sltp_html(pos_data)
+            if html != self._sltp_text.get(symbol):
+                self._sltp_text[symbol] = html
+                self.dataChanged.emit(self.index(sltp_row, SYMBOL_COL), self.index(sltp_row, SYMBOL_COL))
+
+        if not delta:
+            return False
+        self.total_pnl += delta
+        group_name = self._group_of.get(symbol)
+        if group_name is not None:
+            self._group_pnl[group_name] = self._group_pnl.get(group_name, 0.0) + delta
+            text = f"{self._group_pnl[group_name]:,.0f}"
+            group_row = self._group_rows.get(group_name)
+            if text != self._group_text.get(group_name) and group_row is not None:
+                self._group_text[group_name] = text
+                self.dataChanged.emit(self.index(group_row, PNL_COL), self.index(group_row, PNL_COL))
+        return True
+
+    # ── QAbstractTableModel ───────────────────────────────────────────────────
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        kind = self._rows[index.row()][0]
+        if kind in (POSITION, GROUP):
+            return (Qt.ItemIsEnabled | Qt.ItemIsSelectable
+                    | Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled)
+        if kind == DIVIDER:
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def supportedDragActions(self):
+        return Qt.MoveAction
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        kind, key = self._rows[index.row()]
+        col = index.column()
+        if kind == POSITION:
+            return self._position_data(key, col, role)
+        if kind == GROUP:
+            return self._group_data(key, col, role)
+        if kind == SLTP:
+            if role == RICH_TEXT_ROLE and col == SYMBOL_COL:
+                return self._sltp_text.get(key, "")
+            return None
+        if kind == GROUP_SLTP:
+            if role == RICH_TEXT_ROLE and col == SYMBOL_COL:
+                return _group_sltp_html(self._group_sl_tp.get(key, {}))
+            return None
+        if role == Qt.BackgroundRole:
+            return self._divider_bg
+        return None
+
+    def _position_data(self, symbol: str, col: int, role: int):
+        if role == Qt.DisplayRole:
+            if col == SYMBOL_COL:
+                return symbol
+            cells = self._cells.get(symbol)
+            return cells[col - QUANTITY_COL] if cells else None
+        if role == Qt.TextAlignmentRole:
+            return self._align_left if col == SYMBOL_COL else self._align_right
+        if col == PNL_COL:
+            if role == Qt.ForegroundRole:
+                return self._fg['profit'] if self._pnl.get(symbol, 0.0) >= 0 else self._fg['loss']
+            if role == Qt.FontRole:
+                return self._bold
+        return None
+
+    def _group_data(self, group_name: str, col: int, role: int):
+        if role == Qt.BackgroundRole:
+            return self._group_bg
+        style = self._group_styles.get(group_name, {})
+        color_hex = style.get("color", "#E5E7EB")
+        if col == SYMBOL_COL:
+            if role == Qt.DisplayRole:
+                return group_name
+            if role == Qt.ForegroundRole:
+                return QColor(color_hex)
+            if role == Qt.FontRole:
+                return self._bold
+            if role == Qt.TextAlignmentRole:
+                return self._align_left
+            if role == Qt.DecorationRole:
+                icon_kind = "folder" if style.get("icon") in {"folder", "📁", "Folder"} else "cube"
+                icon = self._group_icons.get((icon_kind, color_hex))
+                if icon is None:
+                    icon = QIcon(_group_icon_pixmap(icon_kind, color_hex))
+                    self._group_icons[(icon_kind, color_hex)] = icon
+                return icon
+        elif col == PNL_COL:
+            if role == Qt.DisplayRole:
+                return self._group_text.get(group_name, "0")
+            if role == Qt.ForegroundRole:
+                return self._fg['profit'] if self._group_pnl.get(group_name, 0.0) >= 0 else self._fg['loss']
+            if role == Qt.FontRole:
+                return self._bold
+            if role == Qt.TextAlignmentRole:
+                return self._align_right
+        return None
+
+
+class PositionsTableDelegate(QStyledItemDelegate):
+    """Paints the rich-text SL/TP lines that span a whole row."""
+
+    _CACHE_LIMIT = 256
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont("Segoe UI")
+        self._font.setPixelSize(11)
+        self._font.setWeight(QFont.Medium)
+        self._docs: Dict[tuple, QTextDocument] = {}
+
+    def _document(self, html: str, width: float) -> QTextDocument:
+        key = (html, width)
+        doc = self._docs.get(key)
+        if doc is None:
+            if len(self._docs) >= self._CACHE_LIMIT:
+                self._docs.clear()
+            doc = QTextDocument()
+            doc.setDocumentMargin(0)
+            doc.setDefaultFont(self._font)
+            doc.setDefaultStyleSheet("body { color: #9CA3AF; }")
+            option = QTextOption()
+            option.setAlignment(Qt.AlignRight)
+            option.setWrapMode(QTextOption.NoWrap)
+            doc.setDefaultTextOption(option)
+            doc.setHtml(html)
+            doc.setTextWidth(width)
+            self._docs[key] = doc
+        return doc
+
+    def paint(self, painter, option, index):
+        html = index.data(RICH_TEXT_ROLE)
+        if not html:
+            super().paint(painter, option, index)
+            return
+
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        # Keep SL/TP text clear of row clipping with near-zero cell spacing.
+        rect = opt.rect.adjusted(0, 0, -2, 0)
+        doc = self._document(html, float(rect.width()))
+        painter.save()
+        painter.translate(rect.topLeft())
+        doc.drawContents(painter, QRectF(0, 0, rect.width(), rect.height()))
+        painter.restore()
+
 
 class PositionsTable(QWidget):
     """
@@ -55,11 +446,8 @@ class PositionsTable(QWidget):
         self.config_manager = config_manager
         self.table_name = "positions_table"
         self.positions: Dict[str, dict] = {}
-        self.position_row_map: Dict[str, int] = {}
-        self.group_row_map: Dict[str, int] = {}
         self.group_members: Dict[str, List[str]] = {}
         self.group_order: List[str] = []
-        self._last_structure_signature: tuple = ()
         self.group_sl_tp: Dict[str, Dict[str, float]] = {}
         self.group_styles: Dict[str, Dict[str, str]] = {}
         self.individual_sl_tp: Dict[str, Dict[str, Optional[float]]] = {}
@@ -67,6 +455,7 @@ class PositionsTable(QWidget):
         self._individual_sl_tp_restored = False
 
         self._hovered_row = -1
+        self._footer_text: Optional[str] = None
 
         self._init_ui()
         self._apply_styles()
@@ -90,10 +479,10 @@ class PositionsTable(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
 
-        self.table = QTableWidget()
-        self.table.headers = ["Symbol", "Qty", "Avg", "LTP", "P&L"]
-        self.table.setColumnCount(len(self.table.headers))
-        self.table.setHorizontalHeaderLabels(self.table.headers)
+        self.model = PositionsTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(PositionsTableDelegate(self.table))
         self.table.setDragEnabled(True)
         self.table.setAcceptDrops(True)
         self.table.setDropIndicatorShown(True)
@@ -165,14 +554,17 @@ class PositionsTable(QWidget):
         return sep
 
     def _update_footer(self):
-        total_pnl = sum(pos.get('pnl', 0.0) for pos in self.positions.values())
+        total_pnl = self.model.total_pnl
 
         # Format with proper Indian notation
         sign = "" if total_pnl >= 0 else "-"
         formatted = f"₹ {sign}{abs(total_pnl):,.0f}"
+        if formatted == self._footer_text:
+            return
+        self._footer_text = formatted
         self.total_pnl_value.setText(formatted)
 
-        color = "#1DB87E" if total_pnl >= 0 else "#E0424A"
+        color = PROFIT_COLOR if total_pnl >= 0 else LOSS_COLOR
         self.total_pnl_value.setStyleSheet(
             f"color: {color}; font-weight: 700; font-size: 13px;"
         )
@@ -185,7 +577,7 @@ class PositionsTable(QWidget):
         self.table.customContextMenuRequested.connect(self._show_context_menu)
         self.table.horizontalHeader().sectionResized.connect(self._on_column_resized)
         self.table.viewport().installEventFilter(self)
-        self.table.itemPressed.connect(self._on_item_pressed)
+        self.table.pressed.connect(self._on_index_pressed)
 
     # ------------------------------------------------------------------
     # Row-hover handling (THIS IS THE KEY FIX)
@@ -212,7 +604,7 @@ class PositionsTable(QWidget):
 
                 if row != self._hovered_row:
                     self._hovered_row = row
-                    self.table.setCurrentCell(row, self.SYMBOL_COL)
+                    self._set_current_row(row)
             elif event.type() == QEvent.Type.MouseButtonRelease:
                 # A simple click should not keep the table in drag mode;
                 # reset so hover highlighting can continue to update.
@@ -221,9 +613,9 @@ class PositionsTable(QWidget):
                 # Prevent persistent click-selection; this table uses hover-style highlighting.
                 self.table.clearSelection()
                 if self._hovered_row >= 0 and not self._is_sltp_row(self._hovered_row):
-                    self.table.setCurrentCell(self._hovered_row, self.SYMBOL_COL)
+                    self._set_current_row(self._hovered_row)
                 else:
-                    self.table.setCurrentCell(-1, -1)
+                    self._set_current_row(-1)
 
             elif event.type() == QEvent.Type.MouseButtonRelease:
                 # A simple click should not keep the table in drag mode;
@@ -235,25 +627,31 @@ class PositionsTable(QWidget):
                 self._hovered_row = -1
                 if not self._drag_active:
                     self.table.clearSelection()
-                    self.table.setCurrentCell(-1, -1)
+                    self._set_current_row(-1)
 
             elif event.type() == QEvent.Type.DragLeave:
                 self._hovered_row = -1
                 self._drag_active = False
                 self.table.clearSelection()
-                self.table.setCurrentCell(-1, -1)
+                self._set_current_row(-1)
 
         return super().eventFilter(obj, event)
+
+    def _set_current_row(self, row: int):
+        if row < 0:
+            self.table.setCurrentIndex(QModelIndex())
+        else:
+            self.table.setCurrentIndex(self.model.index(row, self.SYMBOL_COL))
     # ------------------------------------------------------------------
     # Context menu (UNCHANGED)
     # ------------------------------------------------------------------
 
     def _show_context_menu(self, pos: QPoint):
-        item = self.table.itemAt(pos)
-        if not item:
+        index = self.table.indexAt(pos)
+        if not index.isValid():
             return
 
-        row = item.row()
+        row = index.row()
         row_kind = self._row_kind(row)
         if row_kind == "GROUP_SLTP":
             row_kind = "GROUP"
@@ -388,36 +786,59 @@ class PositionsTable(QWidget):
     # Data population (UNCHANGED LOGIC)
     # ------------------------------------------------------------------
 
-    def _compute_structure_signature(self) -> tuple:
-        """
-        A cheap hash of the table's *structure* — symbols, groups, order.
-        If this hasn't changed between ticks, we skip the full rebuild.
-        """
-        groups_part = tuple(
-            (g, tuple(self.group_members.get(g, [])))
-            for g in self.group_order
-            if self.group_members.get(g)
-        )
-        # Include group SL/TP presence so row count stays consistent
-        group_sltp_part = tuple(
-            (g, bool(v)) for g, v in self.group_sl_tp.items()
-        )
-        # Individual position SL/TP rows affect row count too
-        sltp_presence = tuple(
-            (
-                sym,
-                bool(self.positions.get(sym, {}).get('stop_loss_price')),
-                bool(self.positions.get(sym, {}).get('target_price')),
-                bool(self.positions.get(sym, {}).get('trailing_stop_loss')),
-            )
-            for sym in self.positions
-        )
-        return (groups_part, group_sltp_part, tuple(self.visual_order), sltp_presence)
-
     def update_positions(self, positions_data: List[dict]):
-        self.positions = {p['tradingsymbol']: p for p in positions_data}
-        live_symbols = set(self.positions.keys())
+        incoming = {p['tradingsymbol']: p for p in positions_data}
+
+        # Rows only need re-laying out when a symbol appears or goes, an SL/TP
+        # line appears or goes, or a group hint changes; everything else is a
+        # value change folded into the model's cells and running aggregates.
+        structural = incoming.keys() != self.positions.keys()
+        changed: List[dict] = []
+        if not structural:
+            for symbol, pos in incoming.items():
+                if pos == self.positions[symbol]:
+                    continue
+                if self._needs_relayout(pos):
+                    structural = True
+                    break
+                changed.append(pos)
+
+        if structural:
+            self.positions.clear()
+            self.positions.update(incoming)
+            self._sync_layout(positions_data)
+            self._rebuild_table_from_order()
+        else:
+            for pos in changed:
+                self.positions[pos['tradingsymbol']] = pos
+                self.model.update_position(pos)
+            self._update_footer()
+
+        if not self._individual_sl_tp_restored:
+            self._restore_individual_sl_tp()
+
+    def update_changed_positions(self, positions_data: List[dict]):
+        """Apply a tick delta: only the positions whose values moved are passed in."""
+        if any(self._needs_relayout(pos) for pos in positions_data):
+            for pos in positions_data:
+                self.positions[pos['tradingsymbol']] = pos
+            self._sync_layout(list(self.positions.values()))
+            self._rebuild_table_from_order()
+            return
+
+        for pos in positions_data:
+            self.positions[pos['tradingsymbol']] = pos
+            self.model.update_position(pos)
+        self._update_footer()
 
+    def _needs_relayout(self, pos: dict) -> bool:
+        old = self.positions.get(pos['tradingsymbol'])
+        return (old is None
+                or _has_sl_tp(pos) != _has_sl_tp(old)
+                or pos.get('group_name') != old.get('group_name'))
+
+    def _sync_layout(self, positions_data: List[dict]):
+        live_symbols = set(self.positions.keys())
         self._sync_group_memberships(positions_data, live_symbols)
 
         if not self.visual_order:
@@ -430,384 +851,84 @@ class PositionsTable(QWidget):
 
         self._prune_empty_groups()
 
-        new_sig = self._compute_structure_signature()
-
-        if new_sig != self._last_structure_signature:
-            # Structure changed — full rebuild (positions added/removed, groups changed)
-            self._last_structure_signature = new_sig
-            self._rebuild_table_from_order()
-        else:
-            # Only prices/pnl changed — surgical in-place update, no row destruction
-            self._update_cells_in_place()
-
-        if not self._individual_sl_tp_restored:
-            self._restore_individual_sl_tp()
-
     def set_position_manager(self, position_manager):
         self.position_manager = position_manager
+        position_manager.set_group_sl_tp(self.group_members, self.group_sl_tp)
 
     def _rebuild_table_from_order(self):
-        self.table.setUpdatesEnabled(False)
-        self.table.setRowCount(0)
-        self.position_row_map.clear()
-        self.group_row_map.clear()
-
+        rows: List[Tuple[str, Optional[str]]] = []
         rendered_groups = [g for g in self.group_order if self.group_members.get(g)]
 
         for index, group_name in enumerate(rendered_groups):
-            members = self.group_members.get(group_name, [])
-            self._add_group_rows(group_name, members)
+            rows.append((GROUP, group_name))
+            if group_name in self.group_sl_tp:
+                rows.append((GROUP_SLTP, group_name))
+            for symbol in self.group_members.get(group_name, []):
+                self._append_position_rows(rows, symbol)
 
             if index < len(rendered_groups) - 1 or self.visual_order:
-                self._insert_group_divider_row()
+                rows.append((DIVIDER, None))
 
         for symbol in self.visual_order:
-            if symbol in self.positions:
-                self._add_position_rows(self.positions[symbol])
+            self._append_position_rows(rows, symbol)
 
-        self._update_footer()
-        self.table.setUpdatesEnabled(True)
+        if self.position_manager is not None:
+            self.position_manager.set_group_sl_tp(self.group_members, self.group_sl_tp)
 
-    def _update_cells_in_place(self):
-        """
-        Tick-safe update: only writes to price/pnl/qty cells.
-        No row creation/destruction = no hover flicker, no drag interruption.
-        """
         self.table.setUpdatesEnabled(False)
-
-        for symbol, pos_data in self.positions.items():
-            row = self.position_row_map.get(symbol)
-            if row is None or row >= self.table.rowCount():
-                continue
-
-            # Qty
-            item = self.table.item(row, self.QUANTITY_COL)
-            new_qty = f"{int(pos_data.get('quantity', 0)):,}"
-            if item and item.text() != new_qty:
-                item.setText(new_qty)
-
-            # Avg Price
-            item = self.table.item(row, self.AVG_PRICE_COL)
-            new_avg = f"{pos_data.get('average_price', 0.0):,.2f}"
-            if item and item.text() != new_avg:
-                item.setText(new_avg)
-
-            # LTP
-            item = self.table.item(row, self.LTP_COL)
-            new_ltp = f"{pos_data.get('last_price', 0.0):,.2f}"
-            if item and item.text() != new_ltp:
-                item.setText(new_ltp)
-
-            # PnL — also update color
-            pnl = pos_data.get('pnl', 0.0)
-            item = self.table.item(row, self.PNL_COL)
-            new_pnl = f"{pnl:,.0f}"
-            if item:
-                if item.text() != new_pnl:
-                    item.setText(new_pnl)
-                item.setForeground(QColor("#1DB87E") if pnl >= 0 else QColor("#E0424A"))
-
-        # Update group header PnL rows in-place too
-        for group_name, group_row in self.group_row_map.items():
-            if group_row >= self.table.rowCount():
-                continue
-            members = self.group_members.get(group_name, [])
-            group_pnl = sum(self.positions.get(s, {}).get('pnl', 0.0) for s in members)
-            # PnL is in column PNL_COL of the group header row
-            item = self.table.item(group_row, self.PNL_COL)
-            new_pnl = f"{group_pnl:,.0f}"
-            if item:
-                if item.text() != new_pnl:
-                    item.setText(new_pnl)
-                item.setForeground(QColor("#1DB87E") if group_pnl >= 0 else QColor("#E0424A"))
-
+        self.model.set_rows(rows, self.positions, self.group_members, self.group_sl_tp, self.group_styles)
+        self._apply_row_layout()
         self._update_footer()
         self.table.setUpdatesEnabled(True)
 
-    def _add_position_rows(self, pos_data: dict):
-        symbol = pos_data['tradingsymbol']
-        self.positions[symbol] = pos_data
-
-        main_row = self.table.rowCount()
-        self.table.insertRow(main_row)
-        self.position_row_map[symbol] = main_row
-        self.table.setRowHeight(main_row, 30)
-        self.table.setProperty(f"row_pid_{main_row}", symbol)
-        self.table.setProperty(f"row_role_{main_row}", "MAIN")
-        self.table.setProperty(f"row_kind_{main_row}", "POSITION")
-        self.table.setProperty(f"row_group_{main_row}", self._symbol_group(symbol))
-
-        self._set_symbol_item(main_row, pos_data)
-        self._set_item(main_row, self.QUANTITY_COL, pos_data.get('quantity', 0))
-        self._set_item(main_row, self.AVG_PRICE_COL, pos_data.get('average_price', 0.0), is_price=True)
-        self._set_item(main_row, self.LTP_COL, pos_data.get('last_price', 0.0), is_price=True)
-        self._set_pnl_item(main_row, pos_data.get('pnl', 0.0))
-
-        sl = pos_data.get('stop_loss_price')
-        tp = pos_data.get('target_price')
-        tsl = pos_data.get('trailing_stop_loss')
-
-        if (sl and sl > 0) or (tp and tp > 0) or (tsl and tsl > 0):
-            sltp_row = self.table.rowCount()
-            self.table.insertRow(sltp_row)
-            self.table.setRowHeight(sltp_row, 24)
-            self.table.setProperty(f"row_type_{sltp_row}", "SLTP")
-            self._set_sltp_row(sltp_row, pos_data)
-            self.table.setProperty(f"row_pid_{sltp_row}", symbol)
-            self.table.setProperty(f"row_role_{sltp_row}", "SLTP")
-            self.table.setProperty(f"row_kind_{sltp_row}", "SLTP")
-
-    def _insert_group_divider_row(self):
-        """Insert a bright thin row to clearly mark the end of a group."""
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setRowHeight(row, 3)
-        self.table.setProperty(f"row_kind_{row}", "DIVIDER")
-
-        divider_item = QTableWidgetItem("")
-        divider_item.setFlags(Qt.ItemFlag.NoItemFlags)
-        divider_item.setBackground(QColor("#2A3350"))
-        self.table.setItem(row, 0, divider_item)
-        self.table.setSpan(row, 0, 1, self.table.columnCount())
-
-    def _add_group_rows(self, group_name: str, members: List[str]):
-        group_row = self.table.rowCount()
-        self.table.insertRow(group_row)
-        self.table.setRowHeight(group_row, 30)
-        self.group_row_map[group_name] = group_row
-        self.table.setProperty(f"row_kind_{group_row}", "GROUP")
-        self.table.setProperty(f"row_group_{group_row}", group_name)
-
-        group_pnl = sum(self.positions.get(symbol, {}).get('pnl', 0.0) for symbol in members)
-        self._set_group_header_items(group_row, group_name, group_pnl)
-
-        if group_name in self.group_sl_tp:
-            sltp_row = self.table.rowCount()
-            self.table.insertRow(sltp_row)
-            self.table.setRowHeight(sltp_row, 30)
-            self.table.setProperty(f"row_kind_{sltp_row}", "GROUP_SLTP")
-            self.table.setProperty(f"row_group_{sltp_row}", group_name)
-            self._set_group_sltp_row(sltp_row, self.group_sl_tp[group_name])
-
-        for symbol in members:
-            pos = self.positions.get(symbol)
-            if not pos:
-                continue
-            self._add_position_rows(pos)
+    def _append_position_rows(self, rows: List[Tuple[str, Optional[str]]], symbol: str):
+        pos_data = self.positions.get(symbol)
+        if not pos_data:
+            return
+        rows.append((POSITION, symbol))
+        if _has_sl_tp(pos_data):
+            rows.append((SLTP, symbol))
+
+    def _apply_row_layout(self):
+        """Row heights and full-width spans for SL/TP lines and dividers (lost on model reset)."""
+        self.table.clearSpans()
+        columns = self.model.columnCount()
+        for row in range(self.model.rowCount()):
+            kind = self.model.row_kind(row)
+            self.table.setRowHeight(row, ROW_HEIGHTS[kind])
+            if kind in (SLTP, GROUP_SLTP, DIVIDER):
+                self.table.setSpan(row, self.SYMBOL_COL, 1, columns)
 
     # ------------------------------------------------------------------
     # Helpers (UNCHANGED)
     # ------------------------------------------------------------------
 
-    def _update_footer(self):
-        total_pnl = sum(pos.get('pnl', 0.0) for pos in self.positions.values())
-        sign = "" if total_pnl >= 0 else "-"
-        formatted = f"₹ {sign}{abs(total_pnl):,.0f}"
-        self.total_pnl_value.setText(formatted)
-
-        color = "#1DB87E" if total_pnl >= 0 else "#E0424A"
-        self.total_pnl_value.setStyleSheet(
-            f"color: {color}; font-weight: 700; font-size: 13px;"
-        )
-
-    def _set_item(self, row, col, data, is_price=False):
-        item = QTableWidgetItem()
-        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        item.setText(f"{data:,.2f}" if is_price else f"{int(data):,}")
-        self.table.setItem(row, col, item)
-
-    def _set_symbol_item(self, row, pos_data):
-        item = QTableWidgetItem(pos_data.get('tradingsymbol', 'N/A'))
-        item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        self.table.setItem(row, self.SYMBOL_COL, item)
-
-    def _set_pnl_item(self, row, pnl):
-        item = QTableWidgetItem(f"{pnl:,.0f}")
-        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        item.setForeground(QColor("#1DB87E") if pnl >= 0 else QColor("#E0424A"))
-        font = QFont()
-        font.setBold(True)
-        item.setFont(font)
-        self.table.setItem(row, self.PNL_COL, item)
-
-    def _set_sltp_row(self, row, pos_data):
-        sl = pos_data.get('stop_loss_price')
-        tp = pos_data.get('target_price')
-        tsl = pos_data.get('trailing_stop_loss')
-        avg = pos_data.get('average_price', 0.0)
-        qty = abs(pos_data.get('quantity', 0))
-
-        parts = []
-
-        if sl and sl > 0:
-            sl_pnl = abs(avg - sl) * qty
-            parts.append(
-                f"<span style='color:#F87171;'>Stop Loss</span> "
-                f"<span style='color:#E5E7EB;'>₹{sl_pnl:,.0f}</span> "
-                f"<span style='color:#9CA3AF;'>@ {sl:.2f}</span>"
-            )
-
-        if tp and tp > 0:
-            tp_pnl = abs(tp - avg) * qty
-            parts.append(
-                f"<span style='color:#1DB87E;'>Take Profit</span> "
-                f"<span style='color:#E5E7EB;'>₹{tp_pnl:,.0f}</span> "
-                f"<span style='color:#9CA3AF;'>@ {tp:.2f}</span>"
-            )
-
-        if tsl and tsl > 0:
-            parts.append(
-                f"<span style='color:#60A5FA;'>TSL</span> "
-                f"<span style='color:#E5E7EB;'>{tsl:.0f}</span>"
-            )
-
-        # ---- QLabel ----
-        label = QLabel("  •  ".join(parts))
-        label.setTextFormat(Qt.RichText)
-        label.setAlignment(Qt.AlignRight | Qt.AlignTop)
-        label.setStyleSheet("""
-            QLabel {
-                font-family: Segoe UI;
-                font-size: 11px;
-                font-weight: 500;
-                color: #9CA3AF;
-            }
-        """)
-
-        # ---- Wrapper widget (THIS IS THE KEY) ----
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        # Keep SL/TP text clear of row clipping with near-zero cell spacing.
-        layout.setContentsMargins(0, 0, 2, 0)
-        layout.setSpacing(0)
-        layout.addWidget(label)
-        layout.setAlignment(Qt.AlignTop | Qt.AlignRight)
-
-        self.table.setCellWidget(row, self.SYMBOL_COL, container)
-        self.table.setSpan(row, self.SYMBOL_COL, 1, self.table.columnCount())
-
     def _normalize_group_icon_style(self, icon_value: Optional[str]) -> str:
         if icon_value in {"folder", "📁", "Folder"}:
             return "folder"
         return "cube"
 
     def _build_group_icon_pixmap(self, icon_kind: str, color_hex: str) -> QPixmap:
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.transparent)
-
-        color = QColor(color_hex)
-        if not color.isValid():
-            color = QColor("#E5E7EB")
-
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-
-        if icon_kind == "folder":
-            body = color.lighter(110)
-            tab = color.lighter(125)
-            painter.setPen(QPen(color.darker(130), 1.0))
-            painter.setBrush(tab)
-            painter.drawRoundedRect(2, 3, 6, 3, 1.4, 1.4)
-            painter.setBrush(body)
-            painter.drawRoundedRect(1.5, 5, 13, 8.5, 1.8, 1.8)
-        else:
-            painter.setPen(QPen(color.darker(130), 1.1))
-            painter.setBrush(color)
-            painter.drawRoundedRect(3, 3, 10, 10, 1.6, 1.6)
-            painter.setPen(QPen(color.lighter(165), 1.0))
-            painter.drawLine(3.5, 7.5, 13, 7.5)
-            painter.drawLine(7.5, 3.5, 7.5, 13)
-
-        painter.end()
-        return pixmap
-
-    def _set_group_header_items(self, row: int, group_name: str, group_pnl: float):
-        style = self.group_styles.get(group_name, {})
-        icon_kind = self._normalize_group_icon_style(style.get("icon"))
-        color_hex = style.get("color", "#E5E7EB")
-
-        symbol_item = QTableWidgetItem(group_name)
-        symbol_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        symbol_font = QFont()
-        symbol_font.setBold(True)
-        symbol_item.setFont(symbol_font)
-        symbol_item.setForeground(QColor(color_hex))
-        symbol_item.setIcon(QIcon(self._build_group_icon_pixmap(icon_kind, color_hex)))
-        symbol_item.setBackground(QColor("#0E2533"))
-        self.table.setItem(row, self.SYMBOL_COL, symbol_item)
-
-        for col in (self.QUANTITY_COL, self.AVG_PRICE_COL, self.LTP_COL):
-            placeholder = QTableWidgetItem("")
-            placeholder.setFlags(placeholder.flags() ^ Qt.ItemIsEditable)
-            placeholder.setBackground(QColor("#0E2533"))
-            self.table.setItem(row, col, placeholder)
-
-        pnl_item = QTableWidgetItem(f"{group_pnl:,.0f}")
-        pnl_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        pnl_item.setForeground(QColor("#1DB87E") if group_pnl >= 0 else QColor("#E0424A"))
-        pnl_font = QFont()
-        pnl_font.setBold(True)
-        pnl_item.setFont(pnl_font)
-        pnl_item.setBackground(QColor("#0E2533"))
-        self.table.setItem(row, self.PNL_COL, pnl_item)
-
-    def _set_group_sltp_row(self, row: int, sltp_data: Dict[str, float]):
-        sl = sltp_data.get("sl")
-        tp = sltp_data.get("tp")
-
-        parts = []
-        if sl is not None:
-            parts.append(
-                f"<span style='color:#F87171;'>Group SL</span> "
-                f"<span style='color:#E5E7EB;'>₹{abs(sl):,.0f}</span>"
-            )
-        if tp is not None:
-            parts.append(
-                f"<span style='color:#1DB87E;'>Group TP</span> "
-                f"<span style='color:#E5E7EB;'>₹{tp:,.0f}</span>"
-            )
-
-        label = QLabel("  •  ".join(parts) if parts else "Group SL/TP: —")
-        label.setTextFormat(Qt.RichText)
-        label.setAlignment(Qt.AlignRight | Qt.AlignTop)
-        label.setStyleSheet("""
-            QLabel {
-                font-family: Segoe UI;
-                font-size: 11px;
-                font-weight: 500;
-                color: #9CA3AF;
-            }
-        """)
-
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        # Keep SL/TP text clear of row clipping with near-zero cell spacing.
-        layout.setContentsMargins(0, 0, 2, 0)
-        layout.setSpacing(0)
-        layout.addWidget(label)
-        layout.setAlignment(Qt.AlignTop | Qt.AlignRight)
-
-        self.table.setCellWidget(row, self.SYMBOL_COL, container)
-        self.table.setSpan(row, self.SYMBOL_COL, 1, self.table.columnCount())
+        return _group_icon_pixmap(icon_kind, color_hex)
 
     def _row_kind(self, row: int) -> Optional[str]:
-        return self.table.property(f"row_kind_{row}")
+        return self.model.row_kind(row)
 
     def _row_group(self, row: int) -> Optional[str]:
-        return self.table.property(f"row_group_{row}")
+        return self.model.row_group(row)
 
     def _row_symbol(self, row: int) -> Optional[str]:
-        return self.table.property(f"row_pid_{row}")
+        return self.model.row_symbol(row)
 
     def _selected_position_symbols(self) -> List[str]:
         selected_symbols = []
-        for selection_range in self.table.selectedRanges():
-            for row in range(selection_range.topRow(), selection_range.bottomRow() + 1):
-                if self._row_kind(row) != "POSITION":
-                    continue
-                symbol = self._row_symbol(row)
-                if symbol and symbol not in selected_symbols:
-                    selected_symbols.append(symbol)
+        for index in sorted(self.table.selectionModel().selectedRows(), key=lambda i: i.row()):
+            row = index.row()
+            if self._row_kind(row) != POSITION:
+                continue
+            symbol = self._row_symbol(row)
+            if symbol and symbol not in selected_symbols:
+                selected_symbols.append(symbol)
         return selected_symbols
 
     def _create_group_from_selection(self, symbols: List[str]):
@@ -1262,8 +1383,8 @@ class PositionsTable(QWidget):
             with open(path, "r") as f:
                 widths = json.load(f)
             for name, w in widths.items():
-                if name in self.table.headers:
-                    self.table.setColumnWidth(self.table.headers.index(name), int(w))
+                if name in HEADERS:
+                    self.table.setColumnWidth(HEADERS.index(name), int(w))
             return True
         except Exception:
             return False
@@ -1282,7 +1403,7 @@ class PositionsTable(QWidget):
         try:
             path = os.path.expanduser("~/.imperium_desk/positions_table_columns.json")
             os.makedirs(os.path.dirname(path), exist_ok=True)
-            data = {h: self.table.columnWidth(i) for i, h in enumerate(self.table.headers)}
+            data = {h: self.table.columnWidth(i) for i, h in enumerate(HEADERS)}
             with open(path, "w") as f:
                 json.dump(data, f, indent=2)
         except Exception:
@@ -1451,8 +1572,8 @@ class PositionsTable(QWidget):
         return self._row_kind(row) in {"SLTP", "GROUP_SLTP"}
 
 
-    def _on_item_pressed(self, item: QTableWidgetItem):
-        row = item.row()
+    def _on_index_pressed(self, index: QModelIndex):
+        row = index.row()
         row_kind = self._row_kind(row)
 
         # Prevent dragging non-draggable structural rows.
@@ -1465,25 +1586,25 @@ class PositionsTable(QWidget):
     def _handle_drop(self, event):
         self._drag_active = False
 
-        source_row = self.table.currentRow()
+        source_row = self.table.currentIndex().row()
         if source_row < 0:
-            self.table.setCurrentCell(-1, -1)  # 🔥 Clear here
+            self._set_current_row(-1)  # 🔥 Clear here
             return
 
         source_kind = self._row_kind(source_row)
         if source_kind in {None, "SLTP", "GROUP_SLTP"}:
-            self.table.setCurrentCell(-1, -1)
+            self._set_current_row(-1)
             return
 
         pos = event.position().toPoint()
         target_row = self.table.rowAt(pos.y())
         if target_row < 0:
-            self.table.setCurrentCell(-1, -1)  # 🔥 Clear here
+            self._set_current_row(-1)  # 🔥 Clear here
             return
 
         target_kind = self._row_kind(target_row)
         if target_kind in {None, "SLTP", "GROUP_SLTP"}:
-            self.table.setCurrentCell(-1, -1)
+            self._set_current_row(-1)
             return
 
         if source_kind == "GROUP":
@@ -1497,11 +1618,11 @@ class PositionsTable(QWidget):
                 target_group = None
 
             if not source_group or not target_group or source_group == target_group:
-                self.table.setCurrentCell(-1, -1)
+                self._set_current_row(-1)
                 return
 
             if source_group not in self.group_order or target_group not in self.group_order:
-                self.table.setCurrentCell(-1, -1)
+                self._set_current_row(-1)
                 return
 
             src_idx = self.group_order.index(source_group)
@@ -1516,7 +1637,7 @@ class PositionsTable(QWidget):
         if source_kind == "POSITION":
             symbol = self._row_symbol(source_row)
             if not symbol:
-                self.table.setCurrentCell(-1, -1)
+                self._set_current_row(-1)
                 return
 
             source_group = self._symbol_group(symbol)
@@ -1524,7 +1645,7 @@ class PositionsTable(QWidget):
             if target_kind == "GROUP":
                 target_group = self._row_group(target_row)
                 if not target_group:
-                    self.table.setCurrentCell(-1, -1)
+                    self._set_current_row(-1)
                     return
                 if source_group != target_group:
                     self._assign_symbol_to_group(symbol, target_group, append=True)
@@ -1536,14 +1657,14 @@ class PositionsTable(QWidget):
             elif target_kind == "POSITION":
                 target_symbol = self._row_symbol(target_row)
                 if not target_symbol or target_symbol == symbol:
-                    self.table.setCurrentCell(-1, -1)
+                    self._set_current_row(-1)
                     return
                 target_group = self._symbol_group(target_symbol)
 
                 if source_group == target_group:
                     order_list = self.group_members.get(source_group, []) if source_group else self.visual_order
                     if symbol not in order_list or target_symbol not in order_list:
-                        self.table.setCurrentCell(-1, -1)
+                        self._set_current_row(-1)
                         return
                     src_idx = order_list.index(symbol)
                     tgt_idx = order_list.index(target_symbol)
@@ -1575,7 +1696,7 @@ class PositionsTable(QWidget):
         self._rebuild_table_from_order()
         self._save_table_state()
 
-        self.table.setCurrentCell(-1, -1)  # 🔥 Clear selection after successful drop
+        self._set_current_row(-1)  # 🔥 Clear selection after successful drop
 
     def save_state(self):
         self._save_column_widths()
@@ -1588,7 +1709,7 @@ class PositionsTable(QWidget):
     def _apply_styles(self):
         self.table.verticalHeader().hide()
         self.table.setShowGrid(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setFocusPolicy(Qt.StrongFocus)
         self.table.setTabKeyNavigation(False)
         self.table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
@@ -1599,7 +1720,7 @@ class PositionsTable(QWidget):
         # IMPORTANT: enable row selection (used for hover)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.setCurrentCell(-1, -1)
+        self._set_current_row(-1)
 
         header = self.table.horizontalHeader()
         header.setFixedHeight(30)
@@ -1619,7 +1740,7 @@ class PositionsTable(QWidget):
             header.setSectionResizeMode(col, QHeaderView.ResizeToContents)
 
         self.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #0D1117;
                 color: #C9D1D9;
                 border: 1px solid #21262D;
@@ -1702,58 +1823,58 @@ class PositionsTable(QWidget):
             }
 
             /* 🔥 REMOVE focus & current-cell outlines completely */
-            QTableWidget::item {
+            QTableView::item {
                 outline: 0;
             }
 
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 outline: 0;
             }
 
-            QTableWidget::item:selected:!active {
+            QTableView::item:selected:!active {
                 outline: 0;
             }
 
             /* MAIN ROW SEPARATOR */
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px 8px;
                 border-bottom: 1px solid #21262D;
             }
 
             /* ROW HOVER (via selection) */
             /* ===== PREMIUM ROW HIGHLIGHT ===== */
-            QTableWidget::item:selected,
-            QTableWidget::item:selected:active,
-            QTableWidget::item:selected:!active {
+            QTableView::item:selected,
+            QTableView::item:selected:active,
+            QTableView::item:selected:!active {
                 background-color: #1F2937;
                 color: #F0F6FC;
                 border: none;
             }
 
             /* Subtle depth: top/bottom light */
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 border-top: 1px solid #30363D;
                 border-bottom: 1px solid #30363D;
             }
 
             /* Hovered row (current cell, not selected) */
-            QTableWidget::item:!selected:current {
+            QTableView::item:!selected:current {
                 background-color: #161B22;
             }
 
             /* REMOVE current-cell focus rectangle */
-            QTableWidget::item:selected:!active {
+            QTableView::item:selected:!active {
                 outline: 0;
             }
 
             /* Ensure spanned SL/TP rows also glow */
-            QTableWidget::item:selected,
-            QTableWidget::item:selected:active {
+            QTableView::item:selected,
+            QTableView::item:selected:active {
                 background-clip: padding;
             }
 
             /* REMOVE CELL HOVER COMPLETELY */
-            QTableWidget::item:hover {
+            QTableView::item:hover {
                 background-color: transparent;
             }
 
@@ -1,17 +1,20 @@
 import logging
+from bisect import bisect_left, bisect_right
 from typing import Dict, List, Optional, Union
 from datetime import date
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QMenu, QDialog, QFormLayout, QSpinBox, QCheckBox,
-    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QProgressBar, QStyle,
-    QSizePolicy
+    QTableView, QStyledItemDelegate, QHeaderView, QAbstractItemView, QProgressBar, QStyle
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QPoint
-from PySide6.QtGui import QColor, QFont, QPainter, QBrush, QLinearGradient
+from PySide6.QtCore import Qt, Signal, QTimer, QPoint, QRect, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor, QFont, QPainter, QBrush, QPen, QLinearGradient
 from kiteconnect import KiteConnect
 
+from core.cvd.history_loader import HistoryLoadSignals, HistoryLoadTask, history_thread_pool
+from core.market_data.strike_grid import StrikeGrid
+from core.market_data.strike_ladder import StrikeLadder
 from core.utils.data_models import Contract
 
 logger = logging.getLogger(__name__)
@@ -55,64 +58,317 @@ def format_oi_compact(oi: int) -> str:
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-#  Compact OI Cell  — single-row: [███░░░░] 12.4L
+#  Column layout (shared by model, delegate and widget)
 # ──────────────────────────────────────────────────────────────────────────────
-class OICell(QWidget):
+CE_BTN, CE_CHART, CE_BID, CE_ASK, CE_LTP, CE_OI, \
+    STRIKE, \
+PE_OI, PE_LTP, PE_BID, PE_ASK, PE_CHART, PE_BTN = range(13)
+
+HEADERS = ["CE", "↗", "BID", "ASK", "LTP", "OI", "STRIKE", "OI", "LTP", "BID", "ASK", "↗", "PE"]
+
+# column -> (option type, Contract attribute) for the quote columns
+_QUOTE_COLUMNS = {
+    CE_BID: ('CE', 'bid'), CE_ASK: ('CE', 'ask'), CE_LTP: ('CE', 'ltp'),
+    PE_LTP: ('PE', 'ltp'), PE_BID: ('PE', 'bid'), PE_ASK: ('PE', 'ask'),
+}
+_OPTION_TYPE = {CE_BTN: 'CE', CE_CHART: 'CE', CE_OI: 'CE', PE_OI: 'PE', PE_CHART: 'PE', PE_BTN: 'PE'}
+_OI_COLUMNS = (CE_OI, PE_OI)
+_BUTTON_COLUMNS = (CE_BTN, PE_BTN)
+_CHART_COLUMNS = (CE_CHART, PE_CHART)
+
+OI_RATIO_ROLE = Qt.UserRole + 1
+CONTRACT_ROLE = Qt.UserRole + 2
+
+
+def _font(point_size: int = 0, bold: bool = False, pixel_size: int = 0,
+          weight: QFont.Weight | None = None) -> QFont:
+    f = QFont()
+    if point_size:
+        f.setPointSize(point_size)
+    if pixel_size:
+        f.setPixelSize(pixel_size)
+    if bold:
+        f.setBold(True)
+    if weight is not None:
+        f.setWeight(weight)
+    return f
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+#  Model  — one row per strike, values read straight from the Contract objects
+# ──────────────────────────────────────────────────────────────────────────────
+class StrikeLadderModel(QAbstractTableModel):
     """
-    Ultra-compact OI display: coloured bar fills from the strike-side,
-    value label sits right-aligned on the opposite side.
-    Fits cleanly inside a 22 px row without any stacking.
+    Table model over ``contracts[strike][option_type]``.
+
+    Nothing is copied per cell: ``data`` formats from the live Contract, so a
+    tick only needs a ``dataChanged`` for the rows it touched.
     """
 
-    def __init__(self, is_call: bool, parent=None):
+    def __init__(self, contracts: Dict[float, Dict[str, Contract]], parent=None):
         super().__init__(parent)
-        self.is_call = is_call
-        self.ratio   = 0.0          # 0.0 – 1.0
-        self.text    = "—"
-        self.color   = CE_COLOR if is_call else PE_COLOR
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.setMinimumHeight(18)
-
-    def set_data(self, oi: int, max_oi: float):
-        self.ratio = min(oi / max_oi, 1.0) if max_oi > 0 and oi > 0 else 0.0
-        self.text  = format_oi_compact(oi)
-        self.update()
-
-    def paintEvent(self, _event):
-        p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing)
-
-        w, h = self.width(), self.height()
-        bar_h = 3
-        bar_y = h - bar_h - 1          # pin bar to bottom edge
-        bar_w = int(w * self.ratio)
+        self._contracts = contracts
+        self._strikes: List[float] = []
+        self._rows: Dict[float, int] = {}
+        self.atm_strike = 0.0
+        self.max_oi = 1.0
+
+        self._fg = {
+            'CE': QColor(CE_COLOR), 'PE': QColor(PE_COLOR),
+            'atm': QColor(ATM_COLOR), 'main': QColor(TEXT_MAIN),
+            'dim': QColor(DIM_COLOR), 'quote': QColor("#6B7687"),
+        }
+        self._atm_bg = QBrush(QColor(BG_ROW_ATM))
+        self._bold = _font(bold=True)
+        self._atm_font = _font(point_size=9, bold=True)
+        self._align_right = int(Qt.AlignRight | Qt.AlignVCenter)
+        self._align_center = int(Qt.AlignCenter)
+
+    # ── structure ─────────────────────────────────────────────────────────────
+    def set_strikes(self, strikes: List[float]):
+        self.beginResetModel()
+        self._strikes = list(strikes)
+        self._reindex()
+        self.endResetModel()
+
+    def shift_strikes(self, strikes: List[float]) -> bool:
+        """
+        Slide the window to ``strikes`` by removing and inserting rows only at
+        the edges, so rows that stay keep their views' state and scroll offset.
+
+        Returns False (nothing changed) when the new window does not overlap
+        the old one contiguously; the caller resets instead.
+        """
+        old = self._strikes
+        if not old or not strikes or strikes[-1] < old[0] or strikes[0] > old[-1]:
+            return False
+        keep_from = bisect_left(old, strikes[0])
+        keep_to = bisect_right(old, strikes[-1])
+        head = bisect_left(strikes, old[0])
+        tail = bisect_right(strikes, old[-1])
+        if old[keep_from:keep_to] != strikes[head:tail]:
+            return False
+
+        if keep_to < len(old):
+            self.beginRemoveRows(QModelIndex(), keep_to, len(old) - 1)
+            del self._strikes[keep_to:]
+            self._reindex()
+            self.endRemoveRows()
+        if keep_from:
+            self.beginRemoveRows(QModelIndex(), 0, keep_from - 1)
+            del self._strikes[:keep_from]
+            self._reindex()
+            self.endRemoveRows()
+        if head:
+            self.beginInsertRows(QModelIndex(), 0, head - 1)
+            self._strikes[:0] = strikes[:head]
+            self._reindex()
+            self.endInsertRows()
+        if tail < len(strikes):
+            n = len(self._strikes)
+            self.beginInsertRows(QModelIndex(), n, n + len(strikes) - tail - 1)
+            self._strikes.extend(strikes[tail:])
+            self._reindex()
+            self.endInsertRows()
+        return True
+
+    def _reindex(self):
+        self._rows = {s: i for i, s in enumerate(self._strikes)}
+
+    def strike_at(self, row: int) -> Optional[float]:
+        return self._strikes[row] if 0 <= row < len(self._strikes) else None
+
+    def row_for_strike(self, strike: float) -> Optional[int]:
+        return self._rows.get(strike)
+
+    def contract(self, row: int, option_type: str) -> Optional[Contract]:
+        strike = self.strike_at(row)
+        if strike is None:
+            return None
+        return self._contracts.get(strike, {}).get(option_type)
+
+    # ── targeted refresh ──────────────────────────────────────────────────────
+    def set_atm_strike(self, strike: float):
+        old_row = self.row_for_strike(self.atm_strike)
+        self.atm_strike = strike
+        self.refresh_rows({r for r in (old_row, self.row_for_strike(strike)) if r is not None},
+                          first_col=0, last_col=len(HEADERS) - 1)
+
+    def set_max_oi(self, max_oi: float) -> bool:
+        """Returns True when the scale changed (every OI bar was repainted)."""
+        if max_oi == self.max_oi:
+            return False
+        self.max_oi = max_oi
+        if self._strikes:
+            last = len(self._strikes) - 1
+            for col in _OI_COLUMNS:
+                self.dataChanged.emit(self.index(0, col), self.index(last, col), [OI_RATIO_ROLE])
+        return True
+
+    def refresh_rows(self, rows, first_col: int = CE_BID, last_col: int = PE_ASK):
+        """Emit one ``dataChanged`` per contiguous run of ``rows``."""
+        if not rows:
+            return
+        ordered = sorted(rows)
+        start = prev = ordered[0]
+        for row in ordered[1:] + [None]:
+            if row is not None and row == prev + 1:
+                prev = row
+                continue
+            self.dataChanged.emit(self.index(start, first_col), self.index(prev, last_col))
+            if row is not None:
+                start = prev = row
+
+    # ── QAbstractTableModel ───────────────────────────────────────────────────
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._strikes)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return HEADERS[section]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled if index.isValid() else Qt.NoItemFlags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        strike = self._strikes[row]
+        is_atm = abs(strike - self.atm_strike) < 0.001
+
+        if role == Qt.BackgroundRole:
+            return self._atm_bg if is_atm else None
+
+        if col == STRIKE:
+            if role == Qt.DisplayRole:
+                return f"{strike:.0f}"
+            if role == Qt.ForegroundRole:
+                return self._fg['atm'] if is_atm else self._fg['main']
+            if role == Qt.FontRole:
+                return self._atm_font if is_atm else None
+            if role == Qt.TextAlignmentRole:
+                return self._align_center
+            return None
+
+        quote = _QUOTE_COLUMNS.get(col)
+        if quote is not None:
+            ot, field = quote
+            c = self._contracts.get(strike, {}).get(ot)
+            val = getattr(c, field, 0) if c else 0
+            has_val = bool(val) and val > 0
+            if role == Qt.DisplayRole:
+                if not has_val:
+                    return "—"
+                return f"{val:.2f}" if field == 'ltp' else f"{val:.1f}"   # 1 decimal → saves width
+            if role == Qt.TextAlignmentRole:
+                return self._align_right
+            if field != 'ltp':
+                return self._fg['quote'] if role == Qt.ForegroundRole else None
+            if role == Qt.ForegroundRole:
+                return self._fg[ot] if has_val else self._fg['dim']
+            if role == Qt.FontRole:
+                return self._bold if has_val else None
+            return None
+
+        ot = _OPTION_TYPE[col]
+        c = self._contracts.get(strike, {}).get(ot)
+        if role == CONTRACT_ROLE:
+            return c
+        if col in _OI_COLUMNS:
+            oi = c.oi if c else 0
+            if role == Qt.DisplayRole:
+                return format_oi_compact(oi)
+            if role == OI_RATIO_ROLE:
+                return min(oi / self.max_oi, 1.0) if self.max_oi > 0 and oi > 0 else 0.0
+        return None
 
-        # ── background bar track ──────────────────────────────────────────
-        p.setPen(Qt.NoPen)
-        p.setBrush(QBrush(QColor("#1E2638")))
-        p.drawRoundedRect(0, bar_y, w, bar_h, 1.5, 1.5)
 
-        # ── filled portion (fills from outer edge toward centre) ──────────
+# ──────────────────────────────────────────────────────────────────────────────
+#  Delegate  — paints OI bars and the CE/PE/chart buttons without child widgets
+# ──────────────────────────────────────────────────────────────────────────────
+class StrikeLadderDelegate(QStyledItemDelegate):
+    """
+    OI cell: [███░░░░] 12.4L — bar pinned to the bottom edge, filling from
+    the strike side; buttons are drawn as outlined pills and handled by the
+    view's ``clicked`` signal.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._track = QBrush(QColor("#1E2638"))
+        self._fill = {CE_OI: QBrush(QColor(CE_COLOR)), PE_OI: QBrush(QColor(PE_COLOR))}
+        self._text = QColor(TEXT_MAIN)
+        self._oi_font = _font(point_size=8, weight=QFont.Medium)
+        self._btn_font = _font(pixel_size=7, weight=QFont.ExtraBold)
+        self._chart_font = _font(pixel_size=5)
+        self._btn_pen = {
+            CE_BTN: (QColor(CE_COLOR), QPen(QColor(f"{CE_COLOR}55"))),
+            PE_BTN: (QColor(PE_COLOR), QPen(QColor(f"{PE_COLOR}55"))),
+        }
+        self._chart_color = QColor("#3A4458")
+
+    def paint(self, painter: QPainter, option, index):
+        col = index.column()
+        if col not in _OI_COLUMNS and col not in _BUTTON_COLUMNS and col not in _CHART_COLUMNS:
+            super().paint(painter, option, index)
+            return
+
+        painter.save()
+        background = index.data(Qt.BackgroundRole)
+        if background is not None:
+            painter.fillRect(option.rect, background)
+        if col in _OI_COLUMNS:
+            self._paint_oi(painter, option.rect, col, index)
+        elif index.data(CONTRACT_ROLE) is not None:
+            if col in _BUTTON_COLUMNS:
+                self._paint_button(painter, option.rect, col)
+            else:
+                painter.setPen(self._chart_color)
+                painter.setFont(self._chart_font)
+                painter.drawText(option.rect, Qt.AlignCenter, "▲")
+        painter.restore()
+
+    def _paint_oi(self, painter: QPainter, rect: QRect, col: int, index):
+        painter.setRenderHint(QPainter.Antialiasing)
+        x, w, h = rect.x(), rect.width(), rect.height()
+        bar_h = 3
+        bar_y = rect.y() + h - bar_h - 1          # pin bar to bottom edge
+        bar_w = int(w * (index.data(OI_RATIO_ROLE) or 0.0))
+
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._track)
+        painter.drawRoundedRect(x, bar_y, w, bar_h, 1.5, 1.5)
         if bar_w > 0:
-            p.setBrush(QBrush(QColor(self.color)))
-            if self.is_call:
+            painter.setBrush(self._fill[col])
+            if col == CE_OI:
                 # CE bar grows right-to-left (from strike outward)
-                p.drawRoundedRect(w - bar_w, bar_y, bar_w, bar_h, 1.5, 1.5)
+                painter.drawRoundedRect(x + w - bar_w, bar_y, bar_w, bar_h, 1.5, 1.5)
             else:
                 # PE bar grows left-to-right
-                p.drawRoundedRect(0, bar_y, bar_w, bar_h, 1.5, 1.5)
-
-        # ── value label ───────────────────────────────────────────────────
-        p.setPen(QColor(TEXT_MAIN))
-        f = p.font()
-        f.setPointSize(8)
-        f.setWeight(QFont.Medium)
-        p.setFont(f)
-
-        label_rect = self.rect().adjusted(2, 0, -2, -(bar_h + 2))
-        align = Qt.AlignRight | Qt.AlignVCenter if self.is_call else Qt.AlignLeft | Qt.AlignVCenter
-        p.drawText(label_rect, align, self.text)
-        p.end()
+                painter.drawRoundedRect(x, bar_y, bar_w, bar_h, 1.5, 1.5)
+
+        painter.setPen(self._text)
+        painter.setFont(self._oi_font)
+        label_rect = rect.adjusted(2, 0, -2, -(bar_h + 2))
+        align = Qt.AlignRight | Qt.AlignVCenter if col == CE_OI else Qt.AlignLeft | Qt.AlignVCenter
+        painter.drawText(label_rect, align, index.data(Qt.DisplayRole) or "—")
+
+    def _paint_button(self, painter: QPainter, rect: QRect, col: int):
+        color, border = self._btn_pen[col]
+        pill = QRect(0, 0, 20, 16)
+        pill.moveCenter(rect.center())
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(border)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRoundedRect(pill, 2, 2)
+        painter.setPen(color)
+        painter.setFont(self._btn_font)
+        painter.drawText(pill, Qt.AlignCenter, _OPTION_TYPE[col])
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -155,21 +411,27 @@ class StrikeLadderWidget(QWidget):
         self.num_strikes_above, self.num_strikes_below = 15, 15
         self.atm_strike = 0.0
         self.contracts: Dict[float, Dict[str, Contract]] = {}
-        self.instrument_data, self.available_strikes = {}, []
-        self._instrument_index:   Dict[tuple, dict]    = {}
+        self.instrument_data = {}
+        self._strike_grids        = StrikeLadder()
         self._token_contract_map: Dict[int, Contract]  = {}
-        self._strike_row_map:     Dict[float, int]     = {}
-        self._row_strike_map:     Dict[int, float]     = {}
+        self.model                = StrikeLadderModel(self.contracts, self)
         self.auto_adjust_enabled  = True
-        self._max_oi              = 1.0
 
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self._check_price_movement)
-        self.update_timer.start(5000)
         self._last_centered_atm: Optional[float] = None
         self._user_scrolling  = False
-        self._last_atm_strike: Optional[float] = None
         self._index_ltp       = None
+        # Underlying tick that drives ATM tracking (spot index, or nearest
+        # future with its basis over spot removed).
+        self._tracking_token: Optional[int]   = None
+        self._tracking_is_future              = False
+        self._tracking_basis: Optional[float] = None
+
+        # Opening quotes for a rebuilt window load on the shared pool; only
+        # the latest request is applied.
+        self._quote_signals = HistoryLoadSignals(self)
+        self._quote_signals.loaded.connect(self._on_quotes_loaded)
+        self._quote_signals.failed.connect(self._on_quotes_failed)
+        self._quote_request_id = 0
 
         self._visible_tokens_timer = QTimer(self)
         self._visible_tokens_timer.setSingleShot(True)
@@ -188,10 +450,9 @@ class StrikeLadderWidget(QWidget):
         main.setContentsMargins(0, 0, 0, 0)
         main.setSpacing(0)
 
-        self.table = QTableWidget()
-        headers = ["CE", "↗", "BID", "ASK", "LTP", "OI", "STRIKE", "OI", "LTP", "BID", "ASK", "↗", "PE"]
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(StrikeLadderDelegate(self.table))
         self.table.setMouseTracking(False)
         self.table.viewport().setMouseTracking(False)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -211,12 +472,15 @@ class StrikeLadderWidget(QWidget):
     #  Styles
     # ──────────────────────────────────────────────────────────────────────────
     def _apply_styles(self):
-        self.table.verticalHeader().hide()
+        v = self.table.verticalHeader()
+        v.hide()
+        v.setSectionResizeMode(QHeaderView.Fixed)
+        v.setDefaultSectionSize(self.ROW_H)
         self.table.setShowGrid(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setSelectionMode(QAbstractItemView.NoSelection)
         self.table.setFocusPolicy(Qt.NoFocus)
-        self.table.setCurrentCell(-1, -1)
+        self.table.setCurrentIndex(QModelIndex())
         self.table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
         h = self.table.horizontalHeader()
@@ -240,7 +504,7 @@ class StrikeLadderWidget(QWidget):
             h.setSectionResizeMode(col, QHeaderView.Stretch)
 
         self.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {BG_MAIN};
                 color: {TEXT_MAIN};
                 border: 1px solid #1C2333;
@@ -257,13 +521,13 @@ class StrikeLadderWidget(QWidget):
                 font-size: 10px;
                 letter-spacing: 0.3px;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 0px 3px;
                 border-bottom: 1px solid #161A26;
                 outline: 0;
             }}
-            QTableWidget::item:hover      {{ background: transparent; }}
-            QTableWidget::item:selected   {{ background: transparent; }}
+            QTableView::item:hover      {{ background: transparent; }}
+            QTableView::item:selected   {{ background: transparent; }}
             QScrollBar:vertical {{
                 background: transparent;
                 width: 0px;
@@ -319,15 +583,28 @@ class StrikeLadderWidget(QWidget):
     # ──────────────────────────────────────────────────────────────────────────
     def _connect_signals(self):
         self.table.customContextMenuRequested.connect(self._show_menu)
+        self.table.clicked.connect(self._on_cell_clicked)
+
+    def _on_cell_clicked(self, index):
+        col = index.column()
+        if col not in _BUTTON_COLUMNS and col not in _CHART_COLUMNS:
+            return
+        contract = self.model.contract(index.row(), _OPTION_TYPE[col])
+        if contract is None:
+            return
+        if col in _BUTTON_COLUMNS:
+            self.strike_selected.emit(contract)
+        else:
+            self.chart_requested.emit(contract)
 
     # ──────────────────────────────────────────────────────────────────────────
     #  Context menu
     # ──────────────────────────────────────────────────────────────────────────
     def _show_menu(self, pos: QPoint):
-        item = self.table.itemAt(pos)
-        if not item:
+        index = self.table.indexAt(pos)
+        if not index.isValid():
             return
-        strike = self._get_strike_from_row(item.row())
+        strike = self._get_strike_from_row(index.row())
         if not strike:
             return
         menu = QMenu(self)
@@ -354,8 +631,8 @@ class StrikeLadderWidget(QWidget):
 
         f = QFormLayout()
         f.setSpacing(8)
-        above = QSpinBox(); above.setRange(5, 30); above.setValue(self.num_strikes_above)
-        below = QSpinBox(); below.setRange(5, 30); below.setValue(self.num_strikes_below)
+        above = QSpinBox(); above.setRange(5, 100); above.setValue(self.num_strikes_above)
+        below = QSpinBox(); below.setRange(5, 100); below.setValue(self.num_strikes_below)
         auto_check = QCheckBox(); auto_check.setChecked(self.auto_adjust_enabled)
         f.addRow("Strikes Above:", above)
         f.addRow("Strikes Below:", below)
@@ -383,198 +660,22 @@ class StrikeLadderWidget(QWidget):
     #  Table build / update
     # ──────────────────────────────────────────────────────────────────────────
     def _rebuild_table(self):
-        self.table.setRowCount(0)
-        self._strike_row_map.clear()
-        self._row_strike_map.clear()
         all_oi = [c.oi for sc in self.contracts.values() for c in sc.values() if c and c.oi > 0]
-        self._max_oi = max(all_oi) if all_oi else 1.0
-
-        for strike in sorted(self.contracts.keys()):
-            self._add_row(strike)
+        self.model.max_oi = max(all_oi) if all_oi else 1.0
+        self.model.atm_strike = self.atm_strike
+        self.model.set_strikes(sorted(self.contracts.keys()))
 
         QTimer.singleShot(120, self._force_center_atm)
         QTimer.singleShot(0,   self._apply_weighted_column_widths)
         self._schedule_visible_tokens_emit()
 
-    def _add_row(self, strike: float):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setRowHeight(row, self.ROW_H)
-        self._strike_row_map[strike] = row
-        self._row_strike_map[row]    = strike
-
-        ce    = self.contracts.get(strike, {}).get('CE')
-        pe    = self.contracts.get(strike, {}).get('PE')
-        is_atm = abs(strike - self.atm_strike) < 0.001
-
-        # ATM row background highlight
-        if is_atm:
-            for col in range(self.table.columnCount()):
-                bg = QTableWidgetItem()
-                bg.setBackground(QColor(BG_ROW_ATM))
-                self.table.setItem(row, col, bg)
-
-        self.table.setCellWidget(row, self.CE_BTN,   self._make_btn(ce,  'CE'))
-        self.table.setCellWidget(row, self.CE_CHART,  self._make_chart_btn(ce))
-        self.table.setItem(      row, self.CE_BID,    self._make_bid_ask(ce, 'bid'))
-        self.table.setItem(      row, self.CE_ASK,    self._make_bid_ask(ce, 'ask'))
-        self.table.setItem(      row, self.CE_LTP,    self._make_ltp(ce,  True))
-        self.table.setCellWidget(row, self.CE_OI,     self._make_oi(ce,   True))
-        self.table.setItem(      row, self.STRIKE,    self._make_strike(strike, is_atm))
-        self.table.setCellWidget(row, self.PE_OI,     self._make_oi(pe,   False))
-        self.table.setItem(      row, self.PE_LTP,    self._make_ltp(pe,  False))
-        self.table.setItem(      row, self.PE_BID,    self._make_bid_ask(pe, 'bid'))
-        self.table.setItem(      row, self.PE_ASK,    self._make_bid_ask(pe, 'ask'))
-        self.table.setCellWidget(row, self.PE_CHART,  self._make_chart_btn(pe))
-        self.table.setCellWidget(row, self.PE_BTN,    self._make_btn(pe,  'PE'))
-
-    # ──────────────────────────────────────────────────────────────────────────
-    #  Cell factories
-    # ──────────────────────────────────────────────────────────────────────────
-    def _make_btn(self, c: Optional[Contract], ot: str) -> QPushButton:
-        """
-        CE button → cyan (#00C4C6)
-        PE button → red  (#E0424A)
-        """
-        b = QPushButton()
-        b.setFixedSize(20, 16)
-        if not c:
-            b.setEnabled(False)
-            b.setStyleSheet("background: transparent; border: none;")
-            return b
-
-        col = CE_COLOR if ot == 'CE' else PE_COLOR
-        border_col = f"{col}55"
-        b.setObjectName("strikeActionButton")
-        b.setText(ot)
-        b.setCursor(Qt.PointingHandCursor)
-        b.clicked.connect(lambda: self.strike_selected.emit(c))
-        b.setStyleSheet(f"""
-            QPushButton#strikeActionButton {{
-                background: transparent;
-                color: {col};
-                border: 1px solid {border_col};
-                border-radius: 2px;
-                font-size: 7px;
-                font-weight: 800;
-                padding: 0px;
-                min-width: 0px; max-width: 20px;
-                min-height: 0px; max-height: 16px;
-                letter-spacing: 0.2px;
-            }}
-            QPushButton#strikeActionButton:hover {{
-                background: {col};
-                color: #0C0F17;
-                border-color: {col};
-            }}
-        """)
-        return b
-
-    def _make_chart_btn(self, c: Optional[Contract]) -> QPushButton:
-        b = QPushButton()
-        b.setFixedSize(8, 16)
-        if not c:
-            b.setEnabled(False)
-            b.setStyleSheet("background: transparent; border: none;")
-            return b
-        b.setObjectName("chartBtn")
-        b.setText("▲")
-        b.setCursor(Qt.PointingHandCursor)
-        b.clicked.connect(lambda: self.chart_requested.emit(c))
-        b.setStyleSheet("""
-            QPushButton#chartBtn {
-                background: transparent;
-                color: #3A4458;
-                border: none;
-                font-size: 5px;
-                padding: 0px;
-                min-width: 0px; max-width: 8px;
-            }
-            QPushButton#chartBtn:hover {
-                color: #5B9BD5;
-            }
-        """)
-        return b
-
-    def _make_strike(self, s: float, atm: bool) -> QTableWidgetItem:
-        i = QTableWidgetItem(f"{s:.0f}")
-        i.setTextAlignment(Qt.AlignCenter)
-        if atm:
-            i.setForeground(QColor(ATM_COLOR))
-            f = QFont()
-            f.setBold(True)
-            f.setPointSize(9)
-            i.setFont(f)
-        else:
-            i.setForeground(QColor(TEXT_MAIN))
-        return i
-
-    def _make_ltp(self, c: Optional[Contract], is_call: bool) -> QTableWidgetItem:
-        txt = f"{c.ltp:.2f}" if c and c.ltp else "—"
-        i   = QTableWidgetItem(txt)
-        i.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        if c and c.ltp:
-            i.setForeground(QColor(CE_COLOR if is_call else PE_COLOR))
-            f = QFont(); f.setBold(True)
-            i.setFont(f)
-        else:
-            i.setForeground(QColor(DIM_COLOR))
-        return i
-
-    def _make_bid_ask(self, c: Optional[Contract], field: str) -> QTableWidgetItem:
-        val = getattr(c, field, 0) if c else 0
-        txt = f"{val:.1f}" if val and val > 0 else "—"   # 1 decimal → saves width
-        i   = QTableWidgetItem(txt)
-        i.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        i.setForeground(QColor("#6B7687"))
-        return i
-
-    def _make_oi(self, c: Optional[Contract], is_call: bool) -> OICell:
-        """Return a compact OICell widget."""
-        cell = OICell(is_call)
-        val  = c.oi if c else 0
-        cell.set_data(val, self._max_oi)
-        return cell
-
     # ──────────────────────────────────────────────────────────────────────────
     #  Live update helpers
     # ──────────────────────────────────────────────────────────────────────────
-    def _update_table(self, rows: Optional[set] = None, refresh_oi: bool = True):
-        target = rows if rows is not None else set(range(self.table.rowCount()))
-        for row in target:
-            strike = self._get_strike_from_row(row)
-            if strike is None:
-                continue
-            ce = self.contracts.get(strike, {}).get('CE')
-            pe = self.contracts.get(strike, {}).get('PE')
-
-            self._set_price_item_text(row, self.CE_LTP, ce.ltp if ce else 0)
-            self._set_price_item_text(row, self.CE_BID, ce.bid if ce else 0)
-            self._set_price_item_text(row, self.CE_ASK, ce.ask if ce else 0)
-            self._set_price_item_text(row, self.PE_LTP, pe.ltp if pe else 0)
-            self._set_price_item_text(row, self.PE_BID, pe.bid if pe else 0)
-            self._set_price_item_text(row, self.PE_ASK, pe.ask if pe else 0)
-
-            if refresh_oi:
-                self._update_oi_widget(row, self.CE_OI, ce)
-                self._update_oi_widget(row, self.PE_OI, pe)
-
-    def _set_price_item_text(self, row: int, col: int, val: float):
-        item = self.table.item(row, col)
-        if not item:
-            return
-        # BID/ASK use 1 decimal, LTP uses 2
-        if col in (self.CE_BID, self.CE_ASK, self.PE_BID, self.PE_ASK):
-            new_text = f"{val:.1f}" if val and val > 0 else "—"
-        else:
-            new_text = f"{val:.2f}" if val and val > 0 else "—"
-        if item.text() != new_text:
-            item.setText(new_text)
-
-    def _update_oi_widget(self, row: int, col: int, c: Optional[Contract]):
-        w = self.table.cellWidget(row, col)
-        if isinstance(w, OICell):
-            w.set_data(c.oi if c else 0, self._max_oi)
+    def _update_table(self, rows: Optional[set] = None):
+        """Repaint the quote and OI cells of ``rows`` (all rows when None)."""
+        target = rows if rows is not None else range(self.model.rowCount())
+        self.model.refresh_rows(target)
 
     # ──────────────────────────────────────────────────────────────────────────
     #  Navigation
@@ -582,25 +683,15 @@ class StrikeLadderWidget(QWidget):
     def _jump_to_atm(self):
         if self._user_scrolling:
             return
-        for row in range(self.table.rowCount()):
-            s = self._get_strike_from_row(row)
-            if s and abs(s - self.atm_strike) < 0.001:
-                self.table.scrollToItem(
-                    self.table.item(row, self.STRIKE),
-                    QTableWidget.PositionAtCenter
-                )
-                QTimer.singleShot(300, self._reset_user_scroll)
-                return
+        row = self.model.row_for_strike(self.atm_strike)
+        if row is not None:
+            self.table.scrollTo(self.model.index(row, self.STRIKE), QAbstractItemView.PositionAtCenter)
+            QTimer.singleShot(300, self._reset_user_scroll)
 
     def _jump_to_strike(self, target: float):
-        for row in range(self.table.rowCount()):
-            s = self._get_strike_from_row(row)
-            if s and abs(s - target) < 0.001:
-                self.table.scrollToItem(
-                    self.table.item(row, self.STRIKE),
-                    QTableWidget.PositionAtCenter
-                )
-                return
+        row = self.model.row_for_strike(target)
+        if row is not None:
+            self.table.scrollTo(self.model.index(row, self.STRIKE), QAbstractItemView.PositionAtCenter)
 
     def _force_center_atm(self):
         self._user_scrolling   = False
@@ -609,16 +700,7 @@ class StrikeLadderWidget(QWidget):
         self._schedule_visible_tokens_emit()
 
     def _get_strike_from_row(self, row: int) -> Optional[float]:
-        strike = self._row_strike_map.get(row)
-        if strike is not None:
-            return strike
-        i = self.table.item(row, self.STRIKE)
-        if i:
-            try:
-                return float(i.text())
-            except Exception:
-                pass
-        return None
+        return self.model.strike_at(row)
 
     def _trade_both(self, strike: float):
         ce = self.contracts.get(strike, {}).get('CE')
@@ -630,43 +712,21 @@ class StrikeLadderWidget(QWidget):
     #  Price-movement & auto-adjust
     # ──────────────────────────────────────────────────────────────────────────
     def _check_price_movement(self):
+        """Recentre on the latest websocket underlying price once its ATM strike moves."""
         if not self.auto_adjust_enabled or not self.current_price or not self.symbol:
             return
-        try:
-            INDEX_EXCHANGE_MAP = {
-                "NIFTY":      ("NSE", "NIFTY 50"),
-                "BANKNIFTY":  ("NSE", "NIFTY BANK"),
-                "FINNIFTY":   ("NSE", "NIFTY FIN SERVICE"),
-                "MIDCPNIFTY": ("NSE", "NIFTY MID SELECT"),
-                "SENSEX":     ("BSE", "SENSEX"),
-                "BANKEX":     ("BSE", "BANKEX"),
-            }
-            exchange, name = INDEX_EXCHANGE_MAP.get(self.symbol, ("NSE", self.symbol))
-            sym        = f"{exchange}:{name}"
-            quote_data = self.kite.quote([sym])
-            underlying = quote_data.get(sym, {})
-            if not underlying:
-                return
-            new_price = underlying.get('last_price', 0.0)
-            if not new_price:
-                return
-            self._index_ltp = new_price
-            new_atm = self._calculate_atm_strike(new_price)
-            if self._user_scrolling:
-                return
-            if self._last_atm_strike is None:
-                self._last_atm_strike = new_atm
-                return
-            if new_atm == self._last_atm_strike:
-                return
-            self._last_atm_strike = new_atm
-            self.update_strikes(self.symbol, new_price, self.expiry, self.user_strike_interval)
-        except Exception as e:
-            logger.debug(f"Price check failed: {e}")
+        if not self._index_ltp or self._user_scrolling:
+            return
+        new_atm = self._calculate_atm_strike(self._index_ltp)
+        if new_atm == self.atm_strike:
+            return
+        if self._shift_to_atm(self._index_ltp, new_atm):
+            return
+        self._build_window(self.symbol, self._index_ltp, self.expiry, self.user_strike_interval)
 
     def _refresh_ladder(self):
         if self.symbol and self.expiry and self.current_price:
-            self.update_strikes(self.symbol, self.current_price, self.expiry, self.user_strike_interval)
+            self._build_window(self.symbol, self.current_price, self.expiry, self.user_strike_interval)
 
     # ──────────────────────────────────────────────────────────────────────────
     #  Visible-token helpers (for WebSocket subscription management)
@@ -684,7 +744,7 @@ class StrikeLadderWidget(QWidget):
         if table is None:
             return set()
         try:
-            if table.rowCount() == 0:
+            if self.model.rowCount() == 0:
                 return set()
             viewport  = table.viewport()
             top_row   = table.rowAt(0)
@@ -693,7 +753,7 @@ class StrikeLadderWidget(QWidget):
             return set()
         if top_row    < 0: top_row    = 0
         if bottom_row < 0:
-            try:    bottom_row = table.rowCount() - 1
+            try:    bottom_row = self.model.rowCount() - 1
             except RuntimeError: return set()
         tokens: set = set()
         for row in range(top_row, bottom_row + 1):
@@ -718,45 +778,46 @@ class StrikeLadderWidget(QWidget):
     # ──────────────────────────────────────────────────────────────────────────
     #  Public API
     # ──────────────────────────────────────────────────────────────────────────
-    def set_instrument_data(self, data: dict):
+    def set_instrument_data(self, data: dict, strike_grids: Optional[StrikeLadder] = None):
+        """``strike_grids`` lets the ladder share the loader's prebuilt grids."""
         self.instrument_data = data
-        self._build_instrument_index()
-
-    def _build_instrument_index(self):
-        index = {}
-        for symbol, symbol_data in self.instrument_data.items():
-            for inst in symbol_data.get('instruments', []):
-                try:
-                    strike = float(inst.get('strike', 0.0))
-                except (TypeError, ValueError):
-                    continue
-                key = (symbol, inst.get('expiry'), strike, inst.get('instrument_type'))
-                index[key] = inst
-        self._instrument_index = index
+        if strike_grids is None:
+            strike_grids = StrikeLadder()
+            strike_grids.build(data)
+        self._strike_grids = strike_grids
+
+    def _active_grid(self) -> Optional[StrikeGrid]:
+        """Grid for the selected expiry, or across expiries before one is chosen."""
+        if self.expiry is not None:
+            grid = self._strike_grids.grid(self.symbol, self.expiry)
+            if grid is not None and len(grid):
+                return grid
+        return self._strike_grids.grid(self.symbol)
 
     def calculate_strike_interval(self, symbol: str) -> float:
-        if symbol not in self.instrument_data:
-            return 50.0
-        strikes = sorted(set(float(i['strike'])
-                              for i in self.instrument_data[symbol]['instruments']))
-        self.available_strikes = strikes
-        if len(strikes) < 2:
+        grid = self._strike_grids.grid(symbol)
+        if grid is None or len(grid) < 2:
             return 50.0
-        intervals = [s2 - s1 for s1, s2 in zip(strikes, strikes[1:])]
-        self.base_strike_interval = min(intervals) if intervals else 50.0
+        self.base_strike_interval = grid.interval or 50.0
         if self.user_strike_interval <= 0:
             self.user_strike_interval = self.base_strike_interval
         return self.base_strike_interval
 
     def _calculate_atm_strike(self, price: float) -> float:
-        if not self.available_strikes:
+        grid = self._active_grid()
+        if grid is None or not len(grid):
             return round(price / self.base_strike_interval) * self.base_strike_interval
-        return min(self.available_strikes, key=lambda x: abs(x - price))
+        return grid.atm_strike(price)
 
     def update_strikes(self, symbol: str, current_price: float,
                        expiry: date, strike_interval: float):
+        """Rebuild around a fresh spot price; a futures basis is re-measured against it."""
+        self._tracking_basis = None
+        self._build_window(symbol, current_price, expiry, strike_interval)
+
+    def _build_window(self, symbol: str, current_price: float,
+                      expiry: date, strike_interval: float):
         self._last_centered_atm = None
-        self._last_atm_strike   = None
         self.symbol, self.expiry, self.current_price = symbol, expiry, current_price
         self.user_strike_interval = strike_interval
         self.atm_strike = self._calculate_atm_strike(current_price)
@@ -765,72 +826,127 @@ class StrikeLadderWidget(QWidget):
         self._fetch_and_build(symbol, expiry, self._gen_strikes())
 
     def _gen_strikes(self) -> List[float]:
-        if not self.available_strikes:
+        grid = self._active_grid()
+        if grid is None:
             return []
-        try:
-            idx = self.available_strikes.index(self.atm_strike)
-        except ValueError:
+        idx = grid.index_of(self.atm_strike)
+        if idx < 0:
             return []
-        start = max(0, idx - self.num_strikes_below)
-        end   = min(len(self.available_strikes), idx + self.num_strikes_above + 1)
-        return self.available_strikes[start:end]
+        window = grid.window(idx, self.num_strikes_below, self.num_strikes_above)
+        return grid.strikes[window].tolist()
 
     def _fetch_and_build(self, symbol: str, expiry: date, strikes: List[float]):
         to_fetch: List[str] = []
-        tradingsymbol_contract_map: Dict[str, Contract] = {}
-
         for strike in strikes:
-            for ot in ['CE', 'PE']:
-                inst = self._instrument_index.get((symbol, expiry, strike, ot))
-                if not inst:
-                    continue
-                c = Contract(
-                    symbol=symbol,
-                    tradingsymbol=inst['tradingsymbol'],
-                    instrument_token=inst['instrument_token'],
-                    lot_size=inst.get('lot_size', 1),
-                    strike=strike,
-                    option_type=ot,
-                    expiry=expiry,
-                )
-                if strike not in self.contracts:
-                    self.contracts[strike] = {}
-                self.contracts[strike][ot] = c
-                self._token_contract_map[c.instrument_token] = c
-                tradingsymbol_contract_map[c.tradingsymbol]  = c
-                to_fetch.append(f"NFO:{inst['tradingsymbol']}")
+            for c in self._add_strike_contracts(symbol, expiry, strike):
+                to_fetch.append(f"NFO:{c.tradingsymbol}")
 
         if not to_fetch:
             return
-        try:
-            quotes = self.kite.quote(to_fetch)
-            for k, q in quotes.items():
-                ts = k.split(':')[-1]
-                c  = tradingsymbol_contract_map.get(ts)
-                if not c:
-                    continue
-                c.ltp, c.oi = q.get('last_price', 0.0), q.get('oi', 0)
-                depth = q.get('depth', {})
-                if depth and depth.get('buy'):
-                    c.bid = depth['buy'][0]['price']
-                if depth and depth.get('sell'):
-                    c.ask = depth['sell'][0]['price']
-            self._rebuild_table()
-        except Exception as e:
-            logger.error(f"Fetch failed: {e}")
+        # Rows go up at once; their opening quotes fill in when the pool
+        # returns them, and ticks keep them current after that.
+        self._rebuild_table()
+        if self.kite is None:
+            return
+        self._quote_request_id += 1
+        history_thread_pool().start(HistoryLoadTask(
+            self._quote_request_id, self._quote_signals, self.kite.quote, to_fetch,
+        ))
+
+    def _on_quotes_loaded(self, request_id: int, quotes):
+        if request_id != self._quote_request_id or not quotes:
+            return  # superseded by a newer rebuild
+        by_symbol = {c.tradingsymbol: c for sc in self.contracts.values() for c in sc.values() if c}
+        for k, q in quotes.items():
+            c = by_symbol.get(k.split(':')[-1])
+            if not c:
+                continue
+            c.ltp, c.oi = q.get('last_price', 0.0), q.get('oi', 0)
+            depth = q.get('depth', {})
+            if depth and depth.get('buy'):
+                c.bid = depth['buy'][0]['price']
+            if depth and depth.get('sell'):
+                c.ask = depth['sell'][0]['price']
+        all_oi = [c.oi for c in by_symbol.values() if c.oi > 0]
+        self.model.set_max_oi(max(all_oi) if all_oi else 1.0)
+        self._update_table()
+
+    def _on_quotes_failed(self, request_id: int, message: str):
+        if request_id == self._quote_request_id:
+            logger.error(f"Fetch failed: {message}")
+
+    def _add_strike_contracts(self, symbol: str, expiry: date, strike: float) -> List[Contract]:
+        added = []
+        for ot in ['CE', 'PE']:
+            inst = self._strike_grids.get_instrument(symbol, expiry, strike, ot)
+            if not inst:
+                continue
+            c = Contract(
+                symbol=symbol,
+                tradingsymbol=inst['tradingsymbol'],
+                instrument_token=inst['instrument_token'],
+                lot_size=inst.get('lot_size', 1),
+                strike=strike,
+                option_type=ot,
+                expiry=expiry,
+            )
+            self.contracts.setdefault(strike, {})[ot] = c
+            self._token_contract_map[c.instrument_token] = c
+            added.append(c)
+        return added
+
+    def _remove_strike_contracts(self, strike: float):
+        for c in self.contracts.pop(strike, {}).values():
+            if c:
+                self._token_contract_map.pop(c.instrument_token, None)
+
+    def _shift_to_atm(self, price: float, new_atm: float) -> bool:
+        """
+        Recentre by sliding the existing rows: only strikes entering the window
+        get new contracts (filled by their first ticks once subscribed) and
+        only strikes leaving it are dropped.  False when the move is too far to
+        overlap the current window.
+        """
+        old_atm = self.atm_strike
+        self.atm_strike = new_atm
+        strikes = self._gen_strikes()
+        current = set(self.contracts)
+        entering = [k for k in strikes if k not in current]
+        for strike in entering:
+            self._add_strike_contracts(self.symbol, self.expiry, strike)
+        strikes = [k for k in strikes if k in self.contracts]
+        if not self.model.shift_strikes(strikes):
+            for strike in entering:
+                self._remove_strike_contracts(strike)
+            self.atm_strike = old_atm
+            return False
+
+        for strike in current.difference(strikes):
+            self._remove_strike_contracts(strike)
+        self.current_price = price
+        self.model.set_atm_strike(new_atm)
+        all_oi = [c.oi for sc in self.contracts.values() for c in sc.values() if c and c.oi > 0]
+        self.model.set_max_oi(max(all_oi) if all_oi else 1.0)
+        self._force_center_atm()
+        return True
 
     def update_prices(self, data: Union[dict, list]):
         ticks = data if isinstance(data, list) else [data]
         dirty_rows: set = set()
         oi_changed = False
+        underlying_ltp = None
 
         for tick in ticks:
             token = tick.get('instrument_token')
             if token is None:
                 continue
+            if token == self._tracking_token:
+                underlying_ltp = tick.get('last_price') or underlying_ltp
+                continue
             contract = self._token_contract_map.get(token)
             if not contract:
                 continue
+            quote = (contract.ltp, contract.bid, contract.ask)
             if 'last_price' in tick and tick.get('last_price') != contract.ltp:
                 contract.ltp = tick.get('last_price', contract.ltp)
             depth = tick.get('depth', {})
@@ -842,21 +958,51 @@ class StrikeLadderWidget(QWidget):
             if new_oi != contract.oi:
                 contract.oi = new_oi
                 oi_changed  = True
-            row = self._strike_row_map.get(contract.strike)
+            elif quote == (contract.ltp, contract.bid, contract.ask):
+                continue   # nothing on screen moved
+            row = self.model.row_for_strike(contract.strike)
             if row is not None:
                 dirty_rows.add(row)
 
         if dirty_rows:
             if oi_changed:
-                all_oi       = [c.oi for sc in self.contracts.values()
-                                 for c in sc.values() if c and c.oi > 0]
-                prev_max     = self._max_oi
-                self._max_oi = max(all_oi) if all_oi else 1.0
-                refresh_rows = (set(range(self.table.rowCount()))
-                                if self._max_oi != prev_max else dirty_rows)
-                self._update_table(rows=refresh_rows, refresh_oi=True)
-            else:
-                self._update_table(rows=dirty_rows, refresh_oi=False)
+                all_oi = [c.oi for sc in self.contracts.values()
+                          for c in sc.values() if c and c.oi > 0]
+                # A new OI scale repaints every bar; otherwise only the touched rows.
+                self.model.set_max_oi(max(all_oi) if all_oi else 1.0)
+            self._update_table(rows=dirty_rows)
+
+        # Last, since a recentre replaces the rows collected above.
+        if underlying_ltp:
+            self._on_underlying_tick(underlying_ltp)
+
+    def set_tracking_token(self, token: Optional[int], is_future: bool = False):
+        """Follow ``token``'s ticks (fed through ``update_prices``) for ATM tracking.
+
+        Futures trade at a basis over spot; it is measured on the first tick
+        after this call (or after the next ``update_strikes``) against the spot
+        price the ladder was built around, and removed from every later tick.
+        """
+        self._tracking_token     = token
+        self._tracking_is_future = bool(token) and is_future
+        self._tracking_basis     = None
+
+    @property
+    def tracking_token(self) -> Optional[int]:
+        return self._tracking_token
+
+    @property
+    def last_index_price(self) -> Optional[float]:
+        return self._index_ltp
+
+    def _on_underlying_tick(self, ltp: float):
+        if self._tracking_is_future:
+            if self._tracking_basis is None:
+                if not self.current_price:
+                    return
+                self._tracking_basis = ltp - self.current_price
+            ltp -= self._tracking_basis
+        self.update_index_price(ltp)
 
     def update_index_price(self, ltp: float):
         if ltp and ltp > 0:
@@ -0,0 +1,16 @@
+from datetime import date
+
+import pytest
+
+from core.utils.data_models import Contract, Position
+
+
+def _position(symbol, token, qty=50, avg=100.0, **kwargs):
+    contract = Contract("NIFTY", 25000, "CE", date(2099, 1, 1), symbol, token, 50)
+    return Position("NIFTY", symbol, qty, avg, avg, 0.0, contract, None, **kwargs)
+
+
+@pytest.fixture
+def make_position():
+    """Factory for a NIFTY 25000 CE position keyed by ``symbol`` / ``token``."""
+    return _position
@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.cvd.bar_pyramid import DAILY, BarPyramid
+
+
+TZ = "Asia/Kolkata"
+
+
+def _minute_bars(seed: int, days=(12, 13), skip_every=0, tz=TZ) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index, rows = [], []
+    price = 100.0
+    for day in days:
+        for m in range(375):
+            if skip_every and m % skip_every == 2:
+                continue
+            o = price
+            c = o + rng.normal(0.0, 0.5)
+            rows.append((o, max(o, c) + rng.uniform(0, 0.3), min(o, c) - rng.uniform(0, 0.3), c,
+                         float(rng.integers(0, 1000))))
+            index.append(datetime(2026, 10, day, 9, 15) + timedelta(minutes=m))
+            price = c
+    idx = pd.DatetimeIndex(index)
+    if tz:
+        idx = idx.tz_localize(tz)
+    return pd.DataFrame(rows, columns=["open", "high", "low", "close", "volume"], index=idx)
+
+
+def _reference(df: pd.DataFrame, minutes: int) -> pd.DataFrame:
+    agg = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+    if minutes == DAILY:
+        out = df.groupby(df.index.normalize()).agg(agg)
+    else:
+        offset = pd.Timedelta(minutes=(9 * 60 + 15) % minutes)
+        out = df.resample(f"{minutes}min", origin="start_day", offset=offset).agg(agg)
+    return out.dropna(subset=["open"])
+
+
+def _assert_levels_match(pyramid: BarPyramid, df: pd.DataFrame):
+    for minutes in (1, *pyramid.timeframes):
+        got = pyramid.frame(minutes)
+        expected = df if minutes == 1 else _reference(df, minutes)
+        assert list(got.index) == list(expected.index), minutes
+        np.testing.assert_allclose(got.to_numpy(), expected.to_numpy(), err_msg=str(minutes))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_bulk_load_matches_pandas_resample(seed):
+    df = _minute_bars(seed, skip_every=seed * 3)
+    pyramid = BarPyramid()
+    pyramid.load(df)
+
+    _assert_levels_match(pyramid, df)
+
+
+def test_live_revisions_of_forming_minute_reach_every_level():
+    df = _minute_bars(7, days=(13,))
+    pyramid = BarPyramid((3, 5, 15, 30, 60, DAILY))
+    pyramid.load(df.iloc[:100])
+
+    rng = np.random.default_rng(1)
+    for ts, row in df.iloc[100:160].iterrows():
+        # Each minute arrives as several provisional revisions before its final value.
+        for _ in range(3):
+            c = row["open"] + rng.normal(0.0, 0.5)
+            assert pyramid.update(ts, row["open"], max(row["open"], c), min(row["open"], c), c, 1.0)
+        assert pyramid.update(ts, *row.to_numpy())
+
+    _assert_levels_match(pyramid, df.iloc[:160])
+
+
+def test_older_minute_is_rejected_without_changes():
+    df = _minute_bars(3, days=(13,))
+    pyramid = BarPyramid()
+    pyramid.load(df.iloc[:50])
+    before = pyramid.frame(5)
+
+    assert pyramid.update(df.index[10], 1.0, 1.0, 1.0, 1.0) is False
+    pd.testing.assert_frame_equal(pyramid.frame(5), before)
+
+
+def test_cvd_pyramid_stays_gapless_and_naive_index_is_kept():
+    closes = np.cumsum(np.random.default_rng(2).integers(-50, 50, 120)).astype(float)
+    opens = np.concatenate([[0.0], closes[:-1]])
+    idx = pd.date_range("2026-10-13 09:15", periods=120, freq="1min")
+    cvd = pd.DataFrame({"open": opens, "high": np.maximum(opens, closes),
+                        "low": np.minimum(opens, closes), "close": closes}, index=idx)
+    pyramid = BarPyramid()
+    pyramid.load(cvd)
+
+    fifteen = pyramid.frame(15)
+    assert fifteen.index.tz is None and fifteen.index[0] == idx[0]
+    np.testing.assert_allclose(fifteen["open"].to_numpy()[1:], fifteen["close"].to_numpy()[:-1])
+    assert fifteen["open"].iloc[0] == 0.0
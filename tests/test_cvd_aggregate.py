@@ -0,0 +1,150 @@
+import sys
+from datetime import datetime, timedelta
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "core" / "cvd" / "cvd_aggregate.py"
+spec = spec_from_file_location("cvd_aggregate", MODULE_PATH)
+cvd_aggregate = module_from_spec(spec)
+assert spec and spec.loader
+sys.modules[spec.name] = cvd_aggregate
+spec.loader.exec_module(cvd_aggregate)
+AggregateCVDSeries = cvd_aggregate.AggregateCVDSeries
+
+TZ = "Asia/Kolkata"
+
+
+def _cvd_frame(seed: int, days=(12, 13), minutes=30, skip_every=0, tz=TZ) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index, closes = [], []
+    for day in days:
+        cvd = 0.0
+        for m in range(minutes):
+            if skip_every and m % skip_every == 1:
+                continue
+            cvd += float(rng.integers(-500, 500))
+            index.append(datetime(2026, 10, day, 9, 15) + timedelta(minutes=m))
+            closes.append(cvd)
+    idx = pd.DatetimeIndex(index)
+    if tz:
+        idx = idx.tz_localize(tz)
+    return pd.DataFrame({"open": closes, "high": closes, "low": closes, "close": closes}, index=idx)
+
+
+def _reference(frames: dict[int, pd.DataFrame]) -> pd.Series:
+    """Brute force: union of minutes, each member forward-filled within its session."""
+    union = sorted(set().union(*(df.index for df in frames.values())))
+    union = pd.DatetimeIndex(union)
+    total = pd.Series(0.0, index=union)
+    for df in frames.values():
+        s = df["close"].reindex(union)
+        s = s.groupby(union.date).ffill().fillna(0.0)
+        total += s
+    return total
+
+
+def _assert_matches(agg: AggregateCVDSeries, frames):
+    expected = _reference(frames)
+    out = agg.to_frame()
+    assert list(out.index) == list(expected.index)
+    np.testing.assert_allclose(out["close"].to_numpy(), expected.to_numpy())
+    assert list(out["session"]) == list(out.index.date)
+
+
+def test_bulk_members_match_reference_with_gappy_member():
+    frames = {1: _cvd_frame(1), 2: _cvd_frame(2, skip_every=3), 3: _cvd_frame(3, days=(13,))}
+    agg = AggregateCVDSeries()
+    for token, df in frames.items():
+        agg.set_member(token, df)
+
+    _assert_matches(agg, frames)
+
+
+def test_member_leaving_and_rejoining_mid_session():
+    frames = {1: _cvd_frame(1), 2: _cvd_frame(2), 3: _cvd_frame(3)}
+    agg = AggregateCVDSeries()
+    for token, df in frames.items():
+        agg.set_member(token, df)
+
+    agg.remove_member(2)
+    _assert_matches(agg, {1: frames[1], 3: frames[3]})
+
+    agg.set_member(2, frames[2])
+    _assert_matches(agg, frames)
+    assert agg.tokens == {1, 2, 3}
+
+
+def test_member_with_earlier_history_regrids():
+    late = _cvd_frame(1, days=(13,))
+    early = _cvd_frame(2, days=(9, 12, 13))
+    agg = AggregateCVDSeries()
+    agg.set_member(1, late)
+    agg.set_member(2, early)
+
+    _assert_matches(agg, {1: late, 2: early})
+
+
+def test_live_ticks_update_only_forming_minute():
+    frames = {1: _cvd_frame(1), 2: _cvd_frame(2)}
+    agg = AggregateCVDSeries()
+    for token, df in frames.items():
+        agg.set_member(token, df)
+
+    last = frames[1].index[-1].tz_localize(None).to_pydatetime()
+    base = agg.last_value
+
+    # Same minute: only the delta of member 1 lands in the last point.
+    assert agg.update(1, last + timedelta(seconds=20), frames[1]["close"].iloc[-1] + 100) is True
+    assert agg.last_value == pytest.approx(base + 100)
+
+    # New minute: member 2 carries forward, member 1 moves again.
+    nxt = last + timedelta(minutes=1, seconds=5)
+    assert agg.update(1, nxt, frames[1]["close"].iloc[-1] + 250) is True
+    assert agg.last_timestamp == pd.Timestamp(last + timedelta(minutes=1)).tz_localize(TZ)
+    assert agg.last_value == pytest.approx(base + 250)
+
+    # Member 2 catches up in the same minute.
+    assert agg.update(2, nxt, frames[2]["close"].iloc[-1] - 40) is True
+    assert agg.last_value == pytest.approx(base + 250 - 40)
+
+
+def test_live_tick_for_lagging_member_reports_backfill():
+    frames = {1: _cvd_frame(1), 2: _cvd_frame(2, minutes=20)}
+    agg = AggregateCVDSeries()
+    for token, df in frames.items():
+        agg.set_member(token, df)
+
+    lag_minute = frames[2].index[-1].tz_localize(None).to_pydatetime() + timedelta(minutes=1)
+    assert agg.update(2, lag_minute, 999.0) is False
+
+    updated = dict(frames)
+    extra = pd.DataFrame({c: [999.0] for c in ("open", "high", "low", "close")},
+                         index=pd.DatetimeIndex([lag_minute]).tz_localize(TZ))
+    updated[2] = pd.concat([frames[2], extra])
+    _assert_matches(agg, updated)
+
+
+def test_new_session_resets_contributions():
+    frames = {1: _cvd_frame(1, days=(12,)), 2: _cvd_frame(2, days=(12,))}
+    agg = AggregateCVDSeries()
+    for token, df in frames.items():
+        agg.set_member(token, df)
+
+    agg.update(1, datetime(2026, 10, 13, 9, 15, 10), 50.0)
+    assert agg.last_value == pytest.approx(50.0)
+    assert agg.to_frame()["session"].nunique() == 2
+
+
+def test_unknown_and_stale_ticks_are_ignored():
+    agg = AggregateCVDSeries()
+    assert agg.update(1, datetime(2026, 10, 12, 9, 20), 1.0) is None
+
+    agg.set_member(1, _cvd_frame(1))
+    assert agg.update(1, datetime(2026, 10, 12, 9, 20), 1.0) is None
+    agg.remove_member(1)
+    assert agg.to_frame().empty and len(agg) == 0
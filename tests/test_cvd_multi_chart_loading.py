@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from PySide6.QtWidgets import QApplication
+
+from core.cvd.cvd_chart_widget import CVDChartWidget
+from core.dialogs.cvd_multi_chart_dialog import CVDMultiChartDialog
+
+
+class _Kite:
+    access_token = None     # history loading disabled
+
+
+def _app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_failed_history_load_is_signalled():
+    app = _app()
+    chart = CVDChartWidget(kite=_Kite(), instrument_token=1, symbol="NIFTY FUT", auto_refresh=False)
+    events = []
+    chart.history_loaded.connect(lambda: events.append("loaded"))
+    chart.history_failed.connect(lambda: events.append("failed"))
+
+    chart._history_request_id = 7
+    chart._on_history_loaded(7, None)           # no data for the range
+    chart._historical_failed = False
+    chart._on_history_failed(7, "timeout")
+    assert events == ["failed", "failed"]
+    chart.deleteLater()
+    app.processEvents()
+
+
+def test_status_settles_when_charts_have_no_data():
+    app = _app()
+    dialog = CVDMultiChartDialog(_Kite(), {"NIFTY": 1, "BANKNIFTY": 2})
+    day = datetime(2026, 10, 16)
+
+    dialog._load_all_charts(day, datetime(2026, 10, 15))
+
+    assert dialog._pending_loads == set()
+    assert dialog.lbl_status.text() == "Loaded: 2026-10-15 → 2026-10-16 (2 without data)"
+    dialog.close()
+    dialog.deleteLater()
+    app.processEvents()
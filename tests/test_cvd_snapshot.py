@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.cvd.cvd_engine import CVDEngine
+from core.cvd.cvd_snapshot import CVDCheckpointer, gap_deltas, read_snapshot, write_snapshot
+
+
+NOW = datetime(2026, 10, 13, 11, 0, 30)
+
+
+def _minute(dt: datetime) -> int:
+    return int(dt.timestamp()) // 60
+
+
+def _engine_with_session(token=11, start=NOW - timedelta(minutes=30)):
+    engine = CVDEngine()
+    engine.register_token(token)
+    state = engine._states[token]
+    state.session_date = start.date()
+    state.cvd, state.last_price, state.last_volume = 500.0, 100.0, 10_000
+    state.minute_bars = [[_minute(start), 400.0, 520.0, 390.0, 500.0]]
+    return engine
+
+
+def test_snapshot_round_trip_restores_same_day_state(tmp_path):
+    engine = _engine_with_session()
+    path = tmp_path / "cvd.json"
+    write_snapshot(path, engine.export_state(), NOW)
+
+    fresh = CVDEngine()
+    restored = fresh.restore_state(read_snapshot(path)["states"], NOW.date(), _minute(NOW))
+
+    assert restored == {11: _minute(NOW - timedelta(minutes=30))}
+    state = fresh._states[11]
+    assert state.cvd == 500.0 and state.last_price == 100.0
+    assert state.minute_bars == engine._states[11].minute_bars
+    # Ticks were missed since the last bar: the volume baseline must be re-learned.
+    assert state.last_volume is None
+
+
+def test_restore_skips_other_days_tracked_tokens_and_bad_files(tmp_path):
+    engine = _engine_with_session()
+    states = engine.export_state()
+
+    other_day = CVDEngine()
+    assert other_day.restore_state(states, NOW.date() + timedelta(days=1), _minute(NOW)) == {}
+
+    live = CVDEngine()
+    live.register_token(11)
+    assert live.restore_state(states, NOW.date(), _minute(NOW)) == {}
+    assert live.get_cvd(11) == 0.0
+
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    assert read_snapshot(bad) is None
+    assert read_snapshot(tmp_path / "missing.json") is None
+
+
+def test_same_minute_restart_keeps_volume_baseline():
+    engine = _engine_with_session(start=NOW)
+    fresh = CVDEngine()
+    fresh.restore_state(engine.export_state(), NOW.date(), _minute(NOW))
+
+    assert fresh._states[11].last_volume == 10_000
+
+
+def test_gap_deltas_keep_only_missed_completed_minutes():
+    base = NOW.replace(second=0) - timedelta(minutes=5)
+    rows = [
+        {"date": base + timedelta(minutes=i), "open": 100, "close": c, "volume": 10 * (i + 1)}
+        for i, c in enumerate([101, 99, 100, 102, 98, 97])
+    ]
+    gap = gap_deltas(rows, _minute(base), _minute(NOW))
+
+    assert gap == [
+        (_minute(base) + 1, -20.0),
+        (_minute(base) + 2, 0.0),
+        (_minute(base) + 3, 40.0),
+        (_minute(base) + 4, -50.0),
+    ]
+
+
+def test_gap_bars_splice_before_live_bars_and_shift_them():
+    engine = _engine_with_session()
+    last = engine._states[11].minute_bars[-1][0]
+    emitted = []
+    engine.cvd_updated.connect(lambda *args: emitted.append(args))
+
+    # A live bar recorded after restart, before the gap fetch returned.
+    engine._states[11].minute_bars.append([last + 30, 500.0, 530.0, 500.0, 530.0])
+    engine._states[11].cvd = 530.0
+
+    engine.apply_gap_bars(11, [(last + 1, 25.0), (last + 2, -5.0)])
+
+    bars = engine._states[11].minute_bars
+    assert [b[0] for b in bars] == [last, last + 1, last + 2, last + 30]
+    assert bars[1] == [last + 1, 500.0, 525.0, 500.0, 525.0]
+    assert bars[2] == [last + 2, 525.0, 525.0, 520.0, 520.0]
+    assert bars[3] == [last + 30, 520.0, 550.0, 520.0, 550.0]
+    assert engine.get_cvd(11) == pytest.approx(550.0)
+    assert emitted == [(11, 550.0, 100.0)]
+
+
+def test_ticks_build_minute_bars():
+    engine = CVDEngine()
+    engine.register_token(5)
+    t0 = datetime.now()
+    engine._process_single_tick({"instrument_token": 5, "last_price": 100.0, "volume": 1000})
+    engine._process_single_tick({"instrument_token": 5, "last_price": 101.0, "volume": 1200})
+    engine._process_single_tick({"instrument_token": 5, "last_price": 100.5, "volume": 1250})
+
+    bars = engine._states[5].minute_bars
+    assert bars and bars[-1][4] == engine.get_cvd(5) == 150.0
+    assert bars[0][1] == 0.0 and max(b[2] for b in bars) == 200.0
+    assert bars[0][0] >= _minute(t0)
+
+
+def test_checkpointer_restores_without_kite(tmp_path):
+    engine = _engine_with_session()
+    path = tmp_path / "cvd.json"
+    assert CVDCheckpointer(engine, path).save()
+
+    fresh = CVDEngine()
+    assert CVDCheckpointer(fresh, path).restore(now=NOW) == [11]
+    assert fresh.get_cvd(11) == 500.0
@@ -0,0 +1,46 @@
+import numpy as np
+
+from core.widgets.decimated_curve import minmax_decimate
+
+
+def _series(n=50_000, seed=0):
+    x = np.arange(n, dtype=float)
+    y = np.cumsum(np.random.default_rng(seed).normal(size=n))
+    return x, y
+
+
+def test_output_is_bounded_by_pixel_width_and_keeps_extremes():
+    x, y = _series()
+    xs, ys = minmax_decimate(x, y, 0, len(x), 400)
+
+    assert len(xs) <= 2 * 400 + 4
+    assert ys.max() == y.max() and ys.min() == y.min()
+    assert xs[0] == x[0] and xs[-1] == x[-1]
+    assert np.all(np.diff(xs) >= 0)
+
+
+def test_every_pixel_bucket_keeps_its_own_min_and_max():
+    x, y = _series(10_000, seed=3)
+    xs, ys = minmax_decimate(x, y, 0, len(x), 100)
+
+    per_bucket = 100
+    for b in range(100):
+        chunk = y[b * per_bucket:(b + 1) * per_bucket]
+        inside = ys[(xs >= b * per_bucket) & (xs < (b + 1) * per_bucket)]
+        assert inside.max() == chunk.max() and inside.min() == chunk.min()
+
+
+def test_only_visible_slice_plus_edge_points_is_used():
+    x, y = _series()
+    xs, ys = minmax_decimate(x, y, 1000, 1500, 1000)
+
+    # Fewer visible points than 2x pixels: passed through untouched.
+    np.testing.assert_array_equal(xs, x[999:1502])
+    np.testing.assert_array_equal(ys, y[999:1502])
+
+
+def test_short_series_passes_through():
+    x, y = _series(10)
+    xs, ys = minmax_decimate(x, y, -5, 50, 800)
+    np.testing.assert_array_equal(xs, x)
+    np.testing.assert_array_equal(ys, y)
@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+from core.execution.execution_stack import ExecutionRequest, ExecutionStack
+
+
+def _request(**kwargs):
+    return ExecutionRequest(tradingsymbol="NIFTYCE", transaction_type="BUY", quantity=100,
+                            order_type="MARKET", product="MIS", ltp=100.0, **kwargs)
+
+
+def _sliced(n):
+    return _request(execution_algo="TWAP", max_child_orders=n, randomize_slices=False)
+
+
+def test_paper_children_are_placed_inline(tmp_path):
+    stack = ExecutionStack("paper", tmp_path)
+    caller = threading.get_ident()
+    threads = []
+
+    def place(**args):
+        threads.append(threading.get_ident())
+        return f"P{len(threads)}"
+
+    future = stack.submit(_request(), place, {"tradingsymbol": "NIFTYCE"})
+    assert future.done() and future.result().order_ids == ["P1"]
+    assert threads == [caller]
+    stack.shutdown()
+
+
+def test_live_children_go_to_the_pool_and_retry_without_sleeping(tmp_path):
+    stack = ExecutionStack("live", tmp_path)
+    stack.retry.backoff_seconds = lambda bucket, attempt: 0.01
+    caller = threading.get_ident()
+    calls, threads = [], set()
+
+    def place(**args):
+        threads.add(threading.get_ident())
+        calls.append(args["quantity"])
+        if len(calls) == 1:
+            raise TimeoutError("timeout")
+        return f"L{len(calls)}"
+
+    result = stack.submit(_sliced(2), place, {"tradingsymbol": "NIFTYCE"}).result(timeout=5)
+
+    assert calls == [50, 50, 50] and result.order_ids == ["L2", "L3"] and result.error is None
+    assert caller not in threads
+    stack.shutdown()
+
+
+def test_fatal_error_stops_later_slices_and_keeps_placed_ids(tmp_path):
+    stack = ExecutionStack("live", tmp_path)
+    calls = []
+
+    def place(**args):
+        calls.append(args["quantity"])
+        if len(calls) == 2:
+            raise ValueError("insufficient margin")
+        return f"L{len(calls)}"
+
+    result = stack.submit(_sliced(4), place, {"tradingsymbol": "NIFTYCE"}).result(timeout=5)
+
+    assert len(calls) == 2
+    assert result.order_ids == ["L1"] and "margin" in str(result.error) and result.unsent == 2
+
+    def reject(**args):
+        raise ValueError("insufficient margin")
+
+    with pytest.raises(ValueError):
+        stack.execute(_request(), reject, {"tradingsymbol": "NIFTYCE"})
+    stack.shutdown()
@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from core.cvd import history_cache
+from core.cvd.history_cache import MinuteHistoryCache
+
+
+TZ = "Asia/Kolkata"
+DAY = datetime(2026, 10, 13)
+
+
+class FakeHistory:
+    """Kite-like minute history: one bar per minute 09:15-15:29, up to ``now``."""
+
+    def __init__(self, now: datetime):
+        self.now = now
+        self.calls: list[tuple[int, datetime, datetime]] = []
+
+    def __call__(self, token, from_dt, to_dt):
+        self.calls.append((token, from_dt, to_dt))
+        rows = []
+        t = max(from_dt.replace(second=0, microsecond=0), DAY.replace(hour=9, minute=15))
+        end = min(to_dt, self.now)
+        while t <= end and (t.hour, t.minute) < (15, 30):
+            price = 100.0 + t.minute + token
+            rows.append({
+                "date": pd.Timestamp(t).tz_localize(TZ),
+                "open": price, "high": price + 1, "low": price - 1,
+                # The forming minute reports a provisional close.
+                "close": price + (0.5 if t == self.now.replace(second=0) else 0.0),
+                "volume": 10.0,
+            })
+            t += timedelta(minutes=1)
+        return rows
+
+
+def test_unheld_token_is_fetched_every_time_and_not_cached():
+    fetch = FakeHistory(DAY.replace(hour=10))
+    cache = MinuteHistoryCache()
+    start, end = DAY.replace(hour=9), DAY.replace(hour=10)
+
+    a = cache.minute_bars(1, start, end, fetch)
+    b = cache.minute_bars(1, start, end, fetch)
+
+    assert len(fetch.calls) == 2 and len(a) == len(b) == 46
+    assert 1 not in cache
+
+
+def test_views_share_one_fetch_and_covered_reads_hit_memory():
+    fetch = FakeHistory(DAY.replace(hour=11))
+    cache = MinuteHistoryCache()
+    cache.acquire(7)
+    cache.acquire(7)
+
+    full = cache.minute_bars(7, DAY.replace(hour=9), DAY.replace(hour=11), fetch)
+    inner = cache.minute_bars(7, DAY.replace(hour=10), DAY.replace(hour=10, minute=30), fetch)
+
+    assert len(fetch.calls) == 1
+    assert inner.index[0] == pd.Timestamp(DAY.replace(hour=10)).tz_localize(TZ)
+    assert inner.index[-1] == pd.Timestamp(DAY.replace(hour=10, minute=30)).tz_localize(TZ)
+    pd.testing.assert_frame_equal(inner, full.loc[inner.index])
+
+
+def test_live_extension_fetches_only_the_tail_and_refreshes_forming_minute():
+    fetch = FakeHistory(DAY.replace(hour=10, minute=5, second=30))
+    cache = MinuteHistoryCache()
+    cache.acquire(3)
+    first = cache.minute_bars(3, DAY.replace(hour=9), fetch.now, fetch)
+    assert first["close"].iloc[-1] == 100.0 + 5 + 3 + 0.5
+
+    fetch.now = DAY.replace(hour=10, minute=7, second=10)
+    later = cache.minute_bars(3, DAY.replace(hour=9), fetch.now, fetch)
+
+    _, gap_start, gap_end = fetch.calls[-1]
+    assert gap_start == DAY.replace(hour=10, minute=5) and gap_end == fetch.now
+    assert len(later) == len(first) + 2
+    # The bar that was still forming on the first read is replaced, not duplicated.
+    assert later.index.is_unique
+    assert later.loc[first.index[-1], "close"] == 100.0 + 5 + 3
+
+
+def test_earlier_range_fetches_only_the_missing_head():
+    fetch = FakeHistory(DAY.replace(hour=12))
+    cache = MinuteHistoryCache()
+    cache.acquire(5)
+    cache.minute_bars(5, DAY.replace(hour=10), DAY.replace(hour=11), fetch)
+    out = cache.minute_bars(5, DAY.replace(hour=9), DAY.replace(hour=11), fetch)
+
+    assert fetch.calls[-1][1:] == (DAY.replace(hour=9), DAY.replace(hour=10))
+    assert len(out) == 106 and out.index.is_monotonic_increasing
+
+
+def test_last_release_evicts_and_derived_cvd_is_built_once(monkeypatch):
+    builds = []
+
+    def fake_build(bars):
+        builds.append(len(bars))
+        return bars[["open", "high", "low", "close"]].cumsum()
+
+    monkeypatch.setattr(history_cache, "_build_cvd", fake_build)
+    fetch = FakeHistory(DAY.replace(hour=12))
+    cache = MinuteHistoryCache()
+    cache.acquire(9)
+    cache.acquire(9)
+
+    cache.cvd_bars(9, DAY.replace(hour=9), DAY.replace(hour=12), fetch)
+    cache.cvd_bars(9, DAY.replace(hour=10), DAY.replace(hour=11), fetch)
+    assert builds == [166]
+
+    cache.release(9)
+    assert cache.refcount(9) == 1
+    cache.release(9)
+    assert 9 not in cache and cache.refcount(9) == 0
+
+
+def test_resample_aligns_to_session_open():
+    fetch = FakeHistory(DAY.replace(hour=11))
+    df = history_cache._rows_to_frame(fetch(1, DAY.replace(hour=9), DAY.replace(hour=11)))
+
+    thirty = history_cache.resample_minute_bars(df, 30)
+    assert [ts.strftime("%H:%M") for ts in thirty.index] == ["09:15", "09:45", "10:15", "10:45"]
+    first = df.iloc[:30]
+    assert thirty["open"].iloc[0] == first["open"].iloc[0]
+    assert thirty["high"].iloc[0] == first["high"].max()
+    assert thirty["volume"].iloc[0] == first["volume"].sum()
+    assert history_cache.resample_minute_bars(df, 1) is df
+
+
+def test_timeframe_bars_follow_the_live_tail():
+    fetch = FakeHistory(DAY.replace(hour=10, minute=5, second=30))
+    cache = MinuteHistoryCache()
+    cache.acquire(4)
+    start = DAY.replace(hour=9)
+    cache.timeframe_bars(4, start, fetch.now, fetch, 15)
+
+    fetch.now = DAY.replace(hour=10, minute=40, second=5)
+    minutes = cache.minute_bars(4, start, fetch.now, fetch)
+    fifteen = cache.timeframe_bars(4, start, fetch.now, fetch, 15)
+
+    expected = history_cache.resample_minute_bars(minutes, 15)
+    pd.testing.assert_frame_equal(fifteen, expected, check_freq=False, check_dtype=False, check_names=False)
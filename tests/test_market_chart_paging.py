@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+from PySide6.QtWidgets import QApplication
+
+from core.dialogs.market_monitor_dialog import MarketChartWidget
+
+
+def _session(day: str, n: int = 375) -> pd.DataFrame:
+    idx = pd.date_range(f"{day} 09:15", periods=n, freq="1min")
+    close = np.linspace(100.0, 110.0, n)
+    return pd.DataFrame(
+        {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 10.0},
+        index=idx,
+    )
+
+
+def test_paging_past_max_points_keeps_todays_curve_and_live_dot():
+    app = QApplication.instance() or QApplication([])
+    chart = MarketChartWidget()
+    chart.set_data("NIFTY", pd.concat([_session("2026-10-15"), _session("2026-10-16")]), day_separator_pos=375)
+
+    for day in ("2026-10-14", "2026-10-13", "2026-10-12"):
+        chart.prepend_bars(_session(day))
+
+    bars = len(chart.bars)
+    assert bars == 1875 > chart.MAX_CHART_POINTS
+    today_x = chart._line_plot_today.xData
+    assert len(today_x) == bars - chart.day_separator_pos
+    assert today_x[-1] == bars - 1
+    dot_x = chart._live_dot.xData
+    assert dot_x[0] == bars - 1
+    chart.deleteLater()
+    app.processEvents()
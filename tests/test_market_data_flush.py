@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+
+from core.main_window_coordinators import MarketDataOrchestrator
+
+
+class _Sink:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, ticks):
+        self.batches.append(sorted(t["instrument_token"] for t in ticks))
+
+
+def test_each_flush_carries_only_ticks_since_the_last_one():
+    ladder, pnl = _Sink(), _Sink()
+    window = SimpleNamespace(
+        _latest_market_data={}, _ui_update_needed=False, positions_dialog=None, performance_dialog=None,
+        cvd_engine=SimpleNamespace(process_ticks=lambda data: None),
+        strike_ladder=SimpleNamespace(update_prices=ladder, get_ladder_data=lambda: None),
+        position_manager=SimpleNamespace(update_pnl_from_market_data=pnl),
+        _update_account_summary_widget=lambda: None,
+    )
+    orchestrator = MarketDataOrchestrator(window)
+
+    orchestrator.on_market_data([{"instrument_token": 1, "last_price": 10.0},
+                                 {"instrument_token": 2, "last_price": 20.0},
+                                 {"instrument_token": 1, "last_price": 11.0}])
+    orchestrator.update_throttled_ui()
+    orchestrator.update_throttled_ui()                  # nothing new: no flush
+    orchestrator.on_market_data([{"instrument_token": 2, "last_price": 21.0}])
+    orchestrator.update_throttled_ui()
+
+    assert ladder.batches == pnl.batches == [[1, 2], [2]]
@@ -0,0 +1,64 @@
+import threading
+import time
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import QApplication
+
+from core.dialogs import market_monitor_dialog
+from core.dialogs.market_monitor_dialog import MarketMonitorDialog
+
+
+class _Kite:
+    def __init__(self):
+        self.threads = []
+
+    def instruments(self):
+        self.threads.append(threading.get_ident())
+        time.sleep(0.05)                                   # full dump round trip
+        return [{"tradingsymbol": "NIFTY 50", "instrument_token": 256265, "instrument_type": "INDICES",
+                 "exchange": "NSE"},
+                {"tradingsymbol": "RELIANCE", "instrument_token": 738561, "instrument_type": "EQ",
+                 "exchange": "NSE"}]
+
+
+class _Worker(QObject):
+    data_received = Signal(list)
+
+    def __init__(self):
+        super().__init__()
+        self.subscribed_tokens = set()
+
+    def set_instruments(self, tokens, append=False):
+        self.subscribed_tokens = set(tokens) | (self.subscribed_tokens if append else set())
+
+
+class _Config:
+    def load_market_monitor_sets(self):
+        return []
+
+    def load_dialog_state(self, name):
+        return None
+
+    def save_dialog_state(self, name, state):
+        return True
+
+
+def test_instruments_dump_runs_off_the_gui_thread_once_a_day(monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(market_monitor_dialog, "_token_map_cache", {})
+    kite = _Kite()
+    dialog = MarketMonitorDialog(real_kite_client=kite, market_data_worker=_Worker(), config_manager=_Config())
+    deadline = time.monotonic() + 5
+    while dialog._token_map_loading and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+
+    assert threading.get_ident() not in kite.threads
+    assert dialog._get_instrument_token("NIFTY") == 256265
+
+    second = MarketMonitorDialog(real_kite_client=kite, market_data_worker=_Worker(), config_manager=_Config())
+    assert not second._token_map_loading and len(kite.threads) == 1
+    for d in (dialog, second):
+        d.close()
+        d.deleteLater()
+    app.processEvents()
@@ -44,3 +44,13 @@ def test_subscriptions_use_visible_strike_tokens_plus_cvd():
     policy.update_market_subscriptions()
 
     assert window.market_data_worker.calls == [{1, 2, 3, 99}]
+
+
+def test_ladder_tracking_token_stays_subscribed():
+    window = DummyMainWindow(visible_tokens={1, 2}, cvd_tokens=set())
+    window.strike_ladder.tracking_token = 777
+    policy = MarketSubscriptionPolicy(window)
+
+    policy.update_market_subscriptions()
+
+    assert window.market_data_worker.calls == [{1, 2, 777}]
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.utils.ohlcv_ring_buffer import OHLCVRingBuffer
+
+
+def _frame(n: int, tz=None) -> pd.DataFrame:
+    idx = pd.date_range("2026-10-13 09:15", periods=n, freq="1min", tz=tz)
+    close = np.arange(n, dtype=float)
+    return pd.DataFrame(
+        {"open": close - 0.5, "high": close + 1, "low": close - 1, "close": close, "volume": 10.0},
+        index=idx,
+    )
+
+
+def test_load_keeps_newest_rows_and_naive_times():
+    buf = OHLCVRingBuffer(5)
+    df = _frame(8, tz="Asia/Kolkata")
+    buf.load_frame(df)
+
+    assert len(buf) == 5
+    np.testing.assert_array_equal(buf.column("close"), df["close"].to_numpy()[-5:])
+    expected = df.index[-5:].tz_localize(None).as_unit("ns").asi8
+    np.testing.assert_array_equal(buf.times(), expected)
+
+
+def test_append_rolls_oldest_and_views_stay_contiguous():
+    buf = OHLCVRingBuffer(4)
+    buf.load_frame(_frame(3))
+    assert buf.append(100, 1.0, 2.0, 0.5, 1.5, 7.0) is False
+    assert buf.append(200, 2.0, 3.0, 1.5, 2.5, 8.0) is True
+    assert buf.append(300, 3.0, 4.0, 2.5, 3.5, 9.0) is True
+
+    assert len(buf) == 4
+    np.testing.assert_array_equal(buf.column("close"), [2.0, 1.5, 2.5, 3.5])
+    assert buf.times()[-3:].tolist() == [100, 200, 300]
+    assert buf.column("close").base is not None     # a view, not a copy
+    assert buf.last_time() == 300 and buf.last("volume") == 9.0
+
+
+def test_update_last_extends_forming_bar_after_wraparound():
+    buf = OHLCVRingBuffer(3)
+    for i in range(7):
+        buf.append(i, 10.0, 10.0, 10.0, 10.0, 1.0)
+
+    buf.update_last(12.0, 2.0)
+    buf.update_last(9.0, 3.0)
+
+    assert buf.last("high") == 12.0 and buf.last("low") == 9.0
+    assert buf.last("close") == 9.0 and buf.last("volume") == 6.0
+    assert buf.column("high").tolist() == [10.0, 10.0, 12.0]
+
+
+def test_empty_buffer():
+    buf = OHLCVRingBuffer(2)
+    buf.update_last(1.0)
+    assert len(buf) == 0 and buf.last_time() is None and buf.last("close") is None
+    with pytest.raises(ValueError):
+        OHLCVRingBuffer(0)
+
+
+def test_prepend_grows_capacity_and_keeps_live_headroom():
+    buf = OHLCVRingBuffer(6)
+    df = _frame(10)
+    buf.load_frame(df.iloc[6:])          # 4 newest bars, 2 free slots
+    buf.append(999, 1.0, 1.0, 1.0, 1.0)  # wraps nothing yet
+
+    buf.prepend_frame(df.iloc[:6])
+
+    assert buf.capacity == 12 and len(buf) == 11
+    np.testing.assert_array_equal(buf.column("close")[:10], df["close"].to_numpy())
+    assert buf.last_time() == 999
+    assert buf.append(1000, 2.0, 2.0, 2.0, 2.0) is False
+    assert buf.append(1001, 2.0, 2.0, 2.0, 2.0) is True
+    assert buf.column("close")[0] == 1.0
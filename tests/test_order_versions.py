@@ -0,0 +1,51 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from core.execution.order_versions import OrderVersionTracker
+from core.main_window import ImperiumMainWindow
+
+
+def _order(order_id, status="OPEN", filled=0, stamp="2026-10-18 10:00:00"):
+    return {"order_id": order_id, "status": status, "filled_quantity": filled,
+            "exchange_update_timestamp": stamp}
+
+
+def test_only_orders_that_moved_are_handed_on():
+    tracker = OrderVersionTracker()
+    book = [_order("1"), _order("2", "COMPLETE", 50)]
+    assert tracker.changed(book) == book
+    assert tracker.changed(book) == []
+
+    book[0] = _order("1", "COMPLETE", 75, "2026-10-18 10:00:04")
+    assert tracker.changed(book) == [book[0]]
+    assert len(tracker) == 2
+
+
+def test_stale_snapshot_never_rolls_an_order_back():
+    tracker = OrderVersionTracker()
+    assert tracker.advance(_order("1", "COMPLETE", 75, "2026-10-18 10:00:04"))   # postback
+
+    rest_row = _order("1", "OPEN", 25, datetime(2026, 10, 18, 10, 0, 2))       # older poll
+    assert not tracker.advance(rest_row)
+    assert not tracker.advance(_order("1", "COMPLETE", 75, datetime(2026, 10, 18, 10, 0, 4)))
+
+    # Same second and fill, status turned terminal.
+    assert tracker.advance(_order("2", "OPEN", 0, "2026-10-18 10:00:05"))
+    assert tracker.advance(_order("2", "CANCELLED", 0, "2026-10-18 10:00:05"))
+    assert not tracker.advance({"status": "COMPLETE"})
+
+
+def test_unrecorded_completed_exit_is_retried_by_reconciliation():
+    handled = []
+    window = SimpleNamespace(trading_mode="live", _live_order_versions=OrderVersionTracker(),
+                             _processed_live_exit_orders=set(),
+                             _process_live_exit_order=lambda order: handled.append(order["order_id"]))
+    exit_order = dict(_order("X", "COMPLETE", 75), transaction_type="SELL")
+    entry_order = dict(_order("Y", "COMPLETE", 75), transaction_type="BUY")
+    window._live_order_versions.advance(exit_order)     # postback seen before its snapshot existed
+
+    ImperiumMainWindow._reconcile_live_orders(window, [exit_order, entry_order])
+    window._processed_live_exit_orders.add("X")          # recorded this time
+    ImperiumMainWindow._reconcile_live_orders(window, [exit_order, entry_order])
+
+    assert handled == ["X", "Y"]
@@ -0,0 +1,76 @@
+import threading
+import time
+from datetime import date
+
+from PySide6.QtWidgets import QApplication
+
+from core.execution.execution_stack import ExecutionStack
+from core.execution.order_execution_methods import OrderExecutionMethods
+from core.utils.data_models import Contract
+
+
+class _Trader:
+    PRODUCT_MIS, ORDER_TYPE_MARKET, ORDER_TYPE_LIMIT = "MIS", "MARKET", "LIMIT"
+    TRANSACTION_TYPE_BUY, TRANSACTION_TYPE_SELL = "BUY", "SELL"
+    VARIETY_REGULAR, EXCHANGE_NFO = "regular", "NFO"
+
+    def __init__(self):
+        self.placed = 0
+
+    def place_order(self, **args):
+        self.placed += 1
+        if self.placed == 2:
+            raise ValueError("insufficient margin")
+        return f"O{self.placed}"
+
+
+class _Window:
+    def __init__(self, tmp_path):
+        self.trader = _Trader()
+        self.execution_stack = ExecutionStack("live", tmp_path)
+        self.confirm_threads = set()
+        self.positions, self.results, self.done = [], [], False
+        self.position_manager = type("PM", (), {"add_position": lambda _, p: self.positions.append(p)})()
+        self.trade_logger = type("TL", (), {"log_trade": lambda _, o: None})()
+
+    def _validate_pre_trade_risk(self, **kwargs):
+        return True, ""
+
+    def _confirm_order_success(self, order_id):
+        self.confirm_threads.add(threading.get_ident())
+        time.sleep(0.05)                                   # broker round trip
+        return {"order_id": order_id, "status": "COMPLETE", "average_price": 101.0, "filled_quantity": 50}
+
+    def _publish_status(self, message, *args, **kwargs):
+        self.done = self.done or message == "Order placement flow completed."
+
+    def _refresh_positions(self):
+        pass
+
+    def _play_sound(self, success):
+        pass
+
+
+def test_panel_orders_confirm_off_the_gui_thread_and_keep_placed_children(tmp_path, monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    window = _Window(tmp_path)
+    methods = OrderExecutionMethods(window)
+    monkeypatch.setattr(methods, "show_order_results", lambda ok, failed: window.results.append((ok, failed)))
+    contract = Contract("NIFTY", 25000, "CE", date(2099, 1, 1), "NIFTYCE", 1, 50)
+
+    methods.execute_orders({
+        "total_quantity_per_strike": 150, "execution_algo": "TWAP", "max_child_orders": 3,
+        "randomize_slices": False, "strikes": [{"strike": 25000, "contract": contract}],
+    })
+    deadline = time.monotonic() + 5
+    while not window.done and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+
+    assert window.trader.placed == 2                       # third slice never sent
+    assert [p.order_id for p in window.positions] == ["O1"]
+    assert threading.get_ident() not in window.confirm_threads
+    (ok, failed), = window.results
+    assert [o["order_id"] for o in ok] == ["O1"] and "margin" in failed[0]["error"]
+    methods.shutdown()
+    window.execution_stack.shutdown()
@@ -0,0 +1,137 @@
+import threading
+import time
+
+from PySide6.QtCore import QCoreApplication
+
+from core.positions.position_manager import PositionManager
+
+
+def _api_pos(symbol, qty=50, avg=100.0, token=1):
+    return {"tradingsymbol": symbol, "quantity": qty, "average_price": avg,
+            "last_price": avg, "pnl": 0.0, "instrument_token": token}
+
+
+class _Trader:
+    def __init__(self, net, orders=()):
+        self.net, self._orders = net, list(orders)
+        self.threads = set()
+
+    def positions(self):
+        self.threads.add(threading.get_ident())
+        return {"net": list(self.net)}
+
+    def orders(self):
+        return list(self._orders)
+
+
+def _record(pm):
+    events = []
+    pm.positions_updated.connect(lambda p: events.append(("updated", [x.tradingsymbol for x in p])))
+    pm.positions_changed.connect(lambda p: events.append(("changed", [x.tradingsymbol for x in p])))
+    pm.pending_orders_updated.connect(lambda o: events.append(("orders", len(o))))
+    return events
+
+
+def test_refresh_merges_as_a_diff():
+    pm = PositionManager(None, None)
+    pm._process_orders_and_positions([_api_pos("A"), _api_pos("B", token=2)], [])
+    a = pm.get_position("A")
+    a.ltp = 107.0                                      # live tick state
+    events = _record(pm)
+
+    pm._process_orders_and_positions([_api_pos("A"), _api_pos("B", token=2)], [])
+    assert events == [] and pm.get_position("A") is a and a.ltp == 107.0
+
+    pm._process_orders_and_positions([_api_pos("A"), _api_pos("B", qty=100, token=2)],
+                                     [{"status": "OPEN", "tradingsymbol": "C"}])
+    assert events == [("changed", ["B"]), ("orders", 1)]
+
+    pm._process_orders_and_positions([_api_pos("A")], [{"status": "OPEN", "tradingsymbol": "C"}])
+    assert events[-1] == ("updated", ["A"])
+
+
+def test_live_refresh_runs_off_the_gui_thread_and_coalesces():
+    app = QCoreApplication.instance() or QCoreApplication([])
+    trader = _Trader([_api_pos("A")])
+    pm = PositionManager(trader, None)
+    done = []
+    pm.refresh_completed.connect(done.append)
+
+    pm.refresh_from_api()
+    pm.refresh_from_api()                              # folded into one follow-up
+    deadline = time.monotonic() + 5
+    while len(done) < 2 and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+
+    assert done == [True, True]
+    assert threading.get_ident() not in trader.threads
+    assert pm.get_position("A") is not None
+
+
+class _RejectingTrader(_Trader):
+    VARIETY_REGULAR, TRANSACTION_TYPE_SELL, ORDER_TYPE_MARKET = "regular", "SELL", "MARKET"
+
+    def __init__(self, net):
+        super().__init__(net)
+        self.exits = 0
+
+    def place_order(self, **kwargs):
+        self.exits += 1
+        raise RuntimeError("exchange rejected")
+
+
+def test_unchanged_refresh_rearms_a_leg_whose_exit_failed():
+    trader = _RejectingTrader([_api_pos("A")])
+    pm = PositionManager(trader, None)
+    pm._process_orders_and_positions(trader.net, [])
+    pm.update_sl_tp_for_position("A", 95.0, None, None)
+
+    pm.update_pnl_from_market_data({"instrument_token": 1, "last_price": 94.0})
+    assert trader.exits == 1 and pm.get_position("A").is_exiting
+
+    pm._process_orders_and_positions(trader.net, [])   # broker fields unchanged
+    a = pm.get_position("A")
+    assert not a.is_exiting
+
+    pm.update_pnl_from_market_data({"instrument_token": 1, "last_price": 90.0})
+    assert a.ltp == 90.0 and trader.exits == 2
+
+
+
+class _GatedTrader(_Trader):
+    """Takes its snapshot, then holds it until ``release`` is set."""
+
+    def __init__(self, net):
+        super().__init__(net)
+        self.taken, self.release = threading.Event(), threading.Event()
+
+    def positions(self):
+        snapshot = super().positions()
+        self.taken.set()
+        self.release.wait(5)
+        return snapshot
+
+
+def test_snapshot_fetched_before_a_local_add_is_refetched(make_position):
+    app = QCoreApplication.instance() or QCoreApplication([])
+    trader = _GatedTrader([_api_pos("A")])
+    pm = PositionManager(trader, None)
+    pm._process_orders_and_positions(trader.net, [])
+    done = []
+    pm.refresh_completed.connect(done.append)
+
+    pm.refresh_from_api()                              # snapshot without B, held in flight
+    assert trader.taken.wait(5)
+    b = make_position("B", 2, stop_loss_price=95.0)
+    pm.add_position(b)                                 # order confirmed mid-fetch
+    trader.net.append(_api_pos("B", token=2))
+    trader.release.set()
+
+    deadline = time.monotonic() + 5
+    while not done and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+
+    assert done == [True]
+    assert pm.get_position("B") is b and b.stop_loss_price == 95.0
@@ -0,0 +1,60 @@
+from core.positions.position_manager import PositionManager
+
+
+def _manager(*positions):
+    pm = PositionManager(None, None)
+    for pos in positions:
+        pm.add_position(pos)
+    return pm
+
+
+def test_ticks_emit_only_the_positions_they_move(make_position):
+    a, b, c = make_position("A", 1), make_position("B", 2), make_position("C", 3, qty=-50)
+    pm = _manager(a, b, c)
+    deltas = []
+    pm.positions_changed.connect(deltas.append)
+
+    pm.update_pnl_from_market_data([
+        {"instrument_token": 1, "last_price": 102.0},
+        {"instrument_token": 3, "last_price": 99.0},
+        {"instrument_token": 2, "last_price": 100.0},     # unchanged LTP
+        {"instrument_token": 99, "last_price": 5.0},      # not held
+    ])
+
+    assert deltas == [[a, c]]
+    assert a.pnl == 100.0 and c.pnl == 50.0 and b.pnl == 0.0
+    assert pm.get_total_pnl() == 150.0
+
+    pm.update_pnl_from_market_data({"instrument_token": 1, "last_price": 101.0})
+    assert deltas[-1] == [a]
+    assert pm.get_total_pnl() == 100.0
+
+
+def test_total_follows_position_set_changes(make_position):
+    a, b = make_position("A", 1), make_position("B", 2)
+    pm = _manager(a, b)
+    pm.update_pnl_from_market_data([
+        {"instrument_token": 1, "last_price": 110.0},
+        {"instrument_token": 2, "last_price": 90.0},
+    ])
+    assert pm.get_total_pnl() == 0.0
+
+    pm.remove_position("B")
+    assert pm.get_total_pnl() == 500.0
+
+    deltas = []
+    pm.positions_changed.connect(deltas.append)
+    pm.update_pnl_from_market_data({"instrument_token": 2, "last_price": 80.0})
+    assert deltas == [] and b.ltp == 90.0
+
+
+def test_stop_loss_hit_exits_instead_of_emitting(monkeypatch, make_position):
+    a = make_position("A", 1, stop_loss_price=95.0)
+    pm = _manager(a)
+    exited, deltas = [], []
+    monkeypatch.setattr(pm, "exit_position", exited.append)
+    pm.positions_changed.connect(deltas.append)
+
+    pm.update_pnl_from_market_data({"instrument_token": 1, "last_price": 94.0})
+
+    assert exited == [a] and deltas == []
@@ -0,0 +1,54 @@
+import numpy as np
+
+from core.positions.protective_engine import GROUP, LEG, PORTFOLIO, STOP_LOSS, TARGET, ProtectiveOrderEngine
+
+
+def _ticks(*pairs):
+    tokens, prices = zip(*pairs)
+    return np.array(tokens, dtype=np.int64), np.array(prices, dtype=np.float64)
+
+
+def test_leg_levels_fire_once_in_symbol_order(make_position):
+    engine = ProtectiveOrderEngine()
+    engine.load([
+        make_position("B", 2, stop_loss_price=95.0),
+        make_position("A", 1, target_price=105.0),
+        make_position("C", 3, qty=-50, stop_loss_price=104.0),
+    ])
+
+    result = engine.evaluate(*_ticks((3, 106.0), (2, 94.0), (1, 110.0), (1, 103.0)))
+
+    assert result.moved == ["A", "B", "C"]
+    assert [(t.scope, t.reason, t.key) for t in result.triggers] == [(LEG, STOP_LOSS, "B"), (LEG, STOP_LOSS, "C")]
+    assert engine.leg_values("A") == (103.0, 150.0, None)      # last tick per token wins
+    assert engine.evaluate(*_ticks((2, 90.0))).triggers == []    # already fired
+
+
+def test_trailing_stop_only_tightens(make_position):
+    engine = ProtectiveOrderEngine()
+    engine.load([make_position("L", 1, trailing_stop_loss=5.0), make_position("S", 2, qty=-50, trailing_stop_loss=5.0)])
+
+    engine.evaluate(*_ticks((1, 110.0), (2, 90.0)))
+    engine.evaluate(*_ticks((1, 107.0), (2, 93.0)))
+    assert engine.leg_values("L")[2] == 105.0 and engine.leg_values("S")[2] == 95.0
+
+    result = engine.evaluate(*_ticks((1, 104.0), (2, 96.0)))
+    assert [t.key for t in result.triggers] == ["L", "S"]
+
+
+def test_group_supersedes_its_legs_and_portfolio_supersedes_all(make_position):
+    engine = ProtectiveOrderEngine()
+    engine.load([make_position("A", 1, stop_loss_price=80.0), make_position("B", 2), make_position("C", 3, stop_loss_price=99.0)])
+    engine.set_groups({"G": ["A", "B"], "Unarmed": ["C"]}, {"G": {"sl": -1500.0, "tp": None}})
+
+    result = engine.evaluate(*_ticks((1, 75.0), (2, 90.0), (3, 98.0)))
+    assert [(t.scope, t.key) for t in result.triggers] == [(GROUP, "G"), (LEG, "C")]
+    assert result.triggers[0].value == -1750.0
+    assert result.total_pnl == -1850.0
+
+    engine.load([make_position("D", 4)])
+    engine.set_portfolio(-1000.0, 400.0)
+    result = engine.evaluate(*_ticks((4, 110.0)))
+    assert [(t.scope, t.reason) for t in result.triggers] == [(PORTFOLIO, TARGET)]
+    assert engine.evaluate(*_ticks((4, 120.0))).triggers == []
+    assert engine.last_latency_us > 0 and engine.max_latency_us >= engine.last_latency_us
@@ -0,0 +1,156 @@
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "core" / "cvd" / "indicators.py"
+
+SPEC = importlib.util.spec_from_file_location("cvd_indicators", MODULE_PATH)
+indicators = importlib.util.module_from_spec(SPEC)
+assert SPEC is not None and SPEC.loader is not None
+SPEC.loader.exec_module(indicators)
+
+
+# Property: after feeding bars[:i + 1] one at a time, the streaming value equals
+# the last element of the batch function over that same prefix — for every i,
+# every period and every shape of input (trending, flat, gappy, tiny).
+
+SEEDS = range(40)
+
+
+def _random_bars(seed: int):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 120))
+    kind = seed % 4
+    if kind == 0:
+        close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, n))
+    elif kind == 1:
+        close = np.full(n, 250.0)
+    elif kind == 2:
+        close = np.round(1000.0 + np.cumsum(rng.normal(0.0, 5.0, n)), 1)
+    else:
+        close = rng.uniform(50.0, 60.0, n)
+    open_ = close + rng.normal(0.0, 0.5, n) * (kind != 1)
+    high = np.maximum(open_, close) + rng.uniform(0.0, 1.0, n) * (kind != 1)
+    low = np.minimum(open_, close) - rng.uniform(0.0, 1.0, n) * (kind != 1)
+    volume = rng.integers(0, 5000, n).astype(float)
+    period = int(rng.integers(1, 25))
+    return rng, high, low, close, volume, period
+
+
+def _assert_prefix_parity(stream_values, batch_fn, n):
+    for i in range(n):
+        expected = batch_fn(i + 1)[-1]
+        assert stream_values[i] == pytest.approx(expected, rel=1e-9, abs=1e-9), i
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_streaming_ema_matches_batch_prefix(seed):
+    _, _, _, close, _, period = _random_bars(seed)
+    ema = indicators.StreamingEMA(period)
+    values = [ema.update(x) for x in close]
+
+    _assert_prefix_parity(values, lambda m: indicators.calculate_ema(close[:m], period), len(close))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_streaming_vwap_matches_batch_prefix(seed):
+    rng, _, _, close, volume, _ = _random_bars(seed)
+    keys = list(np.sort(rng.integers(0, 3, len(close))))
+    vwap = indicators.StreamingVWAP()
+    values = [vwap.update(p, v, k) for p, v, k in zip(close, volume, keys)]
+
+    _assert_prefix_parity(
+        values,
+        lambda m: indicators.calculate_vwap(close[:m], volume[:m], keys[:m]),
+        len(close),
+    )
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_streaming_atr_matches_batch_prefix(seed):
+    _, high, low, close, _, period = _random_bars(seed)
+    atr = indicators.StreamingATR(period)
+    values = [atr.update(h, l, c) for h, l, c in zip(high, low, close)]
+
+    _assert_prefix_parity(
+        values,
+        lambda m: indicators.calculate_atr(high[:m], low[:m], close[:m], period),
+        len(close),
+    )
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_streaming_adx_matches_batch_prefix(seed):
+    _, high, low, close, _, period = _random_bars(seed)
+    adx = indicators.StreamingADX(period)
+    values = [adx.update(h, l, c) for h, l, c in zip(high, low, close)]
+
+    _assert_prefix_parity(
+        values,
+        lambda m: indicators.compute_adx(high[:m], low[:m], close[:m], period),
+        len(close),
+    )
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_streaming_chop_matches_batch_prefix(seed):
+    rng, high, low, close, _, period = _random_bars(seed)
+    # Integer-valued ATR keeps window sums exact so the ratio comparison is
+    # bit-for-bit identical on both paths.
+    atr = rng.integers(1, 10, len(close)).astype(float)
+    adx = indicators.compute_adx(high, low, close, period)
+    lookback = int(rng.integers(1, 15))
+    chop = indicators.StreamingChopRegime(lookback=lookback)
+    values = [chop.update(a, d) for a, d in zip(atr, adx)]
+
+    expected = indicators.is_chop_regime(atr, adx, lookback=lookback)
+    assert values == expected.tolist()
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_streaming_cvd_zscore_matches_batch_prefix(seed):
+    rng, _, _, close, volume, period = _random_bars(seed)
+    cvd = np.cumsum(np.where(np.diff(close, prepend=close[0]) >= 0, volume, -volume))
+    zscore = indicators.StreamingCVDZScore(period)
+    values = [zscore.update(x) for x in cvd]
+
+    _assert_prefix_parity(
+        values,
+        lambda m: indicators.calculate_cvd_zscore(cvd[:m], period),
+        len(cvd),
+    )
+
+
+def test_streaming_values_converge_to_full_batch_series_after_warmup():
+    rng = np.random.default_rng(7)
+    n = 500
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, n))
+    high = close + rng.uniform(0.0, 1.0, n)
+    low = close - rng.uniform(0.0, 1.0, n)
+
+    ema, atr, adx = (
+        indicators.StreamingEMA(21),
+        indicators.StreamingATR(14),
+        indicators.StreamingADX(14),
+    )
+    ema_vals = np.array([ema.update(c) for c in close])
+    atr_vals = np.array([atr.update(h, l, c) for h, l, c in zip(high, low, close)])
+    adx_vals = np.array([adx.update(h, l, c) for h, l, c in zip(high, low, close)])
+
+    assert ema.ready and atr.ready and adx.ready
+    np.testing.assert_allclose(ema_vals[20:], indicators.calculate_ema(close, 21)[20:], rtol=1e-12)
+    np.testing.assert_allclose(atr_vals[13:], indicators.calculate_atr(high, low, close, 14)[13:], rtol=1e-12)
+    np.testing.assert_allclose(adx_vals[15:], indicators.compute_adx(high, low, close, 14)[15:], rtol=1e-9)
+
+
+def test_streaming_reset_clears_state():
+    ema = indicators.StreamingEMA(3)
+    for x in (1.0, 2.0, 3.0, 4.0):
+        ema.update(x)
+    ema.reset()
+
+    assert not ema.ready
+    assert ema.update(10.0) == 10.0
@@ -0,0 +1,63 @@
+from datetime import date
+
+import numpy as np
+
+from core.market_data.strike_grid import StrikeGrid
+from core.market_data.strike_ladder import StrikeLadder
+
+
+EXPIRY = date(2026, 10, 20)
+
+
+def _instruments(strikes, expiry=EXPIRY, skip_pe=()):
+    insts, token = [], 100
+    for strike in strikes:
+        for ot in ("CE", "PE"):
+            token += 1
+            if ot == "PE" and strike in skip_pe:
+                continue
+            insts.append({"strike": strike, "expiry": expiry, "instrument_type": ot,
+                          "instrument_token": token, "tradingsymbol": f"X{strike}{ot}"})
+    return insts
+
+
+def test_atm_matches_linear_nearest_scan():
+    strikes = list(range(24000, 26001, 50)) + [26100, 26500]
+    grid = StrikeGrid(strikes)
+    for price in np.random.default_rng(0).uniform(23500, 27000, 500):
+        expected = min(strikes, key=lambda s: abs(s - price))
+        assert grid.atm_strike(price) == expected
+
+    assert grid.atm_strike(24025) == 24000       # tie goes to the lower strike
+    assert grid.interval == 50.0
+    assert StrikeGrid([]).atm_index(100.0) == -1
+
+
+def test_window_is_clipped_and_tokens_line_up():
+    grid = StrikeGrid.from_instruments(_instruments(range(100, 1100, 100), skip_pe={300}))
+    center = grid.index_of(200.0)
+
+    window = grid.window(center, 3, 2)
+    assert grid.strikes[window].tolist() == [100.0, 200.0, 300.0, 400.0]
+
+    ce, pe = grid.tokens(window)
+    assert ce.tolist() == [101, 103, 105, 107]
+    assert pe.tolist() == [102, 104, 0, 108]
+    assert grid.index_of(250.0) == -1
+
+
+def test_strike_ladder_exposes_per_expiry_and_symbol_grids():
+    later = date(2026, 10, 27)
+    data = {"NIFTY": {
+        "strikes": [100, 200, 300, 400],
+        "expiries": [EXPIRY, later],
+        "instruments": _instruments([100, 200, 300]) + _instruments([200, 400], expiry=later),
+    }}
+    ladder = StrikeLadder()
+    ladder.build(data)
+
+    assert ladder.grid("NIFTY").strikes.tolist() == [100, 200, 300, 400]
+    assert ladder.grid("NIFTY", later).strikes.tolist() == [200, 400]
+    assert ladder.get_atm_index("NIFTY", 340) == 2
+    assert ladder.get_instrument("NIFTY", later, 400.0, "PE")["tradingsymbol"] == "X400PE"
+    assert ladder.grid("BANKNIFTY") is None
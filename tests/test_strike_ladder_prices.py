@@ -0,0 +1,75 @@
+import threading
+import time
+from datetime import date
+from types import SimpleNamespace
+
+from PySide6.QtWidgets import QApplication
+
+from core.utils.data_models import Contract
+from core.widgets.strike_ladder import StrikeLadderWidget
+
+EXPIRY = date(2099, 1, 1)
+
+
+def _ladder(*contracts):
+    repainted = []
+    ladder = SimpleNamespace(
+        _tracking_token=None,
+        _token_contract_map={c.instrument_token: c for c in contracts},
+        contracts={c.strike: {c.option_type: c} for c in contracts},
+        model=SimpleNamespace(row_for_strike=lambda strike: int(strike // 100), set_max_oi=lambda oi: None),
+        _update_table=lambda rows: repainted.append(sorted(rows)),
+    )
+    return ladder, repainted
+
+
+def test_only_rows_whose_quote_moved_are_repainted():
+    a = Contract("NIFTY", 100, "CE", date(2099, 1, 1), "A", 1, 50, ltp=10.0)
+    b = Contract("NIFTY", 200, "CE", date(2099, 1, 1), "B", 2, 50, ltp=20.0)
+    ladder, repainted = _ladder(a, b)
+
+    StrikeLadderWidget.update_prices(ladder, [{"instrument_token": 1, "last_price": 10.0},
+                                              {"instrument_token": 2, "last_price": 21.0}])
+    StrikeLadderWidget.update_prices(ladder, [{"instrument_token": 1, "last_price": 10.0}])
+    StrikeLadderWidget.update_prices(ladder, [{"instrument_token": 1, "last_price": 10.0,
+                                               "depth": {"buy": [{"price": 9.5}]}}])
+
+    assert repainted == [[2], [1]]
+
+
+class _Kite:
+    def __init__(self):
+        self.threads = []
+
+    def quote(self, instruments):
+        self.threads.append(threading.get_ident())
+        return {k: {"last_price": 5.0, "oi": 100} for k in instruments}
+
+
+def test_rebuild_quotes_off_the_gui_thread_and_remeasures_the_basis():
+    app = QApplication.instance() or QApplication([])
+    strikes = list(range(24000, 26001, 100))
+    insts = [{"strike": k, "expiry": EXPIRY, "instrument_type": ot, "instrument_token": 1000 + i,
+              "tradingsymbol": f"N{k}{ot}", "lot_size": 75}
+             for i, (k, ot) in enumerate((k, ot) for k in strikes for ot in ("CE", "PE"))]
+    kite = _Kite()
+    ladder = StrikeLadderWidget(kite)
+    ladder.set_instrument_data({"NIFTY": {"strikes": strikes, "expiries": [EXPIRY], "instruments": insts}})
+
+    ladder.update_strikes("NIFTY", 25010.0, EXPIRY, 100.0)
+    ladder.set_tracking_token(7, is_future=True)
+    assert ladder.model.rowCount() == 21                          # rows go up before the quotes land
+    deadline = time.monotonic() + 5
+    while not ladder.contracts[25000.0]["CE"].ltp and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    assert ladder.contracts[25000.0]["CE"].ltp == 5.0
+    assert threading.get_ident() not in kite.threads
+
+    ladder.update_prices({"instrument_token": 7, "last_price": 25060.0})
+    assert ladder._tracking_basis == 50.0
+    ladder.update_strikes("NIFTY", 25400.0, EXPIRY, 100.0)       # e.g. symbol switched back
+    ladder.update_prices({"instrument_token": 7, "last_price": 25480.0})
+    assert ladder._tracking_basis == 80.0
+    ladder.deleteLater()
+    app.processEvents()